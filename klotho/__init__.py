@@ -26,7 +26,9 @@ from .topos.graphs import GraphCore, Graph, Tree, Lattice, Group
 from .semeios.visualization import plot
 
 from .utils.playback.player import play
-from .utils.playback._config import set_audio_engine, get_audio_engine
+from .utils.playback._config import (
+    set_audio_engine, get_audio_engine, set_asset_mode, get_asset_mode,
+)
 from .utils.playback.supersonic import register_synthdef
 from .utils.playback.supersonic.samples import register_sample
 from .utils.fetch import fetch_samples, upload_samples
@@ -34,6 +36,7 @@ from .utils.fetch import fetch_samples, upload_samples
 __all__ = [
     'topos', 'chronos', 'tonos', 'dynatos', 'thetos', 'semeios', 'utils',
     'plot', 'play', 'set_audio_engine', 'get_audio_engine',
+    'set_asset_mode', 'get_asset_mode',
     'register_synthdef', 'register_sample', 'fetch_samples', 'upload_samples',
     'GraphCore', 'Graph', 'Tree', 'Lattice', 'Group',
 ]
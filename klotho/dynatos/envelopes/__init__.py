@@ -1,8 +1,9 @@
-from .envelopes import Envelope
+from .envelopes import Envelope, sample_envelopes
 from .utils import line, arch, map_curve
 
 __all__ = [
     'Envelope',
+    'sample_envelopes',
     'line',
     'arch', 
     'map_curve',
@@ -1,5 +1,6 @@
 import uuid
 
+from klotho.utils.playback._event_codec import encode_events
 from .._shared.svg_shared import _script_json
 from .._cdn import (
     cdn_scripts,
@@ -37,6 +38,9 @@ def _payload_json_memo(fig):
     if cached is not None:
         return cached
     payload = fig.audio_payload
+    if isinstance(payload, dict) and isinstance(payload.get("events"), list):
+        # columnar typed-array events; the playback bridge decodes them
+        payload = {**payload, "events": encode_events(payload["events"])}
     payload_json = _script_json(payload) if payload else "null"
     try:
         fig._payload_json_cache = payload_json
@@ -75,8 +75,12 @@ def build_scripts_html(needed_synthdefs=None):
         needed_synthdefs = {'kl_tri', 'kl_kicktone', 'kl_sine', 'kl_saw', 'kl_sqr', 'kl_noisebpf'}
     needed_synthdefs = needed_synthdefs | _INFRA_SYNTHDEFS | {'__klEnvCtrl'}
 
-    all_assets = _load_all_synthdef_assets()
-    assets = _filter_synthdef_assets(all_assets, needed_synthdefs)
+    from klotho.utils.playback._config import get_asset_mode
+    if get_asset_mode() == "store":
+        from klotho.utils.playback.supersonic.asset_store import stored_synthdef_refs
+        assets = stored_synthdef_refs(needed_synthdefs)
+    else:
+        assets = _filter_synthdef_assets(_load_all_synthdef_assets(), needed_synthdefs)
     assets_json = json.dumps(assets)
     needed_json = json.dumps(list(needed_synthdefs))
     manifest_json = json.dumps(load_ss_manifest())
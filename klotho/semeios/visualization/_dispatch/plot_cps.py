@@ -287,7 +287,7 @@ def _cps_scale_run(cps, equaves=1):
     if eq < 0:
         idxs = [-i for i in idxs]
     idxs = idxs + idxs[-2::-1]
-    freqs = [float(collection[i].freq) for i in idxs]
+    freqs = collection.realize(idxs).freqs.tolist()
 
     ratios = list(cps.ratios)
     ratio_to_node = {}
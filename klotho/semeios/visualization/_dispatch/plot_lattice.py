@@ -186,8 +186,7 @@ def _resolve_chord_shape(obj, shape):
     shape_groups, freq_groups = [], []
     for ch in chords:
         group = []
-        for degree in ch.degrees:
-            node = obj._node_for_ratio(degree)
+        for degree, node in zip(ch.degrees, obj._nodes_for_ratios(ch.degrees)):
             if node is None:
                 raise ValueError(
                     f"Shape chord degree {degree} does not correspond to a "
@@ -230,8 +229,7 @@ def _resolve_scale_nodes(obj, nodes):
         )
 
     coords, unresolved = [], []
-    for degree in nodes.degrees:
-        node = obj._node_for_ratio(degree)
+    for degree, node in zip(nodes.degrees, obj._nodes_for_ratios(nodes.degrees)):
         if node is None:
             unresolved.append(str(degree))
         else:
@@ -2217,14 +2217,10 @@ def _plot_field(field: ParameterField, figsize: tuple[float, float] = (12, 12),
     else:
         effective_dimensionality = field.dimensionality
     
-    field_values = []
-    for coord in original_coords:
-        try:
-            field_values.append(field.get_field_value(coord))
-        except KeyError:
-            field_values.append(0.0)
-    
-    field_values = np.array(field_values)
+    field_values = np.zeros(len(original_coords))
+    inside = [i for i, coord in enumerate(original_coords) if coord in field]
+    if inside:
+        field_values[inside] = field.get_field_values([original_coords[i] for i in inside])
     
     if len(field_values) > 0:
         vmin, vmax = field_values.min(), field_values.max()
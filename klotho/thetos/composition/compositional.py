@@ -1525,14 +1525,14 @@ class CompositionalUnit(TemporalUnit):
             time_scale=duration / raw_total if raw_total > 0 else 1.0
         )
         self._invalidate_bind_memo_subtree(sounding, pfields_list)
+        # every leaf sampled in one vectorized call (clamped into the
+        # envelope span exactly as the per-leaf at_time loop used to be)
+        total = scaled_envelope.total_time
+        relative_times = [max(0, min(times[node]['real_onset'] + offset - start_time, total))
+                          for node in sounding]
+        env_values = scaled_envelope.sample(relative_times).tolist()
         with self._rt.batch_writes():
-            for node in sounding:
-                event_time = times[node]['real_onset'] + offset
-                relative_time = max(0, min(event_time - start_time, scaled_envelope.total_time))
-                try:
-                    env_value = scaled_envelope.at_time(relative_time)
-                except ValueError:
-                    env_value = scaled_envelope.values[0] if relative_time <= 0 else scaled_envelope.values[-1]
+            for node, env_value in zip(sounding, env_values):
                 self._rt.set_pfields(node, **{pfield: env_value for pfield in pfields_list})
 
     def _resolve_control_envelope_leaves(self, desc):
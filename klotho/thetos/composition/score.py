@@ -290,6 +290,16 @@ class Score:
     * :meth:`write` — serialize the lowered event payload to JSON (for
       the native SC ``EventScheduler``).
 
+    Parameters
+    ----------
+    block_size : int, default=512
+        Frames per control-envelope block in the lowered buffer (the
+        upper bound when *adaptive_blocks* is set).  Envelopes with equal
+        values/times/curve/warp/time_scale share one block.
+    adaptive_blocks : bool, default=False
+        Size each control-envelope block from the envelope's playback
+        duration and curvature instead of always using *block_size*.
+
     Examples
     --------
     >>> s = Score()
@@ -299,8 +309,10 @@ class Score:
     >>> play(s)
     """
 
-    def __init__(self, block_size: int = _DEFAULT_BLOCK_SIZE):
+    def __init__(self, block_size: int = _DEFAULT_BLOCK_SIZE,
+                 adaptive_blocks: bool = False):
         self._block_size = block_size
+        self._adaptive_blocks = adaptive_blocks
         self._tracks: "OrderedDict[str, dict]" = OrderedDict()
         self._items: "OrderedDict[str, ScoreItem]" = OrderedDict()
         self._insert_registry: dict[str, str] = {}
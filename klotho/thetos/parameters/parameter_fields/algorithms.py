@@ -36,8 +36,9 @@ def find_navigation_path(field, steps: int = 2000, frequency: float = 0.05) -> L
     resolution = field.resolution
     path = []
 
-    coordinates = field.coords()
+    coordinates = field.coords
     coord_array = np.array(coordinates)
+    values = field.get_field_values(coordinates)
 
     for t in range(steps):
         angle = frequency * t
@@ -63,6 +64,6 @@ def find_navigation_path(field, steps: int = 2000, frequency: float = 0.05) -> L
         nearest_index = np.argmin(distances)
         nearest_coordinate = coordinates[nearest_index]
 
-        path.append((nearest_coordinate, field[nearest_coordinate]))
+        path.append((nearest_coordinate, values[nearest_index]))
 
     return path
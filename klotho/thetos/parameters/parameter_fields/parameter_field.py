@@ -9,8 +9,12 @@ class ParameterField(Lattice):
     A parametric field is a lattice with a function evaluated at each coordinate.
     
     Parameter fields inherit all lattice functionality while providing field-specific
-    methods for function evaluation and field manipulation. The function is
-    evaluated lazily as coordinates are materialized in the lattice.
+    methods for function evaluation and field manipulation. Values live in a
+    dense NumPy array aligned to the lattice bounds (allocated on first use);
+    the function is evaluated lazily, in vectorized chunks, for the cells
+    that are read, and whole-grid derivatives are array stencils. Lazy
+    fields too large for a dense grid keep the cells read or set in a
+    sparse map instead, and refuse whole-grid operations.
     
     Parameters
     ----------
@@ -29,7 +33,26 @@ class ParameterField(Lattice):
         If False, coordinates range from 0 to resolution (default is True).
     periodic : bool, optional
         Whether to use periodic boundary conditions (default is False).
+    lazy : bool, optional
+        Use an implicit lattice (see :class:`Lattice`); only coordinates
+        whose value has been evaluated or set are materialized. ``None``
+        (default) picks lazy mode for very large fields.
     """
+
+    # Upper bound on the spatial-point batch handed to the field function
+    # in one call; larger evaluations are split into chunks of this size.
+    _EVAL_CHUNK_BYTES = 64 * 2 ** 20
+
+    # Largest dense grid (values plus known-mask) a lazy field allocates;
+    # beyond it values are kept sparsely.
+    _DENSE_GRID_BYTES = 64 * 2 ** 20
+
+    # Dense value store, indexed by ``coord - lower bound`` per axis, and
+    # the mask of cells evaluated or set so far.
+    _grid = None
+    _grid_known = None
+    # Sparse value store {flat index: value} for oversized lazy fields.
+    _sparse = None
     
     def __init__(self, 
                  dimensionality: int = 2, 
@@ -38,7 +61,8 @@ class ParameterField(Lattice):
                  ranges: Optional[Union[Tuple[float, float], List[Tuple[float, float]]]] = None,
                  bipolar: bool = True,
                  periodic: bool = False,
-                 compute_all: bool = False):
+                 compute_all: bool = False,
+                 lazy: Optional[bool] = None):
         
         if function is None:
             function = lambda x: np.zeros(x.shape[0])
@@ -54,7 +78,7 @@ class ParameterField(Lattice):
                 raise ValueError(f"Ranges list length {len(ranges)} must match dimensionality {dimensionality}")
             self._ranges = ranges
         
-        super().__init__(dimensionality, resolution, bipolar, periodic)
+        super().__init__(dimensionality, resolution, bipolar, periodic, lazy=lazy)
         if compute_all:
             self._compute_all_field_values()
     
@@ -92,25 +116,117 @@ class ParameterField(Lattice):
         
         return np.array(spatial_points) if spatial_points else np.empty((0, self._dimensionality))
     
+    def _grid_lows(self) -> np.ndarray:
+        return np.array([dim.start for dim in self._dims], dtype=np.int64)
+
+    def _axis_points(self) -> List[np.ndarray]:
+        """Spatial position of every lattice index, per axis."""
+        axes = []
+        for (lo, hi), dim in zip(self._ranges, self._dims):
+            n = len(dim)
+            if n > 1:
+                axes.append(lo + np.arange(n) * ((hi - lo) / (n - 1)))
+            else:
+                axes.append(np.full(1, float(lo)))
+        return axes
+
+    def _grid_shape(self) -> Tuple[int, ...]:
+        return tuple(len(dim) for dim in self._dims)
+
+    def _is_dense(self) -> bool:
+        """Whether values live in a dense grid (eager fields, or lazy ones
+        small enough for ``_DENSE_GRID_BYTES``)."""
+        if not self._is_lazy:
+            return True
+        return 9 * int(np.prod(self._grid_shape(), dtype=object)) <= self._DENSE_GRID_BYTES
+
+    def _ensure_grid(self) -> np.ndarray:
+        if self._grid is None:
+            if not self._is_dense():
+                cells = int(np.prod(self._grid_shape(), dtype=object))
+                raise ValueError(
+                    f"Field has {cells} cells, too many to hold as a dense grid "
+                    f"(limit {self._DENSE_GRID_BYTES} bytes); read values per "
+                    f"coordinate instead")
+            shape = self._grid_shape()
+            self._grid = np.zeros(shape)
+            self._grid_known = np.zeros(shape, dtype=bool)
+        return self._grid
+
+    def _flat_indices(self, coords) -> np.ndarray:
+        """Flat grid indices of *coords*; KeyError for coordinates off the lattice."""
+        arr = np.asarray(coords, dtype=np.int64).reshape(-1, self._dimensionality)
+        offsets = arr - self._grid_lows()
+        shape = self._grid_shape()
+        inside = ((offsets >= 0) & (offsets < shape)).all(axis=1)
+        if not inside.all():
+            bad = tuple(int(v) for v in arr[~inside][0])
+            raise KeyError(f"Coordinate {bad} not found in field")
+        return np.ravel_multi_index(tuple(offsets.T), shape)
+
+    def _evaluate_cells(self, flat: Optional[np.ndarray] = None, only_missing: bool = True,
+                        require_vectorized: bool = False):
+        """Evaluate the function into the grid at flat indices (all cells if None).
+
+        The function sees at most ``_EVAL_CHUNK_BYTES`` worth of spatial
+        points per call.
+        """
+        if flat is not None and not self._is_dense():
+            self._evaluate_sparse(flat, only_missing, require_vectorized)
+            return
+        grid = self._ensure_grid()
+        grid_flat = grid.reshape(-1)
+        known_flat = self._grid_known.reshape(-1)
+        axes = self._axis_points()
+        chunk = max(1, self._EVAL_CHUNK_BYTES // (8 * (self._dimensionality + 1)))
+        if flat is None:
+            blocks = (np.arange(begin, min(begin + chunk, grid.size))
+                      for begin in range(0, grid.size, chunk))
+        else:
+            flat = np.unique(flat)
+            blocks = (flat[begin:begin + chunk] for begin in range(0, len(flat), chunk))
+        for block in blocks:
+            if only_missing:
+                block = block[~known_flat[block]]
+            if not len(block):
+                continue
+            idx = np.unravel_index(block, grid.shape)
+            points = np.stack([axes[d][idx[d]] for d in range(grid.ndim)], axis=1)
+            grid_flat[block] = self._evaluate_spatial_points(points, require_vectorized=require_vectorized)
+            known_flat[block] = True
+
+    def _evaluate_sparse(self, flat: np.ndarray, only_missing: bool, require_vectorized: bool):
+        """:meth:`_evaluate_cells` for the sparse store."""
+        if self._sparse is None:
+            self._sparse = {}
+        shape = self._grid_shape()
+        axes = self._axis_points()
+        chunk = max(1, self._EVAL_CHUNK_BYTES // (8 * (self._dimensionality + 1)))
+        flat = np.unique(flat)
+        if only_missing:
+            flat = np.array([i for i in flat.tolist() if i not in self._sparse], dtype=np.int64)
+        for begin in range(0, len(flat), chunk):
+            block = flat[begin:begin + chunk]
+            idx = np.unravel_index(block, shape)
+            points = np.stack([axes[d][idx[d]] for d in range(len(shape))], axis=1)
+            values = self._evaluate_spatial_points(points, require_vectorized=require_vectorized)
+            self._sparse.update(zip(block.tolist(), values.tolist()))
+
     def _evaluate_coordinates(self, coords: List[Tuple[int, ...]], require_vectorized: bool = False):
         """Evaluate function at given coordinates and store values."""
-        if not coords:
+        if not len(coords):
             return
-        
-        spatial_points = self._coordinates_to_spatial_points(coords)
-        values = self._evaluate_spatial_points(spatial_points, require_vectorized=require_vectorized)
-        
-        for coord, value in zip(coords, values):
-            node_id = self._coord_to_node[coord]
-            current_data = self._rx.get_node_data(node_id) or {}
-            field_value = float(value)
-            current_data['field_value'] = field_value
-            self._rx[node_id] = current_data
+        self._evaluate_cells(self._flat_indices(coords), only_missing=False,
+                             require_vectorized=require_vectorized)
     
     def _evaluate_all_coordinates(self):
         """Evaluate function at all existing coordinates."""
-        coords = list(self._coord_to_node.keys())
-        self._evaluate_coordinates(coords)
+        self._evaluate_cells(only_missing=False)
+
+    def _full_grid(self) -> np.ndarray:
+        """The dense value grid with every cell evaluated."""
+        self._evaluate_cells()
+        return self._grid
 
     def _evaluate_spatial_points(self, spatial_points: np.ndarray, require_vectorized: bool = False) -> np.ndarray:
         """Evaluate field function for a batch of spatial points."""
@@ -135,22 +251,16 @@ class ParameterField(Lattice):
 
     def _populate_missing_field_data(self, coords: Optional[List[Tuple[int, ...]]] = None):
         """Populate missing field values for provided coordinates."""
-        target_coords = self.coords if coords is None else coords
-        missing_coords = []
-        for coord in target_coords:
-            node_id = self._get_node_for_coord(coord)
-            if node_id is None:
-                continue
-            node_data = self._rx.get_node_data(node_id) or {}
-            if 'field_value' not in node_data:
-                missing_coords.append(coord)
-        if missing_coords:
-            self._evaluate_coordinates(missing_coords)
+        if coords is None:
+            self._evaluate_cells()
+            return
+        coords = [coord for coord in coords if coord in self]
+        if coords:
+            self._evaluate_cells(self._flat_indices(coords))
 
     def _compute_all_field_values(self):
         """Compute values for all lattice coordinates using vectorized contract."""
-        coords = list(self._coord_to_node.keys())
-        self._evaluate_coordinates(coords, require_vectorized=True)
+        self._evaluate_cells(only_missing=False, require_vectorized=True)
     
     def get_field_value(self, coord: Tuple[int, ...]) -> float:
         """
@@ -166,15 +276,17 @@ class ParameterField(Lattice):
         float
             The field value at the coordinate.
         """
-        node_id = self._get_node_for_coord(coord)
-        if node_id is None:
+        if coord not in self:
             raise KeyError(f"Coordinate {coord} not found in field")
-        node_data = self._rx.get_node_data(node_id) or {}
-        if 'field_value' in node_data:
-            return float(node_data['field_value'])
-        self._evaluate_coordinates([coord])
-        node_data = self._rx.get_node_data(node_id) or {}
-        return float(node_data.get('field_value', 0.0))
+        if not self._is_dense():
+            flat = self._flat_indices([coord])
+            self._evaluate_sparse(flat, True, False)
+            return float(self._sparse[int(flat[0])])
+        grid = self._ensure_grid()
+        idx = tuple(c - dim.start for c, dim in zip(coord, self._dims))
+        if not self._grid_known[idx]:
+            self._evaluate_cells(np.array([np.ravel_multi_index(idx, grid.shape)]))
+        return float(grid[idx])
     
     def set_field_value(self, coord: Tuple[int, ...], value: float):
         """
@@ -187,14 +299,17 @@ class ParameterField(Lattice):
         value : float
             The value to set.
         """
-        node_id = self._get_node_for_coord(coord)
-        if node_id is None:
+        if coord not in self:
             raise KeyError(f"Coordinate {coord} not found in field")
-        
-        current_data = self._rx.get_node_data(node_id) or {}
-        field_value = float(value)
-        current_data['field_value'] = field_value
-        self._rx[node_id] = current_data
+        if not self._is_dense():
+            if self._sparse is None:
+                self._sparse = {}
+            self._sparse[int(self._flat_indices([coord])[0])] = float(value)
+            return
+        grid = self._ensure_grid()
+        idx = tuple(c - dim.start for c, dim in zip(coord, self._dims))
+        grid[idx] = float(value)
+        self._grid_known[idx] = True
     
     def apply_function(self, function: Callable[[np.ndarray], np.ndarray], compute_all: bool = False):
         """
@@ -207,16 +322,18 @@ class ParameterField(Lattice):
             (n_points, dimensionality) and return an array of shape (n_points,).
         """
         self._function = function
-        for node_id in self._rx.node_indices():
-            node_data = self._rx.get_node_data(node_id)
-            if isinstance(node_data, dict) and 'field_value' in node_data:
-                del node_data['field_value']
+        if self._grid_known is not None:
+            self._grid_known[...] = False
+        self._sparse = None
         if compute_all:
             self._compute_all_field_values()
     
     def sample_field(self, points: np.ndarray) -> np.ndarray:
         """
         Sample the field at arbitrary spatial points using interpolation.
+
+        Interpolates (multilinearly) from the cached value grid; points
+        outside the field's ranges sample as 0.
         
         Parameters
         ----------
@@ -227,22 +344,31 @@ class ParameterField(Lattice):
         -------
         numpy.ndarray
             Array of interpolated field values.
+
+        Raises
+        ------
+        ValueError
+            If the field is a lazy field too large to densify.
         """
-        from scipy.interpolate import griddata
-        
-        coords = list(self._coord_to_node.keys())
-        
-        if not coords:
-            return np.zeros(points.shape[0])
-        
-        spatial_points = self._coordinates_to_spatial_points(coords)
-        field_values = np.array([self.get_field_value(coord) for coord in coords])
-        
-        return griddata(spatial_points, field_values, points, method='linear', fill_value=0.0)
+        from scipy.interpolate import RegularGridInterpolator
+
+        grid = self._full_grid()
+        axes = self._axis_points()
+        # the interpolator needs ascending axes; ranges may run high-to-low
+        for d, axis in enumerate(axes):
+            if len(axis) > 1 and axis[0] > axis[-1]:
+                axes[d] = axis[::-1]
+                grid = np.flip(grid, axis=d)
+        interpolator = RegularGridInterpolator(axes, grid, method='linear',
+                                               bounds_error=False, fill_value=0.0)
+        return interpolator(np.asarray(points, dtype=float))
     
     def gradient(self, coord: Tuple[int, ...]) -> np.ndarray:
         """
         Compute the gradient at a lattice coordinate using finite differences.
+
+        Central differences in lattice units (one-sided on the boundary,
+        wrapped when periodic) -- the value of :meth:`gradients` at *coord*.
         
         Parameters
         ----------
@@ -254,18 +380,18 @@ class ParameterField(Lattice):
         numpy.ndarray
             Gradient vector at the coordinate.
         """
+        center = self.get_field_value(coord)
         gradient = np.zeros(self._dimensionality)
-        neighbors = list(self.neighbors(coord))
-        center_value = self.get_field_value(coord)
-        
-        for neighbor_coord in neighbors:
-            direction = np.array(neighbor_coord) - np.array(coord)
-            distance = np.linalg.norm(direction)
-            if distance > 0:
-                direction = direction / distance
-                value_diff = self.get_field_value(neighbor_coord) - center_value
-                gradient += direction * value_diff / distance
-        
+        for axis in range(self._dimensionality):
+            step = tuple(1 if i == axis else 0 for i in range(self._dimensionality))
+            ahead = self._shift(coord, step)
+            behind = self._shift(coord, tuple(-v for v in step))
+            if ahead is not None and behind is not None:
+                gradient[axis] = (self.get_field_value(ahead) - self.get_field_value(behind)) / 2
+            elif ahead is not None:
+                gradient[axis] = self.get_field_value(ahead) - center
+            elif behind is not None:
+                gradient[axis] = center - self.get_field_value(behind)
         return gradient
     
     def laplacian(self, coord: Tuple[int, ...]) -> float:
@@ -287,18 +413,119 @@ class ParameterField(Lattice):
         neighbor_sum = sum(self.get_field_value(neighbor) for neighbor in neighbors)
         
         return neighbor_sum - len(neighbors) * center_value
+
+    def gradients(self) -> np.ndarray:
+        """
+        Gradient of the field at every lattice point.
+
+        ``np.gradient`` over the value grid (central differences in lattice
+        units, one-sided on the boundary); periodic fields use wrapped
+        central differences.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array of shape ``(dimensionality, *grid_shape)``; component
+            ``d`` at index ``coord - lower_bound`` is ``gradient(coord)[d]``.
+
+        Raises
+        ------
+        ValueError
+            If the field is a lazy field too large to densify.
+        """
+        grid = self._full_grid()
+        result = np.zeros((self._dimensionality,) + grid.shape)
+        for axis in range(self._dimensionality):
+            if grid.shape[axis] < 2:
+                continue
+            if self._periodic:
+                result[axis] = (np.roll(grid, -1, axis) - np.roll(grid, 1, axis)) / 2
+            else:
+                result[axis] = np.gradient(grid, axis=axis)
+        return result
+
+    def laplacians(self) -> np.ndarray:
+        """
+        Laplacian of the field at every lattice point.
+
+        The graph Laplacian stencil of :meth:`laplacian` (sum of neighbor
+        values minus neighbor count times the center) applied to the whole
+        value grid at once.
+
+        Returns
+        -------
+        numpy.ndarray
+            Array with the grid's shape (index ``coord - lower_bound``).
+
+        Raises
+        ------
+        ValueError
+            If the field is a lazy field too large to densify.
+        """
+        grid = self._full_grid()
+        result = np.zeros_like(grid)
+        for axis in range(self._dimensionality):
+            n = grid.shape[axis]
+            if self._periodic:
+                # neighbors are deduplicated: a 2-cell axis has one neighbor
+                if n == 2:
+                    result += np.roll(grid, 1, axis) - grid
+                elif n > 2:
+                    result += np.roll(grid, 1, axis) + np.roll(grid, -1, axis) - 2 * grid
+            elif n > 1:
+                forward = np.diff(grid, axis=axis)
+                head = [slice(None)] * grid.ndim
+                tail = [slice(None)] * grid.ndim
+                head[axis] = slice(None, -1)
+                tail[axis] = slice(1, None)
+                result[tuple(head)] += forward
+                result[tuple(tail)] -= forward
+        return result
+
+    def grid_values(self) -> np.ndarray:
+        """
+        The fully evaluated value grid.
+
+        Returns
+        -------
+        numpy.ndarray
+            Read-only array of shape ``tuple(len(axis_range) for each
+            axis)``; the value at ``coord`` is at index
+            ``coord - lower_bound`` (``-resolution`` when bipolar, else 0).
+
+        Raises
+        ------
+        ValueError
+            If the field is a lazy field too large to densify.
+        """
+        view = self._full_grid().view()
+        view.flags.writeable = False
+        return view
     
-    def get_field_values(self) -> List[float]:
+    def get_field_values(self, coords: Optional[List[Tuple[int, ...]]] = None) -> List[float]:
         """
-        Get all field values in the same order as coords.
+        Get field values in the same order as coords.
+
+        Parameters
+        ----------
+        coords : list of tuple of int, optional
+            Coordinates to read (default: all of :attr:`coords`). Missing
+            values are evaluated in one vectorized batch.
         
         Returns
         -------
         list of float
             List of field values.
         """
-        coords = self.coords
-        return [self.get_field_value(coord) for coord in coords]
+        if coords is None:
+            coords = self.coords
+        if not len(coords):
+            return []
+        flat = self._flat_indices(coords)
+        self._evaluate_cells(flat)
+        if not self._is_dense():
+            return [self._sparse[i] for i in flat.tolist()]
+        return self._grid.reshape(-1)[flat].tolist()
     
     def __getitem__(self, key):
         """Allow field[coordinate] access to values for tuples, otherwise delegate to parent."""
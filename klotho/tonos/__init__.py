@@ -34,6 +34,7 @@ harmonic_trees = systems.harmonic_trees
 
 from .pitch import (
     Pitch,
+    PitchArray,
     PitchCollection,
     PitchCollectionBase,
     RelativePitchCollection,
@@ -75,6 +76,7 @@ __all__ = [
     
     # Pitch Collection Classes
     'Pitch',
+    'PitchArray',
     'PitchCollection',
     'PitchCollectionBase',
     'RelativePitchCollection',
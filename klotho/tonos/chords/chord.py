@@ -10,6 +10,7 @@ from ..pitch.pitch_collections import (
     PitchCollectionBase,
     _parse_equave,
     _convert_degree,
+    _interval_to_shift,
     _resolve_reference,
 )
 from ..utils.interval_normalization import equave_reduce
@@ -169,12 +170,12 @@ class Chord(EquaveCyclicMixin, RelativePitchCollection):
         -------
         Chord
         """
-        return Chord(
+        return self._derived('root', (pitch,), lambda: Chord(
             list(self._degrees),
             self._interval_type_mode,
             self._equave,
             pitch
-        )
+        ))
 
     def transpose(self, interval) -> 'Chord':
         """
@@ -193,7 +194,8 @@ class Chord(EquaveCyclicMixin, RelativePitchCollection):
         -------
         Chord
         """
-        return self.root(self._reference_pitch.transpose(interval))
+        return self._derived('transpose', _interval_to_shift(interval),
+                             lambda: self.root(self._reference_pitch.transpose(interval)))
 
     def normalized(self) -> 'Chord':
         """
@@ -203,6 +205,9 @@ class Chord(EquaveCyclicMixin, RelativePitchCollection):
         -------
         Chord
         """
+        return self._derived('normalized', (), self._normalized)
+
+    def _normalized(self) -> 'Chord':
         if not self._degrees:
             return Chord([], self._interval_type_mode, self._equave, self._reference_pitch)
         
@@ -232,6 +237,11 @@ class Chord(EquaveCyclicMixin, RelativePitchCollection):
         -------
         Voicing
         """
+        if hasattr(index, '__iter__') and not isinstance(index, str):
+            index = [int(i) for i in index]
+        return self._derived('voicing', (index,), lambda: self._voicing(index))
+
+    def _voicing(self, index) -> 'Voicing':
         if isinstance(index, slice):
             size = len(self._degrees)
             if size == 0:
@@ -263,6 +273,9 @@ class Chord(EquaveCyclicMixin, RelativePitchCollection):
         return self._calculate_degree_with_shift(equave_shift, wrapped_index)
     
     def __invert__(self) -> 'Chord':
+        return self._derived('invert', (), self._inverted)
+
+    def _inverted(self) -> 'Chord':
         if len(self._degrees) <= 1:
             return Chord(list(self._degrees), self._interval_type_mode, self._equave, self._reference_pitch)
         
@@ -284,11 +297,12 @@ class Chord(EquaveCyclicMixin, RelativePitchCollection):
     
     def __getitem__(self, index: Union[int, slice, Sequence[int], np.ndarray]) -> Union[Pitch, IntervalType, PitchCollectionBase]:
         if isinstance(index, slice):
-            return self._getitem_slice_chord(index)
+            return self._derived('slice', (index,), lambda: self._getitem_slice_chord(index))
         
         if hasattr(index, '__iter__') and not isinstance(index, str):
             flat_indices = self._flatten_indices(index)
-            return self._getitem_sequence_chord(flat_indices)
+            return self._derived('select', tuple(flat_indices),
+                                 lambda: self._getitem_sequence_chord(flat_indices))
         
         if not isinstance(index, int):
             raise TypeError("Index must be an integer, slice, or sequence of integers")
@@ -503,20 +517,21 @@ class Voicing(RelativePitchCollection):
         -------
         Voicing
         """
-        return Voicing(
+        return self._derived('root', (pitch,), lambda: Voicing(
             list(self._degrees),
             self._interval_type_mode,
             self._equave,
             pitch
-        )
+        ))
     
     def __getitem__(self, index: Union[int, slice, Sequence[int], np.ndarray]) -> Union[Pitch, IntervalType, PitchCollectionBase]:
         if isinstance(index, slice):
-            return self._getitem_slice_sonority(index)
+            return self._derived('slice', (index,), lambda: self._getitem_slice_sonority(index))
         
         if hasattr(index, '__iter__') and not isinstance(index, str):
             flat_indices = self._flatten_indices(index)
-            return self._getitem_sequence_sonority(flat_indices)
+            return self._derived('select', tuple(flat_indices),
+                                 lambda: self._getitem_sequence_sonority(flat_indices))
         
         if not isinstance(index, int):
             raise TypeError("Index must be an integer, slice, or sequence of integers")
@@ -744,7 +759,8 @@ class ChordSequence:
         return ChordSequence([fold(chord, lo, hi) for chord in self._chords])
 
     def voice_led(self, lo=None, hi=None, *, voices=None, anchor=None,
-                  doubling='harmonic') -> 'ChordSequence':
+                  doubling='harmonic', strategy='greedy',
+                  beam=None) -> 'ChordSequence':
         """
         Return a new sequence voice-led with assignment-based minimal motion.
 
@@ -766,6 +782,11 @@ class ChordSequence:
         doubling : {'harmonic', 'nearest'} or int or iterable of int, optional
             Doubling policy for ``voices=``; see
             :func:`~klotho.tonos.chords.voice_leading.voice_lead`.
+        strategy : {'greedy', 'global'}, optional
+            Per-transition assignment (default) or a Viterbi/beam search
+            over the whole sequence.
+        beam : int or None, optional
+            Beam width for ``strategy='global'``.
 
         Returns
         -------
@@ -773,7 +794,8 @@ class ChordSequence:
         """
         from .voice_leading import voice_lead
         return ChordSequence(voice_lead(self._chords, lo, hi, voices=voices,
-                                        anchor=anchor, doubling=doubling))
+                                        anchor=anchor, doubling=doubling,
+                                        strategy=strategy, beam=beam))
 
     def __repr__(self) -> str:
         return f"ChordSequence({len(self._chords)} chords)"
@@ -7,7 +7,9 @@ sequence with assignment-based minimal total motion: for each transition
 the equave displacements of the incoming chord's degrees are chosen by
 solving an optimal-assignment problem against the previous sounded
 voicing (in log-frequency space), rather than by independent per-degree
-snapping. Both work uniformly over ratio- and cents-based collections
+snapping. ``strategy='global'`` instead runs a Viterbi (or beam) search
+over every chord's candidate voicings, minimizing motion across the
+whole progression. Both work uniformly over ratio- and cents-based collections
 (all comparison happens in Hz; displacement happens in each chord's
 native domain, so exact ``Fraction`` degrees stay exact).
 """
@@ -510,10 +512,278 @@ def _transition(collection, prev_hz, lo, hi, *, drift=None,
     return out
 
 
+# ---------------------------------------------------------------------------
+# Global (Viterbi / beam) voice leading
+# ---------------------------------------------------------------------------
+
+# Beam width used when a chord's candidates are not confined by a register
+# window (unbounded candidates cluster around the previous layer, so an
+# unpruned layer would widen by an equave per chord).
+_DEFAULT_BEAM = 16
+# Working-set budget for one block of the transition-cost tensor, and the
+# largest transition matrix kept in the per-call shape-pair memo.
+_COST_CHUNK_BYTES = 32 * 2 ** 20
+_MEMO_MAX_ENTRIES = 1 << 20
+
+
+class _Layer:
+    """Every candidate voicing of one chord, as arrays.
+
+    Row ``b`` places member ``j`` at ``degrees[j]`` displaced by
+    ``ks[b, j]`` equaves and adds the doublings ``degrees[extra_j[b, t]]``
+    displaced by ``extra_k[b, t]``; ``ln`` holds the sorted sounded
+    log-frequencies and ``node`` the transition-independent cost.
+    """
+
+    __slots__ = ('key', 'collection', 'degrees', 'ks', 'extra_j', 'extra_k',
+                 'ln', 'node', 'confined')
+
+    def realize(self, b: int) -> list:
+        c = self.collection
+        mode, equave = c._interval_type_mode, c.equave
+        out = [_displace(d, int(k), equave, mode)
+               for d, k in zip(self.degrees, self.ks[b])]
+        out.extend(_displace(self.degrees[j], int(k), equave, mode)
+                   for j, k in zip(self.extra_j[b], self.extra_k[b]))
+        return out
+
+
+def _build_layer(key, collection, degrees, ks_lists, lo_hz, hi_hz, *,
+                 n_extra=0, doubling_mode='harmonic', pool=None,
+                 confined=False):
+    """Enumerate the candidate voicings of *collection* as a :class:`_Layer`.
+
+    Members take every combination of their candidate displacements;
+    with ``n_extra`` doublings, every multiset of doubled members from
+    *pool* is tried, each double placed as :func:`_extend_to_voices`
+    places it (an equave up, else down, else in unison).
+    """
+    import numpy as np
+    from itertools import combinations_with_replacement, product
+    mode = collection._interval_type_mode
+    ref_hz = collection.reference_pitch.freq
+    log_eq = math.log(_equave_factor(collection.equave, mode))
+    m = len(degrees)
+    ln_hz = np.array([math.log(_degree_hz(d, mode, ref_hz)) for d in degrees])
+
+    ks = np.array(list(product(*ks_lists)), dtype=np.int64).reshape(-1, m)
+    node = np.zeros(len(ks))
+    if not getattr(collection, '_equave_cyclic', False) and m:
+        # non-cyclic spread preservation: distance from the nearest block
+        # transposition of the written voicing
+        med = np.median(ks, axis=1, keepdims=True)
+        node += _SPREAD_WEIGHT * log_eq * np.abs(ks - med).sum(axis=1)
+    members_ln = ln_hz + ks * log_eq
+
+    extra_j = np.zeros((len(ks), 0), dtype=np.int64)
+    extra_k = extra_j
+    extra_ln = np.zeros((len(ks), 0))
+    if n_extra:
+        combos = np.array(list(combinations_with_replacement(pool, n_extra)),
+                          dtype=np.int64)
+        n_c = len(combos)
+        ks = np.repeat(ks, n_c, axis=0)
+        node = np.repeat(node, n_c)
+        members_ln = np.repeat(members_ln, n_c, axis=0)
+        extra_j = np.tile(combos, (len(ks) // n_c, 1))
+        rows = np.arange(len(ks))[:, None]
+        placed = members_ln[rows, extra_j]
+        up_ok = (np.ones_like(placed, dtype=bool) if hi_hz is None else
+                 placed + log_eq <= math.log(hi_hz * (1 + _EPS)))
+        down_ok = (np.ones_like(placed, dtype=bool) if lo_hz is None else
+                   placed - log_eq >= math.log(lo_hz * (1 - _EPS)))
+        dk = np.where(up_ok, 1, np.where(down_ok, -1, 0))
+        extra_k = ks[rows, extra_j] + dk
+        extra_ln = placed + dk * log_eq
+        if doubling_mode == 'harmonic':
+            pen = _DOUBLING_WEIGHT * (1.0 - np.array(_doubling_scores(collection)))
+            node = node + pen[extra_j].sum(axis=1)
+
+    layer = _Layer()
+    layer.key = key
+    layer.collection = collection
+    layer.degrees = list(degrees)
+    layer.ks = ks
+    layer.extra_j = extra_j
+    layer.extra_k = extra_k
+    layer.ln = np.sort(np.concatenate([members_ln, extra_ln], axis=1), axis=1)
+    layer.node = node
+    layer.confined = confined
+    return layer
+
+
+def _motion(a, b):
+    import numpy as np
+    d = np.abs(a - b)
+    return d - _COMMON_TONE_BONUS * (d < 1e-9)
+
+
+def _transition_block(prev_ln, ln):
+    """Minimal total motion from every row of *prev_ln* to every row of *ln*.
+
+    Both hold sorted log-frequencies. On a line, some minimal matching
+    never crosses voices, so equal voice counts reduce to sorted pairing
+    and unequal counts to an order-preserving dynamic program over the
+    voices, each step vectorized across all ``(prev, next)`` pairs. As
+    in the greedy transition, every voice of the smaller side is matched
+    to a distinct voice of the larger; surplus predecessors end freely
+    and surplus incoming voices enter from their nearest predecessor.
+    """
+    import numpy as np
+    P = prev_ln[:, None, :]
+    X = ln[None, :, :]
+    n, m = P.shape[2], X.shape[2]
+    if n == m:
+        return _motion(P, X).sum(axis=2)
+    shape = (P.shape[0], X.shape[1])
+    if m < n:
+        dp = [np.zeros(shape)] + [np.full(shape, np.inf) for _ in range(m)]
+        for j in range(n):
+            for i in range(min(m, j + 1), 0, -1):
+                dp[i] = np.minimum(dp[i], dp[i - 1] + _motion(P[..., j], X[..., i - 1]))
+        return dp[m]
+    dp = [np.zeros(shape)] + [np.full(shape, np.inf) for _ in range(n)]
+    for i in range(m):
+        near = _motion(P, X[..., i:i + 1]).min(axis=2)
+        for j in range(min(n, i + 1), 0, -1):
+            dp[j] = np.minimum(dp[j] + near, dp[j - 1] + _motion(P[..., j - 1], X[..., i]))
+        dp[0] = dp[0] + near
+    return dp[n]
+
+
+def _transition_costs(prev_ln, ln):
+    """Transition-cost matrix ``(len(prev_ln), len(ln))``, built in blocks."""
+    import numpy as np
+    out = np.empty((len(prev_ln), len(ln)))
+    width = max(prev_ln.shape[1], ln.shape[1], 1)
+    step = max(1, _COST_CHUNK_BYTES // (8 * width * max(len(ln), 1)))
+    for s in range(0, len(prev_ln), step):
+        out[s:s + step] = _transition_block(prev_ln[s:s + step], ln)
+    return out
+
+
+def _voice_lead_global(chords, lo, hi, *, voices, anchors, drift_for,
+                       doubling_mode, doubling_idx_for, beam):
+    """Viterbi / beam search over candidate voicings of the whole progression.
+
+    Each chord contributes a layer of candidate voicings; the path through
+    the layers minimizing total motion plus spread and doubling penalties
+    is recovered by back-pointers. Layers are memoized per shape (chord,
+    candidate set, bounds), and transition matrices between layers confined
+    by the register window per layer pair, so a progression that revisits
+    the same chord pair pays for its tensor once. Unconfined transitions
+    are costed only from the surviving beam.
+    """
+    import numpy as np
+    bounds = {}   # reference Hz -> resolved (lo_hz, hi_hz)
+    layers = {}   # layer key -> _Layer
+    memo = {}     # (prev layer key, layer key, drift) -> cost matrix
+    steps = []    # (chord index, layer, back-pointers)
+    prev = None   # (layer, alive indices, totals of the alive candidates)
+
+    for i, c in enumerate(chords):
+        if not c._degrees:
+            continue
+        mode = c._interval_type_mode
+        ref = c.reference_pitch
+        eq = _equave_factor(c.equave, mode)
+        log_eq = math.log(eq)
+        chord_key = (mode, tuple(c._degrees), c.equave, ref.freq,
+                     bool(getattr(c, '_equave_cyclic', False)))
+        d_idx = doubling_idx_for(c)
+        drift = drift_for(i) if prev is not None else None
+        shift = drift or 0.0
+
+        if i in anchors:
+            degrees = _verbatim_degrees(c)
+            if voices is not None:
+                degrees = _extend_to_voices(degrees, c, voices, None, None,
+                                            mode, eq, doubling_mode, d_idx)
+            key = ('anchor', chord_key, len(degrees))
+            layer = layers.get(key)
+            if layer is None:
+                layer = layers[key] = _build_layer(
+                    key, c, degrees, [(0,)] * len(degrees), None, None,
+                    confined=True)
+        else:
+            if ref.freq not in bounds:
+                lo_hz = _resolve_bound(lo, ref, 'lo')
+                hi_hz = _resolve_bound(hi, ref, 'hi')
+                if lo_hz is not None and hi_hz is not None and lo_hz > hi_hz:
+                    raise ValueError(
+                        f"lo bound ({lo_hz:.2f} Hz) is above hi bound ({hi_hz:.2f} Hz)")
+                bounds[ref.freq] = (lo_hz, hi_hz)
+            lo_hz, hi_hz = bounds[ref.freq]
+            confined = (lo_hz is not None and hi_hz is not None
+                        and math.log(hi_hz / lo_hz) / log_eq >= 1 - _EPS)
+            if confined or prev is None:
+                pool_ln = []
+            else:
+                p_layer, alive, _ = prev
+                pool_ln = (np.unique(p_layer.ln[alive]) + shift).tolist()
+            degrees = list(c._degrees)
+            ks_lists = tuple(
+                tuple(_candidate_ks(_degree_hz(d, mode, ref.freq), pool_ln,
+                                    eq, log_eq, lo_hz, hi_hz))
+                for d in degrees)
+            n_extra = 0 if voices is None else voices - len(degrees)
+            pool = tuple(d_idx) if doubling_mode == 'explicit' else tuple(range(len(degrees)))
+            key = (chord_key, ks_lists, lo_hz, hi_hz, n_extra, doubling_mode, pool)
+            layer = layers.get(key)
+            if layer is None:
+                layer = layers[key] = _build_layer(
+                    key, c, degrees, ks_lists, lo_hz, hi_hz, n_extra=n_extra,
+                    doubling_mode=doubling_mode, pool=pool, confined=confined)
+
+        if prev is None:
+            total = layer.node.copy()
+            back = None
+        else:
+            p_layer, alive, p_total = prev
+            # Only confined layers recur; unconfined candidate sets follow
+            # the previous voicing, so their pairs are costed on the beam.
+            M = None
+            if p_layer.confined and layer.confined:
+                pair = (p_layer.key, layer.key, drift)
+                M = memo.get(pair)
+                if M is None and len(p_layer.ln) * len(layer.ln) <= _MEMO_MAX_ENTRIES:
+                    M = memo[pair] = _transition_costs(p_layer.ln + shift, layer.ln)
+            C = (M[alive] if M is not None
+                 else _transition_costs(p_layer.ln[alive] + shift, layer.ln))
+            scores = p_total[:, None] + C
+            arg = scores.argmin(axis=0)
+            total = scores[arg, np.arange(len(layer.ln))] + layer.node
+            back = alive[arg]
+
+        width = beam if beam is not None else (None if layer.confined else _DEFAULT_BEAM)
+        if width is not None and len(total) > width:
+            alive = np.sort(np.argpartition(total, width - 1)[:width])
+        else:
+            alive = np.arange(len(total))
+        steps.append((i, layer, back))
+        prev = (layer, alive, total[alive])
+
+    result = [Voicing([], c._interval_type_mode, c.equave, c.reference_pitch,
+                      dedupe=False) for c in chords]
+    if prev is None:
+        return result
+    layer, alive, total = prev
+    b = int(alive[int(np.argmin(total))])
+    for i, layer, back in reversed(steps):
+        c = chords[i]
+        result[i] = Voicing(layer.realize(b), c._interval_type_mode, c.equave,
+                            c.reference_pitch, dedupe=False)
+        if back is not None:
+            b = int(back[b])
+    return result
+
+
 def voice_lead(chords, lo=None, hi=None, *,
                voices: Optional[int] = None,
                anchor: Union[int, Iterable[int], None] = None,
-               doubling: Union[str, int, Iterable[int]] = 'harmonic') -> List[Voicing]:
+               doubling: Union[str, int, Iterable[int]] = 'harmonic',
+               strategy: str = 'greedy',
+               beam: Optional[int] = None) -> List[Voicing]:
     """
     Voice-lead a chord sequence with assignment-based minimal total motion.
 
@@ -563,6 +833,23 @@ def voice_lead(chords, lo=None, hi=None, *,
         doubles the root — the practice emerges from the arithmetic, not
         from style rules), trading off against motion. ``'nearest'`` uses
         pure motion. Explicit indices restrict doubling to those members.
+    strategy : {'greedy', 'global'}, optional
+        ``'greedy'`` (default) solves each transition against the voicing
+        just chosen. ``'global'`` searches the whole progression at once
+        (Viterbi over every chord's candidate voicings), so an early
+        placement that forces poor registers later loses to one that
+        keeps the line smooth throughout. The first chord is then free
+        within the bounds too, doublings are chosen jointly with the
+        placements, and each transition's motion is the optimal
+        order-preserving matching between the two sounded voicings.
+        Transition costs are computed as NumPy arrays over all candidate
+        pairs and memoized per chord-shape pair, so repeating
+        progressions are cheap.
+    beam : int or None, optional
+        ``strategy='global'`` only: keep the ``beam`` cheapest partial
+        paths per chord. ``None`` searches exhaustively wherever ``lo``
+        and ``hi`` span at least one equave (the candidate set is then
+        finite) and falls back to a beam of 16 elsewhere.
 
     Returns
     -------
@@ -573,6 +860,14 @@ def voice_lead(chords, lo=None, hi=None, *,
         return []
     for c in chords:
         _check_collection(c, 'voice_lead')
+    if strategy not in ('greedy', 'global'):
+        raise ValueError(f"strategy must be 'greedy' or 'global', got {strategy!r}")
+    if beam is not None:
+        if strategy != 'global':
+            raise ValueError("beam only applies to strategy='global'")
+        beam = int(beam)
+        if beam < 1:
+            raise ValueError(f"beam must be a positive integer, got {beam}")
 
     anchors = _normalize_anchor(anchor, len(chords))
     if voices is not None:
@@ -614,6 +909,13 @@ def voice_lead(chords, lo=None, hi=None, *,
         card = len(c._degrees)
         return [i for i in doubling_idx_raw if i < card] or list(range(card))
 
+    if strategy == 'global':
+        return _voice_lead_global(chords, lo, hi, voices=voices,
+                                  anchors=anchors, drift_for=_drift_for,
+                                  doubling_mode=doubling_mode,
+                                  doubling_idx_for=_clamp_doubling_idx,
+                                  beam=beam)
+
     result = []
     prev_hz: List[float] = []
     for i, c in enumerate(chords):
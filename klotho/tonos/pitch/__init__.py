@@ -1,4 +1,5 @@
 from .pitch import Pitch
+from .pitch_array import PitchArray
 from .pitch_collections import (
     AbsolutePitchCollection,
     IntervalType,
@@ -10,6 +11,7 @@ from .contour import Contour
 
 __all__ = [
     'Pitch',
+    'PitchArray',
     'PitchCollection',
     'PitchCollectionBase',
     'RelativePitchCollection',
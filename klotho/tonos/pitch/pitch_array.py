@@ -0,0 +1,329 @@
+from __future__ import annotations
+
+import math
+from fractions import Fraction
+from typing import Iterable, List, Optional, Union
+
+import numpy as np
+
+from .pitch import Pitch
+from ..utils.frequency_conversion import A4_Hz, A4_MIDI, PITCH_CLASSES
+
+__all__ = ['PitchArray']
+
+# Tolerance in equave-exponent space for fold placements (matches
+# ``voice_leading.fold``: pitch frequencies are rounded, so bounds need slack).
+_FOLD_EPS = 1e-4
+
+
+def _interval_factor(interval) -> float:
+    """Frequency factor of a transposition interval, as in :meth:`Pitch.transpose`."""
+    from ..types import Cent, Ratio
+    if isinstance(interval, Cent):
+        return 2.0 ** (float(interval.magnitude) / 1200.0)
+    if isinstance(interval, Ratio):
+        return float(interval.magnitude)
+    return float(Fraction(interval))
+
+
+def _bound_hz(bound, name: str) -> Optional[float]:
+    """Resolve an absolute register bound to Hz."""
+    from ..types import Frequency
+    if bound is None:
+        return None
+    if isinstance(bound, Pitch):
+        return bound.freq
+    if isinstance(bound, str):
+        return Pitch(bound).freq
+    if isinstance(bound, Frequency):
+        return float(bound.magnitude)
+    if isinstance(bound, (int, float)):
+        raise TypeError(
+            f"Bare number for '{name}' is ambiguous. Use a note name ('G3'), "
+            f"a Pitch, or frequency(hz)."
+        )
+    raise TypeError(f"Cannot interpret {name}={bound!r} as an absolute register bound")
+
+
+class PitchArray:
+    """
+    A vector of pitches stored as NumPy arrays.
+
+    Holds frequencies (and the partial number each pitch carries) in flat
+    arrays, so realizing, transposing or folding thousands of pitches is a
+    handful of array operations. Derived views — midicents, MIDI numbers,
+    cents offsets, pitch classes — are computed for the whole array at
+    once. :class:`Pitch` objects are only built on scalar access
+    (indexing with an integer, or iterating); indexing with a slice, an
+    index sequence or a boolean mask returns another ``PitchArray``.
+
+    Collections realize into a ``PitchArray`` in one call through
+    :meth:`~klotho.tonos.pitch.pitch_collections.PitchCollectionBase.realize`.
+
+    Parameters
+    ----------
+    freqs : array-like of float
+        Frequencies in Hertz.
+    partials : array-like, optional
+        Partial number (or frequency ratio) of each pitch. Exact values
+        such as ``Fraction`` are kept (in an object array). Default is 1
+        for every pitch.
+
+    Examples
+    --------
+    >>> arr = Scale(['1/1', '9/8', '5/4']).realize(range(6))
+    >>> arr.freqs.round(2)
+    array([261.63, 294.33, 327.03, 523.25, 588.66, 654.06])
+    >>> arr[1]
+    Pitch(D4 (+3.91¢), 294.33 Hz)
+    >>> arr
+    PitchArray([C4, D4 (+3.9¢), E4 (-13.7¢), C5, D5 (+3.9¢), E5 (-13.7¢)])
+    >>> arr.equave_shift(-1).midi.round(2)
+    array([48.  , 50.04, 51.86, 60.  , 62.04, 63.86])
+    """
+
+    __slots__ = ('_freqs', '_partials')
+
+    def __init__(self, freqs, partials=None):
+        f = np.array(freqs, dtype=float).reshape(-1)
+        f.flags.writeable = False
+        if partials is None:
+            p = np.ones(len(f))
+        else:
+            p = np.asarray(partials)
+            if p.dtype.kind not in 'fiub':
+                p = np.array(list(p.reshape(-1)), dtype=object)
+            p = p.reshape(-1)
+            if len(p) != len(f):
+                raise ValueError(
+                    f"partials has {len(p)} entries for {len(f)} frequencies")
+        self._freqs = f
+        self._partials = p
+
+    @classmethod
+    def _from_arrays(cls, freqs: np.ndarray, partials: np.ndarray) -> 'PitchArray':
+        out = cls.__new__(cls)
+        if freqs.flags.writeable:
+            freqs.flags.writeable = False
+        out._freqs = freqs
+        out._partials = partials
+        return out
+
+    @classmethod
+    def from_pitches(cls, pitches: Iterable[Union[Pitch, str]]) -> 'PitchArray':
+        """
+        Build from Pitch objects or note names.
+
+        Parameters
+        ----------
+        pitches : iterable of Pitch or str
+
+        Returns
+        -------
+        PitchArray
+        """
+        pitches = [Pitch(p) if isinstance(p, str) else p for p in pitches]
+        partials = [p.partial for p in pitches]
+        exact = any(not isinstance(x, (int, float)) for x in partials)
+        return cls([p.freq for p in pitches],
+                   np.array(partials, dtype=object if exact else float))
+
+    @classmethod
+    def from_midicents(cls, midicents) -> 'PitchArray':
+        """
+        Build from MIDI cent values (6900 = A4).
+
+        Parameters
+        ----------
+        midicents : array-like of float
+
+        Returns
+        -------
+        PitchArray
+        """
+        mc = np.asarray(midicents, dtype=float).reshape(-1)
+        return cls(A4_Hz * np.exp2((mc - A4_MIDI * 100) / 1200.0))
+
+    @classmethod
+    def from_midi(cls, midi_notes) -> 'PitchArray':
+        """
+        Build from MIDI note numbers (69 = A4).
+
+        Parameters
+        ----------
+        midi_notes : array-like of float
+
+        Returns
+        -------
+        PitchArray
+        """
+        return cls.from_midicents(np.asarray(midi_notes, dtype=float) * 100)
+
+    @property
+    def freqs(self) -> np.ndarray:
+        """numpy.ndarray : Frequencies in Hertz (read-only)."""
+        return self._freqs
+
+    @property
+    def partials(self) -> np.ndarray:
+        """numpy.ndarray : Partial number of each pitch (a copy)."""
+        return self._partials.copy()
+
+    @property
+    def midicents(self) -> np.ndarray:
+        """numpy.ndarray : MIDI cent value of each pitch."""
+        return 100 * (12 * np.log2(self._freqs / A4_Hz) + A4_MIDI)
+
+    def _nearest(self):
+        midi = self.midicents / 100
+        midi_round = np.round(midi)
+        return midi, midi_round
+
+    @property
+    def cents_offsets(self) -> np.ndarray:
+        """numpy.ndarray : Deviation of each pitch from 12-TET, in cents."""
+        midi, midi_round = self._nearest()
+        return np.round((midi - midi_round) * 100, 4)
+
+    @property
+    def midi(self) -> np.ndarray:
+        """numpy.ndarray : MIDI note numbers, rounded where the cents
+        offset is negligible (as :attr:`Pitch.midi`)."""
+        midi, midi_round = self._nearest()
+        return np.where(np.abs((midi - midi_round) * 100) < 0.01, midi_round, midi)
+
+    @property
+    def octaves(self) -> np.ndarray:
+        """numpy.ndarray : Octave number of each pitch (MIDI 60 = C4)."""
+        _, midi_round = self._nearest()
+        return (midi_round // 12).astype(np.int64) - 1
+
+    @property
+    def pitchclasses(self) -> List[str]:
+        """list of str : Pitch-class name of each pitch (sharps)."""
+        labels = PITCH_CLASSES.N_TET_12.names.as_sharps
+        _, midi_round = self._nearest()
+        return [labels[i] for i in (midi_round.astype(np.int64) % 12).tolist()]
+
+    def transpose(self, interval) -> 'PitchArray':
+        """
+        Return every pitch transposed by *interval*.
+
+        Parameters
+        ----------
+        interval : Fraction, int, str, Ratio, or Cent
+            As in :meth:`Pitch.transpose`. Partials are preserved.
+
+        Returns
+        -------
+        PitchArray
+        """
+        return PitchArray._from_arrays(self._freqs * _interval_factor(interval),
+                                       self._partials)
+
+    def equave_shift(self, n, equave: Union[int, Fraction, str] = '2/1') -> 'PitchArray':
+        """
+        Return every pitch shifted by *n* equaves.
+
+        Parameters
+        ----------
+        n : int or array-like of int
+            Equaves to shift; an array shifts each pitch by its own amount.
+        equave : int, Fraction, or str, optional
+            The interval of equivalence. Default is ``'2/1'``.
+
+        Returns
+        -------
+        PitchArray
+        """
+        eq = float(Fraction(equave))
+        n = np.asarray(n)
+        if n.ndim and n.shape != self._freqs.shape:
+            raise ValueError(f"n has shape {n.shape}, expected {self._freqs.shape}")
+        return PitchArray._from_arrays(self._freqs * np.power(eq, n.astype(float)),
+                                       self._partials)
+
+    def fold(self, lo=None, hi=None, equave: Union[int, Fraction, str] = '2/1') -> 'PitchArray':
+        """
+        Equave-displace every pitch until it lies within ``[lo, hi]``.
+
+        A pitch that cannot fit a window narrower than one equave takes
+        the placement nearest the window, as
+        :func:`~klotho.tonos.chords.voice_leading.fold` does.
+
+        Parameters
+        ----------
+        lo, hi : optional
+            Register bounds as a note name (``'G3'``), a :class:`Pitch` or
+            ``frequency(hz)``; either may be omitted.
+        equave : int, Fraction, or str, optional
+            The interval of equivalence. Default is ``'2/1'``.
+
+        Returns
+        -------
+        PitchArray
+        """
+        lo_hz = _bound_hz(lo, 'lo')
+        hi_hz = _bound_hz(hi, 'hi')
+        if lo_hz is not None and hi_hz is not None and lo_hz > hi_hz:
+            raise ValueError(f"lo bound ({lo_hz:.2f} Hz) is above hi bound ({hi_hz:.2f} Hz)")
+        log_eq = math.log(float(Fraction(equave)))
+        ln = np.log(self._freqs)
+        k = np.zeros(len(ln))
+        if lo_hz is not None:
+            k_lo = np.ceil((math.log(lo_hz) - ln) / log_eq - _FOLD_EPS)
+            k = np.maximum(k, k_lo)
+        if hi_hz is not None:
+            k_hi = np.floor((math.log(hi_hz) - ln) / log_eq + _FOLD_EPS)
+            k = np.minimum(k, k_hi)
+        if lo_hz is not None and hi_hz is not None:
+            # no placement fits: keep whichever neighbour is nearer the window
+            miss = k_lo > k_hi
+            below = math.log(lo_hz) - (ln + k_hi * log_eq)
+            above = (ln + k_lo * log_eq) - math.log(hi_hz)
+            k = np.where(miss, np.where(below <= above, k_hi, k_lo), k)
+        return PitchArray._from_arrays(self._freqs * np.exp(k * log_eq),
+                                       self._partials)
+
+    def to_pitches(self) -> List[Pitch]:
+        """
+        Materialize every pitch as a :class:`Pitch`.
+
+        Returns
+        -------
+        list of Pitch
+        """
+        return [self[i] for i in range(len(self))]
+
+    def __len__(self) -> int:
+        return len(self._freqs)
+
+    def __iter__(self):
+        for i in range(len(self._freqs)):
+            yield self[i]
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            partial = self._partials[index]
+            if isinstance(partial, np.generic):
+                partial = partial.item()
+            return Pitch._from_exact_freq(float(self._freqs[index]), partial)
+        if not isinstance(index, slice):
+            index = np.asarray(index)
+            if index.dtype.kind not in 'iub':
+                raise TypeError("Index must be an integer, slice, integer sequence, or boolean mask")
+        return PitchArray._from_arrays(self._freqs[index], self._partials[index])
+
+    def __array__(self, dtype=None, copy=None):
+        return np.array(self._freqs, dtype=dtype)
+
+    def __repr__(self) -> str:
+        names = []
+        head = self[:8]
+        for pc, octave, cents in zip(head.pitchclasses, head.octaves.tolist(),
+                                     head.cents_offsets.tolist()):
+            names.append(f"{pc}{octave} ({cents:+.1f}¢)" if abs(cents) > 0.01
+                         else f"{pc}{octave}")
+        if len(self) > 8:
+            names.append("...")
+        return f"PitchArray([{', '.join(names)}])"
@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import math
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from fractions import Fraction
 from typing import Iterable, List, Optional, Sequence, Union
 
 import numpy as np
 
 from .pitch import Pitch
+from .pitch_array import PitchArray
 
 
 def _interval_to_shift(interval):
@@ -112,6 +114,32 @@ def _resolve_reference(reference_pitch: Union[Pitch, str, None]) -> Pitch:
     return Pitch(reference_pitch) if isinstance(reference_pitch, str) else reference_pitch
 
 
+def _cache_key(value):
+    """A hashable, type-exact key for a derived-collection argument.
+
+    Pitches key on their full state (their own hash rounds the cents
+    offset, and equality is a frequency tolerance); containers recurse.
+    Raises ``TypeError`` for arguments with no such key.
+    """
+    if isinstance(value, Pitch):
+        return (Pitch, value.pitchclass, value.octave, value.cents_offset,
+                value.partial, value.freq)
+    if isinstance(value, (tuple, list)):
+        return (tuple, tuple(_cache_key(v) for v in value))
+    if isinstance(value, slice):
+        return (slice, _cache_key(value.start), _cache_key(value.stop), _cache_key(value.step))
+    hash(value)
+    return (type(value), value)
+
+
+# Collections derived from other collections, keyed on the source's exact
+# state plus the operation and its arguments. One bounded LRU for every
+# collection: results hold no cache of their own, so long derivation
+# chains (``c = c.transpose(...)`` in a loop) are not kept alive.
+_DERIVED_CACHE_SIZE = 1024
+_derived_cache: "OrderedDict[tuple, RelativePitchCollection]" = OrderedDict()
+
+
 class PitchCollectionBase(ABC):
     """
     Abstract base class for all pitch collections.
@@ -186,7 +214,37 @@ class PitchCollectionBase(ABC):
         when assigned to the ``freq`` pfield; wrap in ``Pattern(...)`` to
         cycle the frequencies across events instead.
         """
-        return tuple(float(p.freq) for p in self.pitches)
+        return tuple(self.realize().freqs.tolist())
+
+    def _index_array(self, indices) -> np.ndarray:
+        if indices is None:
+            return np.arange(len(self), dtype=np.int64)
+        if isinstance(indices, (int, np.integer)):
+            indices = [indices]
+        arr = np.asarray(indices)
+        if arr.dtype == object:
+            arr = np.array(self._flatten_indices(indices), dtype=np.int64)
+        return arr.astype(np.int64).reshape(-1)
+
+    def realize(self, indices: Optional[Iterable[int]] = None) -> PitchArray:
+        """
+        Realize pitches into a :class:`PitchArray` in one call.
+
+        Element ``i`` of the result equals ``self[indices[i]]`` (including
+        equave-cyclic wrapping), but no :class:`Pitch` objects are built
+        until one is accessed.
+
+        Parameters
+        ----------
+        indices : iterable of int, optional
+            Indices to realize. Default is every degree, in order.
+
+        Returns
+        -------
+        PitchArray
+        """
+        return PitchArray.from_pitches(
+            [self[i] for i in self._index_array(indices).tolist()])
 
     def equave_shift(self, n: int):
         """
@@ -297,6 +355,14 @@ class RelativePitchCollection(PitchCollectionBase):
     / ``.freqs`` are the realization. Supports equave-cyclic indexing when
     enabled.
 
+    Collections are immutable: every operation returns a new collection.
+    They compare and hash by value — type, degrees, equave, interval type,
+    cyclic indexing and reference frequency — so equal collections built
+    independently can share dictionary entries. Derived collections
+    (rootings, transpositions, slices, and the modes and inversions of
+    subclasses) are memoized in a bounded module-level LRU cache shared by
+    all collections, so repeating an operation returns the same object.
+
     Parameters
     ----------
     degrees : list of float, Fraction, int, or str
@@ -484,6 +550,54 @@ class RelativePitchCollection(PitchCollectionBase):
                     result.append(self._degrees[i] / prev_degree)
         return result
 
+    def _identity_key(self) -> tuple:
+        return (type(self), tuple(self._degrees), self._equave, self._interval_type_mode,
+                self._equave_cyclic, self._reference_pitch.freq)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, RelativePitchCollection):
+            return NotImplemented
+        return self._identity_key() == other._identity_key()
+
+    def __hash__(self) -> int:
+        return hash(self._identity_key())
+
+    def _state_key(self) -> tuple:
+        """Type-exact key of this collection's state (``1.5`` and
+        ``Fraction(3, 2)`` degrees differ), memoized on the identity of
+        the degree list and reference pitch."""
+        cached = self.__dict__.get('_state_key_cache')
+        if (cached is not None and cached[0] is self._degrees
+                and cached[1] is self._reference_pitch and cached[2] == self._equave_cyclic):
+            return cached[3]
+        key = (type(self), tuple((type(d), d) for d in self._degrees),
+               (type(self._equave), self._equave), self._interval_type_mode,
+               self._equave_cyclic, _cache_key(self._reference_pitch))
+        self.__dict__['_state_key_cache'] = (self._degrees, self._reference_pitch,
+                                             self._equave_cyclic, key)
+        return key
+
+    def _derived(self, op: str, args: tuple, build):
+        """Return ``build()``, memoized under this collection's state and
+        ``(op, args)``.
+
+        The cache is one module-level LRU of at most ``_DERIVED_CACHE_SIZE``
+        entries, so equal collections share results. Arguments without a
+        hashable key are not cached.
+        """
+        try:
+            key = (self._state_key(), op, _cache_key(args))
+        except TypeError:
+            return build()
+        value = _derived_cache.get(key)
+        if value is None:
+            value = _derived_cache[key] = build()
+            if len(_derived_cache) > _DERIVED_CACHE_SIZE:
+                _derived_cache.popitem(last=False)
+        else:
+            _derived_cache.move_to_end(key)
+        return value
+
     @property
     def is_relative(self) -> bool:
         """bool : Always True for relative collections."""
@@ -553,14 +667,16 @@ class RelativePitchCollection(PitchCollectionBase):
         -------
         RelativePitchCollection
         """
-        rooted = RelativePitchCollection(
-            list(self._degrees),
-            self._interval_type_mode,
-            self._equave,
-            pitch,
-        )
-        rooted._equave_cyclic = self._equave_cyclic
-        return rooted
+        def build():
+            rooted = RelativePitchCollection(
+                list(self._degrees),
+                self._interval_type_mode,
+                self._equave,
+                pitch,
+            )
+            rooted._equave_cyclic = self._equave_cyclic
+            return rooted
+        return self._derived('root', (pitch,), build)
 
     def transpose(self, interval) -> "RelativePitchCollection":
         """
@@ -583,15 +699,18 @@ class RelativePitchCollection(PitchCollectionBase):
         Same type as ``self``
         """
         kind, value = _interval_to_shift(interval)
-        if self._interval_type_mode == "cents":
-            delta = value if kind == 'cents' else 1200.0 * math.log2(float(value))
-            new_degrees = [d + delta for d in self._degrees]
-        else:
-            factor = value if kind == 'ratio' else 2.0 ** (value / 1200.0)
-            new_degrees = [d * factor for d in self._degrees]
-        out = type(self)(new_degrees, self._interval_type_mode, self._equave, self._reference_pitch)
-        out._equave_cyclic = self._equave_cyclic
-        return out
+
+        def build():
+            if self._interval_type_mode == "cents":
+                delta = value if kind == 'cents' else 1200.0 * math.log2(float(value))
+                new_degrees = [d + delta for d in self._degrees]
+            else:
+                factor = value if kind == 'ratio' else 2.0 ** (value / 1200.0)
+                new_degrees = [d * factor for d in self._degrees]
+            out = type(self)(new_degrees, self._interval_type_mode, self._equave, self._reference_pitch)
+            out._equave_cyclic = self._equave_cyclic
+            return out
+        return self._derived('transpose', (kind, value), build)
 
     def as_voicing(self):
         """
@@ -605,12 +724,84 @@ class RelativePitchCollection(PitchCollectionBase):
         Voicing
         """
         from klotho.tonos.chords.chord import Voicing
-        return Voicing(
+        return self._derived('as_voicing', (), lambda: Voicing(
             list(self._degrees),
             self._interval_type_mode,
             self._equave,
             self._reference_pitch,
-        )
+        ))
+
+    def _shift_row(self, equave_shift: int):
+        """Frequency factors and partials of every degree shifted by
+        *equave_shift* equaves, computed exactly as :meth:`_calculate_pitch`
+        computes them (memoized on the identity of the degree list)."""
+        cached = self.__dict__.get('_shift_rows')
+        if cached is None or cached[0] is not self._degrees or cached[1] != self._equave:
+            cached = (self._degrees, self._equave, {})
+            self.__dict__['_shift_rows'] = cached
+        rows = cached[2]
+        row = rows.get(equave_shift)
+        if row is None:
+            degrees = [self._calculate_degree_with_shift(equave_shift, i)
+                       for i in range(len(self._degrees))]
+            if self._interval_type_mode == "cents":
+                factors = np.array([2 ** (float(d) / 1200) for d in degrees])
+                partials = factors
+            else:
+                factors = np.array([float(d) for d in degrees])
+                partials = np.empty(len(degrees), dtype=object)
+                partials[:] = degrees
+            row = rows[equave_shift] = (factors, partials)
+        return row
+
+    def realize(self, indices: Optional[Iterable[int]] = None) -> PitchArray:
+        """
+        Realize pitches into a :class:`PitchArray` in one call.
+
+        Element ``i`` of the result equals ``self[indices[i]]``: cyclic
+        collections wrap out-of-range indices through equaves, the others
+        follow list indexing. Frequencies are the exact reference-times-
+        degree products ``.pitches`` carries; ratio-mode partials stay
+        exact ``Fraction`` degrees. The per-degree factors are computed once
+        per equave shift, so realizing thousands of indices costs a few
+        array gathers and no :class:`Pitch` construction.
+
+        Parameters
+        ----------
+        indices : iterable of int, optional
+            Indices to realize. Default is every degree, in order.
+
+        Returns
+        -------
+        PitchArray
+
+        Raises
+        ------
+        IndexError
+            If an index is out of range of a non-cyclic collection, or the
+            collection is empty.
+        """
+        idx = self._index_array(indices)
+        size = len(self._degrees)
+        if idx.size and size == 0:
+            raise IndexError("Cannot index an empty collection")
+        if self._equave_cyclic and size:
+            shifts, wrapped = np.divmod(idx, size)
+        else:
+            if idx.size and (idx.max() >= size or idx.min() < -size):
+                raise IndexError("collection index out of range")
+            shifts = np.zeros_like(idx)
+            wrapped = idx % size if size else idx
+        freqs = np.empty(len(idx))
+        partials = np.empty(len(idx), dtype=object if self._interval_type_mode == "ratios" else float)
+        unique, inverse = np.unique(shifts, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        for k, shift in enumerate(unique.tolist()):
+            factors, row_partials = self._shift_row(shift)
+            sel = inverse == k
+            freqs[sel] = factors[wrapped[sel]]
+            partials[sel] = row_partials[wrapped[sel]]
+        return PitchArray._from_arrays(self._reference_pitch.freq * freqs, partials)
 
     def _get_cyclic_index(self, index: int) -> tuple:
         if not self._equave_cyclic:
@@ -649,10 +840,11 @@ class RelativePitchCollection(PitchCollectionBase):
 
     def __getitem__(self, index: Union[int, slice, Sequence[int], np.ndarray]):
         if isinstance(index, slice):
-            return self._getitem_slice(index)
+            return self._derived('slice', (index,), lambda: self._getitem_slice(index))
         if hasattr(index, '__iter__') and not isinstance(index, str):
             flat_indices = self._flatten_indices(index)
-            return self._getitem_sequence(flat_indices)
+            return self._derived('select', tuple(flat_indices),
+                                 lambda: self._getitem_sequence(flat_indices))
         if not isinstance(index, int):
             raise TypeError("Index must be an integer, slice, or sequence of integers")
         return self._getitem_single(index)
@@ -856,6 +1048,39 @@ class AbsolutePitchCollection(PitchCollectionBase):
         out._equave_cyclic = self._equave_cyclic
         return out
 
+    def realize(self, indices: Optional[Iterable[int]] = None) -> PitchArray:
+        """
+        Realize pitches into a :class:`PitchArray` in one call.
+
+        Element ``i`` of the result is ``self[indices[i]]`` (cyclic
+        collections wrap indices without displacement, as indexing does).
+
+        Parameters
+        ----------
+        indices : iterable of int, optional
+            Indices to realize. Default is every pitch, in order.
+
+        Returns
+        -------
+        PitchArray
+        """
+        cached = self.__dict__.get('_pitch_array')
+        if cached is None or cached[0] is not self._pitches:
+            cached = (self._pitches, PitchArray.from_pitches(self._pitches))
+            self.__dict__['_pitch_array'] = cached
+        full = cached[1]
+        if indices is None:
+            return full
+        idx = self._index_array(indices)
+        size = len(self._pitches)
+        if self._equave_cyclic:
+            if idx.size and size == 0:
+                raise IndexError("Cannot index an empty collection")
+            idx = idx % size if size else idx
+        elif idx.size and (idx.max() >= size or idx.min() < -size):
+            raise IndexError("collection index out of range")
+        return full[idx]
+
     def __len__(self) -> int:
         return len(self._pitches)
 
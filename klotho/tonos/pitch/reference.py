@@ -82,6 +82,13 @@ class ReferencePitchAware:
             self.__dict__['_ratio_node_cache'] = cached
         return cached[1].get(reduced)
 
+    def _nodes_for_ratios(self, ratios):
+        """Batched :meth:`_node_for_ratio` (one node or None per ratio).
+
+        Subclasses with a cheaper bulk lookup override this.
+        """
+        return [self._node_for_ratio(r) for r in ratios]
+
     def chord(self, nodes, root: Union[Pitch, str, None] = None, equave=None):
         """
         Build a :class:`~klotho.tonos.chords.chord.Chord` from node
@@ -9,6 +9,7 @@ from ..pitch.pitch_collections import (
     PitchCollectionBase,
     _parse_equave,
     _convert_degree,
+    _interval_to_shift,
     _resolve_reference,
 )
 from ..utils.interval_normalization import equave_reduce
@@ -70,7 +71,6 @@ class Scale(EquaveCyclicMixin, RelativePitchCollection):
         self._equave_cyclic = True
         self._degrees = processed_degrees
         self._interval_type_mode = interval_type
-        self._mode_cache = {}
         self._reference_pitch = _resolve_reference(reference_pitch)
         self._intervals = self._compute_scale_intervals()
     
@@ -170,12 +170,12 @@ class Scale(EquaveCyclicMixin, RelativePitchCollection):
         -------
         Scale
         """
-        return Scale(
+        return self._derived('root', (pitch,), lambda: Scale(
             list(self._degrees),
             self._interval_type_mode,
             self._equave,
             pitch
-        )
+        ))
 
     def transpose(self, interval) -> 'Scale':
         """
@@ -194,7 +194,8 @@ class Scale(EquaveCyclicMixin, RelativePitchCollection):
         -------
         Scale
         """
-        return self.root(self._reference_pitch.transpose(interval))
+        return self._derived('transpose', _interval_to_shift(interval),
+                             lambda: self.root(self._reference_pitch.transpose(interval)))
 
     def mode(self, mode_number: int) -> 'Scale':
         """
@@ -212,12 +213,11 @@ class Scale(EquaveCyclicMixin, RelativePitchCollection):
             A new Scale whose degrees are rotated to begin on the
             specified degree of the original.
         """
-        if mode_number in self._mode_cache:
-            return self._mode_cache[mode_number].root(self._reference_pitch)
-
         if mode_number == 0:
             return self
-        
+        return self._derived('mode', (mode_number,), lambda: self._mode(mode_number))
+
+    def _mode(self, mode_number: int) -> 'Scale':
         size = len(self._degrees)
         if size == 0:
             return Scale([], self._interval_type_mode, self._equave, self._reference_pitch)
@@ -252,11 +252,12 @@ class Scale(EquaveCyclicMixin, RelativePitchCollection):
                         interval *= equave_value
                     modal_degrees.append(interval)
         
-        result = Scale(modal_degrees, self._interval_type_mode, self._equave, None)
-        self._mode_cache[mode_number] = result
-        return result.root(self._reference_pitch)
+        return Scale(modal_degrees, self._interval_type_mode, self._equave, self._reference_pitch)
     
     def __invert__(self) -> 'Scale':
+        return self._derived('invert', (), self._inverted)
+
+    def _inverted(self) -> 'Scale':
         if self._interval_type_mode == "cents":
             inverted = [0.0 if abs(d) < 1e-6 else self._equave - d for d in self._degrees]
         else:
@@ -269,11 +270,12 @@ class Scale(EquaveCyclicMixin, RelativePitchCollection):
     
     def __getitem__(self, index: Union[int, slice, Sequence[int], np.ndarray]) -> Union[Pitch, IntervalType, PitchCollectionBase]:
         if isinstance(index, slice):
-            return self._getitem_slice_scale(index)
+            return self._derived('slice', (index,), lambda: self._getitem_slice_scale(index))
         
         if hasattr(index, '__iter__') and not isinstance(index, str):
             flat_indices = self._flatten_indices(index)
-            return self._getitem_sequence_scale(flat_indices)
+            return self._derived('select', tuple(flat_indices),
+                                 lambda: self._getitem_sequence_scale(flat_indices))
         
         if not isinstance(index, int):
             raise TypeError("Index must be an integer, slice, or sequence of integers")
@@ -1,6 +1,6 @@
 from .combination_product_sets import CombinationProductSet
 from .master_set import MasterSet, MASTER_SETS
-from .algorithms import match_pattern, sub_cps, classify, faces
+from .algorithms import match_pattern, sub_cps, iter_sub_cps, classify, faces, iter_faces
 
 Hexany = CombinationProductSet.hexany
 Dekany = CombinationProductSet.dekany
@@ -19,6 +19,8 @@ __all__ = [
     'MASTER_SETS',
     'match_pattern',
     'sub_cps',
+    'iter_sub_cps',
     'classify',
     'faces',
+    'iter_faces',
 ]
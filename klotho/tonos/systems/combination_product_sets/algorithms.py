@@ -1,16 +1,116 @@
 import math
 import numpy as np
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
 from itertools import combinations, permutations
 
 __all__ = [
     'match_pattern',
     'sub_cps',
+    'iter_sub_cps',
     'classify',
     'faces',
+    'iter_faces',
 ]
 
 
+class _GeometryIndex:
+    """Per-CPS geometric index behind :func:`match_pattern`.
+
+    Built once per CPS (and cached on its traversal cache): node
+    positions, the rounded pairwise-distance matrix, and every distinct
+    distance collapsed to a *class* id (distances within ``1e-7`` share a
+    class).  ``pair_bits[c][i]`` is the bitset of nodes at class-``c``
+    distance from node ``i``.
+
+    A shape's signature is the sorted tuple of its pairwise distance
+    classes -- invariant under rotation, reflection and node order.  Node
+    groups with a given signature are found by growing cliques in the
+    graph of pairs whose distance appears in the signature, with the
+    signature's class counts as a budget, and memoized per signature so
+    repeated queries (including ones differing only in ``sort_by``) are
+    dictionary lookups.
+    """
+
+    def __init__(self, cps):
+        positions = cps.positions
+        self.nodes = sorted(cps.nodes())
+        self.node_to_idx = {node: i for i, node in enumerate(self.nodes)}
+        self.pos = np.array([positions[node] for node in self.nodes])
+        diff = self.pos[:, np.newaxis, :] - self.pos[np.newaxis, :, :]
+        self.dist = np.round(np.sqrt((diff ** 2).sum(axis=-1)), 8)
+        self.pos_rounded = np.round(self.pos, 8)
+
+        n = len(self.nodes)
+        iu, ju = np.triu_indices(n, k=1)
+        values = np.unique(self.dist[iu, ju])
+        class_of_value = np.zeros(len(values), dtype=np.int64)
+        for v in range(1, len(values)):
+            same = values[v] - values[v - 1] < 1e-7
+            class_of_value[v] = class_of_value[v - 1] + (0 if same else 1)
+        cls = np.full((n, n), -1, dtype=np.int64)
+        cls[iu, ju] = class_of_value[np.searchsorted(values, self.dist[iu, ju])]
+        cls[ju, iu] = cls[iu, ju]
+        self.cls = cls.tolist()
+
+        self.pair_bits = {}
+        for i, j in zip(iu.tolist(), ju.tolist()):
+            bits = self.pair_bits.setdefault(self.cls[i][j], [0] * n)
+            bits[i] |= 1 << j
+            bits[j] |= 1 << i
+        self._hits = {}
+
+    def signature(self, idx) -> tuple:
+        return tuple(sorted(self.cls[i][j] for i, j in combinations(idx, 2)))
+
+    def hits(self, signature: tuple, k: int) -> tuple:
+        """All index groups of size *k* with *signature*, lexicographic."""
+        key = (k, signature)
+        found = self._hits.get(key)
+        if found is not None:
+            return found
+        n = len(self.nodes)
+        budget = {}
+        for c in signature:
+            budget[c] = budget.get(c, 0) + 1
+        allowed = [0] * n
+        for c in budget:
+            for i, bits in enumerate(self.pair_bits.get(c, ())):
+                allowed[i] |= bits
+        cls = self.cls
+        out = []
+
+        def grow(chosen, cand):
+            need = k - len(chosen)
+            while cand:
+                if bin(cand).count('1') < need:
+                    return
+                low = cand & -cand
+                i = low.bit_length() - 1
+                cand ^= low
+                spent = [cls[i][j] for j in chosen]
+                for c in spent:
+                    budget[c] -= 1
+                if all(budget[c] >= 0 for c in spent):
+                    if need == 1:
+                        out.append(tuple(chosen) + (i,))
+                    else:
+                        grow(chosen + [i], cand & allowed[i])
+                for c in spent:
+                    budget[c] += 1
+
+        grow([], (1 << n) - 1)
+        found = self._hits[key] = tuple(out)
+        return found
+
+
+def _geometry_index(cps) -> _GeometryIndex:
+    cache = cps._traversal_cache()
+    index = cache.get('cps_geometry_index')
+    if index is None:
+        index = cache['cps_geometry_index'] = _GeometryIndex(cps)
+    return index
+
+
 def match_pattern(cps, node_ids: List[int], sort_by: str = 'position',
                   include_target: bool = False) -> List[Tuple[int, ...]]:
     """
@@ -21,6 +121,11 @@ def match_pattern(cps, node_ids: List[int], sort_by: str = 'position',
     is ordered so that ``match[i]`` occupies the same structural position as
     ``node_ids[i]``.
 
+    Candidates come from a geometric index cached on the CPS: groups
+    sharing the target's rotation-invariant distance signature are looked
+    up by hash (and computed only once per signature), then verified and
+    put in correspondence with *node_ids*.
+
     Parameters
     ----------
     cps : CombinationProductSet
@@ -46,52 +151,36 @@ def match_pattern(cps, node_ids: List[int], sort_by: str = 'position',
     if len(node_ids) < 3:
         return [tuple(node_ids)] if include_target else []
 
-    positions = cps.positions
-    all_nodes = sorted(cps.nodes())
+    index = _geometry_index(cps)
+    all_nodes = index.nodes
+    node_to_idx = index.node_to_idx
+    pos_array = index.pos
+    full_dist = index.dist
     k = len(node_ids)
-    N = len(all_nodes)
-    node_to_idx = {node: i for i, node in enumerate(all_nodes)}
-
-    pos_array = np.array([positions[node] for node in all_nodes])
-    diff = pos_array[:, np.newaxis, :] - pos_array[np.newaxis, :, :]
-    full_dist = np.round(np.sqrt((diff ** 2).sum(axis=-1)), 8)
 
     ref_idx = np.array([node_to_idx[n] for n in node_ids])
     ref_set = frozenset(ref_idx.tolist())
-    triu_i, triu_j = np.triu_indices(k, k=1)
-
-    ref_pair_dists = full_dist[ref_idx[triu_i], ref_idx[triu_j]]
-    ref_fingerprint = np.sort(ref_pair_dists)
     ref_sub = full_dist[np.ix_(ref_idx, ref_idx)]
 
-    ref_pos_rounded = np.round(pos_array[ref_idx], 8)
-    ref_pos_key = frozenset(map(tuple, ref_pos_rounded))
+    ref_pos_key = frozenset(map(tuple, index.pos_rounded[ref_idx]))
     seen_positions = {ref_pos_key}
 
-    all_cand = np.array(list(combinations(range(N), k)))
-    row_idx = all_cand[:, triu_i]
-    col_idx = all_cand[:, triu_j]
-    all_pair_dists = full_dist[row_idx, col_idx]
-    all_sorted = np.sort(all_pair_dists, axis=1)
-
-    fp_match = np.all(np.abs(all_sorted - ref_fingerprint) < 1e-7, axis=1)
-    hit_indices = np.where(fp_match)[0]
-
     matches = []
-    for ci in hit_indices:
-        cand_idx = all_cand[ci]
-        if frozenset(cand_idx.tolist()) == ref_set:
+    for cand in index.hits(index.signature(ref_idx.tolist()), k):
+        if frozenset(cand) == ref_set:
             continue
 
-        cand_pos_rounded = np.round(pos_array[cand_idx], 8)
-        pk = frozenset(map(tuple, cand_pos_rounded))
+        cand_idx = np.array(cand)
+        pk = frozenset(map(tuple, index.pos_rounded[cand_idx]))
         if pk in seen_positions:
             continue
         seen_positions.add(pk)
 
         cand_sub = full_dist[np.ix_(cand_idx, cand_idx)]
-        cand_nodes = [all_nodes[i] for i in cand_idx]
+        cand_nodes = [all_nodes[i] for i in cand]
         ordered = _find_correspondence(ref_sub, cand_sub, cand_nodes)
+        if ordered is None:
+            continue
         matches.append(tuple(ordered))
 
     ref_pts = pos_array[ref_idx]
@@ -147,9 +236,17 @@ def _cw_rotation_angle(ref_pts, match_pts):
 
 
 def _find_correspondence(ref_sub, cand_sub, candidate_nodes):
+    """Order *candidate_nodes* to match the reference shape point for point.
+
+    Returns ``None`` when no ordering makes the two distance matrices
+    agree, i.e. the candidate only shares the reference's distance
+    signature without being congruent to it.
+    """
     n = len(candidate_nodes)
     ref_profiles = [tuple(np.sort(ref_sub[i]).tolist()) for i in range(n)]
     cand_profiles = [tuple(np.sort(cand_sub[j]).tolist()) for j in range(n)]
+    if sorted(ref_profiles) != sorted(cand_profiles):
+        return None
 
     profile_to_ref = {}
     for i, p in enumerate(ref_profiles):
@@ -170,7 +267,10 @@ def _find_correspondence(ref_sub, cand_sub, candidate_nodes):
             ambiguous_groups.append((ref_positions, cand_positions))
 
     if not ambiguous_groups:
-        return ordered
+        trial = [candidate_nodes.index(node) for node in ordered]
+        if np.allclose(cand_sub[np.ix_(trial, trial)], ref_sub, atol=1e-6):
+            return ordered
+        return None
 
     fixed_map = {}
     for i in range(n):
@@ -194,15 +294,41 @@ def _find_correspondence(ref_sub, cand_sub, candidate_nodes):
         if np.allclose(permuted, ref_sub, atol=1e-6):
             return [candidate_nodes[trial[i]] for i in range(n)]
 
-    return list(candidate_nodes)
+    return None
 
 
-def sub_cps(cps, k: int, s: int) -> List[dict]:
+def _combo_index(cps):
+    """``{factor bitmask: (node, combo)}`` for combo-keyed nodes, cached per CPS.
+
+    Bit ``i`` stands for ``cps.factors[i]``, so the node for any anchor
+    plus sub-combination is one OR and one dict lookup instead of a
+    sorted-tuple rebuild.
     """
-    Enumerate all sub-CPS structures within a CPS.
+    cache = cps._traversal_cache()
+    index = cache.get('cps_combo_index')
+    if index is None:
+        bit = {f: 1 << i for i, f in enumerate(cps.factors)}
+        index = {}
+        for node, attrs in cps.nodes(data=True):
+            combo = attrs.get('combo')
+            if combo is None or not all(f in bit for f in combo):
+                continue
+            mask = 0
+            for f in combo:
+                mask |= bit[f]
+            # repeated factors (power rules) do not fit a set bitmask
+            if bin(mask).count('1') == len(combo):
+                index.setdefault(mask, (node, combo))
+        cache['cps_combo_index'] = index
+    return index
+
+
+def iter_sub_cps(cps, k: int, s: int) -> Iterator[dict]:
+    """
+    Lazily enumerate the sub-CPS structures within a CPS.
 
-    A sub-CPS is formed by fixing an *anchor* subset of factors and varying
-    the remaining *k* factors taken *s* at a time.
+    Yields the same entries, in the same order, as :func:`sub_cps`
+    without materializing the full list first.
 
     Parameters
     ----------
@@ -213,11 +339,11 @@ def sub_cps(cps, k: int, s: int) -> List[dict]:
     s : int
         Combination rank within the sub-CPS.
 
-    Returns
-    -------
-    list of dict
-        Each dict contains ``'nodes'``, ``'anchor'``, ``'varying'``,
-        and ``'combos'`` keys.
+    Yields
+    ------
+    dict
+        Entries with ``'nodes'``, ``'anchor'``, ``'varying'``, and
+        ``'combos'`` keys.
     """
     factors = list(cps.factors)
     n = len(factors)
@@ -228,42 +354,69 @@ def sub_cps(cps, k: int, s: int) -> List[dict]:
 
     anchor_size = r - s
     if anchor_size < 0 or k + anchor_size > n:
-        return []
-
-    combo_to_node = {}
-    for node, attrs in cps.nodes(data=True):
-        if 'combo' in attrs:
-            combo_to_node[attrs['combo']] = node
-
-    results = []
-    for anchor in combinations(factors, anchor_size):
-        remaining = [f for f in factors if f not in anchor]
-        for varying in combinations(remaining, k):
-            nodes = []
-            combos = []
-            for sub_combo in combinations(varying, s):
-                full_combo = tuple(sorted(list(anchor) + list(sub_combo)))
-                if full_combo in combo_to_node:
-                    nodes.append(combo_to_node[full_combo])
-                    combos.append(full_combo)
-
-            if len(nodes) == math.comb(k, s):
-                results.append({
-                    'nodes': tuple(sorted(nodes)),
-                    'anchor': anchor,
-                    'varying': varying,
-                    'combos': combos,
-                })
+        return
 
+    index = _combo_index(cps)
+    expected = math.comb(k, s)
+    sub_masks = {}
     seen = set()
-    unique = []
-    for entry in results:
-        key = entry['nodes']
-        if key not in seen:
-            seen.add(key)
-            unique.append(entry)
 
-    return unique
+    for anchor_idx in combinations(range(n), anchor_size):
+        anchor_mask = 0
+        for i in anchor_idx:
+            anchor_mask |= 1 << i
+        remaining = [i for i in range(n) if not anchor_mask >> i & 1]
+        for varying_idx in combinations(remaining, k):
+            masks = sub_masks.get(varying_idx)
+            if masks is None:
+                masks = sub_masks[varying_idx] = [
+                    sum(1 << i for i in sub) for sub in combinations(varying_idx, s)]
+            hits = [index.get(anchor_mask | m) for m in masks]
+            hits = [h for h in hits if h is not None]
+            if len(hits) != expected:
+                continue
+            nodes = tuple(sorted(node for node, _ in hits))
+            if nodes in seen:
+                continue
+            seen.add(nodes)
+            yield {
+                'nodes': nodes,
+                'anchor': tuple(factors[i] for i in anchor_idx),
+                'varying': tuple(factors[i] for i in varying_idx),
+                'combos': [combo for _, combo in hits],
+            }
+
+
+def sub_cps(cps, k: int, s: int) -> List[dict]:
+    """
+    Enumerate all sub-CPS structures within a CPS.
+
+    A sub-CPS is formed by fixing an *anchor* subset of factors and varying
+    the remaining *k* factors taken *s* at a time. Results are cached on
+    the CPS (until its structure changes); use :func:`iter_sub_cps` to
+    stream them for large factor sets.
+
+    Parameters
+    ----------
+    cps : CombinationProductSet
+        The parent CPS.
+    k : int
+        Number of varying factors in each sub-CPS.
+    s : int
+        Combination rank within the sub-CPS.
+
+    Returns
+    -------
+    list of dict
+        Each dict contains ``'nodes'``, ``'anchor'``, ``'varying'``,
+        and ``'combos'`` keys.
+    """
+    cache = cps._traversal_cache()
+    key = ('cps_sub_cps', k, s)
+    entries = cache.get(key)
+    if entries is None:
+        entries = cache[key] = tuple(iter_sub_cps(cps, k, s))
+    return [dict(e, combos=list(e['combos'])) for e in entries]
 
 
 def classify(cps, node_ids: List[int]) -> dict:
@@ -331,12 +484,82 @@ def classify(cps, node_ids: List[int]) -> dict:
     return result
 
 
+def _adjacency_bits(cps):
+    """``(nodes, bits)`` with ``bits[i]`` the neighbour bitset of ``nodes[i]``.
+
+    Two nodes are adjacent when an edge carrying a ``distance`` joins
+    them (in either direction). Cached per CPS.
+    """
+    cache = cps._traversal_cache()
+    adj = cache.get('cps_adjacency_bits')
+    if adj is None:
+        nodes = list(cps.nodes())
+        pos = {node: i for i, node in enumerate(nodes)}
+        bits = [0] * len(nodes)
+        for u, v, data in cps.edges(data=True):
+            if u != v and 'distance' in data:
+                bits[pos[u]] |= 1 << pos[v]
+                bits[pos[v]] |= 1 << pos[u]
+        adj = cache['cps_adjacency_bits'] = (nodes, bits)
+    return adj
+
+
+def iter_faces(cps, size: int) -> Iterator[Tuple[int, ...]]:
+    """
+    Lazily enumerate the fully-connected cliques of a given size.
+
+    Yields the same tuples, in the same order, as :func:`faces`.
+    Cliques grow one node at a time with adjacency bitsets: the
+    candidate set is the AND of the chosen nodes' neighbourhoods
+    restricted to later nodes, and a branch is cut as soon as it holds
+    fewer candidates than the nodes still needed.
+
+    Parameters
+    ----------
+    cps : CombinationProductSet
+        The CPS instance.
+    size : int
+        Number of nodes per face.
+
+    Yields
+    ------
+    tuple of int
+        Node IDs forming a complete subgraph.
+    """
+    nodes, bits = _adjacency_bits(cps)
+    n = len(nodes)
+    if size <= 0:
+        if size == 0:
+            yield ()
+        return
+    if size > n:
+        return
+
+    def expand(clique, cand, need):
+        while cand:
+            if bin(cand).count('1') < need:
+                return
+            low = cand & -cand
+            i = low.bit_length() - 1
+            cand ^= low
+            if need == 1:
+                yield clique + (nodes[i],)
+            else:
+                # later nodes only, so each clique comes out once in
+                # lexicographic order
+                yield from expand(clique + (nodes[i],), cand & bits[i], need - 1)
+
+    yield from expand((), (1 << n) - 1, size)
+
+
 def faces(cps, size: int) -> List[Tuple[int, ...]]:
     """
     Find all fully-connected cliques of a given size in the CPS graph.
 
     A *face* is a subset of nodes where every pair is connected by an
-    edge (a complete subgraph).
+    edge (a complete subgraph). Results are cached on the CPS (until its
+    structure changes); use :func:`iter_faces` to stream them for large
+    factor sets.
 
     Parameters
     ----------
@@ -350,18 +573,9 @@ def faces(cps, size: int) -> List[Tuple[int, ...]]:
     list of tuple of int
         Each tuple contains the node IDs forming a complete subgraph.
     """
-    G = cps
-    all_nodes = list(G.nodes())
-    result = []
-
-    for subset in combinations(all_nodes, size):
-        edge_count = 0
-        for u, v, data in G.edges(data=True):
-            if u in subset and v in subset and 'distance' in data:
-                edge_count += 1
-        undirected_edges = edge_count // 2
-        max_possible = size * (size - 1) // 2
-        if undirected_edges == max_possible:
-            result.append(subset)
-
-    return result
\ No newline at end of file
+    cache = cps._traversal_cache()
+    key = ('cps_faces', size)
+    result = cache.get(key)
+    if result is None:
+        result = cache[key] = tuple(iter_faces(cps, size))
+    return list(result)
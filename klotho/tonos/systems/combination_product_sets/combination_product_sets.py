@@ -3,28 +3,11 @@ from collections import deque
 from typing import Tuple
 from math import prod
 from fractions import Fraction
-import sympy as sp
 import rustworkx as rx
 from tabulate import tabulate
 
-
-def _sym_exp_key(expr):
-  """Canonical exponent-tuple key for a product of symbol powers.
-
-  ``(('A', 1), ('B', -1))`` for ``A/B``. Two such expressions are
-  sympy-equal iff their exponent tuples are equal (aliases are monic
-  products of symbols), which lets pair matching use tuple hashing
-  instead of sympy Mul division + expression hashing.
-  """
-  items = []
-  for base, exp in expr.as_powers_dict().items():
-    e = int(exp)
-    if e:
-      items.append((str(base), e))
-  items.sort()
-  return tuple(items)
-
 from klotho.topos.collections import CombinationSet as CS
+from klotho.topos.collections._monomial import Monomial
 from klotho.tonos.utils.interval_normalization import equave_reduce
 from klotho.tonos.pitch.reference import ReferencePitchAware
 from .master_set import MasterSet, MASTER_SETS
@@ -110,13 +93,21 @@ class CombinationProductSet(ReferencePitchAware, CS):
     self._build_master_set_structure(self._master_set_instance.relationship_dict)
     self._compute_positions()
 
-  def _populate_graph(self):
+  def _build_graph(self):
+    # nodes only, straight into a directed graph: edges come from the
+    # master set, so the base class's complete undirected graph would be
+    # built just to be thrown away
     directed = rx.PyDiGraph()
-    for idx in self._rx.node_indices():
-      directed.add_node(self._rx.get_node_data(idx))
+    directed.add_nodes_from([
+      {'label': i, 'combo': combo} for i, combo in enumerate(sorted(self._combos))])
     self._rx = directed
     self._invalidate_caches()
 
+  def _populate_graph(self):
+    # aliases are Monomials (integer exponents per factor letter), so
+    # building a CPS needs no sympy; Monomial.to_sympy() gives the
+    # expression for display
+    letters = {f: alias.exponents[0][0] for f, alias in self.factor_to_alias.items()}
     for node, attrs in self.nodes(data=True):
       if 'combo' in attrs:
         combo = attrs['combo']
@@ -126,33 +117,27 @@ class CombinationProductSet(ReferencePitchAware, CS):
         if self._normalized:
           ratio = equave_reduce(ratio / max(self._factors))
         
-        symbolic_expr = sp.Integer(1)
-        for factor in combo:
-          symbolic_expr *= self.factor_to_alias[factor]
-        
-        self._write_node_data(node, {'product': product, 'ratio': ratio, 'alias': symbolic_expr})
+        alias = Monomial((letters[factor], 1) for factor in combo)
+        self._write_node_data(node, {'product': product, 'ratio': ratio, 'alias': alias})
   
   def _build_master_set_structure(self, relationship_dict):
     if not relationship_dict:
       return
 
-    # Re-key the relationship dict by canonical exponent tuples once
-    # (O(edges)), then match pairs by integer-dict subtraction — the old
-    # loop performed a sympy Mul division and expression-hash lookup for
-    # every ordered pair (hebdomekontany: 4,830 pairs, 94% of build).
-    # The stored sympy key IS the canonical form of alias1/alias2 for a
-    # matching pair, so the edge payload is unchanged.
+    # Relationship keys and node aliases are both Monomials, so an
+    # ordered pair matches iff alias1 / alias2 is a key: one integer
+    # exponent subtraction and one tuple-hash lookup per pair. The stored
+    # key IS the canonical form of alias1/alias2 for a matching pair.
     exp_rel = {}
     for sym_key, rel_data in relationship_dict.items():
-      exp_rel[_sym_exp_key(sym_key)] = (sym_key, rel_data)
+      exp_rel[sym_key.exponents] = (sym_key, rel_data)
 
     combo_to_node = {}
     combo_to_exp = {}
     for node, attrs in self.nodes(data=True):
       if 'combo' in attrs:
         combo_to_node[attrs['combo']] = node
-        combo_to_exp[attrs['combo']] = {
-          name: e for name, e in _sym_exp_key(attrs['alias'])}
+        combo_to_exp[attrs['combo']] = dict(attrs['alias'].exponents)
 
     for c1 in self._combos:
       node1 = combo_to_node[c1]
@@ -170,7 +155,7 @@ class CombinationProductSet(ReferencePitchAware, CS):
           hit = exp_rel.get(tuple(sorted(diff.items())))
           if hit is not None:
             sym_ratio, rel_data = hit
-            self._add_edge_raw(combo_to_node[c1], combo_to_node[c2],
+            self._add_edge_raw(node1, combo_to_node[c2],
                                relation=sym_ratio,
                                angle=rel_data['angle'],
                                distance=rel_data['distance'],
@@ -276,7 +261,7 @@ class CombinationProductSet(ReferencePitchAware, CS):
 
   @property
   def aliases(self):
-    """dict : Mapping from integer factors to symbolic aliases."""
+    """dict : Mapping from integer factors to symbolic aliases (``Monomial``)."""
     return self.factor_to_alias
     
   @property
@@ -526,7 +511,7 @@ class CombinationProductSet(ReferencePitchAware, CS):
     -------
     CombinationProductSet
     """
-    aliases = {f: sp.Symbol(chr(65 + i)) for i, f in enumerate(sorted(factors))}
+    aliases = {f: Monomial.symbol(chr(65 + i)) for i, f in enumerate(sorted(factors))}
     factors_sorted = tuple(sorted(factors))
     expressions = []
     seen = set()
@@ -537,12 +522,10 @@ class CombinationProductSet(ReferencePitchAware, CS):
         r = rule[1]
         from itertools import combinations as _combs
         for combo in _combs(factors_sorted, r):
-          expr = sp.Integer(1)
+          expr = Monomial()
           for f in combo:
             expr *= aliases[f]
           product = prod(combo)
-          # monomial over factor symbols: Mul auto-canonicalization already
-          # yields the canonical form (verified 0/324 mismatches incl. hash)
           key = expr
           if key not in seen:
             seen.add(key)
@@ -553,8 +536,6 @@ class CombinationProductSet(ReferencePitchAware, CS):
         for f in factors_sorted:
           expr = aliases[f] ** k
           product = f ** k
-          # monomial over factor symbols: Mul auto-canonicalization already
-          # yields the canonical form (verified 0/324 mismatches incl. hash)
           key = expr
           if key not in seen:
             seen.add(key)
@@ -567,10 +548,10 @@ class CombinationProductSet(ReferencePitchAware, CS):
         for num_combo in _combs(factors_sorted, r_num):
           remaining = [f for f in factors_sorted if f not in num_combo]
           for den_combo in _combs(remaining, r_den):
-            num_expr = sp.Integer(1)
+            num_expr = Monomial()
             for f in num_combo:
               num_expr *= aliases[f]
-            den_expr = sp.Integer(1)
+            den_expr = Monomial()
             for f in den_combo:
               den_expr *= aliases[f]
             expr = num_expr / den_expr
@@ -1,7 +1,7 @@
 import math
-import sympy as sp
 import numpy as np
 
+from klotho.topos.collections._monomial import Monomial
 from klotho.tonos.pitch.reference import ReferencePitchAware
 
 __all__ = [
@@ -9,7 +9,7 @@ __all__ = [
     'MASTER_SETS',
 ]
 
-_ALPHA = {chr(65 + i): sp.Symbol(chr(65 + i)) for i in range(26)}
+_ALPHA = {chr(65 + i): Monomial.symbol(chr(65 + i)) for i in range(26)}
 
 
 class MasterSet(ReferencePitchAware):
@@ -90,7 +90,7 @@ class MasterSet(ReferencePitchAware):
 
     @property
     def relationship_dict(self):
-        """dict : Symbolic ratio keys mapping to angle, distance, and displacement data."""
+        """dict : Symbolic ratio keys (``Monomial``, e.g. ``A/B``) mapping to angle, distance, and displacement data."""
         return self._relationship_dict
 
     @property
@@ -4,6 +4,7 @@ from .algorithms import *
 from klotho.tonos.utils.interval_normalization import reduce_interval
 from typing import Tuple, Union
 from fractions import Fraction
+import numpy as np
 
 
 def _odd_prime_generator():
@@ -124,19 +125,35 @@ class HarmonicTree(Tree):
                 return
             parent_harmonic = self[parent]['harmonic']
 
-        def process_subtree(node, inherited_harmonic):
-            value = self[node]['factor']
-            harmonic = value * inherited_harmonic
-            self._rx[node]['multiple'] = value if value > 0 else Fraction(1, abs(value))
-            self._rx[node]['harmonic'] = harmonic
-            if self.equave is not None:
-                self._rx[node]['ratio'] = reduce_interval(Fraction(harmonic), self.equave, self.span)
-            else:
-                self._rx[node]['ratio'] = harmonic
-            for child in self.successors(node):
-                process_subtree(child, harmonic)
-
-        process_subtree(root_node, parent_harmonic)
+        # level-order pass: each depth's harmonics are one (object-dtype,
+        # so exact) array product of its factors and its parents' harmonics
+        equave, span = self.equave, self.span
+        reduced = {}
+        nodes = [root_node]
+        parents = np.zeros(1, dtype=np.intp)
+        harmonics = np.empty(1, dtype=object)
+        harmonics[0] = parent_harmonic
+        while nodes:
+            factors = np.empty(len(nodes), dtype=object)
+            factors[:] = [self._rx[node]['factor'] for node in nodes]
+            harmonics = factors * harmonics[parents]
+            next_nodes, next_parents = [], []
+            for i, (node, value, harmonic) in enumerate(zip(nodes, factors.tolist(), harmonics.tolist())):
+                data = self._rx[node]
+                data['multiple'] = value if value > 0 else Fraction(1, abs(value))
+                data['harmonic'] = harmonic
+                if equave is not None:
+                    ratio = reduced.get(harmonic)
+                    if ratio is None:
+                        ratio = reduced[harmonic] = reduce_interval(Fraction(harmonic), equave, span)
+                    data['ratio'] = ratio
+                else:
+                    data['ratio'] = harmonic
+                children = self._rx.successor_indices(node)
+                next_nodes.extend(children)
+                next_parents.extend([i] * len(children))
+            nodes = next_nodes
+            parents = np.array(next_parents, dtype=np.intp)
 
     @property
     def harmonics(self):
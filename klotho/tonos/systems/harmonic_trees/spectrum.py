@@ -1,10 +1,12 @@
 from klotho.tonos.utils.frequency_conversion import freq_to_pitchclass
 from klotho.tonos.utils.harmonics import partial_to_fundamental
-from klotho.tonos.pitch import Pitch
+from klotho.tonos.pitch import Pitch, PitchArray
 from typing import Union
 from fractions import Fraction
+from numbers import Number
 # from klotho.topos.graphs.trees import Tree
 from .harmonic_tree import HarmonicTree
+import numpy as np
 import pandas as pd
 
 class Spectrum():
@@ -15,12 +17,20 @@ class Spectrum():
     partial numbers (harmonic or non-harmonic). Provides operations for
     reinterpreting, retargeting, and modulating the spectrum.
 
+    The spectrum is held as NumPy arrays of partial numbers and
+    frequencies (sorted by partial), so building, retargeting or
+    modulating a spectrum of thousands of partials is a few array
+    operations. The :attr:`data` DataFrame and the :attr:`ht` tree are
+    built on first access.
+
     Parameters
     ----------
     fundamental : int, float, or Pitch
         The fundamental frequency (Hz) or a Pitch object.
     partials : list of int, float, or Fraction
-        Partial numbers defining the spectrum.
+        Partial numbers defining the spectrum. Nested ``(factor,
+        sub_partials)`` tuples are evaluated through a
+        :class:`HarmonicTree`.
 
     Examples
     --------
@@ -31,8 +41,59 @@ class Spectrum():
         self._fundamental = (Pitch(*freq_to_pitchclass(fundamental)) 
                            if isinstance(fundamental, (int, float)) 
                            else fundamental)
-        self._ht = HarmonicTree(self._fundamental.partial, partials)
-        self._data = self._init_data()
+        self._spec = partials
+        self._ht = None
+        self._data = None
+        self._init_arrays()
+
+    def _init_arrays(self):
+        root = self._fundamental.partial * 1
+        if all(isinstance(p, Number) for p in self._spec):
+            # flat spectra skip the tree: leaf i is node i + 1
+            harmonics = np.empty(len(self._spec), dtype=object)
+            harmonics[:] = list(self._spec)
+            harmonics = harmonics * root
+            node_ids = np.arange(1, len(harmonics) + 1)
+        else:
+            leaves = self.ht.leaf_nodes
+            harmonics = np.empty(len(leaves), dtype=object)
+            harmonics[:] = [self._ht[n]['harmonic'] for n in leaves]
+            node_ids = np.array(leaves, dtype=np.int64)
+        if len(harmonics) and not (harmonics > 0).all():
+            raise ValueError(
+                f"Partials must be positive, got {[p for p in harmonics.tolist() if not p > 0]}")
+        order = np.argsort(harmonics, kind='stable')
+        self._partials = harmonics[order]
+        self._node_ids = node_ids[order]
+        self._freqs = self._fundamental.freq * self._partials.astype(float)
+        self._freqs.flags.writeable = False
+        self._index = None
+
+    @classmethod
+    def _rescaled(cls, source: 'Spectrum', fundamental_freq: float) -> 'Spectrum':
+        """*source*'s partials over a new fundamental, without re-evaluation."""
+        out = cls.__new__(cls)
+        out._fundamental = Pitch(*freq_to_pitchclass(fundamental_freq))
+        out._spec = source.partials
+        out._ht = None
+        out._data = None
+        out._partials = source._partials
+        out._node_ids = np.arange(1, len(source._partials) + 1)
+        out._freqs = out._fundamental.freq * source._partials.astype(float)
+        out._freqs.flags.writeable = False
+        out._index = None
+        return out
+
+    def _position(self, partial, name='Partial', where='spectrum', error=ValueError) -> int:
+        if self._index is None:
+            index = {}
+            for i, p in enumerate(self._partials.tolist()):
+                index.setdefault(p, i)
+            self._index = index
+        try:
+            return self._index[partial]
+        except (KeyError, TypeError):
+            raise error(f"{name} {partial} not found in {where}") from None
 
     @property
     def fundamental(self):
@@ -42,11 +103,13 @@ class Spectrum():
     @property
     def partials(self):
         """tuple : The partial numbers present in the spectrum."""
-        return tuple(self._data['partial'])
+        return tuple(self._partials.tolist())
     
     @property
     def data(self):
         """pandas.DataFrame : Tabular data with partial, frequency, pitch, and offset columns."""
+        if self._data is None:
+            self._data = self._init_data()
         return self._data
 
     @property
@@ -56,7 +119,7 @@ class Spectrum():
         A tuple, so ``freq=spectrum.freq`` assigns the whole spectrum as
         one simultaneity when used as the ``freq`` pfield.
         """
-        return tuple(float(p.freq) for p in self._data['pitch'])
+        return tuple(self._freqs.tolist())
 
     @property
     def freqs(self) -> tuple:
@@ -66,7 +129,20 @@ class Spectrum():
     @property
     def ht(self):
         """HarmonicTree : The underlying harmonic tree structure."""
+        if self._ht is None:
+            self._ht = HarmonicTree(self._fundamental.partial, self._spec)
         return self._ht
+
+    def realize(self) -> PitchArray:
+        """
+        The spectrum as a :class:`~klotho.tonos.pitch.PitchArray`.
+
+        Returns
+        -------
+        PitchArray
+            Frequencies in partial order, each carrying its partial number.
+        """
+        return PitchArray._from_arrays(self._freqs, self._partials)
     
     def __getitem__(self, key):
         """
@@ -87,26 +163,19 @@ class Spectrum():
         KeyError
             If the partial number does not exist in the spectrum.
         """
-        if key not in self.partials:
-            raise KeyError(f"Partial {key} not found in spectrum")
-            
-        return self.data.loc[self.data['partial'] == key, 'pitch'].iloc[0]
+        i = self._position(key, error=KeyError)
+        return Pitch._from_exact_freq(float(self._freqs[i]), self._partials[i])
     
     def _init_data(self):
-        df_data = []
-        for node in self._ht.nodes:
-            harmonic = self._ht[node]['harmonic']
-            pitch = Pitch.from_freq(self._fundamental.freq * harmonic, harmonic)
-
-            if node in self._ht.leaf_nodes:
-                df_data.append({
-                    'partial': harmonic,
-                    'freq (Hz)': pitch.freq,
-                    'pitch': pitch,
-                    'cents_offset': pitch.cents_offset,
-                    'node_id': node
-                })
-        return pd.DataFrame(df_data).sort_values('partial').reset_index(drop=True)
+        pitches = [Pitch._from_exact_freq(f, p)
+                   for f, p in zip(self._freqs.tolist(), self._partials.tolist())]
+        return pd.DataFrame({
+            'partial': self._partials.tolist(),
+            'freq (Hz)': self._freqs,
+            'pitch': pitches,
+            'cents_offset': freq_to_pitchclass(self._freqs).cents_offset,
+            'node_id': self._node_ids,
+        }, columns=['partial', 'freq (Hz)', 'pitch', 'cents_offset', 'node_id'])
 
     @classmethod
     def from_target(cls, target: Pitch, partials: list[Union[int, float, Fraction]]):
@@ -167,22 +236,13 @@ class Spectrum():
         ValueError
             If either partial is not in the spectrum.
         """
-        if source_partial not in self.partials:
-            raise ValueError(f"Source partial {source_partial} not found in spectrum")
-        elif target_partial not in self.partials:
-            raise ValueError(f"Target partial {target_partial} not found in spectrum")
-        
-        source_pitch = self.data.loc[self.data['partial'] == source_partial, 'pitch'].iloc[0]
-        
-        # Create a new Pitch with the target partial instead of trying to modify the existing one
-        new_pitch = Pitch(
-            source_pitch.pitchclass,
-            source_pitch.octave,
-            source_pitch.cents_offset,
-            target_partial  # Use the target partial here
-        )
-        
-        return Spectrum.from_target(new_pitch, self.partials)
+        i = self._position(source_partial, 'Source partial')
+        self._position(target_partial, 'Target partial')
+        if target_partial == 0:
+            raise ValueError("Partial number cannot be zero")
+        freq = float(self._freqs[i])
+        fundamental = freq * abs(target_partial) if target_partial < 0 else freq / target_partial
+        return Spectrum._rescaled(self, float(fundamental))
 
     def retarget(self, partial: Union[int, float], target: Pitch) -> 'Spectrum':
         """
@@ -205,12 +265,8 @@ class Spectrum():
         ValueError
             If the partial is not in the spectrum.
         """
-        if partial not in self.partials:
-            raise ValueError(f"Partial {partial} not found in spectrum")
-        
-        ratio = target.freq / self.data['freq (Hz)'][self.data['partial'] == partial].iloc[0]
-        new_fundamental = self.fundamental.freq * ratio
-        return Spectrum(new_fundamental, self.partials)
+        ratio = target.freq / self._freqs[self._position(partial)]
+        return Spectrum._rescaled(self, float(self.fundamental.freq * ratio))
 
     def modulate(self, target: 'Spectrum', source_partial: Union[int, float], target_partial: Union[int, float]) -> 'Spectrum':
         """
@@ -235,19 +291,13 @@ class Spectrum():
         ValueError
             If either partial is not found in its respective spectrum.
         """
-        if source_partial not in self.partials:
-            raise ValueError(f"Source partial {source_partial} not found in source spectrum")
-        if target_partial not in target.partials:
-            raise ValueError(f"Target partial {target_partial} not found in target spectrum")
-        
-        source_pitch = self.data['pitch'][self.data['partial'] == source_partial].iloc[0]
-        target_pitch = target.data['pitch'][target.data['partial'] == target_partial].iloc[0]
-        ratio = target_pitch['frequency'] / source_pitch['frequency']
-        new_fundamental = self.fundamental.freq * ratio
-        return Spectrum(new_fundamental, self.partials)
+        i = self._position(source_partial, 'Source partial', 'source spectrum')
+        j = target._position(target_partial, 'Target partial', 'target spectrum')
+        ratio = target._freqs[j] / self._freqs[i]
+        return Spectrum._rescaled(self, float(self.fundamental.freq * ratio))
 
     def __str__(self) -> str:
-        df_str = str(self._data)
+        df_str = str(self.data)
         width = max(len(line) for line in df_str.split('\n'))
         border = '-' * width
         
@@ -1,13 +1,19 @@
+import bisect
+import heapq
 import itertools
 import math
+import os
 import random
+from concurrent.futures import ProcessPoolExecutor
 from fractions import Fraction
+from functools import lru_cache
 from typing import Union, List, Optional
+import numpy as np
 import pandas as pd
-import sympy as sp
 
 from klotho.utils.algorithms.ratios import is_superparticular, superparticular_base, validate_primes
 from klotho.utils.algorithms.basis import basis_matrix, monzo_from_ratio
+from klotho.utils.algorithms.integer_linalg import adjugate, is_primitive
 from klotho.tonos.utils.intervals import ratio_to_cents, fold_cents_symmetric
 from klotho.tonos.utils.interval_normalization import equave_reduce
 
@@ -64,48 +70,44 @@ def _pow_curve(x: float, curve: float) -> float:
     return x ** curve
 
 
-def _generator_complexity(
-    ratio: Fraction, 
-    monzo: sp.Matrix,
-    size_weight: float = 1.0,
-    size_curve: float = 1.0,
-    monzo_weight: float = 0.15,
-    monzo_curve: float = 1.0
+def _simplicity(
+    size: float,
+    l1: int,
+    size_weight: float,
+    size_curve: float,
+    monzo_weight: float,
+    monzo_curve: float
 ) -> float:
-    """Compute complexity/simplicity score for a single generator."""
-    p, q = ratio.numerator, ratio.denominator
-    size = math.log2(p) + math.log2(q)
-    l1 = sum(abs(int(v)) for v in monzo)
     return size_weight * _pow_curve(size, size_curve) + monzo_weight * _pow_curve(l1, monzo_curve)
 
 
-def _build_candidates(
-    primes: List[int],
+@lru_cache(maxsize=64)
+def _raw_candidate_pool(
+    primes: tuple,
     exp_bound: int,
     max_int: int,
     octave_reduce: bool,
     ratio_lo: Fraction,
     ratio_hi: Fraction,
-    candidate_cap: int,
     include_octave: bool,
-    size_weight: float,
-    size_curve: float,
-    monzo_weight: float,
-    monzo_curve: float
-) -> List[dict]:
-    """Build the candidate pool of potential generator intervals."""
-    n = len(primes)
+) -> tuple:
+    """Weight-independent candidate data, memoized across searches.
+
+    Returns ``(ratio, monzo, cents, size, l1)`` tuples in generation
+    order; only the ranking (which depends on the weights) is per call.
+    """
+    primes = list(primes)
     seen = set()
-    candidates = []
+    pool = []
+
+    def add(r, exps):
+        pool.append((r, tuple(int(e) for e in exps), ratio_to_cents(r),
+                     math.log2(r.numerator) + math.log2(r.denominator),
+                     sum(abs(int(e)) for e in exps)))
 
     if include_octave and 2 in primes:
         r2 = Fraction(2, 1)
-        m2 = monzo_from_ratio(r2, primes)
-        candidates.append({
-            "ratio": r2,
-            "monzo": m2,
-            "cents": ratio_to_cents(r2),
-        })
+        add(r2, monzo_from_ratio(r2, primes))
         seen.add((2, 1))
 
     ranges = [range(-exp_bound, exp_bound + 1) for _ in primes]
@@ -134,20 +136,40 @@ def _build_candidates(
         if key in seen:
             continue
         seen.add(key)
+        add(r, exps_red)
 
-        m = sp.Matrix(exps_red)
-        candidates.append({
-            "ratio": r,
-            "monzo": m,
-            "cents": ratio_to_cents(r),
-        })
+    return tuple(pool)
 
-    for c in candidates:
-        c["simplicity"] = _generator_complexity(
-            c["ratio"], c["monzo"],
-            size_weight=size_weight, size_curve=size_curve,
-            monzo_weight=monzo_weight, monzo_curve=monzo_curve
-        )
+
+def _build_candidates(
+    primes: List[int],
+    exp_bound: int,
+    max_int: int,
+    octave_reduce: bool,
+    ratio_lo: Fraction,
+    ratio_hi: Fraction,
+    candidate_cap: int,
+    include_octave: bool,
+    size_weight: float,
+    size_curve: float,
+    monzo_weight: float,
+    monzo_curve: float
+) -> List[dict]:
+    """Build the candidate pool of potential generator intervals."""
+    pool = _raw_candidate_pool(
+        tuple(primes), exp_bound, max_int, octave_reduce,
+        ratio_lo, ratio_hi, include_octave,
+    )
+    candidates = [
+        {
+            "ratio": r,
+            "monzo": np.array(monzo, dtype=np.int64),
+            "cents": cents,
+            "simplicity": _simplicity(size, l1, size_weight, size_curve,
+                                      monzo_weight, monzo_curve),
+        }
+        for r, monzo, cents, size, l1 in pool
+    ]
 
     candidates.sort(key=lambda d: (d["simplicity"], d["ratio"].numerator + d["ratio"].denominator))
     
@@ -157,10 +179,40 @@ def _build_candidates(
     return candidates
 
 
+@lru_cache(maxsize=4096)
+def _generator_stats(ratio: Fraction, primes: tuple) -> tuple:
+    """``(monzo, cents, size, l1)`` for one generator, memoized."""
+    monzo = tuple(int(v) for v in monzo_from_ratio(ratio, list(primes)))
+    size = math.log2(ratio.numerator) + math.log2(ratio.denominator)
+    return monzo, ratio_to_cents(ratio), size, sum(abs(v) for v in monzo)
+
+
+@lru_cache(maxsize=65536)
+def _basis_invariants(primes: tuple, generators: tuple) -> Optional[tuple]:
+    """Weight-independent linear algebra for one basis, memoized.
+
+    ``None`` for non-unimodular sets, else ``(det, A, A_inv, max_abs_inv,
+    sum_abs_inv)`` with read-only integer matrices.
+    """
+    A = basis_matrix(list(primes), list(generators))
+    if A.shape[0] != A.shape[1]:
+        return None
+    # one fraction-free Gauss-Jordan pass gives det and adj(A); for
+    # det = +/-1 the integer inverse is det * adj(A)
+    det, adj = adjugate(A)
+    if det not in (1, -1):
+        return None
+    Ainv = det * adj
+    abs_inv = np.abs(Ainv)
+    A.setflags(write=False)
+    Ainv.setflags(write=False)
+    return (det, A, Ainv,
+            int(abs_inv.max()) if abs_inv.size else 0, int(abs_inv.sum()))
+
+
 def _score_basis(
     primes: List[int],
     generators: List[Fraction],
-    A: sp.Matrix,
     size_weight: float,
     size_curve: float,
     monzo_weight: float,
@@ -180,26 +232,20 @@ def _score_basis(
     coverage: bool
 ) -> Optional[dict]:
     """Score a candidate basis. Returns None if invalid (non-unimodular)."""
-    det = int(A.det())
-    if det not in (1, -1):
+    key_primes = tuple(primes)
+    invariants = _basis_invariants(key_primes, tuple(generators))
+    if invariants is None:
         return None
-
-    Ainv = A.inv()
-    max_abs_inv = max(abs(int(x)) for x in Ainv)
-    sum_abs_inv = sum(abs(int(x)) for x in Ainv)
+    det, A, Ainv, max_abs_inv, sum_abs_inv = invariants
 
     gens = []
     for g in generators:
-        m = monzo_from_ratio(g, primes)
+        _, cents, size, l1 = _generator_stats(g, key_primes)
         gens.append({
             "ratio": g,
-            "monzo": m,
-            "cents": ratio_to_cents(g),
-            "simplicity": _generator_complexity(
-                g, m,
-                size_weight=size_weight, size_curve=size_curve,
-                monzo_weight=monzo_weight, monzo_curve=monzo_curve
-            )
+            "cents": cents,
+            "simplicity": _simplicity(size, l1, size_weight, size_curve,
+                                      monzo_weight, monzo_curve),
         })
 
     simp_sum = sum(g["simplicity"] for g in gens)
@@ -239,7 +285,7 @@ def _score_basis(
 
     return {
         "generators": [g for g in generators],
-        "generator_cents": [ratio_to_cents(g) for g in generators],
+        "generator_cents": [g["cents"] for g in gens],
         "score": total,
         "simplicity_sum": float(simp_sum),
         "conditioning_max": int(max_abs_inv),
@@ -253,6 +299,142 @@ def _score_basis(
     }
 
 
+def _result_key(scored: dict, index: tuple) -> tuple:
+    # final ranking; the candidate-index tuple reproduces the emission
+    # order an exhaustive scan's stable sort would fall back on
+    return (scored["score"], abs(scored["det"]), scored["conditioning_max"],
+            scored["simplicity_sum"], index)
+
+
+def _lower_bound_terms(ctx: dict):
+    """Per-candidate cost lower bounds and the score-independent floor.
+
+    A partial basis's final score is at least the exact simplicity of its
+    generators, plus every superparticular bonus it could earn, plus the
+    cheapest completion from later candidates, plus the smallest
+    conditioning penalty any unimodular inverse can have (every entry of
+    ``A_inv`` is bounded by max >= 1 and sum >= n). Returns ``None`` when a
+    negative conditioning or target weight makes the score unbounded
+    below, disabling pruning.
+    """
+    w = ctx["weights"]
+    if (w["conditioning_max_weight"] < 0 or w["conditioning_sum_weight"] < 0
+            or (ctx["target_cents"] and w["target_weight"] < 0)):
+        return None
+
+    def floor(weight, x0, curve):
+        return weight * _pow_curve(float(x0), curve) if curve >= 0 else 0.0
+
+    n = len(ctx["primes"])
+    const = (floor(w["conditioning_max_weight"], 1, w["conditioning_max_curve"])
+             + floor(w["conditioning_sum_weight"], n, w["conditioning_sum_curve"]))
+
+    lb = []
+    for ratio, simplicity in zip(ctx["pool"], ctx["simplicity"]):
+        bonus = 0.0
+        if w["superparticular_weight"] != 0.0 and is_superparticular(ratio):
+            n0 = superparticular_base(ratio)
+            bonus = -w["superparticular_weight"] * _pow_curve(
+                1.0 / (float(n0) ** w["superparticular_severity"]),
+                w["superparticular_curve"])
+        lb.append(simplicity + min(bonus, 0.0))
+    return lb, const
+
+
+# Work (primitivity checks plus scored bases) an "auto" search may spend
+# exhaustively before falling back to random sampling; weights that leave
+# the bound flat (e.g. zero simplicity weights) barely prune at all.
+_AUTO_SEARCH_BUDGET = 2000
+
+
+class _SearchBudgetExceeded(Exception):
+    pass
+
+
+def _branch_and_bound(ctx: dict, first_indices) -> List[tuple]:
+    """Depth-first combination search with pruning.
+
+    Visits candidate-index combinations in lexicographic order (the order
+    ``itertools.combinations`` would) restricted to the given first
+    indices, skipping any prefix that cannot extend to a unimodular
+    basis (:func:`~klotho.utils.algorithms.integer_linalg.is_primitive`)
+    or whose lower bound exceeds the current k-th best score. Returns
+    ``(key, scored)`` pairs for the local top-k; raises
+    ``_SearchBudgetExceeded`` once ``ctx["budget"]`` (if set) is spent.
+    """
+    pool = ctx["pool"]
+    monzos = ctx["monzos"]
+    fixed = ctx["fixed"]
+    fixed_monzos = ctx["fixed_monzos"]
+    need = ctx["need"]
+    top_k = ctx["top_k"]
+    n = len(ctx["primes"])
+    size = len(pool)
+
+    bounds = _lower_bound_terms(ctx)
+    if bounds is not None:
+        lb, const = bounds
+        fixed_cost = ctx["fixed_cost"] + const
+        # best[i][r]: cheapest sum of r lower bounds among candidates after i
+        best = [[0.0] * need for _ in range(size + 1)]
+        tail = []
+        for i in range(size - 1, -1, -1):
+            best[i] = [sum(tail[:r]) for r in range(need)]
+            bisect.insort(tail, lb[i])
+            del tail[need:]
+
+    heap = []  # negated scores of the current top-k
+    found = []
+    budget = ctx.get("budget")
+    work = [0]
+
+    def spend():
+        work[0] += 1
+        if budget is not None and work[0] > budget:
+            raise _SearchBudgetExceeded
+
+    def kth():
+        return -heap[0] if len(heap) >= top_k else math.inf
+
+    def visit(chosen, start, cost):
+        r = need - len(chosen)
+        if r == 0:
+            spend()
+            gens = fixed + [pool[i] for i in chosen]
+            scored = _score_basis(ctx["primes"], gens, **ctx["weights"],
+                                  target_cents=ctx["target_cents"])
+            if scored is not None:
+                found.append((_result_key(scored, tuple(chosen)), scored))
+                heapq.heappush(heap, -scored["score"])
+                if len(heap) > top_k:
+                    heapq.heappop(heap)
+            return
+        indices = first_indices if not chosen else range(start, size - r + 1)
+        for i in indices:
+            if bounds is not None:
+                c = cost + lb[i]
+                limit = kth()
+                if c + best[i][r - 1] > limit + 1e-9 * (1.0 + abs(limit)):
+                    continue
+            else:
+                c = cost
+            if len(fixed) + len(chosen) + 1 < n:
+                spend()
+                vecs = fixed_monzos + [monzos[j] for j in chosen] + [monzos[i]]
+                if not is_primitive(vecs):
+                    continue
+            visit(chosen + [i], i + 1, c)
+
+    visit([], 0, fixed_cost if bounds is not None else 0.0)
+    found.sort(key=lambda item: item[0])
+    return found[:top_k]
+
+
+def _search_task(args):
+    ctx, first_indices = args
+    return _branch_and_bound(ctx, first_indices)
+
+
 def find_generator_basis(
     primes: List[int],
     *,
@@ -267,6 +449,7 @@ def find_generator_basis(
     random_samples: int = 50000,
     seed: int = 0,
     top_k: int = 20,
+    n_jobs: Optional[int] = None,
     size_weight: float = 1.0,
     size_curve: float = 1.0,
     monzo_weight: float = 0.15,
@@ -319,13 +502,26 @@ def find_generator_basis(
     -----------------
     mode : str, default "auto"
         Search strategy: "exhaustive", "random", or "auto".
-        "auto" chooses exhaustive for small search spaces, random otherwise.
+        "exhaustive" is a branch-and-bound search: partial generator sets
+        are dropped when they cannot extend to a unimodular basis or when a
+        lower bound on their score (exact simplicity so far, cheapest
+        completion, best-case superparticular bonus and conditioning)
+        already exceeds the current ``top_k``-th best. Results are identical
+        to scoring every combination. "auto" uses it whenever the bound is
+        valid (no negative conditioning or target weights) and the search
+        finishes within a fixed work budget, and falls back to random
+        sampling otherwise.
     random_samples : int, default 50000
         Number of random samples when mode="random".
     seed : int, default 0
         Random seed for reproducibility.
     top_k : int, default 20
         Number of top-scoring bases to return.
+    n_jobs : int, optional
+        Worker processes for the exhaustive search (``-1`` for all cores).
+        Subtrees are split by first generator and their top-k lists merged
+        by (score, |det|, conditioning, simplicity, candidate order), so the
+        result does not depend on ``n_jobs``.
     
     Simplicity Scoring
     ------------------
@@ -388,8 +584,9 @@ def find_generator_basis(
         - target_term: Target cents penalty
         - conditioning_term: Conditioning penalty
         - det: Determinant (+/-1 for valid bases)
-        - A: Basis matrix
-        - A_inv: Inverse basis matrix
+        - A: Basis matrix (integer ``numpy.ndarray``)
+        - A_inv: Inverse basis matrix (integer ``numpy.ndarray``; see
+          :func:`~klotho.utils.algorithms.basis.to_sympy` for display)
         
         Sorted by score (ascending). Use standard DataFrame methods to
         sort/filter by other columns.
@@ -462,57 +659,94 @@ def find_generator_basis(
     if candidate_cap > 0 and len(pool) > candidate_cap:
         pool = pool[:candidate_cap]
     
-    if mode == "auto":
-        mode = "exhaustive" if (need <= 3 and len(pool) <= 80) else "random"
-    
-    results = []
-    
-    def emit(chosen):
-        gens = fixed + [c["ratio"] for c in chosen]
-        A = basis_matrix(primes, gens)
-        scored = _score_basis(
-            primes=primes,
-            generators=gens,
-            A=A,
-            size_weight=size_weight,
-            size_curve=size_curve,
-            monzo_weight=monzo_weight,
-            monzo_curve=monzo_curve,
-            superparticular_weight=superparticular_weight,
-            superparticular_severity=superparticular_severity,
-            superparticular_curve=superparticular_curve,
-            conditioning_max_weight=conditioning_max_weight,
-            conditioning_max_curve=conditioning_max_curve,
-            conditioning_sum_weight=conditioning_sum_weight,
-            conditioning_sum_curve=conditioning_sum_curve,
-            target_cents=target_cents,
-            target_weight=target_weight,
-            target_scale_cents=target_scale_cents,
-            target_curve=target_curve,
-            target_fold=target_fold,
-            coverage=coverage
-        )
-        if scored is not None:
-            results.append(scored)
-    
     if need < 0:
         raise ValueError("need < 0; check include_octave vs primes dimension")
     
+    weights = dict(
+        size_weight=size_weight,
+        size_curve=size_curve,
+        monzo_weight=monzo_weight,
+        monzo_curve=monzo_curve,
+        superparticular_weight=superparticular_weight,
+        superparticular_severity=superparticular_severity,
+        superparticular_curve=superparticular_curve,
+        conditioning_max_weight=conditioning_max_weight,
+        conditioning_max_curve=conditioning_max_curve,
+        conditioning_sum_weight=conditioning_sum_weight,
+        conditioning_sum_curve=conditioning_sum_curve,
+        target_weight=target_weight,
+        target_scale_cents=target_scale_cents,
+        target_curve=target_curve,
+        target_fold=target_fold,
+        coverage=coverage,
+    )
+    ctx = {
+        "primes": primes,
+        "pool": [c["ratio"] for c in pool],
+        "monzos": [c["monzo"] for c in pool],
+        "simplicity": [c["simplicity"] for c in pool],
+        "fixed": fixed,
+        "fixed_monzos": [monzo_from_ratio(g, primes) for g in fixed],
+        "fixed_cost": sum(
+            _simplicity(*_generator_stats(g, tuple(primes))[2:], size_weight,
+                        size_curve, monzo_weight, monzo_curve)
+            for g in fixed),
+        "need": need,
+        "top_k": top_k,
+        "weights": weights,
+        "target_cents": target_cents,
+    }
+    
+    if mode == "auto":
+        if need <= 3 and len(pool) <= 80:
+            mode = "exhaustive"
+        elif _lower_bound_terms(ctx) is not None:
+            # pruning keeps large prime limits exact when it bites; a
+            # search that outgrows the budget falls back to sampling
+            mode = "exhaustive"
+            ctx["budget"] = _AUTO_SEARCH_BUDGET
+        else:
+            mode = "random"
+    if mode not in ("exhaustive", "random"):
+        raise ValueError("mode must be one of: auto, exhaustive, random")
+
     if need == 0:
-        emit([])
+        scored = _score_basis(primes, fixed, **weights, target_cents=target_cents)
+        found = [] if scored is None else [((), scored)]
     elif mode == "exhaustive":
-        for chosen in itertools.combinations(pool, need):
-            emit(chosen)
-    elif mode == "random":
+        if len(pool) < need:
+            found = []
+        else:
+            firsts = list(range(len(pool) - need + 1))
+            workers = (os.cpu_count() or 1) if n_jobs == -1 else (n_jobs or 1)
+            try:
+                if workers > 1 and len(firsts) > 1:
+                    tasks = [(ctx, [i]) for i in firsts]
+                    with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as ex:
+                        found = [item for part in ex.map(_search_task, tasks) for item in part]
+                else:
+                    found = _branch_and_bound(ctx, firsts)
+                found.sort(key=lambda item: item[0])
+            except _SearchBudgetExceeded:
+                mode = "random"
+    if need > 0 and mode == "random":
         random.seed(seed)
+        found = []
         for _ in range(random_samples):
             if len(pool) >= need:
                 chosen = random.sample(pool, need)
-                emit(chosen)
-    else:
-        raise ValueError("mode must be one of: auto, exhaustive, random")
+                scored = _score_basis(primes, fixed + [c["ratio"] for c in chosen],
+                                      **weights, target_cents=target_cents)
+                if scored is not None:
+                    found.append(((scored["score"], abs(scored["det"]),
+                                   scored["conditioning_max"], scored["simplicity_sum"]), scored))
+        found.sort(key=lambda item: item[0])
     
-    results.sort(key=lambda r: (r["score"], abs(r["det"]), r["conditioning_max"], r["simplicity_sum"]))
-    results = results[:top_k]
+    results = []
+    for _, scored in found[:top_k]:
+        scored = dict(scored)
+        scored["A"] = scored["A"].copy()
+        scored["A_inv"] = scored["A_inv"].copy()
+        results.append(scored)
     
     return pd.DataFrame(results)
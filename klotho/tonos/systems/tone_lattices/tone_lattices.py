@@ -1,14 +1,14 @@
+import bisect
+import itertools
 import numbers
 from typing import List, Union, Tuple, Optional, Iterable, Literal
 from fractions import Fraction
 import warnings
-import sympy as sp
-from sympy import prime as sympy_prime, isprime
 
 from klotho.topos.graphs.lattices import Lattice
 from klotho.tonos.pitch.reference import ReferencePitchAware
 from klotho.utils.algorithms.factors import to_factors
-from klotho.utils.algorithms.exact_solve import precompute_exact_solver, solve_exact
+from klotho.utils.algorithms.integer_linalg import precompute_integer_solver, solve_integer
 
 
 class ToneLatticeLookupWarning(RuntimeWarning):
@@ -50,6 +50,10 @@ class ToneLattice(ReferencePitchAware, Lattice):
         Whether to reduce output ratios by equave. Default is True.
     equave : int, Fraction, or str, optional
         Equivalence interval. Floats are rejected. Default is 2.
+    lazy : bool, optional
+        Use an implicit lattice (see :class:`Lattice`); ratios are computed
+        per coordinate on demand. ``None`` (default) picks lazy mode for
+        lattices with more than 100,000 coordinates.
     """
     
     def __init__(
@@ -59,6 +63,7 @@ class ToneLattice(ReferencePitchAware, Lattice):
         bipolar: bool = True,
         equave_reduce: bool = True,
         equave: Union[int, Fraction, str] = 2,
+        lazy: Optional[bool] = None,
     ):
         self._equave_reduce = equave_reduce
         self._equave = self._parse_equave(equave)
@@ -75,6 +80,7 @@ class ToneLattice(ReferencePitchAware, Lattice):
             resolution=resolution,
             bipolar=bipolar,
             periodic=False,
+            lazy=lazy,
         )
 
     @classmethod
@@ -85,6 +91,7 @@ class ToneLattice(ReferencePitchAware, Lattice):
         bipolar: bool = True,
         equave_reduce: bool = True,
         equave: Union[int, Fraction, str] = 2,
+        lazy: Optional[bool] = None,
     ) -> "ToneLattice":
         """
         Build a ToneLattice from an explicit generator basis.
@@ -102,6 +109,8 @@ class ToneLattice(ReferencePitchAware, Lattice):
             generator is present, that generator axis is removed.
         equave : int | Fraction | str, optional
             Equivalence interval used for reduction.
+        lazy : bool, optional
+            Implicit (non-materialized) lattice; ``None`` decides by size.
         """
         equave_fraction = cls._parse_equave(equave)
 
@@ -122,6 +131,7 @@ class ToneLattice(ReferencePitchAware, Lattice):
             resolution=resolution,
             bipolar=bipolar,
             periodic=False,
+            lazy=lazy,
         )
         return self
 
@@ -132,7 +142,7 @@ class ToneLattice(ReferencePitchAware, Lattice):
         """
         Return a new ToneLattice with the same board but a new generator basis.
 
-        Resolution, polarity, equave, and reference pitch are carried over, so
+        Resolution, polarity, equave, laziness, and reference pitch are carried over, so
         every coordinate (and coordinate group) valid on this lattice remains
         valid on the result — only the represented ratios change.
 
@@ -153,6 +163,7 @@ class ToneLattice(ReferencePitchAware, Lattice):
             bipolar=self.bipolar,
             equave_reduce=self.equave_reduce,
             equave=self.equave,
+            lazy=self._is_lazy,
         )
         if new.dimensionality != self.dimensionality:
             raise ValueError(
@@ -191,6 +202,7 @@ class ToneLattice(ReferencePitchAware, Lattice):
     ) -> List[Fraction]:
         if dimensionality <= 0:
             raise ValueError("dimensionality must be positive")
+        from sympy import prime as sympy_prime
         generators: List[Fraction] = []
         i = 1
         while len(generators) < dimensionality:
@@ -221,17 +233,24 @@ class ToneLattice(ReferencePitchAware, Lattice):
             raise ValueError("Generators must be unique after equave-axis dropping")
 
         self._generators = parsed_generators
-        self._ratio_match_index: Optional[dict[Fraction, List[Tuple[int, ...]]]] = None
+        # per-axis {exponent: generator ** exponent} memo for _coord_to_ratio
+        self._generator_powers = [{} for _ in parsed_generators]
+        # {equave class: [(l1, coord, ratio), ...] sorted by (l1, coord)},
+        # built lazily and extended as coordinates appear
+        self._ratio_match_index: Optional[dict[Fraction, List[Tuple[int, Tuple[int, ...], Fraction]]]] = None
+        self._ratio_indexed_count = 0
         self._warned_lookup_messages: set[str] = set()
         basis_primes = set()
         self._generator_factors = [to_factors(g) for g in self._generators]
         for factors in self._generator_factors:
             basis_primes.update(factors.keys())
         self._basis_primes = sorted(basis_primes)
-        # exact-rational solver precomputed once per generator state —
-        # the matrix is fixed, only the rhs (a ratio's prime exponents)
-        # varies per query. sympy.linsolve here cost 14.5ms per ratio.
-        self._generator_solver = precompute_exact_solver(
+        # exact solver precomputed once per generator state — the matrix
+        # is fixed, only the rhs (a ratio's prime exponents) varies per
+        # query. Square systems (the common case) solve with an integer
+        # adjugate; others fall back to Fraction elimination. sympy
+        # .linsolve here cost 14.5ms per ratio.
+        self._generator_solver = precompute_integer_solver(
             [
                 [factors.get(p, 0) for factors in self._generator_factors]
                 for p in self._basis_primes
@@ -240,7 +259,7 @@ class ToneLattice(ReferencePitchAware, Lattice):
 
         equave_factors = to_factors(equave)
         self._augmented_basis_primes = sorted(basis_primes | set(equave_factors.keys()))
-        self._augmented_solver = precompute_exact_solver(
+        self._augmented_solver = precompute_integer_solver(
             [
                 [factors.get(p, 0) for factors in self._generator_factors]
                 + [equave_factors.get(p, 0)]
@@ -248,6 +267,7 @@ class ToneLattice(ReferencePitchAware, Lattice):
             ]
         )
 
+        from sympy import isprime
         self._is_monzo_basis = (
             len(self._generators) > 0
             and all(g.denominator == 1 and isprime(int(g)) for g in self._generators)
@@ -264,6 +284,9 @@ class ToneLattice(ReferencePitchAware, Lattice):
     def _node_for_ratio(self, ratio):
         return self.get_coordinates_for_ratio(ratio, lookup='first')
 
+    def _nodes_for_ratios(self, ratios):
+        return self.get_coordinates_for_ratios(ratios, lookup='first')
+
     def _custom_equave_reduce(self, interval: Union[int, float, Fraction, str]) -> Fraction:
         interval = Fraction(interval)
         equave = self._equave
@@ -310,12 +333,16 @@ class ToneLattice(ReferencePitchAware, Lattice):
     
     def _coord_to_ratio(self, coord: Tuple[int, ...]) -> Fraction:
         ratio = Fraction(1, 1)
+        powers = self._generator_powers
         for i, exp in enumerate(coord):
             if i >= len(self._generators):
                 break
             exp_int = int(exp)
             if exp_int != 0:
-                ratio *= self._generators[i] ** exp_int
+                power = powers[i].get(exp_int)
+                if power is None:
+                    power = powers[i][exp_int] = self._generators[i] ** exp_int
+                ratio *= power
         if self._equave_reduce:
             ratio = self._custom_equave_reduce(ratio)
         return ratio
@@ -363,20 +390,44 @@ class ToneLattice(ReferencePitchAware, Lattice):
         """
         return self._canonical_class(ratio)
 
+    def _ratio_index(self) -> dict:
+        """Equave-class index of the lattice's coordinates.
+
+        Maps each canonical class (:meth:`_match_key`) to its coordinates
+        as ``(l1, coord, ratio)`` entries kept sorted by L1 norm, then
+        lexicographically. Built on first use and extended incrementally:
+        only coordinates past the last indexed position of the (stably
+        ordered) coordinate iteration are indexed. On a lazy lattice this
+        is the one operation that visits every coordinate; single-ratio
+        ``"first"`` lookups that solve directly never build it.
+        """
+        index = self._ratio_match_index
+        if index is None:
+            index = self._ratio_match_index = {}
+            self._ratio_indexed_count = 0
+        total = self.number_of_nodes()
+        if self._ratio_indexed_count < total:
+            for coord in itertools.islice(self._iter_coords(), self._ratio_indexed_count, None):
+                ratio = self._coord_to_ratio(coord)
+                entry = (sum(abs(v) for v in coord), coord, ratio)
+                key = self._match_key(ratio)
+                bucket = index.get(key)
+                if bucket is None:
+                    index[key] = [entry]
+                else:
+                    bisect.insort(bucket, entry)
+            self._ratio_indexed_count = total
+        return index
+
     def _sorted_matches_for_ratio(self, ratio: Fraction) -> List[Tuple[int, ...]]:
-        if self._ratio_match_index is None:
-            ratio_index: dict[Fraction, List[Tuple[int, ...]]] = {}
-            for coord in self.coords:
-                coord_ratio = self._coord_to_ratio(coord)
-                ratio_index.setdefault(self._match_key(coord_ratio), []).append(coord)
-            self._ratio_match_index = ratio_index
-        matches = list(self._ratio_match_index.get(self._match_key(ratio), []))
+        entries = self._ratio_index().get(self._match_key(ratio), ())
         # A coordinate whose represented ratio equals the query exactly wins
         # over a nearer equave-shifted class-mate; ties break toward the
-        # origin (L1 norm), then lexicographically.
-        matches.sort(key=lambda c: (self._coord_to_ratio(c) != ratio,
-                                    sum(abs(v) for v in c), c))
-        return matches
+        # origin (L1 norm), then lexicographically (the bucket order).
+        exact = [coord for _, coord, r in entries if r == ratio]
+        if len(exact) == len(entries):
+            return exact
+        return exact + [coord for _, coord, r in entries if r != ratio]
 
     def _warn_lookup(self, message: str, warn_once: bool) -> None:
         if warn_once and message in self._warned_lookup_messages:
@@ -405,7 +456,7 @@ class ToneLattice(ReferencePitchAware, Lattice):
                 f"ratio contains primes not present in prime_basis: {sorted(missing_primes)}"
             )
         x = [ratio_factors.get(p, 0) for p in basis_primes]
-        status, y = solve_exact(solver, x)
+        status, y = solve_integer(solver, x)
         if status == 'inconsistent':
             raise ValueError("ratio is not representable with provided generators")
         if status == 'non_unique':
@@ -524,6 +575,65 @@ class ToneLattice(ReferencePitchAware, Lattice):
             )
         return None
         
+    def get_coordinates_for_ratios(
+        self,
+        ratios: Iterable[Union[int, Fraction, str]],
+        lookup: Literal["first", "unique", "all"] = "first",
+        warn: bool = True,
+        warn_once: bool = True,
+    ) -> List[Union[None, Tuple[int, ...], List[Tuple[int, ...]]]]:
+        """
+        Resolve coordinates for many ratios in one call.
+
+        Equivalent to ``[self.get_coordinates_for_ratio(r, lookup, warn,
+        warn_once) for r in ratios]``, but repeated ratios are resolved once
+        and hits are answered from the equave-class index (built on first
+        use) instead of an exact solve per ratio. Unresolved or ambiguous
+        ratios fall back to :meth:`get_coordinates_for_ratio`, so warnings
+        are the same.
+
+        Parameters
+        ----------
+        ratios : Iterable[int | Fraction | str]
+            Target ratios.
+        lookup : {"first", "unique", "all"}, optional
+            Resolution mode, as in :meth:`get_coordinates_for_ratio`.
+        warn : bool, optional
+            Emit ``ToneLatticeLookupWarning`` when lookup fails or is ambiguous.
+        warn_once : bool, optional
+            When True, suppress repeated identical warning messages per instance.
+
+        Returns
+        -------
+        list
+            One result per input ratio, in input order.
+        """
+        if lookup not in ("first", "unique", "all"):
+            raise ValueError("lookup must be one of: 'first', 'unique', 'all'")
+
+        resolved = {}
+        results = []
+        for ratio in ratios:
+            ratio = Fraction(ratio)
+            if self._equave_reduce:
+                ratio = self._custom_equave_reduce(ratio)
+            if ratio not in resolved:
+                matches = self._sorted_matches_for_ratio(ratio)
+                if matches and lookup == "first":
+                    # the exact-solve coordinate, when it exists, is the
+                    # class's unique exact match and so sorts first
+                    resolved[ratio] = matches[0]
+                elif matches and lookup == "all":
+                    resolved[ratio] = matches
+                elif len(matches) == 1:
+                    resolved[ratio] = matches[0]
+                else:
+                    resolved[ratio] = self.get_coordinates_for_ratio(
+                        ratio, lookup=lookup, warn=warn, warn_once=warn_once)
+            result = resolved[ratio]
+            results.append(list(result) if isinstance(result, list) else result)
+        return results
+
     @property
     def prime_basis(self) -> List[int]:
         """Sorted prime support inferred from active generators."""
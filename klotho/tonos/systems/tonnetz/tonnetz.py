@@ -1,5 +1,5 @@
 from fractions import Fraction
-from typing import Iterable, List, Tuple, Union
+from typing import Iterable, List, Optional, Tuple, Union
 
 from klotho.topos.shapes.polyominoes import Shape
 from ..tone_lattices.tone_lattices import ToneLattice
@@ -98,6 +98,10 @@ class Tonnetz(ToneLattice):
         Whether represented ratios are equave-reduced. Default True.
     equave : int, Fraction, or str, optional
         Interval of equivalence. Default 2.
+    lazy : bool, optional
+        Implicit board (see :class:`~klotho.topos.graphs.Lattice`) whose
+        triangular adjacency comes from the edge offsets. ``None``
+        (default) decides by size.
     """
 
     # Hooks consumed by the plotting layer: neighbor offsets defining the
@@ -121,6 +125,7 @@ class Tonnetz(ToneLattice):
         bipolar: bool = True,
         equave_reduce: bool = True,
         equave: Union[int, Fraction, str] = 2,
+        lazy: Optional[bool] = None,
     ):
         equave_fraction = self._parse_equave(equave)
         parsed_generators = [self._parse_generator(g) for g in generators]
@@ -139,6 +144,7 @@ class Tonnetz(ToneLattice):
             resolution=resolution,
             bipolar=bipolar,
             periodic=False,
+            lazy=lazy,
         )
         self._weave()
 
@@ -150,6 +156,7 @@ class Tonnetz(ToneLattice):
         bipolar: bool = True,
         equave_reduce: bool = True,
         equave: Union[int, Fraction, str] = 2,
+        lazy: Optional[bool] = None,
     ) -> "Tonnetz":
         """Build a Tonnetz from an explicit two-generator basis."""
         self = super().from_generators(
@@ -158,6 +165,7 @@ class Tonnetz(ToneLattice):
             bipolar=bipolar,
             equave_reduce=equave_reduce,
             equave=equave,
+            lazy=lazy,
         )
         self._weave()
         return self
@@ -179,6 +187,7 @@ class Tonnetz(ToneLattice):
             bipolar=self.bipolar,
             equave_reduce=self.equave_reduce,
             equave=self.equave,
+            lazy=self._is_lazy,
         )
         if new.dimensionality != self.dimensionality:
             raise ValueError(
@@ -204,6 +213,9 @@ class Tonnetz(ToneLattice):
                 f"(note that a generator equal to the equave is dropped when "
                 f"equave_reduce is True)"
             )
+        if self._is_lazy:
+            # implicit boards take their adjacency from _edge_offsets
+            return
         added = False
         for q, r in self.coords:
             other = (q + 1, r - 1)
@@ -23,6 +23,10 @@ secondary dominants at arbitrary depth in any tonality.
 (``I ii V7 bIII viiø7 V7/V ...``) over just-intonation modal shelves.
 """
 
+from functools import lru_cache
+
+import numpy as np
+
 from .pitch import Pitch
 from .scales import Scale
 from .chords import ChordSequence, Voicing
@@ -75,11 +79,13 @@ def _coerce_stencil(spec):
     return tuple(spec)
 
 
+@lru_cache(maxsize=4096)
 def parse_roman(symbol):
     """
     Split a roman-numeral symbol into its four parts.
 
     ``'bIII'`` → ``('b', 'U', 2, '')``; ``'viiø7'`` → ``('', 'L', 6, 'ø7')``.
+    Memoized: a progression's handful of distinct symbols are parsed once.
 
     Returns
     -------
@@ -98,6 +104,7 @@ def parse_roman(symbol):
     return accidental, case, _NUMERALS.index(roman.upper()), suffix
 
 
+@lru_cache(maxsize=4096)
 def plain(symbol):
     """
     Strip the quality from a roman-numeral symbol: ``'vi7'`` → ``'vi'``,
@@ -156,6 +163,19 @@ class Tonality:
     Voicing(...)
 
     Common practice is the :class:`Key` preset built on this engine.
+
+    Every symbol resolves once per tonality: the result is stored in a
+    chord table, and :meth:`compile` turns a progression into indices
+    into that table, which :meth:`realize` gathers in one step:
+
+    >>> C = Key('C4')
+    >>> ids = C.compile(['I', 'vi', 'ii7', 'V7', 'I'])
+    >>> ids
+    array([0, 1, 2, 3, 0])
+    >>> C.table
+    ('I', 'vi', 'ii7', 'V7')
+    >>> C.realize(ids, freqs=True).shape
+    (5, 4)
     """
 
     def __init__(self, tonic, scale=None, shelves=None, qualities=None,
@@ -236,6 +256,7 @@ class Tonality:
         pitch = _coerce_pitch(pitch)
         new = object.__new__(type(self))
         new.__dict__.update(self.__dict__)
+        new.__dict__.pop('_compiled', None)
         new._tonic = pitch
         if self._chords:
             factor = pitch.freq / self._tonic.freq
@@ -277,7 +298,12 @@ class Tonality:
         Explicit ``chords`` entries win; otherwise the symbol is parsed,
         its root read from the named shelf, and its quality planted on
         that root. ``X/Y`` re-roots the tonality at Y's root first.
+        Resolved symbols are kept in the chord table (see :meth:`compile`),
+        so asking again returns the same sonority.
         """
+        return self._compiled_table()[1][self._symbol_id(symbol)]
+
+    def _resolve(self, symbol):
         head, local = self._split_slash(symbol)
         if head in local._chords:
             entry = local._chords[head]
@@ -320,7 +346,104 @@ class Tonality:
 
     def progression(self, symbols):
         """Resolve a sequence of symbols to a :class:`ChordSequence`."""
-        return ChordSequence([self.chord(symbol) for symbol in symbols])
+        return self.realize(self.compile(symbols))
+
+    # ------------------------------------------------------------------
+    # Compiled progressions
+    # ------------------------------------------------------------------
+    def _compiled_table(self):
+        compiled = self.__dict__.get('_compiled')
+        if compiled is None:
+            compiled = self.__dict__['_compiled'] = ({}, [], [None])
+        return compiled
+
+    def _symbol_id(self, symbol):
+        ids, chords, _ = self._compiled_table()
+        index = ids.get(symbol)
+        if index is None:
+            chord = self._resolve(symbol)
+            index = ids[symbol] = len(chords)
+            chords.append(chord)
+        return index
+
+    @property
+    def table(self):
+        """tuple of str : The symbols resolved so far; a symbol's position
+        is its id in :meth:`compile` output."""
+        return tuple(self._compiled_table()[0])
+
+    def compile(self, symbols):
+        """
+        Compile a progression to chord-table ids.
+
+        Each distinct symbol is parsed and resolved once per tonality and
+        appended to :attr:`table`; later progressions reuse the entries.
+
+        Parameters
+        ----------
+        symbols : iterable of str
+            The progression.
+
+        Returns
+        -------
+        numpy.ndarray of int64
+            One table id per symbol, for :meth:`realize`.
+
+        Raises
+        ------
+        KeyError, ValueError
+            If a symbol does not resolve (nothing is added to the table).
+        """
+        return np.fromiter((self._symbol_id(symbol) for symbol in symbols), dtype=np.int64)
+
+    def realize(self, progression, freqs=False):
+        """
+        Realize a compiled progression.
+
+        Parameters
+        ----------
+        progression : array-like of int, or iterable of str
+            Table ids from :meth:`compile`; symbols are compiled first.
+        freqs : bool, optional
+            When True, return a frequency matrix instead of a
+            :class:`ChordSequence`.
+
+        Returns
+        -------
+        ChordSequence or numpy.ndarray
+            The sonorities in progression order, or an array of shape
+            ``(len(progression), max_voices)`` holding each chord's
+            frequencies in ascending order, right-padded with NaN.
+
+        Raises
+        ------
+        TypeError
+            If *progression* is neither integer ids nor symbols.
+        IndexError
+            If an id is negative or not in :attr:`table`.
+        """
+        ids = np.asarray(progression)
+        if ids.dtype.kind in 'OUS':
+            ids = self.compile(ids.reshape(-1).tolist())
+        elif ids.size and ids.dtype.kind not in 'iu':
+            raise TypeError("progression must be table ids or chord symbols")
+        ids = ids.reshape(-1).astype(np.int64)
+        _, chords, matrix = self._compiled_table()
+        if ids.size and (ids.min() < 0 or ids.max() >= len(chords)):
+            bad = int(ids[(ids < 0) | (ids >= len(chords))][0])
+            raise IndexError(
+                f"table id {bad} out of range for a {len(chords)}-chord table")
+        if not freqs:
+            gathered = np.empty(len(chords), dtype=object)
+            gathered[:] = chords
+            return ChordSequence(gathered[ids].tolist())
+        if matrix[0] is None or len(matrix[0]) != len(chords):
+            width = max((len(chord) for chord in chords), default=0)
+            rows = np.full((len(chords), width), np.nan)
+            for i, chord in enumerate(chords):
+                rows[i, :len(chord)] = chord.realize().freqs
+            matrix[0] = rows
+        return matrix[0][ids]
 
     def interface(self, functions=None):
         """
@@ -55,6 +55,29 @@ _PitchclassResult = namedtuple('result', ['pitchclass', 'octave', 'cents_offset'
 # hoisted: namedtuple() generates a class via exec — doing that per call
 # cost ~300us under every pitch materialization
 
+# |x * 10**n - (k + 0.5)| below this counts as a near-tie in _round_array
+_TIE_SLACK = 1e-6
+
+
+def _round_array(x: np.ndarray, ndigits: int) -> np.ndarray:
+  """
+  Round every entry of *x* to *ndigits* decimals exactly as builtin ``round``.
+
+  ``np.round`` scales by ``10**ndigits`` before rounding, so values lying
+  within float error of a decimal tie can land on the other side of it.
+  Those few entries are re-rounded with the builtin; the rest already agree.
+  """
+  x = np.asarray(x, dtype=float)
+  out = np.round(x, ndigits)
+  scaled = x * 10.0 ** ndigits
+  near = np.abs(scaled - np.floor(scaled) - 0.5) < _TIE_SLACK
+  near &= np.isfinite(x)
+  if ndigits < 0:
+    near[...] = np.isfinite(x)
+  for i in np.flatnonzero(near):
+    out.flat[i] = round(float(x.flat[i]), ndigits)
+  return out
+
 def freq_to_midicents(frequency: float) -> float:
   """
   Convert a frequency in Hertz to MIDI cents notation.
@@ -65,19 +88,24 @@ def freq_to_midicents(frequency: float) -> float:
 
   Parameters
   ----------
-  frequency : float
-      The frequency in Hertz.
+  frequency : float or array-like of float
+      The frequency in Hertz.  Arrays are converted elementwise in one
+      pass (to within one ulp of the scalar result).
 
   Returns
   -------
-  float
+  float or numpy.ndarray
       The MIDI cent value.
 
   Examples
   --------
   >>> freq_to_midicents(440.0)
   6900.0
+  >>> freq_to_midicents([220.0, 880.0])
+  array([5700., 8100.])
   """
+  if np.ndim(frequency):
+    return 100 * (12 * np.log2(np.asarray(frequency, dtype=float) / A4_Hz) + A4_MIDI)
   return 100 * (12 * math.log2(frequency / A4_Hz) + A4_MIDI)
 
 def midicents_to_freq(midicents: float) -> float:
@@ -86,12 +114,13 @@ def midicents_to_freq(midicents: float) -> float:
 
   Parameters
   ----------
-  midicents : float
-      The MIDI cent value (e.g., 6900 for A4).
+  midicents : float or array-like of float
+      The MIDI cent value (e.g., 6900 for A4).  Arrays are converted
+      elementwise.
 
   Returns
   -------
-  float
+  float or numpy.ndarray
       The corresponding frequency in Hertz.
 
   Examples
@@ -99,6 +128,8 @@ def midicents_to_freq(midicents: float) -> float:
   >>> midicents_to_freq(6900)
   440.0
   """
+  if np.ndim(midicents):
+    midicents = np.asarray(midicents, dtype=float)
   return A4_Hz * (2 ** ((midicents - A4_MIDI * 100) / 1200.0))
 
 def midicents_to_pitchclass(midicents: float) -> namedtuple:
@@ -107,15 +138,17 @@ def midicents_to_pitchclass(midicents: float) -> namedtuple:
 
   Parameters
   ----------
-  midicents : float
+  midicents : float or array-like of float
       The MIDI cent value.
 
   Returns
   -------
   namedtuple
       A named tuple with fields ``pitchclass``, ``octave``, and
-      ``cents_offset``.
+      ``cents_offset``.  For array input each field is an array.
   """
+  if np.ndim(midicents):
+    return _pitchclass_arrays(np.asarray(midicents, dtype=float) / 100, 4)
   result = _PitchclassResult
   PITCH_LABELS = PITCH_CLASSES.N_TET_12.names.as_sharps
   midi = midicents / 100
@@ -133,7 +166,7 @@ def freq_to_pitchclass(freq: float, cent_round: int = 4) -> namedtuple:
 
     Parameters
     ----------
-    freq : float
+    freq : float or array-like of float
         The frequency in Hertz.
     cent_round : int, optional
         Decimal places for rounding the cents offset. Default is 4.
@@ -142,8 +175,11 @@ def freq_to_pitchclass(freq: float, cent_round: int = 4) -> namedtuple:
     -------
     namedtuple
         A named tuple with fields ``pitchclass``, ``octave``, and
-        ``cents_offset``.
+        ``cents_offset``.  For array input each field is an array.
     """
+    if np.ndim(freq):
+        midi = A4_MIDI + 12 * np.log2(np.asarray(freq, dtype=float) / A4_Hz)
+        return _pitchclass_arrays(midi, cent_round)
     result = _PitchclassResult
     PITCH_LABELS = PITCH_CLASSES.N_TET_12.names.as_sharps
     n_PITCH_LABELS = len(PITCH_LABELS)
@@ -156,6 +192,15 @@ def freq_to_pitchclass(freq: float, cent_round: int = 4) -> namedtuple:
     
     return result(pitch_label, octave, round(cents_diff, cent_round))
 
+def _pitchclass_arrays(midi: np.ndarray, cent_round: int) -> namedtuple:
+    """Array form of the pitch-class split shared by the two converters above."""
+    labels = np.array(PITCH_CLASSES.N_TET_12.names.as_sharps)
+    midi_round = np.round(midi)
+    octave = (midi_round // len(labels)).astype(np.int64) - 1
+    pitch_label = labels[midi_round.astype(np.int64) % len(labels)]
+    cents_diff = (midi - midi_round) * 100
+    return _PitchclassResult(pitch_label, octave, _round_array(cents_diff, cent_round))
+
 def pitchclass_to_freq(pitchclass: str, octave: int = 4, cent_offset: float = 0.0, hz_round: int = 4, A4_Hz=A4_Hz, A4_MIDI=A4_MIDI):
     """
     Convert a pitch class name to a frequency in Hertz.
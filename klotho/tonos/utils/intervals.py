@@ -1,15 +1,16 @@
+from klotho.utils.algorithms import factors as _factors
 from klotho.utils.algorithms.factors import to_factors
 from typing import Union, List, Tuple, Dict, Set
 from collections import namedtuple
 from functools import lru_cache
 from fractions import Fraction
 import numpy as np
-from sympy import Rational, root
 
 A4_Hz   = 440.0
 A4_MIDI = 69
 
 from klotho.utils.data_structures.enums import DirectValueEnumMeta, Enum  
+from klotho.tonos.utils.frequency_conversion import _round_array
 
 __all__ = [
     'ratio_to_cents',
@@ -29,7 +30,45 @@ __all__ = [
     'ratios_n_tet'
 ]
 
-def ratio_to_cents(ratio: Union[int, float, Fraction, str], round_to: int = 4) -> float:
+def _ratio_arrays(ratio, denominator=None) -> Tuple[np.ndarray, np.ndarray]:
+  """
+  Split array input into integer numerator and denominator arrays.
+
+  *ratio* is either an integer array (with *denominator* an integer array
+  it broadcasts against, default 1) or an array of exact ratios (``int``,
+  ``Fraction`` or ``str``), which is parsed once per entry.  Floats raise
+  ``TypeError``: their binary expansion does not name a ratio.
+  """
+  num = np.asarray(ratio)
+  if denominator is None and (num.dtype == object or num.dtype.kind in 'US'):
+    fracs = [None if isinstance(x, float) else Fraction(x) for x in num.ravel().tolist()]
+    if any(f is None for f in fracs):
+      raise TypeError("Exact ratios (int, Fraction, or str) are required; floats are ambiguous")
+    den = np.array([f.denominator for f in fracs], dtype=np.int64).reshape(num.shape)
+    num = np.array([f.numerator for f in fracs], dtype=np.int64).reshape(num.shape)
+  else:
+    den = np.ones((), dtype=np.int64) if denominator is None else np.asarray(denominator)
+  if num.dtype.kind not in 'iu' or den.dtype.kind not in 'iu':
+    raise TypeError("Integer numerators and denominators are required; floats are ambiguous")
+  num, den = np.broadcast_arrays(num.astype(np.int64), den.astype(np.int64))
+  if (den == 0).any():
+    raise ZeroDivisionError("ratio denominator is zero")
+  return num, den
+
+def _ratio_floats(ratio, denominator=None) -> np.ndarray:
+  """Float value of each ratio, as ``numerator / denominator`` rounds it."""
+  if denominator is None:
+    arr = np.asarray(ratio)
+    if arr.dtype.kind in 'fiub':
+      return arr.astype(float)
+    if arr.dtype == object or arr.dtype.kind in 'US':
+      fracs = [Fraction(x) for x in arr.ravel().tolist()]
+      return np.array([f.numerator / f.denominator for f in fracs]).reshape(arr.shape)
+  num, den = _ratio_arrays(ratio, denominator)
+  return num / den
+
+def ratio_to_cents(ratio: Union[int, float, Fraction, str, np.ndarray], round_to: int = 4,
+                   denominator: Union[int, np.ndarray, None] = None) -> Union[float, np.ndarray]:
   """
   Convert a musical interval ratio to cents.
 
@@ -37,21 +76,30 @@ def ratio_to_cents(ratio: Union[int, float, Fraction, str], round_to: int = 4) -
 
   Parameters
   ----------
-  ratio : int, float, Fraction, or str
-      The interval ratio (e.g., ``'3/2'``, ``1.5``).
+  ratio : int, float, Fraction, str, or array-like
+      The interval ratio (e.g., ``'3/2'``, ``1.5``).  Arrays of floats,
+      integers or exact ratios are converted in one vectorized pass.
   round_to : int, optional
       Decimal places to round the result. Default is 4.
+  denominator : int or array-like of int, optional
+      When given, *ratio* holds the numerators and this the denominators
+      (integer arrays that broadcast together).
 
   Returns
   -------
-  float
+  float or numpy.ndarray
       The interval size in cents.
 
   Examples
   --------
   >>> float(ratio_to_cents('3/2'))
   701.955
+
+  >>> ratio_to_cents([3, 5, 7], denominator=[2, 4, 4])
+  array([701.955 , 386.3137, 968.8259])
   """
+  if denominator is not None or np.ndim(ratio):
+    return np.round(1200 * np.log2(_ratio_floats(ratio, denominator)), round_to)
   # bad...
   # if isinstance(ratio, str):
   #   numerator, denominator = map(float, ratio.split('/'))
@@ -71,12 +119,12 @@ def cents_to_ratio(cents: float) -> str:
 
   Parameters
   ----------
-  cents : float
+  cents : float or array-like of float
       The interval in cents.
 
   Returns
   -------
-  float
+  float or numpy.ndarray
       The corresponding frequency ratio.
 
   Examples
@@ -84,6 +132,8 @@ def cents_to_ratio(cents: float) -> str:
   >>> cents_to_ratio(1200)
   2.0
   """
+  if np.ndim(cents):
+    cents = np.asarray(cents, dtype=float)
   return 2 ** (cents / 1200)
 
 def cents_to_setclass(cent_value: float = 0.0, n_tet: int = 12, round_to: int = 2) -> float:
@@ -92,7 +142,7 @@ def cents_to_setclass(cent_value: float = 0.0, n_tet: int = 12, round_to: int =
 
    Parameters
    ----------
-   cent_value : float, optional
+   cent_value : float or array-like of float, optional
        Interval in cents. Default is 0.0.
    n_tet : int, optional
        Number of equal divisions per octave. Default is 12.
@@ -101,9 +151,11 @@ def cents_to_setclass(cent_value: float = 0.0, n_tet: int = 12, round_to: int =
 
    Returns
    -------
-   float
+   float or numpy.ndarray
        The pitch-class number.
    """
+   if np.ndim(cent_value):
+      return _round_array(np.mod(np.asarray(cent_value, dtype=float) / 100, n_tet), round_to)
    return round((cent_value / 100)  % n_tet, round_to)
 
 def fold_cents_symmetric(cents: float) -> float:
@@ -121,12 +173,12 @@ def fold_cents_symmetric(cents: float) -> float:
 
     Parameters
     ----------
-    cents : float
+    cents : float or array-like of float
         Cents value to fold.
 
     Returns
     -------
-    float
+    float or numpy.ndarray
         Folded cents value in range [0, 600].
 
     Examples
@@ -143,6 +195,9 @@ def fold_cents_symmetric(cents: float) -> float:
     >>> fold_cents_symmetric(-316.0)  # negative minor third
     316.0
     """
+    if np.ndim(cents):
+        c = np.mod(np.abs(np.asarray(cents, dtype=float)), 1200.0)
+        return np.where(c <= 600.0, c, 1200.0 - c)
     c = abs(cents) % 1200.0
     return c if c <= 600.0 else 1200.0 - c
 
@@ -152,8 +207,8 @@ def ratio_to_setclass(ratio: Union[str, float], n_tet: int = 12, round_to: int =
 
   Parameters
   ----------
-  ratio : str or float
-      The interval ratio (e.g., ``'3/2'``).
+  ratio : str, float, or array-like
+      The interval ratio (e.g., ``'3/2'``), or an array of them.
   n_tet : int, optional
       Number of equal divisions per octave. Default is 12.
   round_to : int, optional
@@ -161,7 +216,7 @@ def ratio_to_setclass(ratio: Union[str, float], n_tet: int = 12, round_to: int =
 
   Returns
   -------
-  float
+  float or numpy.ndarray
       The pitch-class number.
   """
   return cents_to_setclass(ratio_to_cents(ratio), n_tet, round_to)
@@ -286,7 +341,7 @@ def harmonic_distance(ratio: Union[int, float, Fraction, str]) -> float:
     return float(np.log2(p * q))
 
 
-def indigestibility(n: int) -> float:
+def indigestibility(n: Union[int, np.ndarray]) -> Union[float, np.ndarray]:
     """
     Compute Barlow's indigestibility of a positive integer.
 
@@ -297,13 +352,15 @@ def indigestibility(n: int) -> float:
 
     Parameters
     ----------
-    n : int
-        A positive integer.  ``indigestibility(1)`` is ``0.0``.
+    n : int or array-like of int
+        A positive integer.  ``indigestibility(1)`` is ``0.0``.  Arrays
+        are evaluated elementwise in one pass over the smallest-prime-
+        factor sieve (see :func:`~klotho.utils.algorithms.factors.set_sieve_limit`).
 
     Returns
     -------
-    float
-        The indigestibility ξ(n).
+    float or numpy.ndarray
+        The indigestibility ξ(n), with the shape of ``n``.
 
     Raises
     ------
@@ -323,7 +380,12 @@ def indigestibility(n: int) -> float:
 
     >>> round(indigestibility(5), 4)
     6.4
+
+    >>> indigestibility([1, 2, 4])
+    array([0., 1., 2.])
     """
+    if np.ndim(n):
+        return _indigestibility_array(n)
     n = int(n)
     if n < 1:
         raise ValueError(f"indigestibility requires a positive integer, got {n}")
@@ -340,7 +402,52 @@ def _indigestibility_cached(n: int) -> float:
     return 2.0 * total
 
 
-def harmonicity(ratio: Union[int, Fraction, str]) -> float:
+def _indigestibility_array(n) -> np.ndarray:
+    """Elementwise indigestibility, walking every entry's prime factors at once.
+
+    Each pass divides the still-composite entries by their smallest prime
+    factor (read from the sieve) as often as it divides, adding the same
+    ``a * (p - 1)**2 / p`` terms in the same ascending-prime order as the
+    scalar path, so results agree bit for bit. Entries above the sieve
+    limit fall back to the scalar path.
+    """
+    arr = np.asarray(n)
+    if arr.dtype.kind not in 'iu':
+        if arr.dtype.kind == 'f' and np.all(arr == np.floor(arr)):
+            arr = arr.astype(np.int64)
+        else:
+            raise TypeError(f"indigestibility requires integers, got dtype {arr.dtype}")
+    arr = arr.astype(np.int64)
+    if arr.size and arr.min() < 1:
+        raise ValueError(
+            f"indigestibility requires positive integers, got {int(arr.min())}")
+    flat = arr.ravel()
+    big = flat > _factors._SIEVE_LIMIT
+    m = np.where(big, 1, flat)
+    total = np.zeros(len(flat))
+    if m.size:
+        spf = _factors._sieve(int(m.max()))
+        idx = np.flatnonzero(m > 1)
+        while idx.size:
+            mm = m[idx]
+            p = spf[mm].astype(np.int64)
+            a = np.zeros(len(idx), dtype=np.int64)
+            div = np.ones(len(idx), dtype=bool)
+            while div.any():
+                mm[div] //= p[div]
+                a[div] += 1
+                div = mm % p == 0
+            m[idx] = mm
+            total[idx] += a * (p - 1) ** 2 / p
+            idx = idx[mm > 1]
+    out = 2.0 * total
+    for i in np.flatnonzero(big):
+        out[i] = _indigestibility_cached(int(flat[i]))
+    return out.reshape(arr.shape)
+
+
+def harmonicity(ratio: Union[int, Fraction, str, np.ndarray],
+                denominator: Union[int, np.ndarray, None] = None) -> Union[float, np.ndarray]:
     """
     Compute Barlow's harmonicity of a ratio.
 
@@ -355,15 +462,21 @@ def harmonicity(ratio: Union[int, Fraction, str]) -> float:
 
     Parameters
     ----------
-    ratio : int, Fraction, or str
+    ratio : int, Fraction, str, or array-like
         The ratio to measure.  Strings like ``'3/2'`` are accepted.
         Exact (rational) input is required; floats are rejected because
-        their binary expansion does not name the intended ratio.
+        their binary expansion does not name the intended ratio.  With
+        ``denominator``, this is the numerator (or an array of them).
+    denominator : int or array-like of int, optional
+        Denominators for a vectorized evaluation: ``harmonicity(num, den)``
+        broadcasts the two integer arrays, reduces each pair to lowest
+        terms and evaluates every ratio in one sieve pass.  An array
+        ``ratio`` without ``denominator`` is evaluated elementwise.
 
     Returns
     -------
-    float
-        The signed Barlow harmonicity.
+    float or numpy.ndarray
+        The signed Barlow harmonicity (an array for array input).
 
     Examples
     --------
@@ -372,7 +485,12 @@ def harmonicity(ratio: Union[int, Fraction, str]) -> float:
 
     >>> harmonicity(1)
     inf
+
+    >>> harmonicity([3, 4, 1], [2, 3, 1]).round(4)
+    array([ 0.2727, -0.2143,     inf])
     """
+    if denominator is not None or np.ndim(ratio):
+        return _harmonicity_array(ratio, denominator)
     if isinstance(ratio, float):
         raise TypeError(
             "harmonicity requires an exact ratio (int, Fraction, or str); "
@@ -389,25 +507,49 @@ def harmonicity(ratio: Union[int, Fraction, str]) -> float:
     return sign / denom
 
 
-def logarithmic_distance(a: Union[int, float, Fraction, str], b: Union[int, float, Fraction, str],
-                         equave: Union[int, float, Fraction, str] = 2) -> float:
+def _harmonicity_array(ratio, denominator):
+    num, den = _ratio_arrays(ratio, denominator)
+    num, den = np.abs(num), np.abs(den)
+    g = np.gcd(num, den)
+    g = np.where(g == 0, 1, g)
+    xi_p = _indigestibility_array(num // g)
+    xi_q = _indigestibility_array(den // g)
+    total = xi_p + xi_q
+    with np.errstate(divide='ignore', invalid='ignore'):
+        out = np.where(total == 0.0, np.inf, np.sign(xi_p - xi_q) / total)
+    if out.ndim == 0:
+        return float(out)
+    return out
+
+
+def logarithmic_distance(a: Union[int, Fraction, str, np.ndarray], b: Union[int, Fraction, str, np.ndarray],
+                         equave: Union[int, float, Fraction, str] = 2) -> Union[float, np.ndarray]:
     """
     Calculate the logarithmic distance between two musical intervals.
 
     Parameters
     ----------
-    a : int, float, Fraction, or str
+    a : int, Fraction, str, or array-like
         First interval.
-    b : int, float, Fraction, or str
-        Second interval.
+    b : int, Fraction, str, or array-like
+        Second interval.  If either is an array (of integers or exact
+        ratios) the distances are computed elementwise, broadcasting.
     equave : int, float, Fraction, or str, optional
         Base for logarithmic scaling. Default is 2 (octave).
 
     Returns
     -------
-    float
+    float or numpy.ndarray
         The absolute logarithmic distance.
     """
+    if np.ndim(a) or np.ndim(b):
+        n1, d1 = _ratio_arrays(np.asarray(a, dtype=object) if np.ndim(a) == 0 else a)
+        n2, d2 = _ratio_arrays(np.asarray(b, dtype=object) if np.ndim(b) == 0 else b)
+        # r2 / r1 = (n2 * d1) / (d2 * n1), reduced so the quotient rounds like Fraction
+        num, den = n2 * d1, d2 * n1
+        g = np.gcd(num, den)
+        g = np.where(g == 0, 1, g)
+        return np.abs(np.log((num // g) / (den // g)) / np.log(float(equave)))
     match a:
         case int() as i:
             r1 = Fraction(i, 1)
@@ -485,7 +627,7 @@ def interval_cost(a: Union[int, float, Fraction, str], b: Union[int, float, Frac
 
     return diff_coeff * log_dist + prime_coeff * prime_diff
 
-def n_tet(divisions: int = 12, equave: Union[int, float, Fraction, str] = 2, nth_division: int = 1, symbolic: bool = False) -> Union[float, Rational]:
+def n_tet(divisions: int = 12, equave: Union[int, float, Fraction, str] = 2, nth_division: int = 1, symbolic: bool = False) -> Union[float, 'sympy.Rational']:
     """
     Calculate the frequency ratio of the *nth* step in an equal temperament.
 
@@ -506,10 +648,11 @@ def n_tet(divisions: int = 12, equave: Union[int, float, Fraction, str] = 2, nth
     float or sympy.Rational
         The frequency ratio.
     """
+    from sympy import Rational, root
     ratio = root(Fraction(equave), Rational(divisions)) ** nth_division
     return ratio if symbolic else float(ratio)
 
-def ratios_n_tet(divisions: int = 12, equave: Union[int, float, Fraction, str] = 2, symbolic: bool = False) -> List[Union[float, Rational]]:
+def ratios_n_tet(divisions: int = 12, equave: Union[int, float, Fraction, str] = 2, symbolic: bool = False) -> List[Union[float, 'sympy.Rational']]:
   """
   Return all step ratios for an equal temperament.
 
@@ -1,7 +1,9 @@
 from .sequences import *
 from .sets import *
+from .set_classes import *
 from .patterns import *
 
 from . import sequences
 from . import sets
+from . import set_classes
 from . import patterns
\ No newline at end of file
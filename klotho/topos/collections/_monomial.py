@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, Tuple, Union
+
+__all__ = ['Monomial']
+
+
+class Monomial:
+    """Product of named symbols with integer exponents, e.g. ``A*B/C``.
+
+    The symbolic aliases of combination sets and CPS nodes are always
+    monomials over single-letter factor names, so they are stored as a
+    sorted tuple of ``(name, exponent)`` pairs rather than sympy
+    expressions: products, quotients and powers are integer additions,
+    equality and hashing are tuple operations, and building a CPS never
+    touches sympy.  ``str()`` matches sympy's printing; :meth:`to_sympy`
+    builds the real expression (importing sympy) when it is needed for
+    display or algebra.
+
+    Parameters
+    ----------
+    terms : mapping or iterable of (str, int), optional
+        Exponent per symbol name; zero exponents are dropped.
+
+    Examples
+    --------
+    >>> A, B, C = (Monomial.symbol(s) for s in 'ABC')
+    >>> A * B / C
+    A*B/C
+    >>> (A * B / C).exponents
+    (('A', 1), ('B', 1), ('C', -1))
+    >>> B / (A * C) ** 2
+    B/(A**2*C**2)
+    """
+
+    __slots__ = ('_terms', '_hash')
+
+    def __init__(self, terms: Union[Dict[str, int], Iterable[Tuple[str, int]]] = ()):
+        items = terms.items() if isinstance(terms, dict) else terms
+        merged = {}
+        for name, exp in items:
+            merged[name] = merged.get(name, 0) + int(exp)
+        self._terms = tuple(sorted((n, e) for n, e in merged.items() if e))
+        self._hash = hash(self._terms)
+
+    @classmethod
+    def symbol(cls, name: str) -> Monomial:
+        """The monomial consisting of the single symbol *name*."""
+        return cls(((name, 1),))
+
+    @property
+    def exponents(self) -> Tuple[Tuple[str, int], ...]:
+        """tuple of (str, int) : Sorted ``(name, exponent)`` pairs."""
+        return self._terms
+
+    def __mul__(self, other):
+        if not isinstance(other, Monomial):
+            return NotImplemented
+        return Monomial(self._terms + other._terms)
+
+    def __truediv__(self, other):
+        if not isinstance(other, Monomial):
+            return NotImplemented
+        return Monomial(self._terms + tuple((n, -e) for n, e in other._terms))
+
+    def __pow__(self, k: int):
+        return Monomial(tuple((n, e * int(k)) for n, e in self._terms))
+
+    def __eq__(self, other):
+        if isinstance(other, Monomial):
+            return self._terms == other._terms
+        return NotImplemented
+
+    def __hash__(self):
+        return self._hash
+
+    def __lt__(self, other):
+        if not isinstance(other, Monomial):
+            return NotImplemented
+        return self._terms < other._terms
+
+    def __reduce__(self):
+        return (Monomial, (self._terms,))
+
+    def __str__(self):
+        def product(terms):
+            return '*'.join(n if e == 1 else f'{n}**{e}' for n, e in terms)
+
+        num = [(n, e) for n, e in self._terms if e > 0]
+        den = [(n, -e) for n, e in self._terms if e < 0]
+        if not den:
+            return product(num) or '1'
+        if not num and len(den) == 1 and den[0][1] > 1:
+            return f'{den[0][0]}**(-{den[0][1]})'
+        den_str = product(den)
+        if len(den) > 1:
+            den_str = f'({den_str})'
+        return f'{product(num) or "1"}/{den_str}'
+
+    __repr__ = __str__
+
+    def to_sympy(self):
+        """The equivalent sympy expression (imports sympy on first use)."""
+        import sympy as sp
+        expr = sp.Integer(1)
+        for name, exp in self._terms:
+            expr *= sp.Symbol(name) ** exp
+        return expr
+
+    def _repr_latex_(self):
+        import sympy as sp
+        return f'${sp.latex(self.to_sympy())}$'
@@ -0,0 +1,418 @@
+from __future__ import annotations
+
+import os
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+__all__ = [
+    'SetClassCatalog',
+    'set_class_catalog',
+]
+
+_MAX_MODULUS = 24
+_CACHE_VERSION = 1
+
+
+def _default_cache_dir() -> Path:
+    env = os.environ.get('KLOTHO_CACHE_DIR')
+    if env:
+        return Path(env)
+    return Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')) / 'klotho'
+
+
+def _popcount(x: np.ndarray) -> np.ndarray:
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(x).astype(np.int64)
+    x = x.astype(np.uint64)
+    table = np.array([bin(i).count('1') for i in range(256)], dtype=np.int64)
+    out = np.zeros(x.shape, dtype=np.int64)
+    for shift in range(0, 64, 8):
+        out += table[(x >> np.uint64(shift)) & np.uint64(0xFF)]
+    return out
+
+
+def _rotate(masks: np.ndarray, k: int, modulus: int) -> np.ndarray:
+    """Transpose every mask by *k* (bit ``p`` moves to bit ``(p + k) % modulus``)."""
+    k %= modulus
+    if k == 0:
+        return masks.copy()
+    full = np.uint32((1 << modulus) - 1)
+    return ((masks << np.uint32(k)) | (masks >> np.uint32(modulus - k))) & full
+
+
+def _invert(masks: np.ndarray, modulus: int) -> np.ndarray:
+    """Invert every mask about 0 (bit ``p`` moves to bit ``-p % modulus``)."""
+    out = masks & np.uint32(1)
+    for b in range(1, modulus):
+        out |= ((masks >> np.uint32(b)) & np.uint32(1)) << np.uint32(modulus - b)
+    return out
+
+
+def _build(modulus: int) -> Dict[str, np.ndarray]:
+    masks = np.arange(1 << modulus, dtype=np.uint32)
+    # Rahn prime form: the transposition or inversion with the smallest
+    # binary value (bit p = pitch class p), which always contains 0
+    inverted = _invert(masks, modulus)
+    prime = masks.copy()
+    for k in range(modulus):
+        np.minimum(prime, _rotate(masks, k, modulus), out=prime)
+        np.minimum(prime, _rotate(inverted, k, modulus), out=prime)
+    del inverted
+    cardinality = _popcount(masks).astype(np.uint8)
+    # classes ordered by cardinality, then prime form
+    class_primes, class_ids = np.unique(
+        cardinality.astype(np.uint64) << np.uint64(32) | prime.astype(np.uint64),
+        return_inverse=True)
+    class_primes = (class_primes & np.uint64(0xFFFFFFFF)).astype(np.uint32)
+    # interval class k counts pairs {p, p + k}; the tritone-like k = m/2
+    # sees each pair from both ends
+    vectors = np.empty((len(class_primes), modulus // 2), dtype=np.int32)
+    for k in range(1, modulus // 2 + 1):
+        count = _popcount(class_primes & _rotate(class_primes, k, modulus))
+        vectors[:, k - 1] = count // 2 if 2 * k == modulus else count
+    return {
+        'prime': prime,
+        'class_id': class_ids.astype(np.int32).reshape(-1),
+        'class_prime': class_primes,
+        'class_vector': vectors,
+    }
+
+
+@lru_cache(maxsize=None)
+def _catalog_arrays(modulus: int, cache_dir: Optional[str]) -> Dict[str, np.ndarray]:
+    path = None
+    if cache_dir is not None:
+        path = Path(cache_dir) / f'setclasses_m{modulus}_v{_CACHE_VERSION}.npz'
+        if path.exists():
+            with np.load(path) as data:
+                return {key: data[key] for key in data.files}
+    arrays = _build(modulus)
+    if path is not None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f'.{os.getpid()}.tmp.npz')
+            np.savez(tmp, **arrays)
+            os.replace(tmp, path)
+        except OSError:
+            pass
+    return arrays
+
+
+class SetClassCatalog:
+    """
+    Precomputed set-class data for every pitch-class subset of a modulus.
+
+    Each of the ``2**modulus`` subsets is identified by its bitmask (bit
+    ``p`` set when pitch class ``p`` is present).  The catalog stores, for
+    every mask, its prime form and set-class id, and for every set class
+    its prime form, cardinality, interval vector and Z-related classes.
+    It is built once with NumPy bit operations over all masks at the same
+    time, then kept in memory per modulus and saved as an ``.npz`` file so
+    later sessions load it instead of rebuilding it.
+
+    Prime forms follow Rahn (the most compact of all transpositions and
+    inversions, compared from the right).  Set-class ids order classes by
+    cardinality, then prime form; labels read ``'<cardinality>-<ordinal>'``
+    in that order and are *not* Forte's numbers.
+
+    Parameters
+    ----------
+    modulus : int, optional
+        Size of the pitch-class universe, at most 24 (default is 12).
+    cache_dir : str or path-like, optional
+        Directory for the on-disk cache. Defaults to ``$KLOTHO_CACHE_DIR``
+        or ``~/.cache/klotho``. Pass ``False`` to keep the catalog in
+        memory only.
+
+    Examples
+    --------
+    >>> cat = SetClassCatalog(12)
+    >>> len(cat)
+    224
+    >>> cat.prime_form({0, 4, 7})
+    (0, 3, 7)
+    >>> cat.interval_vector({0, 4, 7})
+    array([0, 0, 1, 1, 1, 0], dtype=int32)
+    >>> masks = cat.to_masks([{0, 4, 7}, {2, 5, 9}, {0, 1, 4, 6}])
+    >>> cat.classify(masks)
+    array([18, 18, 30], dtype=int32)
+    >>> [cat.label(i) for i in cat.z_related(cat.classify(cat.to_mask({0, 1, 4, 6})))]
+    ['4-15']
+    """
+
+    def __init__(self, modulus: int = 12,
+                 cache_dir: Union[str, os.PathLike, bool, None] = None):
+        modulus = int(modulus)
+        if not 1 <= modulus <= _MAX_MODULUS:
+            raise ValueError(f"modulus must be between 1 and {_MAX_MODULUS}, got {modulus}")
+        if cache_dir is False:
+            resolved = None
+        else:
+            resolved = str(Path(cache_dir) if cache_dir else _default_cache_dir())
+        arrays = _catalog_arrays(modulus, resolved)
+        self._modulus = modulus
+        self._prime = arrays['prime']
+        self._class_id = arrays['class_id']
+        self._class_prime = arrays['class_prime']
+        self._class_vector = arrays['class_vector']
+        for arr in (self._prime, self._class_id, self._class_prime, self._class_vector):
+            arr.flags.writeable = False
+        self._cardinality = _popcount(self._class_prime)
+        self._z_group = self._z_groups()
+
+    def _z_groups(self) -> np.ndarray:
+        """Per class, the id of the first class sharing its interval vector
+        and cardinality."""
+        keys = np.column_stack([self._cardinality, self._class_vector])
+        _, first, inverse = np.unique(keys, axis=0, return_index=True, return_inverse=True)
+        return first[inverse.reshape(-1)]
+
+    @property
+    def modulus(self) -> int:
+        """int : Size of the pitch-class universe."""
+        return self._modulus
+
+    def __len__(self) -> int:
+        return len(self._class_prime)
+
+    def __repr__(self) -> str:
+        return f"SetClassCatalog(modulus={self._modulus}, classes={len(self)})"
+
+    # ---- masks ----
+
+    def to_mask(self, pcs: Iterable[int]) -> int:
+        """
+        Bitmask of a pitch-class set (entries are reduced mod ``modulus``).
+
+        Parameters
+        ----------
+        pcs : iterable of int
+
+        Returns
+        -------
+        int
+        """
+        mask = 0
+        for p in pcs:
+            mask |= 1 << (int(p) % self._modulus)
+        return mask
+
+    def to_masks(self, sets: Iterable[Iterable[int]]) -> np.ndarray:
+        """
+        Bitmasks of many pitch-class sets.
+
+        Parameters
+        ----------
+        sets : iterable of iterable of int
+
+        Returns
+        -------
+        numpy.ndarray
+            ``uint32`` masks, one per set.
+        """
+        return np.array([self.to_mask(s) for s in sets], dtype=np.uint32)
+
+    def from_mask(self, mask: int) -> Tuple[int, ...]:
+        """
+        Sorted pitch classes of a bitmask.
+
+        Parameters
+        ----------
+        mask : int
+
+        Returns
+        -------
+        tuple of int
+        """
+        mask = int(mask)
+        return tuple(p for p in range(self._modulus) if mask >> p & 1)
+
+    def _masks(self, masks) -> np.ndarray:
+        arr = np.asarray(masks)
+        if arr.dtype.kind not in 'iu':
+            raise TypeError(f"masks must be integers, got dtype {arr.dtype}")
+        if arr.size and (arr.min() < 0 or arr.max() >= 1 << self._modulus):
+            raise ValueError(f"masks must lie in [0, 2**{self._modulus})")
+        return arr.astype(np.intp)
+
+    # ---- batched lookups ----
+
+    def classify(self, masks) -> np.ndarray:
+        """
+        Set-class id of every mask.
+
+        Parameters
+        ----------
+        masks : array-like of int
+
+        Returns
+        -------
+        numpy.ndarray
+            ``int32`` ids with the shape of *masks*.
+        """
+        return self._class_id[self._masks(masks)]
+
+    def prime_masks(self, masks) -> np.ndarray:
+        """
+        Prime-form mask of every mask.
+
+        Parameters
+        ----------
+        masks : array-like of int
+
+        Returns
+        -------
+        numpy.ndarray
+            ``uint32`` masks with the shape of *masks*.
+        """
+        return self._prime[self._masks(masks)]
+
+    def interval_vectors(self, masks) -> np.ndarray:
+        """
+        Interval vector of every mask.
+
+        Parameters
+        ----------
+        masks : array-like of int
+
+        Returns
+        -------
+        numpy.ndarray
+            Shape ``masks.shape + (modulus // 2,)``.
+        """
+        return self._class_vector[self.classify(masks)]
+
+    # ---- single sets ----
+
+    def _id_of(self, pcs) -> int:
+        if isinstance(pcs, (int, np.integer)):
+            return int(self.classify(pcs))
+        return int(self._class_id[self.to_mask(pcs)])
+
+    def prime_form(self, pcs: Union[Iterable[int], int]) -> Tuple[int, ...]:
+        """
+        Prime form of a pitch-class set (or of a mask).
+
+        Parameters
+        ----------
+        pcs : iterable of int, or int mask
+
+        Returns
+        -------
+        tuple of int
+        """
+        return self.from_mask(self._class_prime[self._id_of(pcs)])
+
+    def interval_vector(self, pcs: Union[Iterable[int], int]) -> np.ndarray:
+        """
+        Interval vector of a pitch-class set (or of a mask).
+
+        Agrees with :meth:`~klotho.topos.collections.sets.Operations.interval_vector`.
+
+        Parameters
+        ----------
+        pcs : iterable of int, or int mask
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+        return self._class_vector[self._id_of(pcs)].copy()
+
+    def set_class(self, pcs: Union[Iterable[int], int]) -> int:
+        """
+        Set-class id of a pitch-class set (or of a mask).
+
+        Parameters
+        ----------
+        pcs : iterable of int, or int mask
+
+        Returns
+        -------
+        int
+        """
+        return self._id_of(pcs)
+
+    # ---- per class ----
+
+    def label(self, class_id: int) -> str:
+        """
+        Label ``'<cardinality>-<ordinal>'`` of a set class.
+
+        Parameters
+        ----------
+        class_id : int
+
+        Returns
+        -------
+        str
+        """
+        class_id = int(class_id)
+        card = int(self._cardinality[class_id])
+        first = int(np.searchsorted(self._cardinality, card))
+        return f"{card}-{class_id - first + 1}"
+
+    def z_related(self, class_id: int) -> List[int]:
+        """
+        Ids of the other classes with the same interval vector.
+
+        Parameters
+        ----------
+        class_id : int
+
+        Returns
+        -------
+        list of int
+            Empty when the class has no Z-relation.
+        """
+        class_id = int(class_id)
+        group = self._z_group[class_id]
+        return [int(i) for i in np.flatnonzero(self._z_group == group) if i != class_id]
+
+    @property
+    def table(self) -> pd.DataFrame:
+        """
+        One row per set class.
+
+        Returns
+        -------
+        pandas.DataFrame
+            Columns ``label``, ``cardinality``, ``prime_form``,
+            ``interval_vector`` and ``z_related`` (labels), indexed by
+            set-class id.
+        """
+        n = len(self)
+        return pd.DataFrame({
+            'label': [self.label(i) for i in range(n)],
+            'cardinality': self._cardinality,
+            'prime_form': [self.from_mask(m) for m in self._class_prime.tolist()],
+            'interval_vector': [tuple(v) for v in self._class_vector.tolist()],
+            'z_related': [[self.label(j) for j in self.z_related(i)] for i in range(n)],
+        })
+
+
+@lru_cache(maxsize=None)
+def set_class_catalog(modulus: int = 12,
+                      cache_dir: Union[str, os.PathLike, bool, None] = None) -> SetClassCatalog:
+    """
+    Return the :class:`SetClassCatalog` for *modulus*.
+
+    Memoized: repeated calls with the same arguments return the same
+    catalog object.
+
+    Parameters
+    ----------
+    modulus : int, optional
+        Default is 12.
+    cache_dir : str, path-like, or bool, optional
+        As for :class:`SetClassCatalog`.
+
+    Returns
+    -------
+    SetClassCatalog
+    """
+    return SetClassCatalog(modulus, cache_dir)
@@ -2,12 +2,13 @@ import numpy as np
 from itertools import combinations
 import pandas as pd
 import math
+import operator
 from fractions import Fraction
 from functools import cached_property
-from typing import List, Tuple, Set, Dict, Any, Union, Literal
-import sympy as sp
+from typing import List, Tuple, Set, Dict, Any, Union, Literal, Optional
 from ..graphs import Graph, GraphCore
 from ..graphs.generators import complete_graph
+from ._monomial import Monomial
 
 
 __all__ = [
@@ -337,6 +338,11 @@ class Operations:
         numpy.ndarray
             An array representing the interval vector with length modulus//2.
 
+        See Also
+        --------
+        klotho.topos.collections.set_classes.SetClassCatalog.interval_vectors :
+            Batched lookup over arrays of pitch-class bitmasks.
+
         Examples
         --------
         >>> chord = {0, 4, 7}  # C major triad
@@ -358,6 +364,13 @@ class Operations:
 # Sieves
 # ------
 
+# A period up to this many steps is evaluated once and tiled; longer
+# periods are evaluated directly over each requested window.
+_SIEVE_PATTERN_LIMIT = 1 << 22
+
+_SIEVE_SYMBOLS = {'or': '∪', 'and': '∩', 'sub': '-', 'xor': '⊕'}
+
+
 class Sieve:
     """
     Xenakis-style sieve for generating sets through modular arithmetic operations.
@@ -371,12 +384,21 @@ class Sieve:
     modulus and r is the residue. Complex sieves combine these using union (∪), 
     intersection (∩), and complement operations.
 
+    A sieve is kept symbolically as a residue-class expression whose period
+    is the LCM of its moduli; the operators ``|``, ``&``, ``-``, ``^`` and
+    ``~`` compose expressions without evaluating them.  Values are only
+    produced on request, from a boolean bitmap of one period tiled over the
+    requested range, so changing ``N`` costs nothing and ranges of millions
+    of points are a few array operations. Combining sieves with different
+    ``N`` keeps each operand's own bound.
+
     Parameters
     ----------
     modulus : int, optional
         The step size of the arithmetic progression (default is 1).
     residue : int, optional
-        The starting value of the progression (default is 0).
+        The residue class of the progression, taken modulo ``modulus``
+        (default is 0).
     N : int, optional
         The upper bound for generated values (default is 255).
 
@@ -387,9 +409,9 @@ class Sieve:
     N : int
         The upper bound for generated values.
     period : int
-        The modulus (step size) of the sieve.
-    r : int
-        The residue (starting value) of the sieve.
+        The period of the sieve (the LCM of its moduli).
+    r : int or None
+        The residue of an elementary sieve; ``None`` for a combination.
     congr : set
         Values congruent to the residue modulo the period.
     compl : set
@@ -402,6 +424,16 @@ class Sieve:
     >>> sieve = Sieve(modulus=3, residue=1, N=10)
     >>> print(sorted(int(x) for x in sieve.S))
     [1, 4, 7, 10]
+
+    Combine sieves symbolically and evaluate over a large range:
+
+    >>> s = (Sieve(3, 1) | Sieve(5, 2)) - Sieve(2, 0)
+    >>> s.expression, s.period
+    ('((3,1) ∪ (5,2)) - (2,0)', 30)
+    >>> s.indices(0, 30)
+    array([ 1,  7, 13, 17, 19, 25, 27])
+    >>> int(s.mask(0, 10**6).sum())
+    233333
     
     See Also
     --------
@@ -411,8 +443,8 @@ class Sieve:
     Notes
     -----
     This implementation provides the foundation for Xenakis sieve theory.
-    For complex sieve expressions, use the Operations class methods to
-    combine multiple Sieve instances with logical operations.
+    For complex sieve expressions, combine Sieve instances with the
+    logical operators; the result is again a Sieve.
     """
     def __init__(self, modulus: int = 1, residue: int = 0, N: int = 255):
         """
@@ -423,14 +455,147 @@ class Sieve:
         modulus : int, optional
             The step size of the arithmetic progression (default is 1).
         residue : int, optional
-            The starting value of the progression (default is 0).
+            The residue class of the progression (default is 0).
         N : int, optional
             The upper bound for generated values (default is 255).
         """
-        self.__S = set(np.arange(residue, N + 1, modulus))
-        self.__N = N
-        self.__modulus = modulus
+        modulus = int(modulus)
+        if modulus < 1:
+            raise ValueError(f"Sieve modulus must be positive, got {modulus}")
+        self._expr = ('rc', modulus, int(residue) % modulus)
         self._residue = residue
+        self.__N = N
+        self.__period = modulus
+        self._pattern = None
+        self._bounded = False
+
+    @classmethod
+    def _compose(cls, expr: tuple, period: int, N: int, bounded: bool) -> 'Sieve':
+        out = cls.__new__(cls)
+        out._expr = expr
+        out._residue = None
+        out._Sieve__N = N
+        out._Sieve__period = period
+        out._pattern = None
+        out._bounded = bounded
+        return out
+
+    @property
+    def _windowed(self) -> bool:
+        """Whether membership must be evaluated per window rather than
+        tiled from one period (long periods, or operands bounded by a
+        smaller ``N`` than the combination, which are not periodic)."""
+        return self._bounded or self.__period > _SIEVE_PATTERN_LIMIT
+
+    @staticmethod
+    def _evaluate(expr: tuple, start: int, stop: int) -> np.ndarray:
+        """Membership of ``start..stop-1`` under *expr*, as a boolean array."""
+        kind = expr[0]
+        if kind == 'rc':
+            _, m, r = expr
+            out = np.zeros(stop - start, dtype=bool)
+            out[(r - start) % m::m] = True
+            return out
+        if kind == 'not':
+            return ~Sieve._evaluate(expr[1], start, stop)
+        if kind == 'cap':
+            out = Sieve._evaluate(expr[1], start, stop)
+            out[max(0, expr[2] + 1 - start):] = False
+            return out
+        a = Sieve._evaluate(expr[1], start, stop)
+        b = Sieve._evaluate(expr[2], start, stop)
+        if kind == 'or':
+            return a | b
+        if kind == 'and':
+            return a & b
+        if kind == 'sub':
+            return a & ~b
+        return a ^ b
+
+    @staticmethod
+    def _notation(expr: tuple, top: bool = True) -> str:
+        kind = expr[0]
+        if kind == 'rc':
+            return f'({expr[1]},{expr[2]})'
+        if kind == 'not':
+            return f'~{Sieve._notation(expr[1], False)}'
+        if kind == 'cap':
+            return f'{Sieve._notation(expr[1], False)}[0,{expr[2]}]'
+        text = (f'{Sieve._notation(expr[1], False)} {_SIEVE_SYMBOLS[kind]} '
+                f'{Sieve._notation(expr[2], False)}')
+        return text if top else f'({text})'
+
+    @property
+    def pattern(self) -> np.ndarray:
+        """
+        Membership over one period, ``0 .. period - 1``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Read-only boolean array of length ``period``.
+        """
+        if self._pattern is None:
+            pattern = self._evaluate(self._expr, 0, self.__period)
+            pattern.flags.writeable = False
+            self._pattern = pattern
+        return self._pattern
+
+    def mask(self, start: int = 0, stop: int = None) -> np.ndarray:
+        """
+        Membership of every integer in ``[start, stop)`` as a boolean bitmap.
+
+        Parameters
+        ----------
+        start : int, optional
+            First integer (default is 0).
+        stop : int, optional
+            One past the last integer (default is ``N + 1``).
+
+        Returns
+        -------
+        numpy.ndarray
+            Boolean array of length ``stop - start``.
+        """
+        stop = self.__N + 1 if stop is None else int(stop)
+        start = int(start)
+        if stop <= start:
+            return np.zeros(0, dtype=bool)
+        if self._windowed:
+            return self._evaluate(self._expr, start, stop)
+        offset = start % self.__period
+        reps = -(-(offset + stop - start) // self.__period)
+        return np.tile(self.pattern, reps)[offset:offset + stop - start]
+
+    def indices(self, start: int = 0, stop: int = None) -> np.ndarray:
+        """
+        Sieve members in ``[start, stop)``, ascending.
+
+        Parameters
+        ----------
+        start : int, optional
+            First integer (default is 0).
+        stop : int, optional
+            One past the last integer (default is ``N + 1``).
+
+        Returns
+        -------
+        numpy.ndarray
+            Integer array of members.
+        """
+        return np.flatnonzero(self.mask(start, stop)) + int(start)
+
+    @property
+    def expression(self) -> str:
+        """
+        The sieve in Xenakis's residue-class notation.
+
+        Returns
+        -------
+        str
+            E.g. ``'(3,1) ∪ (5,2)'``.
+        """
+        return self._notation(self._expr)
     
     @property
     def S(self):
@@ -440,9 +605,9 @@ class Sieve:
         Returns
         -------
         set
-            The set of integers generated by the sieve.
+            The set of integers in ``[0, N]`` generated by the sieve.
         """
-        return self.__S
+        return set(self.indices().tolist())
     
     @property
     def N(self):
@@ -459,24 +624,25 @@ class Sieve:
     @property
     def period(self):
         """
-        The modulus (step size) of the sieve.
+        The period of the sieve.
         
         Returns
         -------
         int
-            The step size of the arithmetic progression.
+            The modulus of an elementary sieve, or the LCM of the moduli
+            of a combination.
         """
-        return self.__modulus
+        return self.__period
     
     @property
     def r(self):
         """
-        The residue (starting value) of the sieve.
+        The residue of the sieve.
         
         Returns
         -------
-        int
-            The starting value of the arithmetic progression.
+        int or None
+            The residue of an elementary sieve, ``None`` for a combination.
         """
         return self._residue
 
@@ -490,7 +656,9 @@ class Sieve:
         set
             Elements in S that are congruent to residue mod period.
         """
-        return Operations.congruent(self.__S, self.__modulus, self._residue)
+        if self._residue is None:
+            return self.S
+        return Operations.congruent(self.S, self.__period, self._residue % self.__period)
     
     @property
     def compl(self):
@@ -502,12 +670,14 @@ class Sieve:
         set
             All integers from 0 to N that are not in the sieve.
         """
-        return Operations.complement(self.__S, self.__N)
+        return set(np.flatnonzero(~self.mask()).tolist())
     
     @N.setter
     def N(self, N: int):
         """
-        Set the upper bound and regenerate the sieve.
+        Set the upper bound of the sieve.
+
+        Nothing is recomputed: the bound only limits evaluation.
         
         Parameters
         ----------
@@ -515,8 +685,41 @@ class Sieve:
             The new upper bound for the sieve.
         """
         self.__N = N
-        self.__S = set(np.arange(self._residue, N + 1, self.__modulus))
+
+    def __contains__(self, n) -> bool:
+        """Membership in ``[0, N]``, consistent with iteration and :attr:`S`."""
+        n = int(n)
+        if not 0 <= n <= self.__N:
+            return False
+        if self._windowed:
+            return bool(self._evaluate(self._expr, n, n + 1)[0])
+        return bool(self.pattern[n % self.__period])
+
+    def __iter__(self):
+        """Members in ``[0, N]``, produced one period at a time."""
+        block = max(self.__period, 4096)
+        for start in range(0, self.__N + 1, block):
+            yield from self.indices(start, min(start + block, self.__N + 1)).tolist()
+
+    def __len__(self) -> int:
+        if self._windowed:
+            return int(self.mask().sum())
+        full, rest = divmod(self.__N + 1, self.__period)
+        return int(full * self.pattern.sum() + self.pattern[:rest].sum())
     
+    def _last_member(self) -> Optional[int]:
+        """Largest member in ``[0, N]``, scanning back a window at a time
+        (a bounded combination's last period may be empty)."""
+        block = max(self.__period, 4096)
+        stop = self.__N + 1
+        while stop > 0:
+            start = max(0, stop - block)
+            members = self.indices(start, stop)
+            if members.size:
+                return int(members[-1])
+            stop = start
+        return None
+
     def __str__(self) -> str:
         """
         String representation of the Sieve.
@@ -526,13 +729,16 @@ class Sieve:
         str
             A formatted string showing the sieve parameters and values.
         """
-        if len(self.__S) > 10:
-            sieve = f'{list(self.__S)[:5]} ... {list(self.__S)[-1]}'
+        values = self.indices(0, min(self.__N + 1, 4096)).tolist()
+        if len(self) > 10:
+            sieve = f'{values[:5]} ... {self._last_member()}'
         else:
-            sieve = list(self.__S)
+            sieve = values
+        header = (f'Residue: {self._residue}\n' if self._residue is not None
+                  else f'Expr:    {self.expression}\n')
         return (
-            f'Period:  {self.__modulus}\n'
-            f'Residue: {self._residue}\n'
+            f'Period:  {self.__period}\n'
+            f'{header}'
             f'N:       {self.__N}\n'
             f'Sieve:   {sieve}\n'
         )
@@ -547,8 +753,24 @@ class Sieve:
             A formatted string showing the sieve parameters and values.
         """
         return self.__str__()
+
+    def _combine(self, kind: str, other: 'Sieve', N: int) -> 'Sieve':
+        # Each operand keeps its own bound: one with a smaller N than the
+        # result only contributes its members in [0, its N].
+        if not isinstance(other, Sieve):
+            return NotImplemented
+        operands = []
+        bounded = False
+        for sieve in (self, other):
+            expr = sieve._expr
+            if sieve.N < N:
+                expr = ('cap', expr, sieve.N)
+            operands.append(expr)
+            bounded = bounded or sieve._bounded or expr is not sieve._expr
+        return Sieve._compose((kind, *operands),
+                              math.lcm(self.__period, other.period), N, bounded)
     
-    def __or__(self, other: 'Sieve') -> set:
+    def __or__(self, other: 'Sieve') -> 'Sieve':
         """
         Union operation between two sieves (Xenakis: A ∪ B).
         
@@ -559,8 +781,9 @@ class Sieve:
         
         Returns
         -------
-        set
-            The union of both sieve sets.
+        Sieve
+            The union of both sieves, over the larger of the two bounds;
+            each operand contributes only its members in ``[0, N]``.
         
         Examples
         --------
@@ -570,9 +793,9 @@ class Sieve:
         >>> print(sorted(int(x) for x in combined))
         [1, 2, 4, 7, 10]
         """
-        return Operations.union(self.S, other.S)
+        return self._combine('or', other, max(self.__N, other.N) if isinstance(other, Sieve) else None)
     
-    def __and__(self, other: 'Sieve') -> set:
+    def __and__(self, other: 'Sieve') -> 'Sieve':
         """
         Intersection operation between two sieves (Xenakis: A ∩ B).
         
@@ -583,8 +806,8 @@ class Sieve:
         
         Returns
         -------
-        set
-            The intersection of both sieve sets.
+        Sieve
+            The intersection of both sieves, over the smaller of the two bounds.
         
         Examples
         --------
@@ -594,9 +817,9 @@ class Sieve:
         >>> print(sorted(int(x) for x in intersection))
         [0, 6, 12, 18]
         """
-        return Operations.intersect(self.S, other.S)
+        return self._combine('and', other, min(self.__N, other.N) if isinstance(other, Sieve) else None)
     
-    def __sub__(self, other: 'Sieve') -> set:
+    def __sub__(self, other: 'Sieve') -> 'Sieve':
         """
         Difference operation between two sieves (Xenakis: A - B).
         
@@ -607,8 +830,9 @@ class Sieve:
         
         Returns
         -------
-        set
-            Elements in this sieve but not in the other.
+        Sieve
+            Elements in this sieve but not in the other, over this sieve's
+            bound; the other sieve removes only its members in ``[0, N]``.
         
         Examples
         --------
@@ -618,9 +842,9 @@ class Sieve:
         >>> print(sorted(int(x) for x in difference))
         [2, 6, 10]
         """
-        return Operations.diff(self.S, other.S)
+        return self._combine('sub', other, self.__N)
     
-    def __xor__(self, other: 'Sieve') -> set:
+    def __xor__(self, other: 'Sieve') -> 'Sieve':
         """
         Symmetric difference operation between two sieves (A ⊕ B).
         
@@ -631,8 +855,9 @@ class Sieve:
         
         Returns
         -------
-        set
-            Elements in either sieve but not in both.
+        Sieve
+            Elements in either sieve but not in both, over the larger bound;
+            each operand contributes only its members in ``[0, N]``.
         
         Examples
         --------
@@ -642,16 +867,16 @@ class Sieve:
         >>> print(sorted(int(x) for x in sym_diff))
         [2, 3, 4, 8, 9, 10]
         """
-        return Operations.symm_diff(self.S, other.S)
+        return self._combine('xor', other, max(self.__N, other.N) if isinstance(other, Sieve) else None)
     
-    def __invert__(self) -> set:
+    def __invert__(self) -> 'Sieve':
         """
         Complement operation for the sieve (~A).
         
         Returns
         -------
-        set
-            All integers from 0 to N that are not in this sieve.
+        Sieve
+            All integers not in this sieve (listed within [0, N]).
         
         Examples
         --------
@@ -660,7 +885,7 @@ class Sieve:
         >>> print(sorted(complement))
         [1, 3, 5, 7, 9]
         """
-        return self.compl
+        return Sieve._compose(('not', self._expr), self.__period, self.__N, self._bounded)
         
 
 # ------------------------------------------------------------------------------
@@ -875,7 +1100,9 @@ class CombinationSet(GraphCore):
     combos : set
         The set of all r-combinations from the factors.
     factor_to_alias : dict
-        Mapping from factors to symbolic aliases.
+        Mapping from factors to symbolic aliases
+        (:class:`~klotho.topos.collections._monomial.Monomial`; call
+        ``.to_sympy()`` for a sympy expression).
     alias_to_factor : dict
         Mapping from symbolic aliases to factors.
 
@@ -909,7 +1136,7 @@ class CombinationSet(GraphCore):
         self._factors = tuple(sorted(factors))
         self._r = r
         self._combos = set(combinations(self._factors, self._r))
-        self._factor_aliases = {f: sp.Symbol(chr(65 + i)) for i, f in enumerate(self._factors)}
+        self._factor_aliases = {f: Monomial.symbol(chr(65 + i)) for i, f in enumerate(self._factors)}
         self._build_graph()
 
     @property
@@ -1019,9 +1246,16 @@ class PartitionSet:
     """
     A set of integer partitions with computed structural features.
 
-    This class generates all partitions of an integer n into exactly k parts
+    This class represents all partitions of an integer n into exactly k parts
     and analyzes their structural properties (unique counts, span, variance).
 
+    Partitions are never stored: a table of partition counts lets the set
+    report its size, return the *i*-th partition directly (unranking) and
+    draw uniform random partitions, and iteration produces one partition
+    at a time.  The feature DataFrame is only built when ``data`` is read.
+    Partitions are written largest part first and ordered by descending
+    lexicographic order, so index 0 is ``(n - k + 1, 1, ..., 1)``.
+
     Parameters
     ----------
     n : int
@@ -1035,6 +1269,8 @@ class PartitionSet:
         DataFrame containing partitions and their computed features.
     partitions : tuple
         Tuple of all generated partitions.
+    count : int
+        The number of partitions.
     mean : float
         The mean value of partition parts (n/k).
 
@@ -1050,6 +1286,16 @@ class PartitionSet:
     2  (4, 3, 1)             3     3  1.555556
     3  (4, 2, 2)             2     2  0.888889
     4  (3, 3, 2)             2     1  0.222222
+
+    Count, index and sample without enumerating:
+
+    >>> big = PartitionSet(300, 12)
+    >>> big.count
+    232477235048
+    >>> big[10**11]
+    (79, 55, 53, 35, 20, 18, 16, 11, 6, 3, 3, 1)
+    >>> len(big.sample(rng=1, size=3))
+    3
     """
     def __init__(self, n: int, k: int):
         """
@@ -1064,46 +1310,165 @@ class PartitionSet:
         """
         self._n = n
         self._k = k
-        self._data = self._generate_partitions()
-    
-    def _generate_partitions(self) -> pd.DataFrame:
+        self._data = None
+        # _exact[r][j]: partitions of r into exactly j parts
+        self._exact = [[0] * (k + 1) for _ in range(n + 1)]
+        self._exact[0][0] = 1
+        for r in range(1, n + 1):
+            for j in range(1, min(r, k) + 1):
+                self._exact[r][j] = self._exact[r - 1][j - 1] + self._exact[r - j][j]
+        self._bounded_rows = {}
+
+    def _bounded(self, r: int, j: int, m: int) -> int:
+        """Partitions of r into exactly j parts, none larger than m."""
+        if j == 0:
+            return 1 if r == 0 else 0
+        if r < j or j * m < r:
+            return 0
+        if m >= r - j + 1:
+            return self._exact[r][j]
+        # row[i]: count with largest part at most lo + i, grown on demand
+        lo = -(-r // j)
+        row = self._bounded_rows.setdefault((r, j), [])
+        while lo + len(row) <= m:
+            x = lo + len(row)
+            row.append((row[-1] if row else 0) + self._bounded(r - x, j - 1, x))
+        return row[m - lo]
+
+    def _unrank(self, index: int) -> tuple:
+        parts = []
+        r, m = self._n, self._n
+        for j in range(self._k, 0, -1):
+            for x in range(min(m, r - j + 1), -(-r // j) - 1, -1):
+                c = self._bounded(r - x, j - 1, x)
+                if index < c:
+                    break
+                index -= c
+            parts.append(x)
+            r, m = r - x, x
+        return tuple(parts)
+
+    @property
+    def count(self) -> int:
         """
-        Generate all partitions of n into k parts with computed features.
+        The number of partitions of n into exactly k parts.
         
         Returns
         -------
-        pandas.DataFrame
-            DataFrame with columns for partition, unique_count, span, and variance.
-        """
-        def backtrack(remaining: int, k: int, start: int, current: tuple) -> list:
-            if k == 0:
-                if remaining == 0:
-                    return [{
-                        'partition': current,
-                        'unique_count': len(set(current)),
-                        'span': max(current) - min(current),
-                        'variance': np.var(current)
-                    }]
-                return []
-            
-            results = []
-            for x in range(start, 0, -1):
-                if x <= remaining:
-                    results.extend(backtrack(remaining - x, k - 1, x, current + (x,)))
-            return results
-                    
-        return pd.DataFrame(backtrack(self._n, self._k, self._n, ()))
-    
+        int
+        """
+        if self._n < 0 or self._k < 0 or self._k > self._n:
+            return 1 if self._n == self._k == 0 else 0
+        return self._exact[self._n][self._k]
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index):
+        """
+        The partition at *index* in descending lexicographic order.
+
+        Parameters
+        ----------
+        index : int or slice
+            Negative indices count from the end.
+
+        Returns
+        -------
+        tuple of int, or list of tuple for a slice
+        """
+        if isinstance(index, slice):
+            return [self._unrank(i) for i in range(*index.indices(self.count))]
+        index = operator.index(index)
+        count = self.count
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError(f"partition index out of range for {count} partitions")
+        return self._unrank(index)
+
+    def __iter__(self):
+        """Partitions in descending lexicographic order, one at a time."""
+        n, k = self._n, self._k
+        if self.count == 0:
+            return
+        if k == 0:
+            yield ()
+            return
+        parts = [n - k + 1] + [1] * (k - 1)
+        while True:
+            yield tuple(parts)
+            # rightmost part that can shrink while the tail still fits below it
+            tail = 0
+            for i in range(k - 1, -1, -1):
+                v = parts[i] - 1
+                slots = k - 1 - i
+                tail_sum = tail + 1
+                if v >= 1 and slots and slots <= tail_sum <= slots * v:
+                    break
+                tail += parts[i]
+            else:
+                return
+            parts[i] = v
+            for p in range(i + 1, k):
+                slots -= 1
+                parts[p] = min(v, tail_sum - slots)
+                tail_sum -= parts[p]
+
+    def sample(self, rng=None, size: int = None):
+        """
+        Draw partitions uniformly at random.
+
+        Parameters
+        ----------
+        rng : numpy.random.Generator or int, optional
+            Random generator or seed.
+        size : int, optional
+            Number of draws. If omitted a single partition is returned.
+
+        Returns
+        -------
+        tuple of int, or list of tuple
+        """
+        count = self.count
+        if count == 0:
+            raise ValueError(f"There are no partitions of {self._n} into {self._k} parts")
+        rng = np.random.default_rng(rng)
+
+        def draw():
+            if count <= np.iinfo(np.int64).max:
+                return int(rng.integers(count))
+            nbits = count.bit_length()
+            while True:
+                words = rng.integers(0, 1 << 32, size=-(-nbits // 32), dtype=np.uint64)
+                value = int.from_bytes(words.astype('<u4').tobytes(), 'little')
+                value &= (1 << nbits) - 1
+                if value < count:
+                    return value
+
+        if size is None:
+            return self._unrank(draw())
+        return [self._unrank(draw()) for _ in range(size)]
+
     @property
     def data(self):
         """
         DataFrame containing partitions and their computed features.
+
+        Built on first access.
         
         Returns
         -------
         pandas.DataFrame
             DataFrame with partition, unique_count, span, and variance columns.
         """
+        if self._data is None:
+            self._data = pd.DataFrame([{
+                'partition': p,
+                'unique_count': len(set(p)),
+                'span': max(p) - min(p),
+                'variance': np.var(p),
+            } for p in self])
         return self._data
     
     @property
@@ -1116,7 +1481,9 @@ class PartitionSet:
         tuple
             All partitions of n into k parts.
         """
-        return tuple(self._data['partition'])
+        if self._data is not None:
+            return tuple(self._data['partition'])
+        return tuple(self)
     
     @property
     def mean(self) -> float:
@@ -1139,7 +1506,7 @@ class PartitionSet:
         str
             A formatted string showing partition data and statistics.
         """
-        display_df = self._data.copy()
+        display_df = self.data.copy()
         display_df['variance'] = display_df['variance'].round(4)
         
         df_str = str(display_df)
@@ -1,6 +1,10 @@
 from typing import List, Tuple, Optional
+import heapq
+import itertools
+import math
 import random
-import rustworkx as rx
+from fractions import Fraction
+import numpy as np
 from .lattices import Lattice
 
 
@@ -48,8 +52,8 @@ def random_walk(lattice: Lattice, start_coord: Tuple[int, ...], num_steps: int,
     if start_coord not in lattice:
         raise KeyError(f"Start coordinate {start_coord} not found in lattice")
     
-    if seed is not None:
-        random.seed(seed)
+    # a private generator: seeding must not touch the global random state
+    rng = random.Random(seed) if seed is not None else random
     
     path = [start_coord]
     current_coord = start_coord
@@ -88,7 +92,7 @@ def random_walk(lattice: Lattice, start_coord: Tuple[int, ...], num_steps: int,
         else:
             stuck_budget = stuck_tolerance
         
-        next_coord = random.choice(valid_neighbors)
+        next_coord = rng.choice(valid_neighbors)
         
         visit_counts[next_coord] = visit_counts.get(next_coord, 0) + 1
         path.append(next_coord)
@@ -132,8 +136,7 @@ def directed_walk(lattice: Lattice, start_coord: Tuple[int, ...], direction_weig
     if start_coord not in lattice:
         raise KeyError(f"Start coordinate {start_coord} not found in lattice")
     
-    if seed is not None:
-        random.seed(seed)
+    rng = random.Random(seed) if seed is not None else random
     
     path = [start_coord]
     current_coord = start_coord
@@ -170,9 +173,9 @@ def directed_walk(lattice: Lattice, start_coord: Tuple[int, ...], direction_weig
             break
         
         if sum(neighbor_weights) == 0:
-            next_coord = random.choice(valid_neighbors)
+            next_coord = rng.choice(valid_neighbors)
         else:
-            next_coord = random.choices(valid_neighbors, weights=neighbor_weights)[0]
+            next_coord = rng.choices(valid_neighbors, weights=neighbor_weights)[0]
         
         visit_counts[next_coord] = visit_counts.get(next_coord, 0) + 1
         path.append(next_coord)
@@ -181,6 +184,181 @@ def directed_walk(lattice: Lattice, start_coord: Tuple[int, ...], direction_weig
     return path
 
 
+def random_walks(lattice: Lattice, start_coords, num_steps: int,
+                 n_walkers: Optional[int] = None,
+                 direction_weights: Optional[List[float]] = None,
+                 max_repeats: Optional[int] = None,
+                 avoid_backtrack: bool = False,
+                 stuck_tolerance: int = 3,
+                 seed=None) -> np.ndarray:
+    """
+    Advance many independent random walkers over a lattice in parallel.
+
+    Batched counterpart of :func:`random_walk` (and, with
+    ``direction_weights``, of :func:`directed_walk`). All walkers move at
+    once on integer coordinate arrays: neighbors come from the lattice's
+    bounds, periodicity and edge offsets, and the ``max_repeats``,
+    ``avoid_backtrack`` and stuck-tolerance rules are applied as array
+    masks. Randomness is drawn from a :class:`numpy.random.Generator`, so
+    results are reproducible and the global ``random`` state is untouched.
+
+    Parameters
+    ----------
+    lattice : Lattice
+        The lattice to walk on.
+    start_coords : tuple of int or array-like
+        A single start coordinate shared by every walker, or an
+        ``(N, dimensionality)`` array of per-walker starts.
+    num_steps : int
+        Number of steps each walker takes.
+    n_walkers : int, optional
+        Number of walkers when a single start coordinate is given
+        (default 1).
+    direction_weights : list of float, optional
+        Per-direction weights as in :func:`directed_walk` (length
+        ``2 * dimensionality``; indices ``[2d, 2d + 1]`` weight moves of
+        ``-1`` and ``+1`` along dimension ``d``). Uniform when omitted.
+    max_repeats : int, optional
+        Maximum number of times a walker may visit any coordinate.
+    avoid_backtrack : bool, optional
+        Avoid stepping straight back to the previous coordinate when
+        another neighbor exists.
+    stuck_tolerance : int, optional
+        As in :func:`random_walk`: how many times in a row a walker blocked
+        by ``max_repeats`` may allow itself one extra visit.
+    seed : int or numpy.random.Generator, optional
+        Seed or generator for :func:`numpy.random.default_rng`.
+
+    Returns
+    -------
+    numpy.ndarray
+        Integer array of shape ``(N, num_steps + 1, dimensionality)``;
+        ``[:, 0]`` holds the start coordinates. A walker left with no
+        admissible move stops and repeats its last coordinate for the
+        remaining steps (where :func:`random_walk` would return a shorter
+        path).
+
+    Raises
+    ------
+    KeyError
+        If a start coordinate is not in the lattice.
+    ValueError
+        If num_steps is negative or the argument shapes do not match.
+    """
+    if num_steps < 0:
+        raise ValueError("num_steps must be non-negative")
+    dim = lattice.dimensionality
+    if direction_weights is not None and len(direction_weights) != 2 * dim:
+        raise ValueError(f"direction_weights length {len(direction_weights)} must be "
+                        f"2 * dimensionality ({2 * dim})")
+
+    starts = np.asarray(start_coords, dtype=np.int64)
+    if starts.ndim == 1:
+        starts = np.tile(starts, (1 if n_walkers is None else n_walkers, 1))
+    elif n_walkers is not None and n_walkers != len(starts):
+        raise ValueError(f"n_walkers={n_walkers} does not match {len(starts)} start coordinates")
+    if starts.ndim != 2 or starts.shape[1] != dim:
+        raise ValueError(f"start coordinates must have length {dim}")
+
+    lo = np.array([d.start for d in lattice._dims], dtype=np.int64)
+    size = np.array([len(d) for d in lattice._dims], dtype=np.int64)
+    inside = ((starts >= lo) & (starts < lo + size)).all(axis=1)
+    if not inside.all():
+        bad = tuple(int(v) for v in starts[~inside][0])
+        raise KeyError(f"Start coordinate {bad} not found in lattice")
+
+    rng = np.random.default_rng(seed)
+    offsets = np.array(lattice._neighbor_offsets(), dtype=np.int64)
+    moves = np.concatenate([offsets, -offsets])
+    n = len(starts)
+    rows = np.arange(n)
+
+    # Visits are counted in one sorted array of (walker, cell) keys, so a
+    # lookup is a binary search rather than a scan of the walker's history.
+    # Lattices too large for int64 keys fall back to the scan.
+    cells = math.prod(size.tolist())
+    if n * cells < 2 ** 62:
+        strides = np.cumprod(np.concatenate([size[1:], [1]])[::-1])[::-1]
+        row_base = rows * cells
+
+        def keys(coords):
+            return ((coords - lo) * strides).sum(axis=-1) + (row_base if coords.ndim == 2 else row_base[:, None])
+
+        visited = np.sort(keys(starts))
+    else:
+        keys = None
+
+    if direction_weights is not None:
+        weights_by_dir = np.asarray(direction_weights, dtype=float).reshape(dim, 2)
+
+    paths = np.empty((n, num_steps + 1, dim), dtype=np.int64)
+    paths[:, 0] = starts
+    pos = starts
+    alive = np.ones(n, dtype=bool)
+    budget = np.full(n, stuck_tolerance)
+
+    for t in range(num_steps):
+        cands = pos[:, None, :] + moves[None, :, :]
+        if lattice._periodic:
+            cands = (cands - lo) % size + lo
+            valid = np.ones(cands.shape[:2], dtype=bool)
+            # axes with fewer than three points wrap both ways onto one cell
+            for k in range(1, len(moves)):
+                valid[:, k] = ~(cands[:, :k] == cands[:, k:k + 1]).all(axis=2).any(axis=1)
+        else:
+            valid = ((cands >= lo) & (cands < lo + size)).all(axis=2)
+
+        allowed = valid.copy()
+        if max_repeats is not None:
+            if keys is not None:
+                # out-of-bounds candidates may alias other walkers' keys,
+                # but they are masked out by `valid` anyway
+                q = keys(cands)
+                visits = np.searchsorted(visited, q, 'right') - np.searchsorted(visited, q, 'left')
+            else:
+                history = paths[:, :t + 1]
+                visits = (cands[:, :, None, :] == history[:, None, :, :]).all(axis=3).sum(axis=2)
+            allowed &= visits <= max_repeats
+        if avoid_backtrack and t > 0:
+            back = (cands == paths[:, t - 1][:, None, :]).all(axis=2)
+            allowed &= ~(back & (valid.sum(axis=1) > 1)[:, None])
+
+        stuck = ~allowed.any(axis=1)
+        if max_repeats is not None:
+            relaxed = valid & (visits <= max_repeats + 1)
+            rescue = stuck & (budget > 0) & relaxed.any(axis=1)
+            allowed[rescue] = relaxed[rescue]
+            budget = np.where(stuck, budget - rescue, stuck_tolerance)
+            stuck &= ~rescue
+        alive &= ~stuck
+        if not alive.any():
+            paths[:, t + 1:] = pos[:, None, :]
+            break
+
+        weights = allowed & alive[:, None]
+        if direction_weights is not None:
+            diff = cands - pos[:, None, :]
+            factor = np.where(diff == 1, weights_by_dir[:, 1],
+                              np.where(diff == -1, weights_by_dir[:, 0], 1.0)).prod(axis=2)
+            weighted = weights * factor
+            zero = (weighted.sum(axis=1) == 0) & weights.any(axis=1)
+            weighted[zero] = weights[zero]
+            weights = weighted
+        else:
+            weights = weights.astype(float)
+
+        cum = weights.cumsum(axis=1)
+        total = cum[:, -1]
+        choice = (cum > (rng.random(n) * total)[:, None]).argmax(axis=1)
+        pos = np.where((total > 0)[:, None], cands[rows, choice], pos)
+        paths[:, t + 1] = pos
+        if max_repeats is not None and keys is not None:
+            new = np.sort(keys(pos))
+            visited = np.insert(visited, np.searchsorted(visited, new), new)
+
+    return paths
+
+
 def boundary_walk(lattice: Lattice, start_coord: Tuple[int, ...], num_steps: int,
                   boundary_preference: float = 0.7, seed: Optional[int] = None) -> List[Tuple[int, ...]]:
     """
@@ -210,8 +388,7 @@ def boundary_walk(lattice: Lattice, start_coord: Tuple[int, ...], num_steps: int
     if start_coord not in lattice:
         raise KeyError(f"Start coordinate {start_coord} not found in lattice")
     
-    if seed is not None:
-        random.seed(seed)
+    rng = random.Random(seed) if seed is not None else random
     
     def is_boundary_coord(coord):
         """Check if a coordinate is on the lattice boundary."""
@@ -233,12 +410,12 @@ def boundary_walk(lattice: Lattice, start_coord: Tuple[int, ...], num_steps: int
         boundary_neighbors = [n for n in neighbors if is_boundary_coord(n)]
         interior_neighbors = [n for n in neighbors if not is_boundary_coord(n)]
         
-        if boundary_neighbors and random.random() < boundary_preference:
-            next_coord = random.choice(boundary_neighbors)
+        if boundary_neighbors and rng.random() < boundary_preference:
+            next_coord = rng.choice(boundary_neighbors)
         elif interior_neighbors:
-            next_coord = random.choice(interior_neighbors)
+            next_coord = rng.choice(interior_neighbors)
         else:
-            next_coord = random.choice(neighbors)
+            next_coord = rng.choice(neighbors)
         
         path.append(next_coord)
         current_coord = next_coord
@@ -246,13 +423,123 @@ def boundary_walk(lattice: Lattice, start_coord: Tuple[int, ...], num_steps: int
     return path
 
 
+def _step_costs(lattice: Lattice, weight) -> List[float]:
+    """Cost of one step along each of the lattice's neighbor offsets."""
+    offsets = lattice._neighbor_offsets()
+    if weight is None:
+        return [1.0] * len(offsets)
+    if isinstance(weight, str):
+        if weight != 'harmonic':
+            raise ValueError(f"Unknown weight {weight!r}; expected 'harmonic' or a sequence")
+        generators = getattr(lattice, '_generators', None)
+        if generators is None:
+            raise ValueError("weight='harmonic' requires a lattice with generators (e.g. ToneLattice)")
+        costs = []
+        for offset in offsets:
+            interval = Fraction(1)
+            for g, e in zip(generators, offset):
+                interval *= Fraction(g) ** e
+            costs.append(math.log2(interval.numerator * interval.denominator))
+        return costs
+    costs = [float(w) for w in weight]
+    if len(costs) != len(offsets):
+        raise ValueError(f"weight needs one cost per edge direction ({len(offsets)}), got {len(costs)}")
+    if any(c < 0 for c in costs):
+        raise ValueError("edge costs must be non-negative")
+    return costs
+
+
+def _is_grid(lattice: Lattice) -> bool:
+    """Whether the neighbor offsets are exactly the unit axis vectors."""
+    offsets = lattice._neighbor_offsets()
+    n = lattice.dimensionality
+    return len(offsets) == n and all(
+        o == tuple(1 if i == d else 0 for i in range(n)) for d, o in enumerate(offsets))
+
+
+def _axis_moves(lattice: Lattice, start, end):
+    """Per-axis ``(signed step, count)`` of a shortest grid path.
+
+    Periodic axes go the shorter way around (the direct way on ties).
+    """
+    moves = []
+    for s, e, dim in zip(start, end, lattice._dims):
+        delta = e - s
+        if lattice._periodic and abs(delta) * 2 > len(dim):
+            delta -= int(math.copysign(len(dim), delta))
+        moves.append((1 if delta >= 0 else -1, abs(delta)))
+    return moves
+
+
+def _grid_path(lattice: Lattice, start, end) -> List[Tuple[int, ...]]:
+    """Closed-form axis-ordered Manhattan path on a rectangular grid."""
+    path = [start]
+    current = start
+    for axis, (step, count) in enumerate(_axis_moves(lattice, start, end)):
+        offset = tuple(step if i == axis else 0 for i in range(len(start)))
+        for _ in range(count):
+            current = lattice._shift(current, offset)
+            path.append(current)
+    return path
+
+
+def _astar_path(lattice: Lattice, start, end, costs) -> Tuple[List[Tuple[int, ...]], float]:
+    """A* over the lattice's arithmetic neighbors with per-direction costs.
+
+    The heuristic charges the L1 gap at the cheapest cost per unit of L1
+    progress any move offers, so it never overestimates (with periodic
+    wrap it is dropped, since a wrapped step can close a large gap).
+    """
+    steps = []
+    for offset, cost in zip(lattice._neighbor_offsets(), costs):
+        steps.append((offset, cost))
+        steps.append((tuple(-v for v in offset), cost))
+    rate = 0.0 if lattice._periodic else min(
+        cost / sum(abs(v) for v in offset) for offset, cost in steps)
+
+    def h(coord):
+        return rate * sum(abs(a - b) for a, b in zip(coord, end))
+
+    g = {start: 0.0}
+    parents = {start: None}
+    counter = itertools.count()
+    heap = [(h(start), next(counter), start)]
+    closed = set()
+    while heap:
+        _, _, coord = heapq.heappop(heap)
+        if coord == end:
+            path = []
+            while coord is not None:
+                path.append(coord)
+                coord = parents[coord]
+            return path[::-1], g[end]
+        if coord in closed:
+            continue
+        closed.add(coord)
+        base = g[coord]
+        for offset, cost in steps:
+            other = lattice._shift(coord, offset)
+            if other is None or other in closed:
+                continue
+            cand = base + cost
+            if cand < g.get(other, math.inf):
+                g[other] = cand
+                parents[other] = coord
+                heapq.heappush(heap, (cand + h(other), next(counter), other))
+    raise ValueError(f"No path exists between {start} and {end}")
+
+
 def shortest_path(lattice: Lattice, start_coord: Tuple[int, ...],
-                  end_coord: Tuple[int, ...]) -> List[Tuple[int, ...]]:
+                  end_coord: Tuple[int, ...], weight=None) -> List[Tuple[int, ...]]:
     """
     Find the shortest path between two coordinates in a lattice.
 
-    Uses breadth-first search on the underlying graph, so every edge
-    has equal weight (one lattice step).
+    Computed from the lattice geometry rather than by graph search, so it
+    works identically on lazy lattices. On a rectangular grid the path is
+    closed-form: axis-ordered Manhattan moves (the shorter way around on
+    periodic axes), which is optimal for any non-negative per-axis costs.
+    Other boards (e.g. a Tonnetz, whose diagonal makes axis order
+    suboptimal) use A* with an admissible Manhattan heuristic.
 
     Parameters
     ----------
@@ -262,6 +549,12 @@ def shortest_path(lattice: Lattice, start_coord: Tuple[int, ...],
         Starting coordinate.
     end_coord : Tuple[int, ...]
         Target coordinate.
+    weight : None, 'harmonic' or sequence of float, optional
+        Step costs. ``None`` (default) counts lattice steps. A sequence
+        gives one non-negative cost per edge direction (per axis on a grid,
+        in ``_edge_offsets`` order otherwise). ``'harmonic'`` weights each
+        direction by the Tenney height ``log2(n * d)`` of the interval it
+        moves by (lattices with generators, e.g. ``ToneLattice``).
 
     Returns
     -------
@@ -281,17 +574,95 @@ def shortest_path(lattice: Lattice, start_coord: Tuple[int, ...],
     if end_coord not in lattice:
         raise KeyError(f"End coordinate {end_coord} not found in lattice")
 
-    start_node = lattice._get_node_for_coord(start_coord)
-    end_node = lattice._get_node_for_coord(end_coord)
+    start_coord, end_coord = tuple(start_coord), tuple(end_coord)
+    costs = _step_costs(lattice, weight)
+    if _is_grid(lattice):
+        return _grid_path(lattice, start_coord, end_coord)
+    return _astar_path(lattice, start_coord, end_coord, costs)[0]
+
+
+def _coord_pairs(lattice: Lattice, start_coords, end_coords):
+    starts = np.asarray(start_coords, dtype=np.int64)
+    ends = np.asarray(end_coords, dtype=np.int64)
+    starts, ends = np.broadcast_arrays(np.atleast_2d(starts), np.atleast_2d(ends))
+    if starts.shape[-1] != lattice.dimensionality:
+        raise ValueError(f"coordinates must have length {lattice.dimensionality}")
+    lo = np.array([d.start for d in lattice._dims], dtype=np.int64)
+    size = np.array([len(d) for d in lattice._dims], dtype=np.int64)
+    for label, coords in (("Start", starts), ("End", ends)):
+        inside = ((coords >= lo) & (coords < lo + size)).all(axis=1)
+        if not inside.all():
+            bad = tuple(int(v) for v in coords[~inside][0])
+            raise KeyError(f"{label} coordinate {bad} not found in lattice")
+    return starts, ends, size
+
 
-    node_paths = rx.dijkstra_shortest_paths(
-        lattice._rx, start_node, target=end_node,
-        weight_fn=lambda _: 1.0,
-    )
+def shortest_paths(lattice: Lattice, start_coords, end_coords,
+                   weight=None) -> List[List[Tuple[int, ...]]]:
+    """
+    Shortest paths between many coordinate pairs.
+
+    Parameters
+    ----------
+    lattice : Lattice
+        The lattice to search.
+    start_coords, end_coords : array-like
+        ``(N, dimensionality)`` coordinate arrays, or single coordinates
+        broadcast against the other argument.
+    weight : None, 'harmonic' or sequence of float, optional
+        Step costs, as in :func:`shortest_path`.
+
+    Returns
+    -------
+    list of list of tuple of int
+        One path per pair, as returned by :func:`shortest_path`.
+    """
+    starts, ends, _ = _coord_pairs(lattice, start_coords, end_coords)
+    costs = _step_costs(lattice, weight)
+    grid = _is_grid(lattice)
+    paths = []
+    for s, e in zip(starts.tolist(), ends.tolist()):
+        s, e = tuple(s), tuple(e)
+        paths.append(_grid_path(lattice, s, e) if grid else _astar_path(lattice, s, e, costs)[0])
+    return paths
 
-    if end_node not in node_paths:
-        raise ValueError(
-            f"No path exists between {start_coord} and {end_coord}"
-        )
 
-    return [lattice._node_to_coord[n] for n in node_paths[end_node]]
+def shortest_path_lengths(lattice: Lattice, start_coords, end_coords,
+                          weight=None) -> np.ndarray:
+    """
+    Shortest-path distances between many coordinate pairs.
+
+    On a rectangular grid this is a single vectorized expression: the
+    per-axis gaps (the shorter way around on periodic axes) times the
+    per-axis costs. Other boards run A* per pair.
+
+    Parameters
+    ----------
+    lattice : Lattice
+        The lattice to measure on.
+    start_coords, end_coords : array-like
+        ``(N, dimensionality)`` coordinate arrays, or single coordinates
+        broadcast against the other argument.
+    weight : None, 'harmonic' or sequence of float, optional
+        Step costs, as in :func:`shortest_path`.
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of shape ``(N,)``: integer step counts when *weight* is None,
+        float costs otherwise.
+    """
+    starts, ends, size = _coord_pairs(lattice, start_coords, end_coords)
+    costs = _step_costs(lattice, weight)
+    if _is_grid(lattice):
+        gaps = np.abs(ends - starts)
+        if lattice._periodic:
+            gaps = np.minimum(gaps, size - gaps)
+        if weight is None:
+            return gaps.sum(axis=1)
+        return gaps @ np.asarray(costs, dtype=float)
+    lengths = [_astar_path(lattice, tuple(s), tuple(e), costs)[1]
+               for s, e in zip(starts.tolist(), ends.tolist())]
+    if weight is None:
+        return np.asarray(lengths, dtype=np.int64)
+    return np.asarray(lengths, dtype=float)
@@ -1,4 +1,8 @@
-from typing import Tuple, List, Union
+import copy
+import itertools
+import math
+from types import MappingProxyType
+from typing import Tuple, List, Union, Optional
 import pandas as pd
 from ..core import GraphCore
 from ..generators import grid_graph
@@ -23,13 +27,32 @@ class Lattice(GraphCore):
         If False, coordinates range from 0 to resolution (default is True).
     periodic : bool, optional
         Whether to use periodic boundary conditions (default is False).
+    lazy : bool, optional
+        Use an implicit lattice whose structure is computed arithmetically
+        from the bounds instead of being stored as a graph. ``None``
+        (default) chooses lazy mode for lattices with more than
+        100,000 coordinates.
+
+    Notes
+    -----
+    In lazy mode membership, :attr:`coords`, :meth:`neighbors`,
+    :meth:`has_edge`, :attr:`edges` and the node/edge counts are computed
+    from the per-axis ranges (and periodicity), so construction is O(1)
+    regardless of size. A coordinate gets a node in the underlying graph
+    only when data is attached to it (or :meth:`get_node` asks for its
+    id). Iteration and :attr:`nodes` therefore yield coordinates in lazy
+    mode, covering the whole lattice as ``len()`` does, rather than the
+    node ids of the materialized coordinates.
     """
+
+    _LAZY_THRESHOLD = 100_000
     
     def __init__(self, 
                  dimensionality : int                   = 2, 
                  resolution     : Union[int, List[int]] = 10, 
                  bipolar        : bool                  = True,
                  periodic       : bool                  = False,
+                 lazy           : Optional[bool]        = None,
         ):
         
         self._dimensionality = dimensionality
@@ -54,12 +77,15 @@ class Lattice(GraphCore):
         
         self._estimate_size()
 
-        lattice_graph = grid_graph(self._dims, periodic=periodic)
         super().__init__()
-        self._rx = lattice_graph._rx.copy()
-        self._is_lazy = False
-        self._build_coordinate_mapping()
-        self._materialized_coords = set(self._coord_to_node.keys())
+        self._is_lazy = self._should_use_lazy(lazy)
+        if self._is_lazy:
+            self._seed_initial_coords()
+        else:
+            lattice_graph = grid_graph(self._dims, periodic=periodic)
+            self._rx = lattice_graph._rx.copy()
+            self._build_coordinate_mapping()
+            self._materialized_coords = set(self._coord_to_node.keys())
         
         self._meta = pd.DataFrame(index=[''])
     
@@ -69,22 +95,28 @@ class Lattice(GraphCore):
         for res in self._resolution:
             size = (2 * res + 1) if self._bipolar else (res + 1)
             self._estimated_size *= size
-            if self._estimated_size > 100_000:
+            if self._estimated_size > self._LAZY_THRESHOLD:
                 self._estimated_size = float('inf')
                 break
     
-    def _should_use_lazy(self):
+    def _should_use_lazy(self, lazy=None):
         """Determine if lazy loading should be used."""
-        return False
+        if lazy is not None:
+            return bool(lazy)
+        return self._estimated_size > self._LAZY_THRESHOLD
     
     def _seed_initial_coords(self):
-        """Create initial coordinates for lazy lattice."""
-        return
+        """Create initial coordinates for lazy lattice.
+
+        Nothing is seeded: every coordinate is implicit until data is
+        attached to it, so the graph starts empty.
+        """
+        self._coord_to_node = {}
+        self._node_to_coord = {}
+        self._materialized_coords = set()
     
     def _build_coordinate_mapping(self):
         """Build coordinate mapping for non-lazy lattice."""
-        import itertools
-        
         for node_id in self._rx.node_indices():
             coord_data = self._rx.get_node_data(node_id)
             if coord_data and 'coord' in coord_data:
@@ -103,20 +135,30 @@ class Lattice(GraphCore):
         return True
     
     def _materialize_coord(self, coord):
-        """Materialize a coordinate and its neighbors in lazy lattice."""
-        if coord in self._materialized_coords:
-            return
-        if self._is_valid_coord(coord) and coord in self._coord_to_node:
+        """Node ID for a coordinate, adding its node first in a lazy lattice.
+
+        Returns None for coordinates outside the lattice. Materializing
+        does not change the lattice's structure (edges stay implicit), so
+        caches are not invalidated.
+        """
+        node_id = self._coord_to_node.get(coord)
+        if node_id is None and self._is_lazy and self._is_valid_coord(coord):
+            node_id = self._rx.add_node({'coord': coord})
+            self._coord_to_node[coord] = node_id
+            self._node_to_coord[node_id] = coord
             self._materialized_coords.add(coord)
+        return node_id
     
     def _get_node_for_coord(self, coord):
-        """Get node ID for coordinate, materializing if needed."""
+        """Get node ID for coordinate (None if not materialized)."""
         return self._coord_to_node.get(coord)
     
     def __getitem__(self, coord):
         """Get node data for a coordinate tuple."""
         node_id = self._get_node_for_coord(coord)
         if node_id is None:
+            if self._is_lazy and self._is_valid_coord(coord):
+                return MappingProxyType({'coord': coord})
             raise KeyError(f"Coordinate {coord} not found in lattice")
         return super().__getitem__(node_id)
     
@@ -124,7 +166,32 @@ class Lattice(GraphCore):
         """Check if a coordinate exists in the lattice."""
         if not self._is_valid_coord(coord):
             return False
-        return coord in self._coord_to_node
+        return self._is_lazy or coord in self._coord_to_node
+
+    def __len__(self):
+        """Return the number of coordinates."""
+        return self.number_of_nodes()
+
+    def __iter__(self):
+        """Iterate over node ids (coordinates in a lazy lattice)."""
+        if self._is_lazy:
+            return self._iter_coords()
+        return super().__iter__()
+
+    @property
+    def nodes(self):
+        """View of the nodes (of every coordinate in a lazy lattice)."""
+        if self._is_lazy:
+            return LatticeNodeView(self)
+        return super().nodes
+
+    def __deepcopy__(self, memo):
+        """Deep copy including the coordinate maps, bounds and lazy-mode state."""
+        new_lattice = super().__deepcopy__(memo)
+        for name, value in self.__dict__.items():
+            if name not in new_lattice.__dict__:
+                new_lattice.__dict__[name] = copy.deepcopy(value, memo)
+        return new_lattice
     
     def get_coordinates(self, node_id):
         """Get coordinates for a given node ID."""
@@ -134,8 +201,8 @@ class Lattice(GraphCore):
             raise KeyError(f"Node {node_id} not found in lattice")
     
     def get_node(self, coord):
-        """Get node ID for given coordinates."""
-        return self._get_node_for_coord(coord)
+        """Get node ID for given coordinates (materializing it if lazy)."""
+        return self._materialize_coord(coord)
     
     @property
     def coords(self) -> List[Tuple[int, ...]]:
@@ -147,7 +214,54 @@ class Lattice(GraphCore):
         list of tuple of int
             List of lattice coordinates.
         """
-        return list(self._coord_to_node.keys())
+        return list(self._iter_coords())
+
+    def _iter_coords(self):
+        """Iterate over all coordinates without building a list."""
+        if self._is_lazy:
+            return itertools.product(*self._dims)
+        return iter(self._coord_to_node)
+
+    def _neighbor_offsets(self) -> List[Tuple[int, ...]]:
+        """Offsets joining a coordinate to its neighbors (one sign each).
+
+        Unit axis vectors, or the class's ``_edge_offsets`` when it
+        defines a non-rectangular board (e.g. the Tonnetz diagonal).
+        """
+        offsets = getattr(self, '_edge_offsets', None)
+        if offsets is None:
+            n = self._dimensionality
+            offsets = [tuple(1 if i == d else 0 for i in range(n)) for d in range(n)]
+        return [tuple(o) for o in offsets]
+
+    def _shift(self, coord, offset):
+        """``coord + offset`` (wrapped when periodic), or None if off the lattice."""
+        shifted = []
+        for val, step, dim in zip(coord, offset, self._dims):
+            val += step
+            if val not in dim:
+                if not self._periodic:
+                    return None
+                val = dim.start + (val - dim.start) % len(dim)
+            shifted.append(val)
+        return tuple(shifted)
+
+    def _implicit_neighbors(self, coord):
+        result = []
+        for offset in self._neighbor_offsets():
+            for step in (offset, tuple(-v for v in offset)):
+                other = self._shift(coord, step)
+                if other is not None and other not in result:
+                    result.append(other)
+        return result
+
+    def _implicit_edges(self):
+        offsets = self._neighbor_offsets()
+        for coord in itertools.product(*self._dims):
+            for offset in offsets:
+                other = self._shift(coord, offset)
+                if other is not None:
+                    yield (coord, other)
     
     def _get_plot_coords(self, max_resolution: int) -> List[Tuple[int, ...]]:
         """Get coordinates for plotting, limited by max resolution from origin.
@@ -162,8 +276,6 @@ class Lattice(GraphCore):
         list of tuple of int
             Coordinate tuples within the resolution limit.
         """
-        import itertools
-        
         if self._bipolar:
             plot_ranges = [range(-max_resolution, max_resolution + 1) for _ in range(self._dimensionality)]
         else:
@@ -200,14 +312,26 @@ class Lattice(GraphCore):
     
     def number_of_nodes(self):
         """Return total number of nodes in lattice."""
+        if self._is_lazy:
+            return math.prod(len(dim) for dim in self._dims)
         return super().number_of_nodes()
     
     def number_of_edges(self):
         """Return total number of edges in lattice."""
+        if self._is_lazy:
+            total = 0
+            for offset in self._neighbor_offsets():
+                count = 1
+                for step, dim in zip(offset, self._dims):
+                    count *= len(dim) if (step == 0 or self._periodic) else max(len(dim) - abs(step), 0)
+                total += count
+            return total
         return super().number_of_edges()
     
     def neighbors(self, coord):
         """Get neighbor coordinates of a coordinate."""
+        if self._is_lazy:
+            return self._implicit_neighbors(coord) if self._is_valid_coord(coord) else []
         node_id = self._get_node_for_coord(coord)
         if node_id is None:
             return []
@@ -217,6 +341,8 @@ class Lattice(GraphCore):
     
     def has_edge(self, u, v):
         """Check if edge exists between two coordinates."""
+        if self._is_lazy:
+            return self._is_valid_coord(u) and self._is_valid_coord(v) and v in self._implicit_neighbors(u)
         u_node = self._get_node_for_coord(u)
         v_node = self._get_node_for_coord(v)
 
@@ -252,7 +378,7 @@ class Lattice(GraphCore):
     
     def __str__(self) -> str:
         """String representation of the lattice."""
-        coord_count = str(len(self.coords))
+        coord_count = str(self.number_of_nodes())
         
         return (f"Lattice(dimensionality={self._dimensionality}, "
                 f"resolution={self._resolution}, "
@@ -263,6 +389,30 @@ class Lattice(GraphCore):
         return self.__str__()
 
 
+class LatticeNodeView:
+    """View of a lazy lattice's nodes, keyed by coordinate tuples."""
+
+    def __init__(self, lattice):
+        self._lattice = lattice
+
+    def __iter__(self):
+        return self._lattice._iter_coords()
+
+    def __len__(self):
+        return self._lattice.number_of_nodes()
+
+    def __contains__(self, coord):
+        return coord in self._lattice
+
+    def __getitem__(self, coord):
+        return self._lattice[coord]
+
+    def __call__(self, data=False):
+        """Return coordinates with optional data."""
+        for coord in self._lattice._iter_coords():
+            yield (coord, self._lattice[coord]) if data else coord
+
+
 class LatticeEdgeView:
     """View of lattice edges that returns coordinate tuples."""
     
@@ -271,6 +421,9 @@ class LatticeEdgeView:
     
     def __iter__(self):
         """Iterate over edges as coordinate tuple pairs."""
+        if self._lattice._is_lazy:
+            yield from self._lattice._implicit_edges()
+            return
         for src_node, tgt_node in self._lattice._rx.edge_list():
             src_coord = self._lattice._node_to_coord.get(src_node)
             tgt_coord = self._lattice._node_to_coord.get(tgt_node)
@@ -283,7 +436,10 @@ class LatticeEdgeView:
     
     def __call__(self, data=False):
         """Return edges with optional data."""
-        if data:
+        if data and self._lattice._is_lazy:
+            for src_coord, tgt_coord in self._lattice._implicit_edges():
+                yield (src_coord, tgt_coord, {})
+        elif data:
             for src_node, tgt_node in self._lattice._rx.edge_list():
                 src_coord = self._lattice._node_to_coord.get(src_node)
                 tgt_coord = self._lattice._node_to_coord.get(tgt_node)
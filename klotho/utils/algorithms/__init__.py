@@ -5,6 +5,7 @@ from .lists import *
 from .random import *
 from .ratios import *
 from .basis import *
+from .integer_linalg import *
 
 from . import costs
 from . import factors
@@ -13,6 +14,7 @@ from . import lists
 from . import random
 from . import ratios
 from . import basis
+from . import integer_linalg
 
 __all__ = [
     'normalize_sum',
@@ -38,4 +40,12 @@ __all__ = [
     'generator_to_prime_coords',
     'ratio_from_prime_coords',
     'ratio_from_generator_coords',
+    'to_sympy',
+    'bareiss_det',
+    'adjugate',
+    'unimodular_inverse',
+    'hermite_normal_form',
+    'is_primitive',
+    'precompute_integer_solver',
+    'solve_integer',
 ]
\ No newline at end of file
@@ -1,9 +1,20 @@
+"""Basis matrices and prime <-> generator coordinate transforms.
+
+Matrices are exact integer NumPy arrays (``int64``, or ``object`` holding
+Python ints if an entry would overflow) computed with the sympy-free
+backend in :mod:`~klotho.utils.algorithms.integer_linalg`. Inputs may also
+be ``sympy.Matrix``; use :func:`to_sympy` for symbolic display.
+"""
 from fractions import Fraction
 from typing import Union, List, Tuple
-import sympy as sp
+
+import numpy as np
 
 from .ratios import validate_primes
 from .factors import to_factors
+from .integer_linalg import (
+    bareiss_det, hermite_normal_form, unimodular_inverse, _int_rows,
+)
 
 __all__ = [
     'monzo_from_ratio',
@@ -15,10 +26,42 @@ __all__ = [
     'generator_to_prime_coords',
     'ratio_from_prime_coords',
     'ratio_from_generator_coords',
+    'to_sympy',
 ]
 
 
-def monzo_from_ratio(ratio: Union[int, float, Fraction, str], primes: List[int]) -> sp.Matrix:
+def _int_vector(values) -> List[int]:
+    """Flatten a vector (list, 1-D/column array, or sympy Matrix) to ints."""
+    if hasattr(values, 'tolist'):
+        values = values.tolist()
+    flat = []
+    for v in values:
+        if isinstance(v, (list, tuple)):
+            flat.extend(v)
+        else:
+            flat.append(v)
+    return [int(v) for v in flat]
+
+
+def to_sympy(matrix):
+    """Convert an integer matrix or vector to ``sympy.Matrix`` for display.
+
+    Parameters
+    ----------
+    matrix : array-like
+        Matrix (or vector) as returned by the functions in this module.
+
+    Returns
+    -------
+    sympy.Matrix
+    """
+    import sympy as sp
+    if hasattr(matrix, 'tolist'):
+        matrix = matrix.tolist()
+    return sp.Matrix(matrix)
+
+
+def monzo_from_ratio(ratio: Union[int, float, Fraction, str], primes: List[int]) -> np.ndarray:
     """
     Convert a ratio to its monzo (prime exponent vector) representation.
     
@@ -35,35 +78,29 @@ def monzo_from_ratio(ratio: Union[int, float, Fraction, str], primes: List[int])
 
     Returns
     -------
-    sympy.Matrix
-        Column vector of prime exponents.
+    numpy.ndarray
+        Integer vector of prime exponents.
 
     Examples
     --------
     >>> monzo_from_ratio('3/2', [2, 3, 5])
-    Matrix([
-    [-1],
-    [ 1],
-    [ 0]])
+    array([-1,  1,  0])
     
     >>> monzo_from_ratio('5/4', [2, 3, 5])
-    Matrix([
-    [-2],
-    [ 0],
-    [ 1]])
+    array([-2,  0,  1])
     """
     ratio = Fraction(ratio)
     factors = to_factors(ratio)
-    return sp.Matrix([factors.get(p, 0) for p in primes])
+    return np.array([factors.get(p, 0) for p in primes], dtype=np.int64)
 
 
-def ratio_from_monzo(monzo: Union[List[int], sp.Matrix], primes: List[int]) -> Fraction:
+def ratio_from_monzo(monzo: Union[List[int], np.ndarray], primes: List[int]) -> Fraction:
     """
     Convert a monzo (prime exponent vector) back to a ratio.
     
     Parameters
     ----------
-    monzo : List[int] or sympy.Matrix
+    monzo : List[int], numpy.ndarray, or sympy.Matrix
         Vector of prime exponents.
     primes : List[int]
         Ordered list of prime numbers defining the basis.
@@ -81,8 +118,7 @@ def ratio_from_monzo(monzo: Union[List[int], sp.Matrix], primes: List[int]) -> F
     >>> ratio_from_monzo([-2, 0, 1], [2, 3, 5])
     Fraction(5, 4)
     """
-    if isinstance(monzo, sp.Matrix):
-        monzo = [int(v) for v in monzo]
+    monzo = _int_vector(monzo)
     
     numerator = 1
     denominator = 1
@@ -95,7 +131,7 @@ def ratio_from_monzo(monzo: Union[List[int], sp.Matrix], primes: List[int]) -> F
     return Fraction(numerator, denominator)
 
 
-def basis_matrix(primes: List[int], generators: List[Union[int, float, Fraction, str]]) -> sp.Matrix:
+def basis_matrix(primes: List[int], generators: List[Union[int, float, Fraction, str]]) -> np.ndarray:
     """
     Construct the change-of-basis matrix from generator monzos.
     
@@ -111,33 +147,36 @@ def basis_matrix(primes: List[int], generators: List[Union[int, float, Fraction,
 
     Returns
     -------
-    sympy.Matrix
-        Square matrix where column i is the monzo of generator i.
+    numpy.ndarray
+        Square integer matrix where column i is the monzo of generator i.
 
     Examples
     --------
     >>> A = basis_matrix([2, 3, 5], ['2/1', '5/4', '6/5'])
     >>> A
-    Matrix([
-    [ 1, -2,  1],
-    [ 0,  0,  1],
-    [ 0,  1, -1]])
+    array([[ 1, -2,  1],
+           [ 0,  0,  1],
+           [ 0,  1, -1]])
     """
     generators = [Fraction(g) for g in generators]
     cols = [monzo_from_ratio(g, primes) for g in generators]
-    return sp.Matrix.hstack(*cols)
+    if not cols:
+        return np.zeros((len(primes), 0), dtype=np.int64)
+    return np.column_stack(cols)
 
 
-def is_unimodular(matrix: sp.Matrix) -> bool:
+def is_unimodular(matrix: np.ndarray) -> bool:
     """
     Check if an integer matrix is unimodular (det = +/-1).
     
     A unimodular matrix has an integer inverse, meaning it represents
-    a valid change of basis that spans the same lattice.
+    a valid change of basis that spans the same lattice. Tested exactly
+    via the Hermite normal form, which is the identity iff the matrix
+    is unimodular.
     
     Parameters
     ----------
-    matrix : sympy.Matrix
+    matrix : array-like
         Square integer matrix to check.
 
     Returns
@@ -151,18 +190,22 @@ def is_unimodular(matrix: sp.Matrix) -> bool:
     >>> is_unimodular(A)
     True
     
-    >>> A = basis_matrix([2, 3, 5], ['2/1', '3/2', '5/4'])
+    >>> A = basis_matrix([2, 3, 5], ['2/1', '9/8', '5/4'])
     >>> is_unimodular(A)
     False
     """
-    det = int(matrix.det())
-    return det in (1, -1)
+    rows = _int_rows(matrix)
+    n = len(rows)
+    if any(len(r) != n for r in rows):
+        return False
+    H, _ = hermite_normal_form(rows)
+    return bool((H == np.eye(n, dtype=np.int64)).all())
 
 
 def change_of_basis(
     primes: List[int], 
     generators: List[Union[int, float, Fraction, str]]
-) -> Tuple[sp.Matrix, sp.Matrix]:
+) -> Tuple[np.ndarray, np.ndarray]:
     """
     Compute the change-of-basis matrices for a generator set.
     
@@ -179,8 +222,8 @@ def change_of_basis(
 
     Returns
     -------
-    Tuple[sympy.Matrix, sympy.Matrix]
-        (A, A_inv) where:
+    Tuple[numpy.ndarray, numpy.ndarray]
+        Integer matrices (A, A_inv) where:
         - A converts generator coords to prime coords: x = A @ y
         - A_inv converts prime coords to generator coords: y = A_inv @ x
 
@@ -201,17 +244,21 @@ def change_of_basis(
     generators = [Fraction(g) for g in generators]
     
     A = basis_matrix(primes, generators)
-    det = int(A.det())
+    if A.shape[0] != A.shape[1]:
+        raise ValueError(
+            f"need exactly {A.shape[0]} generators for {A.shape[0]} primes, got {A.shape[1]}"
+        )
+    det = bareiss_det(A)
     
     if det not in (1, -1):
         raise ValueError(f"generator set is not unimodular (det={det})")
     
-    return A, A.inv()
+    return A, unimodular_inverse(A)
 
 
 def prime_to_generator_coords(
-    prime_coords: Union[List[int], sp.Matrix], 
-    A_inv: sp.Matrix
+    prime_coords: Union[List[int], np.ndarray], 
+    A_inv: np.ndarray
 ) -> List[int]:
     """
     Convert prime coordinates to generator coordinates.
@@ -221,9 +268,9 @@ def prime_to_generator_coords(
     
     Parameters
     ----------
-    prime_coords : List[int] or sympy.Matrix
+    prime_coords : List[int] or numpy.ndarray
         Prime exponent vector (monzo).
-    A_inv : sympy.Matrix
+    A_inv : array-like
         Inverse of the basis matrix (from change_of_basis).
 
     Returns
@@ -243,18 +290,17 @@ def prime_to_generator_coords(
     >>> prime_to_generator_coords([-2, 0, 1], A_inv)  # monzo of 5/4
     [0, 1, 0]
     """
-    x = sp.Matrix([int(v) for v in prime_coords])
-    y = A_inv * x
-    
-    if any(sp.denom(v) != 1 for v in y):
-        raise ValueError("non-integer result (unexpected for unimodular bases)")
-    
-    return [int(v) for v in y]
+    x = _int_vector(prime_coords)
+    try:
+        M = _int_rows(A_inv)
+    except ValueError:
+        raise ValueError("non-integer result (unexpected for unimodular bases)") from None
+    return [sum(a * b for a, b in zip(row, x)) for row in M]
 
 
 def generator_to_prime_coords(
-    gen_coords: Union[List[int], sp.Matrix], 
-    A: sp.Matrix
+    gen_coords: Union[List[int], np.ndarray], 
+    A: np.ndarray
 ) -> List[int]:
     """
     Convert generator coordinates to prime coordinates.
@@ -264,9 +310,9 @@ def generator_to_prime_coords(
     
     Parameters
     ----------
-    gen_coords : List[int] or sympy.Matrix
+    gen_coords : List[int] or numpy.ndarray
         Generator exponent vector.
-    A : sympy.Matrix
+    A : array-like
         The basis matrix (from change_of_basis).
 
     Returns
@@ -286,18 +332,17 @@ def generator_to_prime_coords(
     >>> generator_to_prime_coords([0, 1, 0], A)  # 5/4 in generator coords
     [-2, 0, 1]
     """
-    y = sp.Matrix([int(v) for v in gen_coords])
-    x = A * y
-    
-    if any(sp.denom(v) != 1 for v in x):
-        raise ValueError("non-integer result (unexpected)")
-    
-    return [int(v) for v in x]
+    y = _int_vector(gen_coords)
+    try:
+        M = _int_rows(A)
+    except ValueError:
+        raise ValueError("non-integer result (unexpected)") from None
+    return [sum(a * b for a, b in zip(row, y)) for row in M]
 
 
 def ratio_from_prime_coords(
     primes: List[int], 
-    prime_coords: Union[List[int], sp.Matrix]
+    prime_coords: Union[List[int], np.ndarray]
 ) -> Fraction:
     """
     Compute a ratio from its prime coordinates (monzo).
@@ -309,7 +354,7 @@ def ratio_from_prime_coords(
     ----------
     primes : List[int]
         Ordered list of prime numbers defining the prime basis.
-    prime_coords : List[int] or sympy.Matrix
+    prime_coords : List[int] or numpy.ndarray
         Prime exponent vector (monzo).
 
     Returns
@@ -328,7 +373,7 @@ def ratio_from_prime_coords(
 
 def ratio_from_generator_coords(
     generators: List[Union[int, float, Fraction, str]], 
-    gen_coords: Union[List[int], sp.Matrix]
+    gen_coords: Union[List[int], np.ndarray]
 ) -> Fraction:
     """
     Compute a ratio from its generator coordinates.
@@ -337,7 +382,7 @@ def ratio_from_generator_coords(
     ----------
     generators : List[Fraction-like]
         The generator ratios defining the basis.
-    gen_coords : List[int] or sympy.Matrix
+    gen_coords : List[int] or numpy.ndarray
         Generator exponent vector.
 
     Returns
@@ -353,8 +398,7 @@ def ratio_from_generator_coords(
     """
     generators = [Fraction(g) for g in generators]
     
-    if isinstance(gen_coords, sp.Matrix):
-        gen_coords = [int(v) for v in gen_coords]
+    gen_coords = _int_vector(gen_coords)
     
     result = Fraction(1, 1)
     for g, e in zip(generators, gen_coords):
@@ -1,12 +1,79 @@
 from fractions import Fraction
-from sympy import factorint, primepi, isprime
 from typing import Union, Dict, List, Optional, Sequence
 from functools import lru_cache
 import numpy as np
-import sympy as sp
 
 from klotho.utils.algorithms.exact_solve import precompute_exact_solver, solve_exact
 
+# Smallest-prime-factor sieve: _SPF[n] is the least prime dividing n (n >= 2).
+# It grows lazily (doubling) up to _SIEVE_LIMIT; integers above the limit
+# fall back to sympy. int32 keeps the default 2**22 bound at 16 MiB.
+_SIEVE_LIMIT = 1 << 22
+_SPF = np.zeros(2, dtype=np.int32)
+_PRIMES = np.zeros(0, dtype=np.int64)
+
+
+def set_sieve_limit(limit: int) -> None:
+    """
+    Set the largest integer factored through the smallest-prime-factor sieve.
+
+    Integers up to *limit* are factored by table lookup (the table is
+    grown on demand, never beyond *limit*); larger integers go to
+    ``sympy.factorint``. Lowering the limit releases the table.
+
+    Parameters
+    ----------
+    limit : int
+        New upper bound (at least 1, at most ``2**31 - 1``).
+    """
+    global _SIEVE_LIMIT, _SPF, _PRIMES
+    limit = int(limit)
+    if not 1 <= limit < 2 ** 31:
+        raise ValueError(f"sieve limit must be in [1, 2**31), got {limit}")
+    _SIEVE_LIMIT = limit
+    if len(_SPF) > limit + 1:
+        _SPF = np.zeros(2, dtype=np.int32)
+        _PRIMES = np.zeros(0, dtype=np.int64)
+    _to_factors_cached.cache_clear()
+
+
+def _sieve(n: int) -> np.ndarray:
+    """The sieve, grown to cover *n* (which must not exceed the limit)."""
+    global _SPF, _PRIMES
+    if n < len(_SPF):
+        return _SPF
+    size = min(max(n + 1, 2 * len(_SPF), 1 << 16), _SIEVE_LIMIT + 1)
+    spf = np.zeros(size, dtype=np.int32)
+    for p in range(2, int(np.sqrt(size - 1)) + 1):
+        if spf[p] == 0:
+            multiples = spf[p * p::p]
+            multiples[multiples == 0] = p
+    primes = np.flatnonzero(spf == 0)[2:]
+    spf[primes] = primes
+    _SPF, _PRIMES = spf, primes
+    return spf
+
+
+def _factorint(n: int) -> Dict[int, int]:
+    """``sympy.factorint`` with sieve lookup for ``1 <= n <= limit``."""
+    if n < 1 or n > _SIEVE_LIMIT:
+        from sympy import factorint
+        return factorint(n)
+    spf = _sieve(n)
+    out = {}
+    while n > 1:
+        p = int(spf[n])
+        out[p] = out.get(p, 0) + 1
+        n //= p
+    return out
+
+
+def _primes_upto(n: int) -> np.ndarray:
+    """All primes ``<= n`` (``n`` within the sieve limit)."""
+    _sieve(n)
+    return _PRIMES[:np.searchsorted(_PRIMES, n, side='right')]
+
+
 def to_factors(value: Union[int, Fraction, str]) -> Dict[int, int]:
     """
     Convert a numeric value to its prime factorization representation.
@@ -67,8 +134,8 @@ def to_factors(value: Union[int, Fraction, str]) -> Dict[int, int]:
 
 @lru_cache(maxsize=8192)
 def _to_factors_cached(ratio: Fraction):
-    num_factors = factorint(ratio.numerator)
-    den_factors = factorint(ratio.denominator)
+    num_factors = _factorint(ratio.numerator)
+    den_factors = _factorint(ratio.denominator)
     for p, e in den_factors.items():
         num_factors[p] = num_factors.get(p, 0) - e
     return tuple(num_factors.items())
@@ -158,6 +225,11 @@ def nth_prime(prime: int) -> int:
     >>> nth_prime(11)
     5
     """
+    if 2 <= prime <= _SIEVE_LIMIT:
+        if _sieve(prime)[prime] != prime:
+            raise ValueError(f"{prime} is not a prime number")
+        return len(_primes_upto(prime))
+    from sympy import isprime, primepi
     if not isprime(prime):
         raise ValueError(f"{prime} is not a prime number")
 
@@ -222,7 +294,13 @@ def factors_to_lattice_vector(factors: Dict[int, int], vector_size: Optional[int
         raise ValueError(f"vector_size ({vector_size}) must be at least {min_size} to represent prime {max_prime}")
     
     target_size = vector_size or min_size
-    primes = [sympy_prime(i) for i in range(1, target_size + 1)]
+    if len(_PRIMES) >= target_size:
+        # nth_prime grew the sieve past max_prime; padding beyond the
+        # sieved primes is rare and goes to sympy
+        primes = _PRIMES[:target_size].tolist()
+    else:
+        from sympy import prime as sympy_prime
+        primes = [sympy_prime(i) for i in range(1, target_size + 1)]
     arr = np.array([factors.get(p, 0) for p in primes], dtype=int)
     arr.setflags(write=False)
     return arr
@@ -291,6 +369,7 @@ def ratio_to_coordinate(
         primes = [int(p) for p in basis_primes]
     if len(set(primes)) != len(primes):
         raise ValueError("basis_primes must be unique")
+    from sympy import isprime
     if any(not isprime(p) for p in primes):
         raise ValueError("basis_primes must contain only prime numbers")
 
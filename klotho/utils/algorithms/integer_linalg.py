@@ -0,0 +1,338 @@
+"""Exact integer linear algebra for lattice bases, without sympy.
+
+Generator-basis work only ever needs a handful of exact operations on
+small integer matrices: determinants, inverses of unimodular matrices and
+unimodularity tests.  Doing them symbolically through ``sympy.Matrix``
+costs milliseconds per matrix, which dominates basis searches that score
+tens of thousands of candidates.  Here they run on Python integers
+(arbitrary precision, so nothing overflows mid-elimination):
+
+* :func:`bareiss_det` -- fraction-free Bareiss elimination; every
+  division is exact.
+* :func:`adjugate` -- fraction-free Gauss-Jordan on ``[A | I]``, which
+  ends at ``[d I | d A^-1]`` and so yields ``det`` and ``adj(A)`` in one
+  pass; :func:`unimodular_inverse` turns that into the integer inverse.
+* :func:`hermite_normal_form` -- row-style HNF with its unimodular
+  transform; a square integer matrix is unimodular iff its HNF is the
+  identity.
+* :func:`is_primitive` -- whether integer vectors extend to a basis of
+  ``Z^n`` (gcd of maximal minors is 1), read off the same HNF.
+* :func:`precompute_integer_solver` / :func:`solve_integer` -- adjugate
+  solves for square systems with the same contract as
+  :func:`~klotho.utils.algorithms.exact_solve.solve_exact` (which they
+  fall back to for non-square or singular systems).
+
+Inputs may be nested lists, NumPy arrays (integer or object dtype) or
+``sympy.Matrix``; matrix results are NumPy arrays, ``int64`` when every
+entry fits and ``object`` (Python ints) otherwise.
+"""
+from fractions import Fraction
+from typing import List, Tuple
+
+import numpy as np
+
+from klotho.utils.algorithms.exact_solve import precompute_exact_solver, solve_exact
+
+__all__ = [
+    'bareiss_det',
+    'adjugate',
+    'unimodular_inverse',
+    'hermite_normal_form',
+    'is_primitive',
+    'precompute_integer_solver',
+    'solve_integer',
+]
+
+_INT64_MAX = np.iinfo(np.int64).max
+
+
+def _to_int(value) -> int:
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if int(value) != value:
+        raise ValueError(f"matrix entry {value!r} is not an integer")
+    return int(value)
+
+
+def _int_rows(matrix) -> List[List[int]]:
+    """Copy *matrix* into a list of rows of Python ints."""
+    if hasattr(matrix, 'tolist'):
+        matrix = matrix.tolist()
+    rows = [[_to_int(v) for v in row] for row in matrix]
+    if rows and any(len(r) != len(rows[0]) for r in rows):
+        raise ValueError("matrix rows must all have the same length")
+    return rows
+
+
+def _square_rows(matrix) -> List[List[int]]:
+    rows = _int_rows(matrix)
+    if any(len(r) != len(rows) for r in rows):
+        raise ValueError("matrix must be square")
+    return rows
+
+
+def _as_array(rows: List[List[int]]) -> np.ndarray:
+    fits = all(abs(v) <= _INT64_MAX for row in rows for v in row)
+    return np.array(rows, dtype=np.int64 if fits else object).reshape(
+        len(rows), len(rows[0]) if rows else 0)
+
+
+def bareiss_det(matrix) -> int:
+    """Determinant of a square integer matrix by Bareiss elimination.
+
+    Parameters
+    ----------
+    matrix : array-like
+        Square integer matrix.
+
+    Returns
+    -------
+    int
+        The exact determinant.
+
+    Examples
+    --------
+    >>> bareiss_det([[1, -2, 1], [0, 0, 1], [0, 1, -1]])
+    -1
+    """
+    a = _square_rows(matrix)
+    n = len(a)
+    if n == 0:
+        return 1
+    sign = 1
+    prev = 1
+    for k in range(n - 1):
+        if a[k][k] == 0:
+            swap = next((i for i in range(k + 1, n) if a[i][k] != 0), None)
+            if swap is None:
+                return 0
+            a[k], a[swap] = a[swap], a[k]
+            sign = -sign
+        pivot = a[k][k]
+        row_k = a[k]
+        for i in range(k + 1, n):
+            row_i = a[i]
+            f = row_i[k]
+            for j in range(k + 1, n):
+                row_i[j] = (row_i[j] * pivot - f * row_k[j]) // prev
+        prev = pivot
+    return sign * a[n - 1][n - 1]
+
+
+def _gauss_jordan(a: List[List[int]]) -> Tuple[int, List[List[int]]]:
+    """``(det, adj)`` of square *a* via fraction-free Gauss-Jordan.
+
+    ``adj`` is ``None`` when the matrix is singular.
+    """
+    n = len(a)
+    aug = [row + [1 if i == j else 0 for j in range(n)] for i, row in enumerate(a)]
+    width = 2 * n
+    sign = 1
+    prev = 1
+    for k in range(n):
+        if aug[k][k] == 0:
+            swap = next((i for i in range(k + 1, n) if aug[i][k] != 0), None)
+            if swap is None:
+                return 0, None
+            aug[k], aug[swap] = aug[swap], aug[k]
+            sign = -sign
+        pivot = aug[k][k]
+        row_k = aug[k]
+        for i in range(n):
+            if i == k:
+                continue
+            row_i = aug[i]
+            f = row_i[k]
+            for j in range(width):
+                if j != k:
+                    row_i[j] = (row_i[j] * pivot - f * row_k[j]) // prev
+            row_i[k] = 0
+        prev = pivot
+    # rows now read [d I | d A^-1] with d = det(PA) = sign * det(A);
+    # adj(A) = det(A) A^-1 = sign * (d A^-1)
+    det = sign * prev
+    adj = [[sign * v for v in row[n:]] for row in aug]
+    return det, adj
+
+
+def adjugate(matrix) -> Tuple[int, np.ndarray]:
+    """Determinant and adjugate of a square integer matrix.
+
+    ``A @ adj == det * I`` exactly, so ``A^-1 = adj / det``.
+
+    Parameters
+    ----------
+    matrix : array-like
+        Square integer matrix.
+
+    Returns
+    -------
+    tuple of (int, numpy.ndarray)
+        ``(det, adj)``. For a singular matrix ``adj`` is ``None``.
+    """
+    a = _square_rows(matrix)
+    if not a:
+        return 1, np.zeros((0, 0), dtype=np.int64)
+    det, adj = _gauss_jordan(a)
+    return det, (None if adj is None else _as_array(adj))
+
+
+def unimodular_inverse(matrix) -> np.ndarray:
+    """Integer inverse of a unimodular matrix (``det == ±1``).
+
+    Parameters
+    ----------
+    matrix : array-like
+        Square integer matrix.
+
+    Returns
+    -------
+    numpy.ndarray
+        The exact integer inverse.
+
+    Raises
+    ------
+    ValueError
+        If the matrix is not unimodular.
+
+    Examples
+    --------
+    >>> unimodular_inverse([[1, -2, 1], [0, 0, 1], [0, 1, -1]]).tolist()
+    [[1, 1, 2], [0, 1, 1], [0, 1, 0]]
+    """
+    a = _square_rows(matrix)
+    if not a:
+        return np.zeros((0, 0), dtype=np.int64)
+    det, adj = _gauss_jordan(a)
+    if det not in (1, -1):
+        raise ValueError(f"matrix is not unimodular (det={det})")
+    # A^-1 = adj / det, and 1/det == det for det = ±1
+    return _as_array([[det * v for v in row] for row in adj])
+
+
+def hermite_normal_form(matrix) -> Tuple[np.ndarray, np.ndarray]:
+    """Row-style Hermite normal form of an integer matrix.
+
+    Parameters
+    ----------
+    matrix : array-like
+        ``m x n`` integer matrix.
+
+    Returns
+    -------
+    tuple of (numpy.ndarray, numpy.ndarray)
+        ``(H, U)`` with ``U`` unimodular and ``U @ A == H``. ``H`` is upper
+        echelon with positive pivots and the entries above each pivot
+        reduced into ``[0, pivot)``; zero rows come last.
+
+    Examples
+    --------
+    >>> H, U = hermite_normal_form([[2, 3], [4, 7]])
+    >>> H.tolist()
+    [[2, 0], [0, 1]]
+    """
+    a = _int_rows(matrix)
+    m = len(a)
+    n = len(a[0]) if m else 0
+    u = [[1 if i == j else 0 for j in range(m)] for i in range(m)]
+
+    def sub(i, r, q):
+        if q:
+            a[i] = [x - q * y for x, y in zip(a[i], a[r])]
+            u[i] = [x - q * y for x, y in zip(u[i], u[r])]
+
+    r = 0
+    for c in range(n):
+        if r == m:
+            break
+        while True:
+            nonzero = [i for i in range(r, m) if a[i][c] != 0]
+            if not nonzero:
+                break
+            p = min(nonzero, key=lambda i: abs(a[i][c]))
+            a[r], a[p] = a[p], a[r]
+            u[r], u[p] = u[p], u[r]
+            done = True
+            for i in range(r + 1, m):
+                if a[i][c]:
+                    sub(i, r, a[i][c] // a[r][c])
+                    if a[i][c]:
+                        done = False
+            if done:
+                break
+        if a[r][c] == 0:
+            continue
+        if a[r][c] < 0:
+            a[r] = [-x for x in a[r]]
+            u[r] = [-x for x in u[r]]
+        for i in range(r):
+            sub(i, r, a[i][c] // a[r][c])
+        r += 1
+    return _as_array(a), _as_array(u)
+
+
+def is_primitive(vectors) -> bool:
+    """Whether integer *vectors* can be completed to a unimodular basis.
+
+    True iff the vectors are linearly independent and the gcd of the
+    maximal minors of the matrix they form is 1, i.e. iff every pivot of
+    the Hermite normal form of the column matrix is 1.
+
+    Parameters
+    ----------
+    vectors : array-like
+        ``k`` integer vectors of length ``n`` (one per row).
+
+    Returns
+    -------
+    bool
+
+    Examples
+    --------
+    >>> is_primitive([[2, 1, 0]])
+    True
+    >>> is_primitive([[1, 1, 0], [1, -1, 0]])
+    False
+    """
+    rows = _int_rows(vectors)
+    if not rows:
+        return True
+    k, n = len(rows), len(rows[0])
+    if k > n:
+        return False
+    cols = [[rows[i][j] for i in range(k)] for j in range(n)]
+    H, _ = hermite_normal_form(cols)
+    return all(H[i, i] == 1 for i in range(k))
+
+
+def precompute_integer_solver(rows):
+    """Precompute a solver for the integer system ``A y = rhs``.
+
+    Square nonsingular matrices get an adjugate solver (one integer
+    matrix-vector product and ``n`` divisibility checks per solve);
+    anything else falls back to
+    :func:`~klotho.utils.algorithms.exact_solve.precompute_exact_solver`.
+    Returns an opaque state for :func:`solve_integer`.
+    """
+    a = _int_rows(rows)
+    if a and all(len(r) == len(a) for r in a):
+        det, adj = _gauss_jordan(a)
+        if det != 0:
+            return {'kind': 'adjugate', 'det': det, 'adj': adj}
+    return {'kind': 'exact', 'state': precompute_exact_solver(rows)}
+
+
+def solve_integer(state, rhs):
+    """Solve with a :func:`precompute_integer_solver` state.
+
+    Same contract as :func:`~klotho.utils.algorithms.exact_solve.solve_exact`:
+    ``('ok', [Fraction, ...])``, ``('inconsistent', None)`` or
+    ``('non_unique', None)``. Integral solutions come back as Fractions
+    with denominator 1.
+    """
+    if state['kind'] == 'exact':
+        return solve_exact(state['state'], rhs)
+    det = state['det']
+    rhs = [int(x) for x in rhs]
+    return ('ok', [Fraction(sum(t * x for t, x in zip(row, rhs) if x), det)
+                   for row in state['adj']])
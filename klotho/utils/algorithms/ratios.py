@@ -1,6 +1,5 @@
 from fractions import Fraction
 from typing import Union, List
-from sympy import isprime
 
 __all__ = [
     'is_superparticular',
@@ -130,6 +129,7 @@ def validate_primes(primes: List[Union[int, float]]) -> List[int]:
     primes = [int(p) for p in primes]
     if len(set(primes)) != len(primes):
         raise ValueError("primes must be unique")
+    from sympy import isprime
     if any(not isprime(p) for p in primes):
         raise ValueError("all entries in primes must be prime")
     return primes
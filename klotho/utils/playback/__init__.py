@@ -1,5 +1,5 @@
 from .player import play
-from ._config import set_audio_engine, get_audio_engine
+from ._config import set_audio_engine, get_audio_engine, set_asset_mode, get_asset_mode
 from .animation_events import (
     build_path_payload,
     build_shape_payload,
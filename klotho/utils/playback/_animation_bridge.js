@@ -7,8 +7,9 @@
   // public name is overwritten unconditionally. V3 (10.16, adds record())
   // is a strict superset of V2, so it also claims the V2 name — otherwise
   // a stale 10.15 output rendered after a 10.16 widget would see V2 unset
-  // and clobber the public name with a build lacking record().
-  if (typeof globalThis.__klothoPlaybackBridgeV3 !== "undefined") return;
+  // and clobber the public name with a build lacking record(). V4 decodes
+  // columnar (KlothoEventCodec) event payloads and claims V2/V3 likewise.
+  if (typeof globalThis.__klothoPlaybackBridgeV4 !== "undefined") return;
 
   function buildBridge(config) {
     var audioPayload = config.audioPayload || null;
@@ -33,10 +34,18 @@
       if (!Number.isNaN(pauseVal) && pauseVal > 0) _pause = pauseVal;
     }
 
+    var _decodedEvents = null;
+
     function _rawEvents() {
       if (!audioPayload) return [];
       if (Array.isArray(audioPayload)) return audioPayload;
-      return Array.isArray(audioPayload.events) ? audioPayload.events : [];
+      var evts = audioPayload.events;
+      if (Array.isArray(evts)) return evts;
+      if (evts && globalThis.KlothoEventCodec && globalThis.KlothoEventCodec.isEncoded(evts)) {
+        if (_decodedEvents === null) _decodedEvents = globalThis.KlothoEventCodec.decode(evts);
+        return _decodedEvents;
+      }
+      return [];
     }
 
     function _scEvents() {
@@ -440,4 +449,5 @@
   globalThis.KlothoPlaybackBridge = buildBridge;
   globalThis.__klothoPlaybackBridgeV2 = buildBridge;
   globalThis.__klothoPlaybackBridgeV3 = buildBridge;
+  globalThis.__klothoPlaybackBridgeV4 = buildBridge;
 })();
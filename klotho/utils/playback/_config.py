@@ -38,3 +38,65 @@ def get_audio_engine():
         Always ``'supersonic'``.
     """
     return _current_engine
+
+
+_VALID_ASSET_MODES = ("embed", "store")
+
+_asset_mode = "embed"
+_asset_store_root = None
+_asset_store_url_prefix = None
+_asset_store_serve = False
+
+
+def set_asset_mode(mode, root=None, url_prefix=None, serve=False):
+    """Select how playback widgets ship SynthDefs and samples to the browser.
+
+    Parameters
+    ----------
+    mode : {'embed', 'store'}
+        ``'embed'`` (the default) inlines every needed asset as base64 in
+        the widget HTML. ``'store'`` writes each asset once to a
+        content-addressed cache directory and has the widget fetch it by
+        hash, so repeated ``play()`` calls skip encoding and saved
+        notebooks stay small.
+    root : str or Path, optional
+        Store directory for ``'store'`` mode. Defaults to
+        ``'klotho_assets'`` (relative to the working directory, which is
+        the notebook's directory under Jupyter).
+    url_prefix : str, optional
+        URL the browser uses to reach *root*. Defaults to *root* itself,
+        i.e. a path relative to the notebook page.
+    serve : bool, optional
+        Serve *root* from a local background HTTP server instead and
+        point the widget at it (overrides *url_prefix*).
+
+    Raises
+    ------
+    ValueError
+        If ``mode`` is not a recognized asset mode.
+    """
+    global _asset_mode, _asset_store_root, _asset_store_url_prefix, _asset_store_serve
+    if mode not in _VALID_ASSET_MODES:
+        raise ValueError(
+            f"Unknown asset mode {mode!r}. "
+            f"Choose from: {', '.join(_VALID_ASSET_MODES)}."
+        )
+    _asset_mode = mode
+    _asset_store_root = root
+    _asset_store_url_prefix = url_prefix
+    _asset_store_serve = bool(serve)
+
+
+def get_asset_mode():
+    """Return the current asset mode (``'embed'`` or ``'store'``).
+
+    Returns
+    -------
+    str
+    """
+    return _asset_mode
+
+
+def _asset_store_config():
+    return (_asset_store_root or "klotho_assets", _asset_store_url_prefix,
+            _asset_store_serve)
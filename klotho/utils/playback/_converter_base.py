@@ -136,24 +136,18 @@ def _merge_pfields(base, extra):
 
 
 def scale_pitch_sequence(obj, equaves=1):
+    """Pitches of *obj* played up ``equaves`` equaves and back down.
+
+    Negative ``equaves`` run down first. Returned as a
+    :class:`~klotho.tonos.pitch.pitch_array.PitchArray`, realized in one
+    call (``Pitch`` objects are built only if the caller indexes it).
+    """
     if equaves == 0:
         equaves = 1
-    scale_len = len(obj)
-    abs_equaves = abs(equaves)
-    going_up = equaves > 0
-
-    all_pitches = []
-    if going_up:
-        for idx in range(abs_equaves * scale_len + 1):
-            all_pitches.append(obj[idx])
-        pitches_down = list(reversed(all_pitches[:-1]))
-        all_pitches = all_pitches + pitches_down
-    else:
-        for i in range(abs_equaves * scale_len + 1):
-            all_pitches.append(obj[-i])
-        pitches_up = list(reversed(all_pitches[:-1]))
-        all_pitches = all_pitches + pitches_up
-    return all_pitches
+    idxs = list(range(abs(equaves) * len(obj) + 1))
+    if equaves < 0:
+        idxs = [-i for i in idxs]
+    return obj.realize(idxs + idxs[-2::-1])
 
 
 _CONVERT_REGISTRY = None
@@ -0,0 +1,77 @@
+// Columnar event-list decoder: the browser half of
+// klotho/utils/playback/_event_codec.py. Widgets ship large event lists
+// as base64 typed-array columns plus an interned string table instead of
+// one JSON object per event; KlothoEventCodec.decode rebuilds the plain
+// event objects the schedulers consume. Installed once per page.
+(() => {
+  if (typeof globalThis.__klothoEventCodecV1 !== "undefined") return;
+
+  function bytesOf(b64) {
+    var bin = atob(b64);
+    var out = new Uint8Array(bin.length);
+    for (var i = 0; i < bin.length; i++) out[i] = bin.charCodeAt(i);
+    return out;
+  }
+
+  // Fresh buffer per column, so typed-array views are always aligned.
+  function view(b64, Ctor) {
+    return new Ctor(bytesOf(b64).buffer);
+  }
+
+  var COLUMN_TYPES = { f64: Float64Array, str: Uint32Array, bool: Uint8Array };
+
+  function isEncoded(obj) {
+    return !!obj && !Array.isArray(obj) && typeof obj === "object" && obj.__klCols === 1;
+  }
+
+  function decode(enc) {
+    if (!isEncoded(enc)) return enc;
+    var n = enc.n;
+    var strings = enc.strings;
+    var events = new Array(n);
+    for (var i = 0; i < n; i++) events[i] = {};
+
+    var columns = enc.columns || {};
+    for (var key in columns) {
+      if (!columns.hasOwnProperty(key)) continue;
+      var col = columns[key];
+      var data = view(col.data, COLUMN_TYPES[col.kind]);
+      var mask = col.mask ? bytesOf(col.mask) : null;
+      for (var j = 0; j < n; j++) {
+        if (mask && !mask[j]) continue;
+        if (col.kind === "str") events[j][key] = strings[data[j]];
+        else if (col.kind === "bool") events[j][key] = data[j] !== 0;
+        else events[j][key] = data[j];
+      }
+    }
+
+    var sparse = enc.sparse || {};
+    for (var skey in sparse) {
+      if (!sparse.hasOwnProperty(skey)) continue;
+      var pairs = sparse[skey];
+      for (var p = 0; p < pairs.length; p++) events[pairs[p][0]][skey] = pairs[p][1];
+    }
+
+    var layouts = enc.layouts;
+    var layoutIds = view(enc.pfieldLayout, Int32Array);
+    var values = view(enc.pfieldValues, Float64Array);
+    var pos = 0;
+    for (var e = 0; e < n; e++) {
+      var lid = layoutIds[e];
+      if (lid < 0) continue;
+      var layout = layouts[lid];
+      var pf = {};
+      for (var k = 0; k < layout.length; k++) {
+        var name = strings[layout[k][0]];
+        var kind = layout[k][1];
+        var v = values[pos++];
+        pf[name] = kind === 1 ? strings[v] : (kind === 2 ? v !== 0 : v);
+      }
+      events[e].pfields = pf;
+    }
+    return events;
+  }
+
+  globalThis.KlothoEventCodec = { decode: decode, isEncoded: isEncoded };
+  globalThis.__klothoEventCodecV1 = globalThis.KlothoEventCodec;
+})();
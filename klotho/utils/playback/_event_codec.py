@@ -0,0 +1,253 @@
+"""Columnar typed-array encoding of SC event lists for playback widgets.
+
+A lowered event list is a list of dicts that repeats the same handful of
+keys (``type``, ``id``, ``defName``, ``start``, ``pfields`` ...) for
+every event; as JSON that is 200+ bytes per event, and large pieces make
+the browser's JSON parse the bottleneck.  :func:`encode_events` packs the
+list column by column instead:
+
+* every top-level key becomes one column -- numbers as float64, booleans
+  as uint8, strings as uint32 indices into one shared, interned string
+  table -- with a presence mask only when some events lack the key;
+* each event's pfields reference a *layout* (the interned tuple of
+  ``(key, kind)`` pairs, where kind is number/string/bool) and append
+  their values to one packed float64 array (strings as table indices);
+* anything else (nested lists/dicts, ``None``) falls back to sparse
+  ``[index, value]`` JSON pairs.
+
+Binary columns travel as base64 little-endian typed arrays, so the
+browser decodes them with ``Float64Array``/``Uint32Array`` views over a
+single ``atob``.  The JS inverse is ``KlothoEventCodec.decode`` (see
+``_event_codec.js``); :func:`decode_events` is the Python inverse used to
+check round trips.  Values come out as plain JSON types: numpy scalars
+are encoded directly, so callers no longer need ``convert_numpy_types``
+over the whole event list.
+"""
+
+import base64
+import numbers
+
+import numpy as np
+
+__all__ = ['encode_events', 'decode_events', 'is_encoded_events']
+
+CODEC_VERSION = 1
+
+# pfield value kinds
+_NUM, _STR, _BOOL = 0, 1, 2
+
+# column kinds
+_COL_NUM, _COL_STR, _COL_BOOL = 'f64', 'str', 'bool'
+
+_MISSING_STR = 0xFFFFFFFF
+
+
+def _b64(arr, dtype):
+    return base64.b64encode(np.asarray(arr, dtype=dtype).astype(
+        np.dtype(dtype).newbyteorder('<'), copy=False).tobytes()).decode('ascii')
+
+
+def _unb64(data, dtype):
+    return np.frombuffer(base64.b64decode(data), dtype=np.dtype(dtype).newbyteorder('<'))
+
+
+def _kind(value):
+    # bool before numbers: bool is an int subclass
+    if isinstance(value, (bool, np.bool_)):
+        return _COL_BOOL
+    if isinstance(value, numbers.Real):
+        return _COL_NUM
+    if isinstance(value, str):
+        return _COL_STR
+    return None
+
+
+def _plain(value):
+    """JSON-safe copy of a fallback value (numpy scalars/arrays unwrapped)."""
+    if isinstance(value, dict):
+        return {k: _plain(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain(v) for v in value]
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def is_encoded_events(obj):
+    """True if *obj* is the output of :func:`encode_events`."""
+    return isinstance(obj, dict) and obj.get('__klCols') == CODEC_VERSION
+
+
+def encode_events(events):
+    """Encode an SC event list as a JSON-serializable columnar dict.
+
+    Parameters
+    ----------
+    events : list of dict
+        Lowered SC events (``type``, ``id``, ``start``, ``pfields`` ...).
+
+    Returns
+    -------
+    dict
+        ``{'__klCols': 1, 'n', 'strings', 'columns', 'layouts',
+        'pfieldLayout', 'pfieldValues', 'sparse'}``; decode with
+        :func:`decode_events` or ``KlothoEventCodec.decode`` in the browser.
+    """
+    n = len(events)
+    strings = []
+    string_index = {}
+
+    def intern(s):
+        idx = string_index.get(s)
+        if idx is None:
+            idx = string_index[s] = len(strings)
+            strings.append(s)
+        return idx
+
+    key_order = []
+    raw_columns = {}
+    sparse = {}
+    layouts = []
+    layout_index = {}
+    pfield_layout = np.full(n, -1, dtype=np.int32)
+    pfield_values = []
+
+    for i, ev in enumerate(events):
+        for key, value in ev.items():
+            if key == 'pfields' and isinstance(value, dict):
+                entry = []
+                for pk, pv in value.items():
+                    kind = _kind(pv)
+                    if kind is None:
+                        break
+                    if kind == _COL_STR:
+                        entry.append((pk, _STR))
+                        pfield_values.append(intern(pv))
+                    elif kind == _COL_BOOL:
+                        entry.append((pk, _BOOL))
+                        pfield_values.append(1.0 if pv else 0.0)
+                    else:
+                        entry.append((pk, _NUM))
+                        pfield_values.append(float(pv))
+                else:
+                    entry = tuple(entry)
+                    idx = layout_index.get(entry)
+                    if idx is None:
+                        idx = layout_index[entry] = len(layouts)
+                        layouts.append(entry)
+                    pfield_layout[i] = idx
+                    continue
+                # non-scalar pfield value: undo this event's values and
+                # ship its pfields verbatim instead
+                del pfield_values[len(pfield_values) - len(entry):]
+                sparse.setdefault('pfields', []).append([i, _plain(value)])
+                continue
+            kind = _kind(value)
+            col = raw_columns.get(key)
+            if col is None:
+                col = raw_columns[key] = {'kind': kind, 'idx': [], 'vals': []}
+                key_order.append(key)
+            elif col['kind'] is None:
+                col['kind'] = kind
+            if kind is None or kind != col['kind']:
+                sparse.setdefault(key, []).append([i, _plain(value)])
+                continue
+            col['idx'].append(i)
+            col['vals'].append(intern(value) if kind == _COL_STR else value)
+
+    columns = {}
+    for key in key_order:
+        col = raw_columns[key]
+        idx = col['idx']
+        if not idx:
+            continue
+        kind = col['kind']
+        if kind == _COL_NUM:
+            dense = np.zeros(n, dtype=np.float64)
+            dense[idx] = np.asarray(col['vals'], dtype=np.float64)
+            data = _b64(dense, '<f8')
+        elif kind == _COL_STR:
+            dense = np.full(n, _MISSING_STR, dtype=np.uint32)
+            dense[idx] = col['vals']
+            data = _b64(dense, '<u4')
+        else:
+            dense = np.zeros(n, dtype=np.uint8)
+            dense[idx] = np.asarray(col['vals'], dtype=bool)
+            data = _b64(dense, 'u1')
+        entry = {'kind': kind, 'data': data}
+        if len(idx) != n:
+            mask = np.zeros(n, dtype=np.uint8)
+            mask[idx] = 1
+            entry['mask'] = _b64(mask, 'u1')
+        columns[key] = entry
+
+    return {
+        '__klCols': CODEC_VERSION,
+        'n': n,
+        'strings': strings,
+        'columns': columns,
+        'layouts': [[[intern(k), kind] for k, kind in layout] for layout in layouts],
+        'pfieldLayout': _b64(pfield_layout, '<i4'),
+        'pfieldValues': _b64(pfield_values, '<f8'),
+        'sparse': sparse,
+    }
+
+
+def decode_events(encoded):
+    """Inverse of :func:`encode_events` (mirrors the browser decoder).
+
+    Parameters
+    ----------
+    encoded : dict
+        Output of :func:`encode_events`.
+
+    Returns
+    -------
+    list of dict
+        Events with plain Python values; numbers come back as floats,
+        exactly as the browser sees them after JSON.
+    """
+    n = encoded['n']
+    strings = encoded['strings']
+    events = [{} for _ in range(n)]
+    for key, col in encoded['columns'].items():
+        kind = col['kind']
+        dtype = {_COL_NUM: '<f8', _COL_STR: '<u4', _COL_BOOL: 'u1'}[kind]
+        data = _unb64(col['data'], dtype)
+        mask = _unb64(col['mask'], 'u1') if 'mask' in col else None
+        for i in range(n):
+            if mask is not None and not mask[i]:
+                continue
+            v = data[i]
+            if kind == _COL_NUM:
+                events[i][key] = float(v)
+            elif kind == _COL_STR:
+                events[i][key] = strings[int(v)]
+            else:
+                events[i][key] = bool(v)
+    for key, pairs in encoded['sparse'].items():
+        for i, value in pairs:
+            events[i][key] = value
+
+    layouts = encoded['layouts']
+    layout_ids = _unb64(encoded['pfieldLayout'], '<i4')
+    values = _unb64(encoded['pfieldValues'], '<f8')
+    pos = 0
+    for i in range(n):
+        lid = int(layout_ids[i])
+        if lid < 0:
+            continue
+        pfields = {}
+        for key_idx, kind in layouts[lid]:
+            v = float(values[pos])
+            pos += 1
+            if kind == _STR:
+                pfields[strings[key_idx]] = strings[int(v)]
+            elif kind == _BOOL:
+                pfields[strings[key_idx]] = bool(v)
+            else:
+                pfields[strings[key_idx]] = v
+        events[i]['pfields'] = pfields
+    return events
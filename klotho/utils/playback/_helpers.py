@@ -2,6 +2,7 @@ from pathlib import Path
 
 _ANIMATION_BRIDGE_JS_PATH = Path(__file__).parent / '_animation_bridge.js'
 _ANIMATION_BRIDGE_JS_CACHE = None
+_EVENT_CODEC_JS_PATH = Path(__file__).parent / '_event_codec.js'
 _LOOP_CONTROL_JS_PATH = Path(__file__).parent / '_loop_control.js'
 _LOOP_CONTROL_JS_CACHE = None
 _RECORDER_JS_PATH = Path(__file__).parent / '_recorder.js'
@@ -43,9 +44,13 @@ def substitute_loop_tokens(template, loop):
 
 
 def get_animation_bridge_js():
+    """The shared ``KlothoPlaybackBridge`` JS, preceded by the
+    ``KlothoEventCodec`` decoder it uses for columnar event payloads."""
     global _ANIMATION_BRIDGE_JS_CACHE
     if _ANIMATION_BRIDGE_JS_CACHE is None:
-        _ANIMATION_BRIDGE_JS_CACHE = _ANIMATION_BRIDGE_JS_PATH.read_text() if _ANIMATION_BRIDGE_JS_PATH.exists() else ""
+        parts = [p.read_text() for p in (_EVENT_CODEC_JS_PATH, _ANIMATION_BRIDGE_JS_PATH)
+                 if p.exists()]
+        _ANIMATION_BRIDGE_JS_CACHE = "\n".join(parts)
     return _ANIMATION_BRIDGE_JS_CACHE
 
 
@@ -0,0 +1,202 @@
+"""Pure-Python OSC 1.0 message/bundle codec and NRT score-file framing.
+
+Only the subset scsynth consumes is supported: int32 (``i``), float32
+(``f``), float64 (``d``), string (``s``) and blob (``b``) arguments, plus
+bundles (optionally nested).  Python values are typed on encode as
+``bool``/``int`` → ``i``, ``float`` → ``f``, ``str`` → ``s`` and
+``bytes`` → ``b``; numpy scalars follow their Python counterparts.
+
+A SuperCollider non-realtime score file is a plain concatenation of
+bundles, each prefixed by its int32 byte size; bundle time tags are
+seconds from the start of the render (64-bit NTP fixed point).
+"""
+
+import struct
+
+__all__ = [
+    'encode_message',
+    'encode_bundle',
+    'decode_message',
+    'decode_bundle',
+    'encode_nrt_score',
+    'decode_nrt_score',
+]
+
+_BUNDLE_TAG = b'#bundle\x00'
+
+
+def _pad(data: bytes) -> bytes:
+    return data + b'\x00' * (-len(data) % 4)
+
+
+def _encode_string(value: str) -> bytes:
+    return _pad(value.encode('utf-8') + b'\x00')
+
+
+def _encode_arg(value):
+    # numpy scalars expose .item(); bool must be tested before int
+    if hasattr(value, 'item') and not isinstance(value, (bytes, str)):
+        value = value.item()
+    if isinstance(value, bool):
+        return 'i', struct.pack('>i', int(value))
+    if isinstance(value, int):
+        return 'i', struct.pack('>i', value)
+    if isinstance(value, float):
+        return 'f', struct.pack('>f', value)
+    if isinstance(value, str):
+        return 's', _encode_string(value)
+    if isinstance(value, (bytes, bytearray)):
+        return 'b', struct.pack('>i', len(value)) + _pad(bytes(value))
+    raise TypeError(f"Unsupported OSC argument {value!r} ({type(value).__name__})")
+
+
+def encode_message(address: str, args=()) -> bytes:
+    """Encode one OSC message.
+
+    Parameters
+    ----------
+    address : str
+        OSC address pattern, e.g. ``'/s_new'``.
+    args : sequence, optional
+        Message arguments (see the module docstring for type mapping).
+
+    Returns
+    -------
+    bytes
+    """
+    tags = [',']
+    payload = []
+    for arg in args:
+        tag, data = _encode_arg(arg)
+        tags.append(tag)
+        payload.append(data)
+    return _encode_string(address) + _encode_string(''.join(tags)) + b''.join(payload)
+
+
+def _encode_timetag(seconds: float) -> bytes:
+    whole = int(seconds // 1)
+    frac = int(round((seconds - whole) * (1 << 32)))
+    if frac >= (1 << 32):
+        whole, frac = whole + 1, 0
+    return struct.pack('>II', whole, frac)
+
+
+def encode_bundle(time: float, elements) -> bytes:
+    """Encode an OSC bundle.
+
+    Parameters
+    ----------
+    time : float
+        Time tag in seconds (NRT scores: seconds from render start).
+    elements : iterable
+        ``(address, args)`` tuples, or already-encoded message/bundle
+        ``bytes``.
+
+    Returns
+    -------
+    bytes
+    """
+    parts = [_BUNDLE_TAG, _encode_timetag(time)]
+    for element in elements:
+        if not isinstance(element, (bytes, bytearray)):
+            address, args = element
+            element = encode_message(address, args)
+        parts.append(struct.pack('>i', len(element)))
+        parts.append(bytes(element))
+    return b''.join(parts)
+
+
+def _read_string(data: bytes, pos: int):
+    end = data.index(b'\x00', pos)
+    value = data[pos:end].decode('utf-8')
+    return value, end + 1 + (-(end + 1 - pos) % 4)
+
+
+def decode_message(data: bytes):
+    """Decode one OSC message into ``(address, [args])``.
+
+    Floats come back as Python floats of float32 precision.
+    """
+    address, pos = _read_string(data, 0)
+    tags, pos = _read_string(data, pos)
+    if not tags.startswith(','):
+        raise ValueError(f"Malformed OSC type tag string {tags!r}")
+    args = []
+    for tag in tags[1:]:
+        if tag == 'i':
+            args.append(struct.unpack_from('>i', data, pos)[0])
+            pos += 4
+        elif tag == 'f':
+            args.append(struct.unpack_from('>f', data, pos)[0])
+            pos += 4
+        elif tag == 'd':
+            args.append(struct.unpack_from('>d', data, pos)[0])
+            pos += 8
+        elif tag == 's':
+            value, pos = _read_string(data, pos)
+            args.append(value)
+        elif tag == 'b':
+            size = struct.unpack_from('>i', data, pos)[0]
+            pos += 4
+            args.append(bytes(data[pos:pos + size]))
+            pos += size + (-size % 4)
+        else:
+            raise ValueError(f"Unsupported OSC type tag {tag!r}")
+    return address, args
+
+
+def decode_bundle(data: bytes):
+    """Decode an OSC bundle into ``(time, [elements])``.
+
+    Messages decode to ``(address, [args])`` tuples; nested bundles to
+    ``(time, [elements])`` tuples via recursion.
+    """
+    if not data.startswith(_BUNDLE_TAG):
+        raise ValueError("Not an OSC bundle")
+    whole, frac = struct.unpack_from('>II', data, 8)
+    time = whole + frac / (1 << 32)
+    pos = 16
+    elements = []
+    while pos < len(data):
+        size = struct.unpack_from('>i', data, pos)[0]
+        pos += 4
+        chunk = data[pos:pos + size]
+        pos += size
+        if chunk.startswith(_BUNDLE_TAG):
+            elements.append(decode_bundle(chunk))
+        else:
+            elements.append(decode_message(chunk))
+    return time, elements
+
+
+def encode_nrt_score(bundles) -> bytes:
+    """Frame ``(time, [(address, args), ...])`` bundles as an NRT score.
+
+    Parameters
+    ----------
+    bundles : iterable
+        Bundles in ascending time order.
+
+    Returns
+    -------
+    bytes
+        Contents of a file readable by ``scsynth -N``.
+    """
+    parts = []
+    for time, messages in bundles:
+        encoded = encode_bundle(time, messages)
+        parts.append(struct.pack('>i', len(encoded)))
+        parts.append(encoded)
+    return b''.join(parts)
+
+
+def decode_nrt_score(data: bytes):
+    """Inverse of :func:`encode_nrt_score`: a list of decoded bundles."""
+    bundles = []
+    pos = 0
+    while pos < len(data):
+        size = struct.unpack_from('>i', data, pos)[0]
+        pos += 4
+        bundles.append(decode_bundle(data[pos:pos + size]))
+        pos += size
+    return bundles
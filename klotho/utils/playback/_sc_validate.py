@@ -4,7 +4,15 @@ Raises ``AssemblyValidationError`` on the first structural violation.
 Call ``validate_sc_events`` on any event list destined for the SuperSonic
 engine (audio-only or animation).  Call ``validate_sc_meta`` on Score meta
 dicts.
+
+Numeric fields accept any real number, numpy scalars included: widget
+event lists are encoded column-wise straight from the lowered events
+(see :mod:`klotho.utils.playback._event_codec`), without a prior
+``convert_numpy_types`` pass.
 """
+from numbers import Real
+
+import numpy as np
 
 
 class AssemblyValidationError(Exception):
@@ -38,7 +46,7 @@ def _check_pfields(idx, pfields, label="pfields"):
             if not v:
                 _err(idx, f"{label}['{k}'] sample name must be non-empty")
             continue
-        if not isinstance(v, (int, float)):
+        if not isinstance(v, Real):
             hint = ""
             if isinstance(v, list):
                 hint = (
@@ -54,13 +62,13 @@ def _check_optional_dur_release_after(idx, ev):
         dur = ev['dur']
         if dur is None:
             pass
-        elif not isinstance(dur, (int, float)):
+        elif not isinstance(dur, Real):
             _err(idx, f"'dur' must be numeric or null, got {type(dur).__name__}")
         elif dur < 0:
             _err(idx, f"'dur' must be >= 0, got {dur}")
     if 'releaseAfter' in ev:
         ra = ev['releaseAfter']
-        if not isinstance(ra, bool):
+        if not isinstance(ra, (bool, np.bool_)):
             _err(idx, f"'releaseAfter' must be a bool, got {type(ra).__name__}")
 
 
@@ -96,7 +104,7 @@ def validate_sc_events(events, animation=False):
             _err(i, f"'id' must be a non-empty str, got {eid!r}")
 
         start = ev.get('start')
-        if not isinstance(start, (int, float)):
+        if not isinstance(start, Real):
             _err(i, f"'start' must be numeric, got {type(start).__name__}")
         if start < 0:
             _err(i, f"'start' must be >= 0, got {start}")
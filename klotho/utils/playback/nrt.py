@@ -0,0 +1,437 @@
+"""Non-realtime (NRT) rendering: lowered payloads as binary OSC scores.
+
+The browser widget is the interactive engine; this module is its offline
+twin.  It turns the same lowered payload produced by
+:func:`~klotho.utils.playback.supersonic.converters.convert_score_to_sc_events`
+/ :func:`~klotho.utils.playback.supersonic.converters.convert_to_sc_payload`
+into a SuperCollider NRT score file that a local ``scsynth -N`` renders
+to audio without a browser, so batches of variants can be rendered in
+parallel on headless machines.
+
+The node/bus layout mirrors the browser scheduler (``scheduler_core.js``
+and ``scheduler_score.js``): one score group, per-track source/FX groups
+summed through ``__busRouter`` into ``main``, ``releaseAfter`` gate-offs
+for gated defs, and control envelopes streamed by ``__klEnvCtrl`` synths
+onto control buses that are ``/n_map``-ed into their target synths.
+
+Examples
+--------
+>>> from klotho.utils.playback.nrt import write_nrt_score, render_nrt
+>>> osc_path = write_nrt_score(score, 'piece.osc')
+>>> render_nrt(osc_path, 'piece.wav')  # requires scsynth on PATH
+"""
+
+import base64
+import subprocess
+from pathlib import Path
+
+from klotho.utils.playback._osc import encode_nrt_score, decode_nrt_score
+
+__all__ = [
+    'payload_to_nrt_bundles',
+    'write_nrt_score',
+    'read_nrt_score',
+    'nrt_command',
+    'render_nrt',
+]
+
+# Keep in sync with scheduler_core.js: audio buses below this are
+# hardware outputs/inputs (and stem taps) and are never allocated.
+FIRST_PRIVATE_BUS = 48
+BUS_CHANNELS = 2
+
+_SCORE_GROUP_ID = 1000
+_FIRST_NODE_ID = 1001
+_CONTROL_BUFNUM = 0
+
+
+def _lower(obj, **kwargs):
+    """Lower *obj* to ``{"events", "meta", "control_data"}``.
+
+    Already-lowered payload dicts pass through unchanged.
+    """
+    if isinstance(obj, dict) and "events" in obj:
+        return obj
+    from klotho.thetos.composition.score import Score
+    from klotho.utils.playback.supersonic.converters import (
+        convert_score_to_sc_events, convert_to_sc_payload,
+    )
+    if isinstance(obj, Score):
+        return convert_score_to_sc_events(obj, **kwargs)
+    return convert_to_sc_payload(obj, **kwargs)
+
+
+def _resolve_def_name(name):
+    if not name or name == "sonic-pi-beep":
+        return "kl_tri"
+    return name
+
+
+class _NRTBuilder:
+    """Accumulates timestamped OSC messages for one payload."""
+
+    def __init__(self, manifest, sample_bufnums):
+        self.manifest = manifest
+        self.sample_bufnums = sample_bufnums
+        self._messages: list[tuple[float, int, str, list]] = []
+        self._seq = 0
+        self._next_node = _FIRST_NODE_ID
+        self._next_audio_bus = FIRST_PRIVATE_BUS
+        self._next_control_bus = 0
+        self.node_map: dict[str, int] = {}
+        self.def_names: dict[str, str] = {}
+        self.track_map = None
+
+    def add(self, time, address, args):
+        self._messages.append((float(time), self._seq, address, list(args)))
+        self._seq += 1
+
+    def node(self):
+        nid = self._next_node
+        self._next_node += 1
+        return nid
+
+    def audio_bus(self):
+        bus = self._next_audio_bus
+        self._next_audio_bus += BUS_CHANNELS
+        return bus
+
+    def control_bus(self):
+        bus = self._next_control_bus
+        self._next_control_bus += 1
+        return bus
+
+    def has_gate(self, def_name):
+        return 'gate' in (self.manifest.get(def_name) or {})
+
+    def pfield_args(self, pfields):
+        """Flatten pfields to OSC ``key, value`` pairs (``buf*`` sample
+        names become bufnums; non-scalar and unresolved values drop, as
+        in the browser's ``_resolveDefPfields``)."""
+        args = []
+        for key, val in pfields.items():
+            if val is None or isinstance(val, (dict, list, tuple)):
+                continue
+            if isinstance(val, str):
+                if key.startswith('buf') and val in self.sample_bufnums:
+                    args.extend((key, self.sample_bufnums[val]))
+                continue
+            args.extend((key, float(val)))
+        return args
+
+    def bundles(self):
+        """Group messages into ascending-time bundles (stable order)."""
+        ordered = sorted(self._messages, key=lambda m: (m[0], m[1]))
+        result: list[tuple[float, list]] = []
+        for time, _, address, args in ordered:
+            if result and result[-1][0] == time:
+                result[-1][1].append((address, args))
+            else:
+                result.append((time, [(address, args)]))
+        return result
+
+
+def _setup_tracks(b, meta):
+    groups = list(meta.get("groups") or [])
+    inserts = meta.get("inserts") or {}
+    track_map = {}
+    for name in groups + ["main"]:
+        parent, src, fx = b.node(), b.node(), b.node()
+        b.add(0.0, '/g_new', [parent, 1, _SCORE_GROUP_ID])
+        b.add(0.0, '/g_new', [src, 0, parent])
+        b.add(0.0, '/g_new', [fx, 3, src])
+        track_map[name] = {"parent": parent, "src": src, "fx": fx,
+                           "srcBus": b.audio_bus(), "fxBus": b.audio_bus()}
+
+    for name in groups + ["main"]:
+        track = track_map[name]
+        specs = inserts.get(name) or []
+        if not specs:
+            b.add(0.0, '/s_new', ['__busRouter', b.node(), 0, track["fx"],
+                                  'inBus', track["srcBus"], 'outBus', track["fxBus"],
+                                  'gain', 1.0])
+            continue
+        prev_bus = track["srcBus"]
+        for i, spec in enumerate(specs):
+            next_bus = b.audio_bus() if i < len(specs) - 1 else track["fxBus"]
+            fx_node = b.node()
+            b.add(0.0, '/s_new', [spec["defName"], fx_node, 1, track["fx"],
+                                  'inBus', prev_bus, 'outBus', next_bus]
+                  + b.pfield_args(spec.get("args") or {}))
+            b.node_map[spec["uid"]] = fx_node
+            b.def_names[spec["uid"]] = spec["defName"]
+            prev_bus = next_bus
+
+    main_src_bus = track_map["main"]["srcBus"]
+    for name in groups:
+        track = track_map[name]
+        b.add(0.0, '/s_new', ['__busRouter', b.node(), 1, track["parent"],
+                              'inBus', track["fxBus"], 'outBus', main_src_bus,
+                              'gain', 1.0])
+    b.add(0.0, '/s_new', ['__busRouter', b.node(), 1, track_map["main"]["parent"],
+                          'inBus', track_map["main"]["fxBus"], 'outBus', 0,
+                          'gain', 1.0])
+    track_map.setdefault("default", track_map["main"])
+    b.track_map = track_map
+
+
+def _setup_control_envelopes(b, control_data, buffer_path):
+    """Allocate/read the control buffer and spawn one ``__klEnvCtrl`` per
+    descriptor; returns ``{event_id: [mapping, ...]}``."""
+    descriptors = control_data.get("descriptors") or []
+    buffer = control_data.get("buffer")
+    if not descriptors or buffer is None:
+        return {}
+    block_size = control_data.get("blockSize", 512)
+    b.add(0.0, '/b_alloc', [_CONTROL_BUFNUM, len(buffer), 1])
+    b.add(0.0, '/b_read', [_CONTROL_BUFNUM, str(buffer_path), 0, -1, 0, 0])
+
+    ctrl_group = b.node()
+    b.add(0.0, '/g_new', [ctrl_group, 0, _SCORE_GROUP_ID])
+    mappings: dict[str, list] = {}
+    for desc in descriptors:
+        bus = b.control_bus()
+        start_frame = desc.get("frameOffset")
+        if start_frame is None:
+            start_frame = desc["blockIndex"] * block_size
+        num_frames = desc.get("numFrames") or block_size
+        first = float(buffer[start_frame]) if start_frame < len(buffer) else 0.0
+        b.add(0.0, '/c_set', [bus, first])
+        b.add(desc["start"], '/s_new', [
+            '__klEnvCtrl', b.node(), 0, ctrl_group,
+            'bufnum', _CONTROL_BUFNUM, 'bus', bus, 'dur', float(desc["dur"]),
+            'startFrame', int(start_frame), 'numFrames', int(num_frames),
+        ])
+        param = desc["pfields"][0] if desc.get("pfields") else 'amp'
+        for tgt in desc.get("targets") or []:
+            mappings.setdefault(tgt["id"], []).append(
+                {"param": param, "bus": bus, "startTime": tgt["startTime"]})
+    return mappings
+
+
+def _route_out(b, ev, args_pf):
+    if b.track_map is None:
+        return _SCORE_GROUP_ID
+    group = ev.get("group") or "default"
+    track = b.track_map.get(group) or b.track_map["default"]
+    args_pf["out"] = track["srcBus"]
+    return track["src"]
+
+
+def _schedule_auto_release(b, ev, node_id, def_name):
+    dur = ev.get("dur")
+    if ev.get("releaseAfter") and isinstance(dur, (int, float)) and dur > 0 \
+            and b.has_gate(def_name):
+        b.add(ev["start"] + dur, '/n_set', [node_id, 'gate', 0])
+
+
+def _lower_events(b, events, mappings):
+    piece_end = 0.0
+    for ev in events:
+        kind = ev.get("type")
+        start = float(ev.get("start", 0.0))
+        end = start + (ev["dur"] if kind in ("new", "set")
+                       and isinstance(ev.get("dur"), (int, float)) else 0.0)
+        piece_end = max(piece_end, end)
+        if ev.get("defName") == "__rest__":
+            continue
+
+        if kind == "new":
+            def_name = _resolve_def_name(ev.get("defName"))
+            node_id = b.node()
+            pfields = dict(ev.get("pfields") or {})
+            target = _route_out(b, ev, pfields)
+            b.add(start, '/s_new', [def_name, node_id, 0, target] + b.pfield_args(pfields))
+            b.node_map[ev["id"]] = node_id
+            b.def_names[ev["id"]] = def_name
+            _schedule_auto_release(b, ev, node_id, def_name)
+            for mp in mappings.get(ev["id"], []):
+                deferred = mp["startTime"] > start + 1e-9
+                b.add(mp["startTime"] if deferred else start,
+                      '/n_map', [node_id, mp["param"], mp["bus"]])
+        elif kind == "set":
+            node_id = b.node_map.get(ev.get("id"))
+            if node_id is None:
+                continue
+            def_name = b.def_names[ev["id"]]
+            pfields = dict(ev.get("pfields") or {})
+            _route_out(b, ev, pfields)
+            b.add(start, '/n_set', [node_id] + b.pfield_args(pfields))
+            _schedule_auto_release(b, ev, node_id, def_name)
+            for mp in mappings.get(ev["id"], []):
+                if abs(mp["startTime"] - start) <= 1e-6:
+                    b.add(start, '/n_map', [node_id, mp["param"], mp["bus"]])
+        elif kind == "release":
+            node_id = b.node_map.get(ev.get("id"))
+            if node_id is not None and b.has_gate(b.def_names[ev["id"]]):
+                b.add(start, '/n_set', [node_id, 'gate', 0])
+    return piece_end
+
+
+def _needed_synthdefs(events, meta, control_data):
+    names = {"__busRouter"}
+    for ev in events:
+        if ev.get("type") == "new" and ev.get("defName") != "__rest__":
+            names.add(_resolve_def_name(ev.get("defName")))
+    for specs in (meta.get("inserts") or {}).values():
+        names.update(spec["defName"] for spec in specs)
+    if control_data.get("descriptors"):
+        names.add("__klEnvCtrl")
+    return names
+
+
+def _needed_samples(events):
+    names = set()
+    for ev in events:
+        for key, val in (ev.get("pfields") or {}).items():
+            if isinstance(val, str) and key.startswith('buf'):
+                names.add(val)
+    return names
+
+
+def payload_to_nrt_bundles(payload, asset_dir, ring_time=5.0, stem='score'):
+    """Translate a lowered payload into timestamped OSC bundles.
+
+    Writes the sidecar audio the score reads (the control-envelope buffer
+    and any referenced samples) into *asset_dir*.
+
+    Parameters
+    ----------
+    payload : dict
+        ``{"events": [...], "meta": {...}, "control_data": {...}}`` as
+        returned by the SuperSonic converters (``meta`` and
+        ``control_data`` are optional).
+    asset_dir : str or Path
+        Directory receiving ``<stem>_ctrl.wav`` and ``<stem>_samples/``.
+    ring_time : float, optional
+        Seconds rendered past the last event end before the score group
+        is freed (default is 5).
+    stem : str, optional
+        File-name prefix for the sidecar assets.
+
+    Returns
+    -------
+    list of tuple
+        ``(time, [(address, args), ...])`` in ascending time order. The
+        final bundle frees the score group and so sets the render length.
+    """
+    from klotho.thetos.instruments._shared import load_ss_manifest
+    from klotho.utils.playback.supersonic.engine import _load_all_synthdef_assets
+
+    events = payload.get("events") or []
+    meta = payload.get("meta") or {}
+    control_data = payload.get("control_data") or {}
+    asset_dir = Path(asset_dir)
+
+    sample_bufnums = {}
+    sample_files = {}
+    needed_samples = sorted(_needed_samples(events))
+    if needed_samples:
+        from klotho.utils.playback.supersonic.samples import sample_bytes_b64
+        sample_dir = asset_dir / f"{stem}_samples"
+        sample_dir.mkdir(parents=True, exist_ok=True)
+        for i, name in enumerate(needed_samples, start=_CONTROL_BUFNUM + 1):
+            path = sample_dir / f"{name}.wav"
+            path.write_bytes(base64.b64decode(sample_bytes_b64(name)))
+            sample_bufnums[name] = i
+            sample_files[name] = path
+
+    b = _NRTBuilder(load_ss_manifest(), sample_bufnums)
+
+    assets = _load_all_synthdef_assets()
+    for name in sorted(_needed_synthdefs(events, meta, control_data)):
+        asset = assets.get(name) or (assets.get("kl_tri") if name == "default" else None)
+        if asset is not None:
+            b.add(0.0, '/d_recv', [base64.b64decode(asset)])
+    for name, bufnum in sample_bufnums.items():
+        b.add(0.0, '/b_allocRead', [bufnum, str(sample_files[name])])
+
+    b.add(0.0, '/g_new', [_SCORE_GROUP_ID, 0, 0])
+    if meta.get("groups") or meta.get("inserts"):
+        _setup_tracks(b, meta)
+
+    mappings = {}
+    buffer = control_data.get("buffer")
+    if control_data.get("descriptors") and buffer is not None:
+        import numpy as np
+        import scipy.io.wavfile as wavfile
+        buffer_path = asset_dir / f"{stem}_ctrl.wav"
+        asset_dir.mkdir(parents=True, exist_ok=True)
+        wavfile.write(str(buffer_path), 44100, np.asarray(buffer, dtype=np.float32))
+        mappings = _setup_control_envelopes(b, control_data, buffer_path)
+
+    piece_end = _lower_events(b, events, mappings)
+    b.add(piece_end + ring_time, '/n_free', [_SCORE_GROUP_ID])
+    return b.bundles()
+
+
+def write_nrt_score(obj, path, ring_time=5.0, **kwargs):
+    """Write *obj* as a SuperCollider NRT binary OSC score.
+
+    Parameters
+    ----------
+    obj : object
+        A :class:`~klotho.thetos.composition.score.Score`, any playable
+        Klotho object accepted by ``convert_to_sc_payload``, or an
+        already-lowered payload dict.
+    path : str or Path
+        Output score path (conventionally ``.osc``). The control buffer
+        and referenced samples are written alongside it.
+    ring_time : float, optional
+        Seconds of tail rendered after the last event (default is 5).
+    **kwargs
+        Forwarded to the converter when *obj* is not yet lowered.
+
+    Returns
+    -------
+    Path
+        The written score path.
+    """
+    path = Path(path)
+    payload = _lower(obj, **kwargs)
+    bundles = payload_to_nrt_bundles(payload, path.parent, ring_time=ring_time,
+                                     stem=path.stem)
+    path.write_bytes(encode_nrt_score(bundles))
+    return path
+
+
+def read_nrt_score(path):
+    """Decode an NRT score file into ``[(time, [(address, args), ...]), ...]``."""
+    return decode_nrt_score(Path(path).read_bytes())
+
+
+def nrt_command(score_path, output_path, sample_rate=48000, channels=2,
+                header_format='WAV', sample_format='int24', scsynth='scsynth'):
+    """The ``scsynth -N`` argv that renders *score_path* to *output_path*."""
+    return [scsynth, '-N', str(score_path), '_', str(output_path),
+            str(int(sample_rate)), header_format, sample_format,
+            '-o', str(int(channels))]
+
+
+def render_nrt(score_path, output_path, **kwargs):
+    """Render an NRT score with a local ``scsynth``.
+
+    Parameters
+    ----------
+    score_path, output_path : str or Path
+        Score written by :func:`write_nrt_score` and the audio file to
+        produce.
+    **kwargs
+        Forwarded to :func:`nrt_command` (``sample_rate``, ``channels``,
+        ``header_format``, ``sample_format``, ``scsynth``).
+
+    Returns
+    -------
+    Path
+        *output_path*.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the ``scsynth`` executable cannot be found.
+    subprocess.CalledProcessError
+        If scsynth exits with an error.
+    """
+    subprocess.run(nrt_command(score_path, output_path, **kwargs),
+                   check=True, capture_output=True)
+    return Path(output_path)
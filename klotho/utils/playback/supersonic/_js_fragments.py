@@ -100,6 +100,7 @@ def synthdef_registry_merge_js(assets_json):
 
 
 def synthdef_loader_js(needed_json):
+    # Registry values are inline base64 or "@<url>" asset-store references.
     return f"""(async function() {{
     var state = globalThis.__klothoSonic;
     if (!state || !state.promise) return;
@@ -111,10 +112,22 @@ def synthdef_loader_js(needed_json):
     for (var i = 0; i < needed.length; i++) {{
         var name = needed[i];
         if (loaded.has(name)) continue;
-        var b64 = registry[name];
-        if (b64) {{
-            var bytes = Uint8Array.from(atob(b64), function(c) {{ return c.charCodeAt(0); }});
-            try {{ await sonic.loadSynthDef(bytes); loaded.add(name); }} catch(e) {{}}
+        var asset = registry[name];
+        if (asset) {{
+            try {{
+                var bytes;
+                if (asset.charAt(0) === '@') {{
+                    var url = asset.slice(1);
+                    var resp = await fetch(url);
+                    if (!resp.ok) throw new Error('HTTP ' + resp.status + ' for ' + url);
+                    bytes = new Uint8Array(await resp.arrayBuffer());
+                }} else {{
+                    bytes = Uint8Array.from(atob(asset), function(c) {{ return c.charCodeAt(0); }});
+                }}
+                await sonic.loadSynthDef(bytes); loaded.add(name);
+            }} catch(e) {{
+                console.warn('[Klotho] ' + name + ': ' + (e && e.message ? e.message : e));
+            }}
         }} else {{
             try {{ await sonic.loadSynthDef(name); loaded.add(name); }} catch(e) {{}}
         }}
@@ -3,8 +3,36 @@
 // animated-figure bridge) goes through these instead of carrying its own
 // copies. Session state (loadedDefs, sampleMap, bufnum allocator) lives on
 // globalThis.__klothoSonic and is shared across widgets.
+//
+// Asset values are either inline base64 or, in the 'store' asset mode,
+// content-addressed references: SynthDefs as "@<url>" strings ('@' is not
+// a base64 character) and samples as {url, hash}. References are fetched
+// on first use; the versioned guard lets a newer widget replace an older
+// lifecycle left on the page by saved outputs.
 (() => {
-    if (typeof globalThis.KlothoEngineLifecycle !== "undefined") return;
+    var LIFECYCLE_VERSION = 2;
+    var prev = globalThis.KlothoEngineLifecycle;
+    if (prev && prev.version >= LIFECYCLE_VERSION) return;
+
+    function b64Bytes(b64) {
+        return Uint8Array.from(atob(b64), function(c) { return c.charCodeAt(0); });
+    }
+
+    async function fetchBytes(url) {
+        var resp = await fetch(url);
+        if (!resp.ok) throw new Error('HTTP ' + resp.status + ' for ' + url);
+        return new Uint8Array(await resp.arrayBuffer());
+    }
+
+    function synthdefBytes(value) {
+        return value.charAt(0) === '@'
+            ? fetchBytes(value.slice(1))
+            : Promise.resolve(b64Bytes(value));
+    }
+
+    function sampleBytes(asset) {
+        return asset.url ? fetchBytes(asset.url) : Promise.resolve(b64Bytes(asset.b64));
+    }
 
     function ensureSonic(ssConfig) {
         if (typeof globalThis.__ensureSuperSonic === "function") {
@@ -40,10 +68,9 @@
         for (var i = 0; i < neededSynthdefs.length; i++) {
             var name = neededSynthdefs[i];
             if (loaded.has(name)) continue;
-            var b64 = registry[name];
-            if (b64) {
-                var bytes = Uint8Array.from(atob(b64), function(c) { return c.charCodeAt(0); });
-                try { await sonic.loadSynthDef(bytes); loaded.add(name); } catch(e) {}
+            var asset = registry[name];
+            if (asset) {
+                try { await sonic.loadSynthDef(await synthdefBytes(asset)); loaded.add(name); } catch(e) {}
             } else {
                 try { await sonic.loadSynthDef(name); loaded.add(name); } catch(e) {}
             }
@@ -62,10 +89,9 @@
         for (var name in sampleAssets) {
             if (!sampleAssets.hasOwnProperty(name)) continue;
             if (state.sampleMap[name] != null) continue;
-            var b64 = sampleAssets[name].b64;
-            var bytes = Uint8Array.from(atob(b64), function(c) { return c.charCodeAt(0); });
             var bufnum = state._nextBufnum++;
             try {
+                var bytes = await sampleBytes(sampleAssets[name]);
                 await sonic.loadSample(bufnum, bytes.buffer);
                 state.sampleMap[name] = bufnum;
             } catch(e) {
@@ -78,6 +104,7 @@
     }
 
     globalThis.KlothoEngineLifecycle = {
+        version: LIFECYCLE_VERSION,
         ensureSonic: ensureSonic,
         loadDefs: loadDefs,
         loadSamples: loadSamples,
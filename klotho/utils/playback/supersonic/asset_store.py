@@ -0,0 +1,254 @@
+"""Content-addressed on-disk store for widget SynthDefs and samples.
+
+By default every playback widget embeds the compiled SynthDefs and WAV
+samples it needs as base64 JSON, so replaying a sampler-heavy piece
+duplicates megabytes per notebook cell.  In ``'store'`` asset mode (see
+:func:`~klotho.utils.playback._config.set_asset_mode`) each asset is
+instead written once to a cache directory under its SHA-256 digest, and
+the widget references it by URL; the browser fetches it on first use.
+
+A persistent ``manifest.json`` in the store maps each source (a file path
+with its size and mtime, or the digest of an in-memory registration) to
+its content hash, so repeated ``play()`` calls neither re-read nor
+re-encode assets that are already stored.
+
+Layout::
+
+    <root>/manifest.json
+    <root>/<sha256>.scsyndef
+    <root>/<sha256>.wav
+"""
+
+import base64
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+__all__ = [
+    'AssetStore',
+    'get_asset_store',
+    'stored_synthdef_refs',
+    'stored_sample_refs',
+]
+
+_MANIFEST_NAME = "manifest.json"
+
+# Synthdef registry values are base64 strings in embed mode; '@' is not in
+# the base64 alphabet, so '@<url>' unambiguously marks a stored reference
+# for the JS loaders (and changes whenever the content hash changes).
+STORED_REF_PREFIX = "@"
+
+
+class AssetStore:
+    """A directory of immutable, hash-named asset files.
+
+    Parameters
+    ----------
+    root : str or Path
+        Store directory (created on first write).
+    url_prefix : str or None, optional
+        Prefix the browser uses to fetch stored files. Defaults to *root*
+        as given (a path relative to the notebook when *root* is
+        relative). Set it to whatever URL serves *root*, e.g. a Jupyter
+        ``files/`` route or the address returned by :meth:`serve`.
+    """
+
+    def __init__(self, root, url_prefix=None):
+        self.root = Path(root)
+        self.url_prefix = (url_prefix if url_prefix is not None
+                           else Path(root).as_posix()).rstrip('/')
+        self._manifest = None
+        self._lock = threading.Lock()
+        self._server = None
+
+    # ------------------------------------------------------------------
+    # Manifest
+    # ------------------------------------------------------------------
+
+    @property
+    def manifest_path(self):
+        return self.root / _MANIFEST_NAME
+
+    def _load_manifest(self):
+        if self._manifest is None:
+            try:
+                self._manifest = json.loads(self.manifest_path.read_text())
+            except (OSError, ValueError):
+                self._manifest = {}
+        return self._manifest
+
+    def _save_manifest(self):
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.manifest_path.with_suffix('.json.tmp')
+        tmp.write_text(json.dumps(self._manifest, sort_keys=True, indent=1))
+        os.replace(tmp, self.manifest_path)
+
+    def _lookup(self, source_key):
+        entry = self._load_manifest().get(source_key)
+        if entry is not None and self.path(entry["hash"], entry["ext"]).exists():
+            return entry["hash"]
+        return None
+
+    def _record(self, source_key, digest, ext):
+        self._load_manifest()[source_key] = {"hash": digest, "ext": ext}
+        self._save_manifest()
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def path(self, digest, ext):
+        """Filesystem path of a stored object."""
+        return self.root / f"{digest}.{ext}"
+
+    def url(self, digest, ext):
+        """Browser URL of a stored object."""
+        return f"{self.url_prefix}/{digest}.{ext}"
+
+    def put_bytes(self, data, ext):
+        """Store *data* under its SHA-256 digest and return the digest.
+
+        Existing objects are never rewritten (same digest, same bytes).
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        target = self.path(digest, ext)
+        if not target.exists():
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp = target.with_suffix(f'.{ext}.tmp{os.getpid()}')
+            tmp.write_bytes(data)
+            os.replace(tmp, target)
+        return digest
+
+    def put_file(self, path, ext=None):
+        """Store the file at *path*; unchanged files are a manifest hit.
+
+        The source key is the resolved path plus its size and mtime, so a
+        hit costs one ``stat`` and no read.
+        """
+        path = Path(path)
+        ext = ext or path.suffix.lstrip('.')
+        st = path.stat()
+        key = f"file:{path.resolve()}:{st.st_size}:{st.st_mtime_ns}"
+        with self._lock:
+            digest = self._lookup(key)
+            if digest is None:
+                digest = self.put_bytes(path.read_bytes(), ext)
+                self._record(key, digest, ext)
+        return digest
+
+    def put_b64(self, b64, ext):
+        """Store base64-encoded bytes (runtime registrations).
+
+        Keyed by a digest of the base64 text, so a hit skips decoding.
+        """
+        key = "b64:" + hashlib.sha256(b64.encode('ascii')).hexdigest()
+        with self._lock:
+            digest = self._lookup(key)
+            if digest is None:
+                digest = self.put_bytes(base64.b64decode(b64), ext)
+                self._record(key, digest, ext)
+        return digest
+
+    # ------------------------------------------------------------------
+    # Local file server
+    # ------------------------------------------------------------------
+
+    def serve(self, host="127.0.0.1", port=0):
+        """Serve the store over HTTP from a daemon thread.
+
+        Sets :attr:`url_prefix` to the server address (CORS enabled so
+        notebook frontends on another origin can fetch) and returns it.
+        Calling again returns the running server's address.
+        """
+        if self._server is not None:
+            return self.url_prefix
+        from functools import partial
+        from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+        class _Handler(SimpleHTTPRequestHandler):
+            def end_headers(self):
+                self.send_header("Access-Control-Allow-Origin", "*")
+                self.send_header("Cache-Control", "public, max-age=31536000, immutable")
+                super().end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        server = ThreadingHTTPServer(
+            (host, port), partial(_Handler, directory=str(self.root)))
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self._server = server
+        self.url_prefix = f"http://{host}:{server.server_address[1]}"
+        return self.url_prefix
+
+    def shutdown(self):
+        """Stop the server started by :meth:`serve`, if any."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+_STORE = None
+
+
+def get_asset_store():
+    """The store configured by ``set_asset_mode('store', ...)``."""
+    global _STORE
+    from klotho.utils.playback._config import _asset_store_config
+    root, url_prefix, serve = _asset_store_config()
+    if _STORE is None or _STORE.root != Path(root) or (
+            url_prefix is not None and _STORE.url_prefix != url_prefix.rstrip('/')):
+        if _STORE is not None:
+            _STORE.shutdown()
+        _STORE = AssetStore(root, url_prefix=url_prefix)
+    if serve:
+        _STORE.serve()
+    return _STORE
+
+
+def stored_synthdef_refs(needed, store=None):
+    """``{name: '@<url>'}`` for the needed SynthDefs, storing as required.
+
+    Same name resolution as the embedded path: runtime registrations win
+    over bundled files, and ``default`` aliases ``kl_tri``.
+    """
+    from klotho.utils.playback.supersonic.engine import (
+        _INFRA_SYNTHDEFS, _disk_synthdef_paths,
+    )
+    from klotho.utils.playback.supersonic.registry import runtime_assets
+    store = store or get_asset_store()
+    runtime = runtime_assets()
+    disk = _disk_synthdef_paths()
+    refs = {}
+    for name in set(needed) | _INFRA_SYNTHDEFS | {"default"}:
+        if name in runtime:
+            digest = store.put_b64(runtime[name], "scsyndef")
+        elif name in disk:
+            digest = store.put_file(disk[name], "scsyndef")
+        else:
+            continue
+        refs[name] = STORED_REF_PREFIX + store.url(digest, "scsyndef")
+    return refs
+
+
+def stored_sample_refs(names, store=None):
+    """``{name: {"url", "hash", "channels"}}`` for the named samples."""
+    from klotho.utils.playback.supersonic.samples import (
+        SAMPLES_DIR, _RUNTIME_SAMPLES, sample_info,
+    )
+    store = store or get_asset_store()
+    refs = {}
+    for name in sorted(names):
+        info = sample_info(name)
+        runtime = _RUNTIME_SAMPLES.get(name)
+        if runtime is not None:
+            digest = store.put_b64(runtime["b64"], "wav")
+        else:
+            digest = store.put_file(SAMPLES_DIR / info["file"], "wav")
+        refs[name] = {"url": store.url(digest, "wav"), "hash": digest,
+                      "channels": info["channels"]}
+    return refs
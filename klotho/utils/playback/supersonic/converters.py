@@ -1,6 +1,8 @@
+import numpy as np
+
 from klotho.utils.ids import fast_id
 
-from klotho.tonos import Pitch
+from klotho.tonos import Pitch, PitchArray
 from klotho.tonos.pitch.pitch_collections import PitchCollectionBase
 from klotho.tonos.chords.chord import Chord, Voicing, ChordSequence
 from klotho.tonos.scales.scale import Scale
@@ -141,13 +143,13 @@ def pitch_to_sc_events(pitch, duration=None, amp=None, extra_pfields=None, inst=
 
 def pitch_collection_to_sc_events(obj, duration=None, mode="seq", arp=False, strum=0, direction='u',
                                   amp=None, pause=0.0, extra_pfields=None, inst=None):
-    pitches = [obj[i] for i in range(len(obj))]
+    pitches = obj.realize()
     synth, inst_ctx = _resolve_synth(inst, DEFAULT_COLLECTION_SYNTH)
 
     if mode == "chord":
-        pitches = sorted(pitches, key=lambda p: p.freq)
+        pitches = pitches[np.argsort(pitches.freqs, kind='stable')]
         if direction.lower() == 'd':
-            pitches = list(reversed(pitches))
+            pitches = pitches[::-1]
         if arp:
             dur = duration if duration is not None else DEFAULT_CHORD_DURATION
             return _build_seq_sc_events(pitches, 0, synth=synth, amp=amp,
@@ -176,11 +178,11 @@ def scale_to_sc_events(obj, duration=None, equaves=1, amp=None, pause=0.0, extra
 
 def chord_to_sc_events(obj, duration=None, arp=False, strum=0, direction='u',
                        amp=None, extra_pfields=None, inst=None):
-    pitches = [obj[i] for i in range(len(obj))]
+    pitches = obj.realize()
     synth, inst_ctx = _resolve_synth(inst, DEFAULT_COLLECTION_SYNTH)
 
     if direction.lower() == 'd':
-        pitches = list(reversed(pitches))
+        pitches = pitches[::-1]
 
     if arp:
         dur = duration if duration is not None else DEFAULT_CHORD_DURATION
@@ -201,26 +203,23 @@ def chord_sequence_to_sc_events(obj, duration=None, arp=False, strum=0, directio
     synth, inst_ctx = _resolve_synth(inst, DEFAULT_COLLECTION_SYNTH)
     groups = []
     for chord in obj:
-        groups.append([chord[i] for i in range(len(chord))])
-    group_voice_amps = [
-        compute_voice_amplitudes([p.freq for p in group], amp)
-        for group in groups
-    ]
+        groups.append(chord.realize().freqs.tolist())
+    group_voice_amps = [compute_voice_amplitudes(group, amp) for group in groups]
 
     if arp:
-        for gi, _, start_time, voice_dur, p in iter_group_sequence(groups, dur, arp=True, direction=direction, pause=pause):
+        for gi, _, start_time, voice_dur, freq in iter_group_sequence(groups, dur, arp=True, direction=direction, pause=pause):
             uid = _uid()
             events.extend(_inst_note(uid, synth, start_time,
                 voice_dur, {
-                    "freq": p.freq,
-                    "amp": single_voice_amplitude(p.freq, amp),
+                    "freq": freq,
+                    "amp": single_voice_amplitude(freq, amp),
                 }, step_index=gi, extra_pfields=extra_pfields, inst_ctx=inst_ctx))
     else:
-        for gi, vi, start_time, voice_dur, p in iter_group_sequence(groups, dur, arp=False, strum=strum, direction=direction, pause=pause):
+        for gi, vi, start_time, voice_dur, freq in iter_group_sequence(groups, dur, arp=False, strum=strum, direction=direction, pause=pause):
             uid = _uid()
             events.extend(_inst_note(uid, synth, start_time,
                 voice_dur, {
-                    "freq": p.freq,
+                    "freq": freq,
                     "amp": group_voice_amps[gi][vi],
                 }, step_index=gi, extra_pfields=extra_pfields, inst_ctx=inst_ctx))
 
@@ -331,6 +330,13 @@ def compositional_unit_to_sc_animation_events(obj, extra_pfields=None):
     return compositional_unit_to_sc_events(obj, extra_pfields=extra_pfields, animation=True)
 
 
+def _freqs_of(pitches):
+    """Frequencies of a PitchArray (no Pitch objects) or a Pitch list."""
+    if isinstance(pitches, PitchArray):
+        return pitches.freqs.tolist()
+    return [p.freq for p in pitches]
+
+
 def _build_seq_sc_events(pitches, start, synth, amp=None, per_voice_dur=None,
                          total_dur=None, pause=0.0, extra_pfields=None, inst_ctx=None):
     events = []
@@ -346,11 +352,11 @@ def _build_seq_sc_events(pitches, start, synth, amp=None, per_voice_dur=None,
         voice_dur = DEFAULT_NOTE_DURATION
 
     cursor = start
-    for i, pitch in enumerate(pitches):
+    for i, freq in enumerate(_freqs_of(pitches)):
         uid = _uid()
         events.extend(_inst_note(uid, synth, cursor, voice_dur, {
-            "freq": pitch.freq,
-            "amp": single_voice_amplitude(pitch.freq, amp),
+            "freq": freq,
+            "amp": single_voice_amplitude(freq, amp),
         }, step_index=i, extra_pfields=extra_pfields, inst_ctx=inst_ctx))
         cursor += voice_dur + max(0.0, pause)
     return events
@@ -363,16 +369,16 @@ def _build_chord_sc_events(pitches, start, dur, strum, synth, amp=None,
     if num == 0:
         return events
 
-    freqs = [p.freq for p in pitches]
+    freqs = _freqs_of(pitches)
     voice_amps = compute_voice_amplitudes(freqs, amp)
     strum = max(0, min(1, strum))
 
-    for i, pitch in enumerate(pitches):
+    for i, freq in enumerate(freqs):
         uid = _uid()
         start_offset = (strum * dur * i) / num if num > 1 else 0
         events.extend(_inst_note(uid, synth, start + start_offset,
             (dur * dur_factor) - start_offset, {
-                "freq": pitch.freq,
+                "freq": freq,
                 "amp": voice_amps[i],
             }, step_index=i, extra_pfields=extra_pfields, inst_ctx=inst_ctx))
     return events
@@ -555,35 +561,100 @@ def _build_score_meta(score) -> dict:
     return meta
 
 
-def _build_score_control_data(control_descriptors, block_size):
+# __klEnvCtrl sample-and-holds its bus in ~30ms steps, so frames finer
+# than that are never heard; keep in sync with klotho_synthdefs.scd.
+_CONTROL_STEP_SECONDS = 0.03
+_MIN_CONTROL_BLOCK_SIZE = 16
+
+
+def _adaptive_block_size(env, duration, max_size):
+    """Frames needed to render *env* over *duration* seconds of playback.
+
+    Curved or exp-warped envelopes get one frame per ``__klEnvCtrl`` hold
+    step (finer resolution is inaudible). Piecewise-linear envelopes are
+    reconstructed by the buffer read's linear interpolation, so they only
+    need enough frames to put a few samples inside their shortest segment.
+    The result is clamped to ``[_MIN_CONTROL_BLOCK_SIZE, max_size]``.
+    """
+    import math
+
+    floor = min(_MIN_CONTROL_BLOCK_SIZE, max_size)
+    if duration <= 0 or env.total_time <= 0:
+        return floor
+    frames = math.ceil(duration / _CONTROL_STEP_SECONDS) + 1
+    if env.warp == 'lin' and not any(env._curve):
+        shortest = min((t for t in env.times if t > 0), default=0.0)
+        if shortest > 0:
+            per_segment = math.ceil(4 * sum(env.times) / shortest) + 1
+            frames = min(frames, per_segment)
+    return max(floor, min(max_size, frames))
+
+
+def _build_score_control_data(control_descriptors, block_size, adaptive=False):
     """Build ``{buffer, blockSize, descriptors}`` for SuperSonic from the
     per-UC resolved control-envelope descriptors collected during
-    lowering."""
+    lowering.
+
+    Blocks are content-addressed: descriptors whose envelopes share
+    :attr:`~klotho.dynatos.Envelope.content_key` (and block length) point
+    at one sampled block via ``blockIndex``, so a shape applied per phrase
+    across a repeated unit is sampled and stored once.
+
+    With *adaptive*, each block's length comes from
+    :func:`_adaptive_block_size` (at most *block_size*) and every
+    descriptor additionally carries ``frameOffset``/``numFrames``;
+    otherwise all blocks are *block_size* frames and a block starts at
+    ``blockIndex * blockSize``.
+    """
     if not control_descriptors:
         return {"buffer": None, "blockSize": block_size, "descriptors": []}
 
     import numpy as np
+    from klotho.dynatos.envelopes import sample_envelopes
 
-    blocks = []
-    serializable: list[dict] = []
-
-    for i, desc in enumerate(control_descriptors):
+    block_ids: dict = {}
+    unique: list[tuple] = []
+    desc_blocks: list[int] = []
+    for desc in control_descriptors:
         env = desc["envelope"]
-        total = env.total_time
-        if total <= 0:
-            samples = np.full(block_size, float(env.values[0]), dtype=np.float32)
-        else:
-            sample_times = np.linspace(0.0, total, block_size, dtype=np.float64)
-            samples = np.array(env.sample(sample_times), dtype=np.float32)
-        blocks.append(samples)
+        n = (_adaptive_block_size(env, desc["duration"], block_size)
+             if adaptive else block_size)
+        key = (env.content_key, n)
+        idx = block_ids.get(key)
+        if idx is None:
+            idx = block_ids[key] = len(unique)
+            unique.append((env, n))
+        desc_blocks.append(idx)
+
+    # one array pass per distinct block length over the unique envelopes
+    # (rows span each envelope's own duration; zero-length envelopes hold
+    # their first value)
+    blocks: list = [None] * len(unique)
+    by_size: dict[int, list[int]] = {}
+    for idx, (_, n) in enumerate(unique):
+        by_size.setdefault(n, []).append(idx)
+    for n, indices in by_size.items():
+        rows = sample_envelopes([unique[i][0] for i in indices], n)
+        for i, row in zip(indices, rows.astype(np.float32)):
+            blocks[i] = row
+
+    offsets = np.concatenate(
+        ([0], np.cumsum([n for _, n in unique])[:-1])
+    ).tolist()
 
-        serializable.append({
-            "blockIndex": i,
+    serializable: list[dict] = []
+    for desc, idx in zip(control_descriptors, desc_blocks):
+        entry = {"blockIndex": idx}
+        if adaptive:
+            entry["frameOffset"] = offsets[idx]
+            entry["numFrames"] = unique[idx][1]
+        entry.update({
             "start": desc["start"],
             "dur": desc["duration"],
             "pfields": desc["pfields"],
             "targets": desc["targets"],
         })
+        serializable.append(entry)
 
     buffer_data = np.concatenate(blocks)
     return {
@@ -963,7 +1034,10 @@ def convert_score_to_sc_events(score, start_time=None, **kwargs) -> dict:
 
     block_size = getattr(score, "_block_size", _DEFAULT_SCORE_BLOCK_SIZE)
     meta = _build_score_meta(score)
-    control_data = _build_score_control_data(control_descriptors, block_size)
+    control_data = _build_score_control_data(
+        control_descriptors, block_size,
+        adaptive=getattr(score, "_adaptive_blocks", False),
+    )
 
     return {
         "events": all_events,
@@ -976,8 +1050,10 @@ def _payload_sample_assets(events):
     """Sample assets referenced by ``buf*`` pfields, keyed by name.
 
     Same discovery rule as ``SuperSonicEngine._needed_samples``; used by
-    the animated plot(score) payload, which travels as JSON.
+    the animated plot(score) payload, which travels as JSON. In ``'store'``
+    asset mode entries are ``{"url", "hash", "channels"}`` references.
     """
+    from klotho.utils.playback._config import get_asset_mode
     from klotho.utils.playback.supersonic.samples import (
         sample_info, sample_bytes_b64,
     )
@@ -989,6 +1065,9 @@ def _payload_sample_assets(events):
         for key, val in pfields.items():
             if isinstance(val, str) and key.startswith('buf'):
                 names.add(val)
+    if get_asset_mode() == "store":
+        from klotho.utils.playback.supersonic.asset_store import stored_sample_refs
+        return stored_sample_refs(names)
     return {
         name: {"b64": sample_bytes_b64(name),
                "channels": sample_info(name)["channels"]}
@@ -1070,7 +1149,10 @@ def convert_score_to_sc_animation_events(score) -> dict:
     validate_sc_events(all_events, animation=True)
 
     block_size = getattr(score, "_block_size", _DEFAULT_SCORE_BLOCK_SIZE)
-    control_data = _build_score_control_data(control_descriptors, block_size)
+    control_data = _build_score_control_data(
+        control_descriptors, block_size,
+        adaptive=getattr(score, "_adaptive_blocks", False),
+    )
 
     return {
         "events": all_events,
@@ -1143,7 +1225,8 @@ def _shift_payload_to_zero(events, descriptors):
     return events, descriptors
 
 
-def convert_to_sc_payload(obj, block_size=_DEFAULT_SCORE_BLOCK_SIZE, **kwargs):
+def convert_to_sc_payload(obj, block_size=_DEFAULT_SCORE_BLOCK_SIZE,
+                          adaptive_blocks=False, **kwargs):
     """Convert a bare UC/UTS/BT (or any playable object) to a payload
     ``{"events": [...], "control_data": {...}}``.
 
@@ -1152,7 +1235,8 @@ def convert_to_sc_payload(obj, block_size=_DEFAULT_SCORE_BLOCK_SIZE, **kwargs):
     :class:`CompositionalUnit` so ``apply_envelope(..., control=True)``
     produces continuous bus automation outside a Score. Other object
     types fall through to :func:`convert_to_sc_events` with an empty
-    ``control_data``.
+    ``control_data``. *block_size* and *adaptive_blocks* size the
+    control-envelope blocks as in :class:`~klotho.thetos.composition.score.Score`.
     """
     from klotho.utils.playback._sc_validate import validate_sc_events
     from klotho.thetos.instruments.base import reset_kit_rotations
@@ -1172,7 +1256,9 @@ def convert_to_sc_payload(obj, block_size=_DEFAULT_SCORE_BLOCK_SIZE, **kwargs):
         descriptors = []
 
     validate_sc_events(events)
-    control_data = _build_score_control_data(descriptors, block_size)
+    control_data = _build_score_control_data(
+        descriptors, block_size, adaptive=adaptive_blocks
+    )
     return {"events": events, "control_data": control_data}
 
 
@@ -7,6 +7,7 @@ from IPython.display import HTML, display
 
 from klotho.utils.playback.supersonic.cdn import supersonic_config
 from klotho.utils.playback._helpers import convert_numpy_types
+from klotho.utils.playback._event_codec import encode_events
 from klotho.utils.playback.supersonic._js_fragments import (
     ss_init_js, draw_scheduler_js, scheduler_core_js, scheduler_score_js,
     synthdef_registry_merge_js, control_bar_html, lifecycle_js,
@@ -17,20 +18,31 @@ SYNTHDEFS_DIR = Path(__file__).parent / "assets" / "synthdefs"
 _WIDGET_JS_PATH = Path(__file__).parent / "_engine_widget.js"
 _WIDGET_JS_TEMPLATE = None
 _DISK_SYNTHDEF_ASSETS = None
+_DISK_SYNTHDEF_PATHS = None
 
 _INFRA_SYNTHDEFS = frozenset({'__busRouter', '__busRouterMonitor', '__chainLimiter'})
 
 
+def _disk_synthdef_paths():
+    global _DISK_SYNTHDEF_PATHS
+    if _DISK_SYNTHDEF_PATHS is None:
+        paths = {}
+        if SYNTHDEFS_DIR.exists():
+            for path in sorted(SYNTHDEFS_DIR.rglob("*.scsyndef")):
+                paths[path.stem] = path
+        if "default" not in paths and "kl_tri" in paths:
+            paths["default"] = paths["kl_tri"]
+        _DISK_SYNTHDEF_PATHS = paths
+    return _DISK_SYNTHDEF_PATHS
+
+
 def _load_disk_synthdef_assets():
     global _DISK_SYNTHDEF_ASSETS
     if _DISK_SYNTHDEF_ASSETS is None:
-        assets = {}
-        if SYNTHDEFS_DIR.exists():
-            for path in sorted(SYNTHDEFS_DIR.rglob("*.scsyndef")):
-                assets[path.stem] = base64.b64encode(path.read_bytes()).decode("ascii")
-        if "default" not in assets and "kl_tri" in assets:
-            assets["default"] = assets["kl_tri"]
-        _DISK_SYNTHDEF_ASSETS = assets
+        _DISK_SYNTHDEF_ASSETS = {
+            name: base64.b64encode(path.read_bytes()).decode("ascii")
+            for name, path in _disk_synthdef_paths().items()
+        }
     return _DISK_SYNTHDEF_ASSETS
 
 
@@ -114,7 +126,9 @@ class SuperSonicEngine:
 
     def __init__(self, events, meta=None, control_data=None, ring_time=5, loop=False,
                  record=False):
-        self.events = convert_numpy_types(events)
+        # Events stay as lowered (numpy scalars included); the widget
+        # ships them column-encoded, so no per-event conversion pass.
+        self.events = events if isinstance(events, list) else list(events)
         self.meta = convert_numpy_types(meta or {})
         raw_control = control_data or {"buffer": None, "blockSize": 512, "descriptors": []}
         raw_buffer = raw_control.get("buffer")
@@ -130,8 +144,17 @@ class SuperSonicEngine:
         if self.meta:
             validate_sc_meta(self.meta)
         self._needed = self._needed_synthdefs() | _INFRA_SYNTHDEFS
-        self.synthdef_assets = _filter_synthdef_assets(_load_all_synthdef_assets(), self._needed)
-        self.sample_assets = self._load_needed_samples()
+        from klotho.utils.playback._config import get_asset_mode
+        if get_asset_mode() == "store":
+            from klotho.utils.playback.supersonic.asset_store import (
+                stored_synthdef_refs, stored_sample_refs,
+            )
+            self.synthdef_assets = stored_synthdef_refs(self._needed)
+            self.sample_assets = stored_sample_refs(self._needed_samples())
+        else:
+            self.synthdef_assets = _filter_synthdef_assets(
+                _load_all_synthdef_assets(), self._needed)
+            self.sample_assets = self._load_needed_samples()
         self._is_score = bool(self.meta.get("groups") or self.meta.get("inserts"))
 
     def _needed_synthdefs(self):
@@ -186,7 +209,8 @@ class SuperSonicEngine:
                 f"This widget embeds {total_bytes / 1048576:.1f} MB of sample "
                 f"audio in its HTML, and every play() re-embeds it (saved "
                 f"notebooks store it per cell; Colab cells cannot share it). "
-                f"Consider trimming samples or using fewer per piece.",
+                f"Consider trimming samples, using fewer per piece, or "
+                f"klotho.set_asset_mode('store') to reference them by hash.",
                 stacklevel=3,
             )
         return assets
@@ -195,7 +219,7 @@ class SuperSonicEngine:
         return serialize_control_data(self.control_data)
 
     def _generate_html(self):
-        events_json = json.dumps(self.events)
+        events_json = json.dumps(encode_events(self.events))
         synthdef_assets_json = json.dumps(self.synthdef_assets)
         needed_json = json.dumps(list(self._needed))
         config_json = json.dumps(supersonic_config())
@@ -7,7 +7,10 @@
   // Keyed on the V2 marker (not setupTracks) so pages carrying a stale
   // pre-V2 copy from saved outputs get THIS build's preloadControlBuffer
   // (the pre-V2 one raced /b_alloc and left control envelopes silent).
-  if (globalThis.BrowserScheduler.prototype.__klothoScoreExtV2) return;
+  // V3 (per-descriptor frameOffset/numFrames for adaptive, deduplicated
+  // control blocks): a stale V2 copy would read every block at
+  // blockIndex * blockSize, so V3 keys on its own name.
+  if (globalThis.BrowserScheduler.prototype.__klothoScoreExtV3) return;
 
   var FIRST_PRIVATE_BUS = 48; // keep in sync with scheduler_core.js
   var BUS_CHANNELS = 2;
@@ -274,7 +277,12 @@
     for (var di = 0; di < descs.length; di++) {
       var desc = descs[di];
       var ctrlBus = this._allocControlBus();
-      var startFrame = desc.blockIndex * blockSize;
+      // Adaptive payloads size each block individually; uniform ones
+      // (the default) locate blocks by index. Deduplicated descriptors
+      // share a blockIndex either way.
+      var startFrame = (desc.frameOffset != null)
+        ? desc.frameOffset : desc.blockIndex * blockSize;
+      var numFrames = desc.numFrames || blockSize;
       // Preset the (possibly recycled) bus to the envelope's first value
       // so a mapped param can never read a stale level in the gap before
       // its __klEnvCtrl synth starts writing.
@@ -288,7 +296,7 @@
         dur: desc.dur,
         bufnum: bufnum,
         startFrame: startFrame,
-        numFrames: blockSize,
+        numFrames: numFrames,
         controlGroupId: ctrlGid
       });
     }
@@ -344,4 +352,5 @@
   };
 
   proto.__klothoScoreExtV2 = true;
+  proto.__klothoScoreExtV3 = true;
 })();
@@ -0,0 +1,140 @@
+"""Content-addressed asset store and the 'store' asset mode.
+
+Assets are written once under their SHA-256 digest, a persistent manifest
+lets later calls (and later sessions) skip reading/encoding, and widgets
+in store mode carry URL references instead of base64 bytes.
+"""
+import hashlib
+import io
+import json
+import urllib.request
+import wave
+
+import pytest
+
+from klotho.utils.playback._config import set_asset_mode, get_asset_mode
+from klotho.utils.playback.supersonic.asset_store import (
+    AssetStore, stored_synthdef_refs, stored_sample_refs,
+)
+from klotho.utils.playback.supersonic.samples import (
+    register_sample, clear_runtime_samples,
+)
+
+
+@pytest.fixture(autouse=True)
+def _embed_mode_after():
+    yield
+    set_asset_mode('embed')
+    clear_runtime_samples()
+
+
+def make_wav(seed=0):
+    bio = io.BytesIO()
+    with wave.open(bio, 'wb') as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(44100)
+        w.writeframes(bytes([seed % 256]) * 400)
+    return bio.getvalue()
+
+
+def _events():
+    return [{
+        "type": "new", "id": "a1", "defName": "kl_tri", "start": 0.0,
+        "dur": 0.5, "releaseAfter": True,
+        "pfields": {"freq": 440.0, "amp": 0.5},
+    }]
+
+
+class TestAssetStore:
+    def test_put_bytes_is_content_addressed(self, tmp_path):
+        store = AssetStore(tmp_path)
+        digest = store.put_bytes(b'abc', 'wav')
+        assert digest == hashlib.sha256(b'abc').hexdigest()
+        assert store.path(digest, 'wav').read_bytes() == b'abc'
+        assert store.put_bytes(b'abc', 'wav') == digest
+        assert store.url(digest, 'wav') == f"{tmp_path.as_posix()}/{digest}.wav"
+
+    def test_manifest_skips_rereading_unchanged_files(self, tmp_path, monkeypatch):
+        src = tmp_path / 'src.wav'
+        src.write_bytes(b'data')
+        store = AssetStore(tmp_path / 'store')
+        digest = store.put_file(src)
+
+        fresh = AssetStore(tmp_path / 'store')
+        monkeypatch.setattr(type(src), 'read_bytes',
+                            lambda self: pytest.fail('re-read a stored file'))
+        assert fresh.put_file(src) == digest
+        manifest = json.loads(fresh.manifest_path.read_text())
+        assert [e['hash'] for e in manifest.values()] == [digest]
+
+    def test_changed_file_is_restored(self, tmp_path):
+        src = tmp_path / 'src.wav'
+        src.write_bytes(b'one')
+        store = AssetStore(tmp_path / 'store')
+        first = store.put_file(src)
+        src.write_bytes(b'two!')
+        assert store.put_file(src) != first
+
+    def test_missing_object_is_rewritten(self, tmp_path):
+        store = AssetStore(tmp_path)
+        import base64
+        b64 = base64.b64encode(b'xyz').decode('ascii')
+        digest = store.put_b64(b64, 'scsyndef')
+        store.path(digest, 'scsyndef').unlink()
+        assert store.put_b64(b64, 'scsyndef') == digest
+        assert store.path(digest, 'scsyndef').read_bytes() == b'xyz'
+
+    def test_serve(self, tmp_path):
+        store = AssetStore(tmp_path)
+        digest = store.put_bytes(b'served', 'wav')
+        try:
+            prefix = store.serve()
+            assert store.url(digest, 'wav').startswith(prefix)
+            with urllib.request.urlopen(store.url(digest, 'wav')) as resp:
+                assert resp.read() == b'served'
+                assert resp.headers['Access-Control-Allow-Origin'] == '*'
+        finally:
+            store.shutdown()
+
+
+class TestStoreMode:
+    def test_rejects_unknown_mode(self):
+        with pytest.raises(ValueError, match="Unknown asset mode"):
+            set_asset_mode('cdn')
+        assert get_asset_mode() == 'embed'
+
+    def test_synthdef_refs(self, tmp_path):
+        store = AssetStore(tmp_path, url_prefix='assets')
+        refs = stored_synthdef_refs({'kl_tri'}, store=store)
+        assert refs['kl_tri'].startswith('@assets/')
+        assert refs['default'] == refs['kl_tri']
+        assert '__busRouter' in refs
+        digest = refs['kl_tri'].rsplit('/', 1)[1].split('.')[0]
+        assert store.path(digest, 'scsyndef').exists()
+
+    def test_sample_refs(self, tmp_path):
+        register_sample('st_kick', make_wav(seed=3))
+        store = AssetStore(tmp_path)
+        refs = stored_sample_refs({'st_kick'}, store=store)
+        ref = refs['st_kick']
+        assert ref['channels'] == 1
+        assert store.path(ref['hash'], 'wav').read_bytes() == make_wav(seed=3)
+        assert 'b64' not in ref
+
+    def test_loader_rejects_failed_asset_fetches(self):
+        from klotho.utils.playback.supersonic._js_fragments import synthdef_loader_js
+        src = synthdef_loader_js('["kl_tri"]')
+        assert "if (!resp.ok) throw new Error('HTTP ' + resp.status + ' for ' + url)" in src
+        assert "console.warn('[Klotho] ' + name" in src
+
+    def test_widget_references_assets_by_hash(self, tmp_path):
+        from klotho.utils.playback.supersonic.engine import (
+            SuperSonicEngine, _load_all_synthdef_assets,
+        )
+        set_asset_mode('store', root=tmp_path / 'cache', url_prefix='cache')
+        engine = SuperSonicEngine(_events())
+        html = engine._generate_html()
+        assert all(v.startswith('@cache/') for v in engine.synthdef_assets.values())
+        assert engine.synthdef_assets['kl_tri'] in html
+        assert _load_all_synthdef_assets()['kl_tri'] not in html
@@ -0,0 +1,134 @@
+"""Content-addressed control-envelope blocks in score lowering.
+
+Descriptors whose envelopes share ``Envelope.content_key`` point at one
+sampled block; ``adaptive_blocks`` sizes blocks per envelope and adds
+explicit ``frameOffset``/``numFrames`` to every descriptor.
+"""
+
+import numpy as np
+import pytest
+
+from klotho.chronos import TemporalUnit as UT
+from klotho.chronos import TemporalUnitSequence as UTS
+from klotho.dynatos import Envelope
+from klotho.thetos import CompositionalUnit as UC
+from klotho.thetos.composition.score import Score
+from klotho.thetos.instruments.synthdef import SynthDefInstrument
+from klotho.utils.playback.supersonic.converters import (
+    _build_score_control_data,
+    convert_score_to_sc_events,
+)
+
+
+def _desc(env, start=0.0, duration=None):
+    return {
+        "envelope": env,
+        "start": start,
+        "duration": env.total_time if duration is None else duration,
+        "pfields": ["amp"],
+        "targets": [],
+    }
+
+
+class TestContentKey:
+    def test_equal_definitions_share_key(self):
+        a = Envelope([0, 1, 0], times=[0.5, 0.5], curve=-2)
+        b = Envelope([0.0, 1.0, 0.0], times=[0.5, 0.5], curve=-2)
+        assert a.content_key == b.content_key
+        assert hash(a.content_key) == hash(b.content_key)
+
+    @pytest.mark.parametrize("other", [
+        Envelope([0, 1, 0.5], times=[0.5, 0.5], curve=-2),
+        Envelope([0, 1, 0], times=[0.4, 0.6], curve=-2),
+        Envelope([0, 1, 0], times=[0.5, 0.5], curve=2),
+        Envelope([0, 1, 0], times=[0.5, 0.5], curve=-2, time_scale=2.0),
+    ])
+    def test_any_field_changes_key(self, other):
+        base = Envelope([0, 1, 0], times=[0.5, 0.5], curve=-2)
+        assert base.content_key != other.content_key
+
+    def test_warp_changes_key(self):
+        a = Envelope([1, 2], warp='lin')
+        b = Envelope([1, 2], warp='exp')
+        assert a.content_key != b.content_key
+
+
+class TestDedupedBuffer:
+    def test_shared_envelope_sampled_once(self):
+        env = Envelope([0.0, 1.0, 0.0], times=[0.5, 0.5])
+        twin = Envelope([0.0, 1.0, 0.0], times=[0.5, 0.5])
+        other = Envelope([1.0, 0.0], times=1.0)
+        cd = _build_score_control_data(
+            [_desc(env), _desc(env, 1.0), _desc(twin, 2.0), _desc(other, 3.0)],
+            block_size=32,
+        )
+        assert [d["blockIndex"] for d in cd["descriptors"]] == [0, 0, 0, 1]
+        assert cd["buffer"].shape == (64,)
+        assert np.array_equal(
+            cd["buffer"][32:],
+            other.sample(np.linspace(0, 1, 32)).astype(np.float32),
+        )
+        assert [d["start"] for d in cd["descriptors"]] == [0.0, 1.0, 2.0, 3.0]
+
+    def test_uniform_descriptors_have_no_offsets(self):
+        cd = _build_score_control_data([_desc(Envelope([0, 1]))], block_size=32)
+        assert "frameOffset" not in cd["descriptors"][0]
+
+    def test_repeated_unit_buffer_does_not_grow(self):
+        inst = SynthDefInstrument(
+            name='tri', defName='kl_tri',
+            pfields={'amp': 0.1, 'freq': 440.0, 'pan': 0.0, 'gate': 1, 'out': 0})
+
+        def phrase():
+            uc = UC(tempus='4/4', prolatio=(1, 1, 1, 1), beat='1/4', bpm=60,
+                    inst=inst, pfields=['amp'])
+            uc.root.apply_envelope(Envelope([0.1, 0.8, 0.1], times=[0.5, 0.5]),
+                                   pfields='amp', control=True)
+            return uc
+
+        score = Score(block_size=64)
+        score.add(UTS([phrase() for _ in range(8)]))
+        cd = convert_score_to_sc_events(score)["control_data"]
+        assert len(cd["descriptors"]) == 8
+        assert {d["blockIndex"] for d in cd["descriptors"]} == {0}
+        assert cd["buffer"].shape == (64,)
+
+
+class TestAdaptiveBlocks:
+    def test_block_sizes_follow_duration_and_curvature(self):
+        linear = Envelope([0.0, 1.0], times=1.0)
+        curved = Envelope([0.0, 1.0], times=1.0, curve=-4)
+        long_curved = Envelope([0.0, 1.0], times=1.0, curve=-4, time_scale=600.0)
+        cd = _build_score_control_data(
+            [_desc(linear, duration=4.0), _desc(curved, duration=4.0),
+             _desc(long_curved, duration=600.0)],
+            block_size=512, adaptive=True,
+        )
+        sizes = [d["numFrames"] for d in cd["descriptors"]]
+        assert sizes[0] < sizes[1] < sizes[2]
+        assert sizes[2] == 512
+        assert all(s >= 16 for s in sizes)
+
+    def test_offsets_address_each_block(self):
+        envs = [Envelope([0.0, 1.0], times=1.0, curve=c) for c in (-4, 0, 3)]
+        cd = _build_score_control_data(
+            [_desc(e, duration=2.0) for e in envs], block_size=256, adaptive=True)
+        buf = cd["buffer"]
+        offset = 0
+        for env, d in zip(envs, cd["descriptors"]):
+            assert d["frameOffset"] == offset
+            n = d["numFrames"]
+            expected = env.sample(np.linspace(0, env.total_time, n)).astype(np.float32)
+            assert np.array_equal(buf[offset:offset + n], expected)
+            offset += n
+        assert buf.shape == (offset,)
+
+    def test_score_flag_reaches_lowering(self):
+        uc = UC(tempus='4/4', prolatio=(1, 1, 1, 1), beat='1/4', bpm=60,
+                inst=SynthDefInstrument.from_manifest('kl_tri'))
+        uc.root.apply_envelope(Envelope([0.1, 0.8]), pfields='amp', control=True)
+        score = Score(adaptive_blocks=True)
+        score.add(uc)
+        desc = convert_score_to_sc_events(score)["control_data"]["descriptors"][0]
+        assert desc["frameOffset"] == 0
+        assert 16 <= desc["numFrames"] < 512
@@ -45,11 +45,20 @@ class TestControlPreloadContract:
 
     def test_score_ext_install_guard_is_versioned(self):
         """Pages carrying a stale pre-V2 extension from saved outputs must
-        get this build's preload (same lesson as the 10.16 core guard)."""
+        get this build's preload (same lesson as the 10.16 core guard);
+        V3 (per-descriptor block offsets) keys on its own marker."""
         assert "__klothoScoreExtV2" in SCORE_SRC
-        guard = SCORE_SRC.index("__klothoScoreExtV2) return;")
+        guard = SCORE_SRC.index("__klothoScoreExtV3) return;")
         marker = SCORE_SRC.index("proto.__klothoScoreExtV2 = true;")
-        assert guard < marker
+        marker_v3 = SCORE_SRC.index("proto.__klothoScoreExtV3 = true;")
+        assert guard < marker < marker_v3
+
+    def test_envelope_frames_honor_descriptor_offsets(self):
+        """Adaptive/deduplicated blocks: frameOffset/numFrames win over
+        the uniform blockIndex * blockSize layout."""
+        setup = SCORE_SRC[SCORE_SRC.index("setupControlEnvelopes"):]
+        assert "desc.frameOffset != null" in setup
+        assert "numFrames: numFrames," in setup
 
 
 class TestStopFreeVsPurgeContract:
@@ -1016,6 +1016,36 @@ class TestPartitionSet:
             rt = RT(subdivisions=partition)
             assert sum(abs(d) for d in rt.durations) == 1
 
+    def test_count_unrank_and_iteration_agree(self):
+        for n, k in [(12, 4), (20, 6), (15, 1), (9, 9), (5, 7)]:
+            ps = PS(n, k)
+            listed = list(ps)
+            assert len(listed) == ps.count == len(ps)
+            assert [ps[i] for i in range(ps.count)] == listed
+            assert listed == sorted(listed, reverse=True)
+            assert all(sum(p) == n and len(p) == k for p in listed)
+        assert PS(8, 3)[-1] == (3, 3, 2)
+        assert PS(8, 3)[1:3] == [(5, 2, 1), (4, 3, 1)]
+        with pytest.raises(IndexError):
+            PS(8, 3)[5]
+
+    def test_large_sets_without_enumeration(self):
+        ps = PS(600, 40)
+        assert ps.count > 2 ** 64
+        assert ps._data is None
+        middle = ps[ps.count // 2]
+        assert sum(middle) == 600 and len(middle) == 40
+        assert ps[0] == (561,) + (1,) * 39
+        assert ps[-1] == (15,) * 40
+
+    def test_sampling_is_uniform_and_seeded(self):
+        from collections import Counter
+        ps = PS(12, 4)
+        draws = Counter(ps.sample(rng=0, size=15000))
+        assert set(draws) == set(ps)
+        assert max(draws.values()) < 1.2 * 1000
+        assert PS(600, 40).sample(rng=3) == PS(600, 40).sample(rng=np.random.default_rng(3))
+
 
 class TestConverters:
 
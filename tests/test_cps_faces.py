@@ -0,0 +1,65 @@
+"""Bitset clique enumeration for CPS faces and sub-CPS search."""
+import inspect
+import math
+from itertools import combinations
+
+import pytest
+
+from klotho.tonos.systems.combination_product_sets import (
+    Dekany, Eikosany, Hebdomekontany, Hexany, faces, iter_faces,
+    iter_sub_cps, sub_cps,
+)
+
+
+def _brute_faces(cps, size):
+    adjacent = {(u, v) for u, v, d in cps.edges(data=True) if 'distance' in d}
+    return [c for c in combinations(list(cps.nodes()), size)
+            if all((u, v) in adjacent or (v, u) in adjacent for u, v in combinations(c, 2))]
+
+
+@pytest.mark.parametrize("make", [Hexany, Dekany, Eikosany])
+@pytest.mark.parametrize("size", [2, 3, 4])
+def test_faces_match_brute_force(make, size):
+    cps = make()
+    assert faces(cps, size) == _brute_faces(cps, size)
+
+
+def test_hexany_triangles():
+    tris = faces(Hexany(), 3)
+    assert len(tris) == 8
+    assert tris == sorted(tris)
+
+
+def test_iter_faces_streams():
+    stream = iter_faces(Hexany(), 3)
+    assert inspect.isgenerator(stream)
+    assert next(stream) == faces(Hexany(), 3)[0]
+
+
+def test_results_cached_per_structure_version():
+    hx = Hexany()
+    first = faces(hx, 3)
+    first.clear()
+    assert len(faces(hx, 3)) == 8
+    assert ('cps_faces', 3) in hx._traversal_cache()
+    hx._invalidate_caches()
+    assert ('cps_faces', 3) not in hx._traversal_cache()
+
+
+def test_sub_cps_hexanies_in_eikosany():
+    ek = Eikosany()
+    subs = sub_cps(ek, 4, 2)
+    # one anchor factor out of 6, 4 varying out of the remaining 5
+    assert len(subs) == 6 * 5
+    for entry in subs:
+        assert len(entry['nodes']) == math.comb(4, 2)
+        for combo in entry['combos']:
+            assert set(entry['anchor']) <= set(combo)
+    assert list(iter_sub_cps(ek, 4, 2)) == subs
+
+
+def test_sub_cps_large_factor_set():
+    hb = Hebdomekontany()
+    first = next(iter_sub_cps(hb, 4, 2))
+    assert first['anchor'] == (1, 3)
+    assert len(sub_cps(hb, 4, 2)) == math.comb(8, 2) * math.comb(6, 4)
@@ -0,0 +1,69 @@
+"""Sympy-free CPS construction with exponent-tuple (Monomial) aliases."""
+import subprocess
+import sys
+from pathlib import Path
+
+import sympy as sp
+
+from klotho.topos.collections._monomial import Monomial
+from klotho.tonos.systems.combination_product_sets import (
+    CombinationProductSet, Eikosany, Hexany,
+)
+
+ROOT = Path(__file__).parent.parent
+
+
+class TestMonomial:
+    def test_arithmetic_and_identity(self):
+        A, B, C = (Monomial.symbol(s) for s in 'ABC')
+        assert A * B / C == Monomial({'A': 1, 'B': 1, 'C': -1})
+        assert hash(A * B) == hash(B * A)
+        assert (A / A) == Monomial()
+        assert (A ** 3).exponents == (('A', 3),)
+
+    def test_str_matches_sympy(self):
+        A, B, C = (Monomial.symbol(s) for s in 'ABC')
+        for m in [A, A * B, A / B, A * B / C, Monomial() / (A * B), A ** -2,
+                  (A ** 2) / (B ** 3), C / A ** 2, Monomial()]:
+            assert str(m) == str(m.to_sympy())
+
+    def test_to_sympy(self):
+        a, b = sp.symbols('A B')
+        m = Monomial.symbol('A') ** 2 / Monomial.symbol('B')
+        assert m.to_sympy() == a ** 2 / b
+
+
+class TestCPSAliases:
+    def test_node_aliases_are_factor_products(self):
+        ek = Eikosany()
+        for _, attrs in ek.nodes(data=True):
+            expected = sp.Integer(1)
+            for f in attrs['combo']:
+                expected *= ek.factor_to_alias[f].to_sympy()
+            assert attrs['alias'].to_sympy() == expected
+
+    def test_edge_relation_is_alias_quotient(self):
+        hx = Hexany()
+        for u, v, data in hx.edges(data=True):
+            assert data['relation'] == hx.nodes[u]['alias'] / hx.nodes[v]['alias']
+        assert str(hx.factor_to_alias[1]) == 'A'
+
+    def test_from_rules_aliases(self):
+        cps = CombinationProductSet.from_rules(
+            (1, 3, 5, 7), [('product', 2), ('power', 2), ('ratio', 1, 1)],
+            master_set='tetrad')
+        aliases = {str(a['alias']) for _, a in cps.nodes(data=True)}
+        assert {'A*B', 'A**2', 'A/B'} <= aliases
+
+
+def test_cps_import_and_build_without_sympy():
+    code = (
+        "import sys; sys.modules['sympy'] = None\n"
+        "from klotho.tonos.systems.combination_product_sets import Hebdomekontany, faces\n"
+        "h = Hebdomekontany()\n"
+        "assert str(h.nodes[0]['alias']) == 'A*B*C*D'\n"
+        "faces(h, 2)\n"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], cwd=ROOT,
+                          capture_output=True, text=True, timeout=300)
+    assert proc.returncode == 0, proc.stderr
@@ -0,0 +1,92 @@
+"""Vectorized ``Envelope.sample`` and batched ``sample_envelopes``.
+
+Both must agree with the scalar ``at_time`` path (documented tolerance
+``rtol=1e-12``), including curve shaping, exp warp, zero-length segments
+and the exact endpoint values.
+"""
+
+import numpy as np
+import pytest
+
+from klotho.dynatos import Envelope
+from klotho.dynatos.envelopes import sample_envelopes
+
+
+ENVELOPES = [
+    Envelope([0, 1, 0.5, 0], times=[0.1, 0.8, 0.1]),
+    Envelope([0.0, 1.0], times=1.0, curve=4),
+    Envelope([100.0, 400.0, 50.0], times=[1, 2], curve=[-3, 2], warp='exp', time_scale=1.7),
+    Envelope([0, 1, 1, 0], times=[0.3, 0.0, 0.7], curve=-2),
+    Envelope.adsr(),
+]
+
+
+def _scalar(env, xs):
+    return np.array([env.at_time(float(x)) for x in xs])
+
+
+class TestSample:
+    @pytest.mark.parametrize("env", ENVELOPES, ids=repr)
+    def test_matches_at_time(self, env):
+        xs = np.linspace(0.0, env.total_time, 301)
+        got = env.sample(xs)
+        assert isinstance(got, np.ndarray)
+        assert got.dtype == np.float64
+        assert np.allclose(got, _scalar(env, xs), rtol=1e-12, atol=0)
+
+    def test_endpoints_exact(self):
+        env = Envelope([100.0, 400.0], times=2.0, warp='exp', curve=-3)
+        got = env.sample([0.0, 2.0])
+        assert got[0] == 100.0
+        assert got[1] == 400.0
+
+    def test_preserves_shape(self):
+        env = ENVELOPES[0]
+        assert env.sample(0.5).shape == ()
+        assert env.sample(np.zeros((3, 4))).shape == (3, 4)
+
+    def test_out_of_range_raises(self):
+        env = Envelope([0.0, 1.0], times=1.0)
+        with pytest.raises(ValueError, match="outside envelope duration"):
+            env.sample([0.5, 1.5])
+        with pytest.raises(ValueError):
+            env.sample([-0.1])
+
+    def test_zero_length_envelope(self):
+        env = Envelope([3.0, 5.0], times=0.0)
+        assert env.sample([0.0]).tolist() == [3.0]
+
+
+class TestSampleEnvelopes:
+    def test_rows_match_per_envelope_sample(self):
+        envs = ENVELOPES + [Envelope([2.0, 9.0], times=0.0)]
+        got = sample_envelopes(envs, 64)
+        assert got.shape == (len(envs), 64)
+        for row, env in zip(got, envs):
+            expected = env.sample(np.linspace(0.0, env.total_time, 64))
+            assert np.array_equal(row, expected)
+
+    def test_zero_duration_row_is_constant(self):
+        got = sample_envelopes([Envelope([2.0, 9.0], times=0.0)], 8)
+        assert np.all(got == 2.0)
+
+    def test_empty(self):
+        assert sample_envelopes([], 16).shape == (0, 16)
+
+    def test_memory_does_not_grow_with_segment_count(self):
+        import tracemalloc
+        rng = np.random.default_rng(0)
+
+        def peak(n_segments):
+            envs = [Envelope(rng.random(n_segments + 1).tolist(),
+                             times=(rng.random(n_segments) + 0.01).tolist())
+                    for _ in range(50)]
+            tracemalloc.start()
+            got = sample_envelopes(envs, 2000)
+            used = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            expected = envs[-1].sample(np.linspace(0.0, envs[-1].total_time, 2000))
+            assert np.array_equal(got[-1], expected)
+            return used
+
+        assert peak(400) < 1.5 * peak(4)
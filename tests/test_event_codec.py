@@ -0,0 +1,109 @@
+"""Columnar typed-array event encoding for playback widgets.
+
+``encode_events`` packs an SC event list into base64 typed-array columns
+plus interned string/layout tables; ``decode_events`` (Python) and
+``KlothoEventCodec.decode`` (browser, exercised under Node when present)
+must rebuild the same events the schedulers consumed as plain JSON.
+"""
+import json
+import shutil
+import subprocess
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from klotho.utils.playback._event_codec import (
+    decode_events, encode_events, is_encoded_events,
+)
+
+CODEC_JS = (Path(__file__).parent.parent / "klotho" / "utils" / "playback"
+            / "_event_codec.js")
+node = shutil.which("node")
+
+
+def _events():
+    return [
+        {"type": "new", "id": "a1", "defName": "kl_tri", "start": 0.0,
+         "dur": 0.5, "releaseAfter": True, "group": "drums",
+         "pfields": {"freq": np.float64(440.0), "amp": np.float32(0.5), "gate": 1}},
+        {"type": "new", "id": "a2", "defName": "kl_sampler", "start": np.float64(0.25),
+         "dur": None, "releaseAfter": False,
+         "pfields": {"buf": "bb_kick", "amp": 0.7}},
+        {"type": "set", "id": "a1", "start": 0.4, "pfields": {"freq": 550}},
+        {"type": "new", "id": "a3", "defName": "kl_tri", "start": 1.0, "dur": 0.5,
+         "pfields": {"freq": [220.0, 330.0]}, "_stepIndex": np.int64(3)},
+        {"type": "release", "id": "a3", "start": 1.5},
+    ]
+
+
+def _as_json(events):
+    """What the browser saw before: the events after a JSON round trip."""
+    def plain(v):
+        if isinstance(v, np.generic):
+            return v.item()
+        if isinstance(v, dict):
+            return {k: plain(x) for k, x in v.items()}
+        if isinstance(v, list):
+            return [plain(x) for x in v]
+        return v
+    return json.loads(json.dumps(plain(events)))
+
+
+def _canonical(events):
+    return [dict(sorted(ev.items())) for ev in events]
+
+
+class TestRoundTrip:
+    def test_python_round_trip(self):
+        enc = encode_events(_events())
+        assert is_encoded_events(enc)
+        got = decode_events(json.loads(json.dumps(enc)))
+        assert _canonical(got) == _canonical(_as_json(_events()))
+
+    def test_values_exact(self):
+        got = decode_events(encode_events(_events()))
+        assert got[0]["pfields"] == {"freq": 440.0, "amp": 0.5, "gate": 1.0}
+        assert got[1]["pfields"]["buf"] == "bb_kick"
+        assert got[1]["dur"] is None
+        assert got[1]["releaseAfter"] is False
+        assert "defName" not in got[2] and "dur" not in got[2]
+        assert got[3]["pfields"] == {"freq": [220.0, 330.0]}
+        assert got[3]["_stepIndex"] == 3
+        assert "pfields" not in got[4]
+
+    def test_layouts_and_strings_are_interned(self):
+        events = [{"type": "new", "id": f"n{i}", "defName": "kl_tri",
+                   "start": i * 0.1, "dur": 0.1,
+                   "pfields": {"freq": 200.0 + i, "amp": 0.1}}
+                  for i in range(500)]
+        enc = encode_events(events)
+        assert len(enc["layouts"]) == 1
+        assert enc["strings"].count("kl_tri") == 1
+        assert not enc["sparse"]
+        assert len(json.dumps(enc)) < 0.65 * len(json.dumps(events))
+
+    def test_empty(self):
+        assert decode_events(encode_events([])) == []
+
+
+class TestWidgetEmbedding:
+    def test_engine_widget_embeds_columnar_events(self):
+        from klotho.utils.playback.supersonic.engine import SuperSonicEngine
+        events = [ev for ev in _events() if ev["id"] == "a1"]
+        html = SuperSonicEngine(events)._generate_html()
+        assert '"__klCols": 1' in html
+        assert "KlothoEventCodec" in html
+        assert '"defName": "kl_tri"' not in html
+
+
+@pytest.mark.skipif(node is None, reason="node not installed")
+def test_js_decoder_matches_python():
+    enc = encode_events(_events())
+    script = (CODEC_JS.read_text()
+              + "\nconst enc = JSON.parse(process.argv[1]);"
+              + "\nprocess.stdout.write(JSON.stringify(KlothoEventCodec.decode(enc)));")
+    proc = subprocess.run([node, "-e", script, json.dumps(enc)],
+                          capture_output=True, text=True, timeout=60)
+    assert proc.returncode == 0, proc.stderr
+    assert _canonical(json.loads(proc.stdout)) == _canonical(_as_json(_events()))
@@ -0,0 +1,103 @@
+"""Branch-and-bound generator-basis search.
+
+The pruned exhaustive search must return exactly what scoring every
+combination returns, independently of ``n_jobs``, and reuse memoized
+per-candidate data across runs with different weights.
+"""
+import itertools
+from fractions import Fraction
+
+import pytest
+
+from klotho.tonos.systems.tone_lattices import find_generator_basis
+from klotho.tonos.systems.tone_lattices import basis as gb
+from klotho.utils.algorithms.integer_linalg import is_primitive
+
+
+def _brute_force(primes, top_k=20, candidate_cap=60, **weights):
+    defaults = dict(
+        size_weight=1.0, size_curve=1.0, monzo_weight=0.15, monzo_curve=1.0,
+        superparticular_weight=0.0, superparticular_severity=1.0,
+        superparticular_curve=1.0, conditioning_max_weight=0.20,
+        conditioning_max_curve=1.0, conditioning_sum_weight=0.01,
+        conditioning_sum_curve=1.0, target_weight=0.0,
+        target_scale_cents=50.0, target_curve=1.0, target_fold=True,
+        coverage=True,
+    )
+    target_cents = weights.pop("target_cents", [])
+    defaults.update(weights)
+    candidates = gb._build_candidates(
+        primes, 3, 256, True, Fraction(1), Fraction(2), candidate_cap, True,
+        defaults["size_weight"], defaults["size_curve"],
+        defaults["monzo_weight"], defaults["monzo_curve"],
+    )
+    pool = [c["ratio"] for c in candidates if c["ratio"] != 2][:candidate_cap]
+    scored = []
+    for chosen in itertools.combinations(pool, len(primes) - 1):
+        s = gb._score_basis(primes, [Fraction(2)] + list(chosen),
+                            **defaults, target_cents=target_cents)
+        if s is not None:
+            scored.append(s)
+    scored.sort(key=lambda r: (r["score"], abs(r["det"]), r["conditioning_max"], r["simplicity_sum"]))
+    return [(tuple(r["generators"]), r["score"]) for r in scored[:top_k]]
+
+
+def _rows(df):
+    return [(tuple(g), s) for g, s in zip(df["generators"], df["score"])]
+
+
+@pytest.mark.parametrize("kwargs", [
+    {},
+    {"superparticular_weight": 2.0},
+    {"target_cents": [315.64, 386.31], "target_weight": 1.5},
+    {"conditioning_max_weight": 1.0, "conditioning_max_curve": 2.0, "size_curve": 0.5},
+    {"conditioning_sum_weight": -0.1},
+])
+def test_pruned_search_matches_brute_force(kwargs):
+    expected = _brute_force([2, 3, 5, 7], candidate_cap=30, **dict(kwargs))
+    got = find_generator_basis([2, 3, 5, 7], mode="exhaustive", candidate_cap=30, **kwargs)
+    assert _rows(got) == expected
+
+
+def test_n_jobs_is_deterministic():
+    serial = find_generator_basis([2, 3, 5, 7, 11], candidate_cap=30, top_k=10)
+    parallel = find_generator_basis([2, 3, 5, 7, 11], candidate_cap=30, top_k=10, n_jobs=2)
+    assert _rows(serial) == _rows(parallel)
+
+
+def test_auto_stays_exact_for_large_limits():
+    results = find_generator_basis([2, 3, 5, 7, 11, 13], candidate_cap=20, top_k=3)
+    assert list(results["generators"].iloc[0]) == [
+        2, Fraction(3, 2), Fraction(5, 3), Fraction(7, 4), Fraction(11, 6), Fraction(13, 7)]
+
+
+def test_auto_falls_back_to_sampling_when_pruning_stalls(monkeypatch):
+    monkeypatch.setattr(gb, "_AUTO_SEARCH_BUDGET", 50)
+    kwargs = dict(candidate_cap=20, top_k=5, size_weight=0.0, monzo_weight=0.0,
+                  random_samples=200)
+    auto = find_generator_basis([2, 3, 5, 7, 11], **kwargs)
+    sampled = find_generator_basis([2, 3, 5, 7, 11], mode="random", **kwargs)
+    assert _rows(auto) == _rows(sampled)
+    exact = find_generator_basis([2, 3, 5, 7, 11], mode="exhaustive", **kwargs)
+    assert len(exact) == 5
+
+
+def test_candidate_data_is_memoized_across_weights():
+    gb._raw_candidate_pool.cache_clear()
+    find_generator_basis([2, 3, 5], top_k=3)
+    find_generator_basis([2, 3, 5], top_k=3, size_curve=2.0, monzo_weight=1.0)
+    info = gb._raw_candidate_pool.cache_info()
+    assert info.misses == 1 and info.hits == 1
+
+
+def test_returned_matrices_are_writable_copies():
+    results = find_generator_basis([2, 3, 5], top_k=2)
+    A = results["A"].iloc[0]
+    A[0, 0] = 99
+    assert find_generator_basis([2, 3, 5], top_k=2)["A"].iloc[0][0, 0] != 99
+
+
+def test_is_primitive():
+    assert is_primitive([[1, 0, 0], [0, 1, -1]])
+    assert not is_primitive([[2, 0, 0]])
+    assert not is_primitive([[1, 0], [2, 0]])
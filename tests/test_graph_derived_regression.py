@@ -325,13 +325,12 @@ def test_parametric_field_values_are_cached_on_access():
         compute_all=False,
     )
     coord = (1, -1, 2)
-    node_id = field.get_node(coord)
-    node_data_before = field._rx.get_node_data(node_id)
-    assert 'field_value' not in node_data_before
+    idx = (coord[0] + 3, coord[1] + 3, coord[2] + 3)
+    assert field._grid is None
 
     value_1 = field.get_field_value(coord)
     value_2 = field.get_field_value(coord)
-    node_data_after = field._rx.get_node_data(node_id)
 
     assert value_1 == value_2
-    assert 'field_value' in node_data_after
+    assert field._grid_known[idx]
+    assert field._grid_known.sum() == 1
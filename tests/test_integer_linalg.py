@@ -0,0 +1,133 @@
+"""Sympy-free integer linear algebra for tone-lattice bases.
+
+Bareiss determinants, adjugates, unimodular inverses and Hermite normal
+forms are checked against sympy (used here only as a reference), and the
+basis helpers / generator search are checked to return exact integer
+NumPy matrices.
+"""
+import random
+from fractions import Fraction
+
+import numpy as np
+import pytest
+import sympy as sp
+
+from klotho.utils.algorithms.basis import (
+    basis_matrix, change_of_basis, is_unimodular, monzo_from_ratio,
+    prime_to_generator_coords, generator_to_prime_coords, to_sympy,
+)
+from klotho.utils.algorithms.integer_linalg import (
+    adjugate, bareiss_det, hermite_normal_form, precompute_integer_solver,
+    solve_integer, unimodular_inverse,
+)
+
+
+def _random_matrices(count, seed=7, max_n=5, bound=5):
+    rng = random.Random(seed)
+    for _ in range(count):
+        n = rng.randint(1, max_n)
+        yield [[rng.randint(-bound, bound) for _ in range(n)] for _ in range(n)]
+
+
+class TestDeterminantAndInverse:
+    @pytest.mark.parametrize("M", list(_random_matrices(60)))
+    def test_matches_sympy(self, M):
+        S = sp.Matrix(M)
+        assert bareiss_det(M) == S.det()
+        det, adj = adjugate(M)
+        assert det == S.det()
+        if det != 0:
+            assert adj.tolist() == S.adjugate().tolist()
+        else:
+            assert adj is None
+
+    def test_unimodular_inverse(self):
+        A = [[1, -2, 1], [0, 0, 1], [0, 1, -1]]
+        inv = unimodular_inverse(A)
+        assert inv.dtype == np.int64
+        assert (np.array(A) @ inv == np.eye(3, dtype=int)).all()
+
+    def test_non_unimodular_raises(self):
+        with pytest.raises(ValueError, match="not unimodular"):
+            unimodular_inverse([[2, 0], [0, 1]])
+
+    def test_large_entries_stay_exact(self):
+        big = 10 ** 12
+        M = [[big, 1], [big - 1, 1]]
+        assert bareiss_det(M) == 1
+        inv = unimodular_inverse(M)
+        assert inv.tolist() == [[1, -1], [1 - big, big]]
+
+    def test_rejects_non_integer_entries(self):
+        with pytest.raises(ValueError, match="not an integer"):
+            bareiss_det([[Fraction(1, 2), 0], [0, 1]])
+
+
+class TestHermiteNormalForm:
+    @pytest.mark.parametrize("M", list(_random_matrices(40, seed=3)))
+    def test_transform_is_unimodular(self, M):
+        H, U = hermite_normal_form(M)
+        assert (U @ np.array(M) == H).all()
+        assert abs(bareiss_det(U)) == 1
+
+    def test_canonical_form(self):
+        H, _ = hermite_normal_form([[2, 3], [4, 7]])
+        assert H.tolist() == [[2, 0], [0, 1]]
+
+    def test_rectangular(self):
+        M = [[2, 4, 6], [1, 3, 5]]
+        H, U = hermite_normal_form(M)
+        assert (U @ np.array(M) == H).all()
+        assert H.tolist() == [[1, 1, 1], [0, 2, 4]]
+
+
+class TestIntegerSolver:
+    def test_adjugate_solver_for_square_systems(self):
+        state = precompute_integer_solver([[1, -2, 1], [0, 0, 1], [0, 1, -1]])
+        assert state['kind'] == 'adjugate'
+        status, y = solve_integer(state, [-2, 0, 1])
+        assert status == 'ok'
+        assert y == [0, 1, 0]
+
+    def test_fractional_solution_is_reported(self):
+        state = precompute_integer_solver([[2, 0], [0, 1]])
+        assert solve_integer(state, [1, 1]) == ('ok', [Fraction(1, 2), Fraction(1)])
+
+    def test_non_square_falls_back(self):
+        state = precompute_integer_solver([[1, 0], [0, 1], [1, 1]])
+        assert state['kind'] == 'exact'
+        assert solve_integer(state, [1, 2, 4])[0] == 'inconsistent'
+
+
+class TestBasisHelpers:
+    def test_integer_arrays(self):
+        primes = [2, 3, 5]
+        assert monzo_from_ratio('5/4', primes).tolist() == [-2, 0, 1]
+        A, A_inv = change_of_basis(primes, ['2/1', '5/4', '6/5'])
+        assert A.dtype == np.int64 and A_inv.dtype == np.int64
+        assert (A @ A_inv == np.eye(3, dtype=int)).all()
+        assert prime_to_generator_coords([-2, 0, 1], A_inv) == [0, 1, 0]
+        assert generator_to_prime_coords([0, 1, 0], A) == [-2, 0, 1]
+
+    def test_is_unimodular(self):
+        assert is_unimodular(basis_matrix([2, 3, 5], ['2/1', '5/4', '6/5']))
+        assert not is_unimodular(basis_matrix([2, 3, 5], ['2/1', '9/8', '5/4']))
+        assert not is_unimodular([[1, 0, 0], [0, 1, 0]])
+
+    def test_accepts_sympy_inputs(self):
+        A = sp.Matrix([[1, -2, 1], [0, 0, 1], [0, 1, -1]])
+        assert is_unimodular(A)
+        assert generator_to_prime_coords(sp.Matrix([0, 1, 0]), A) == [-2, 0, 1]
+
+    def test_to_sympy_for_display(self):
+        A, _ = change_of_basis([2, 3, 5], ['2/1', '5/4', '6/5'])
+        assert to_sympy(A) == sp.Matrix(A.tolist())
+
+
+def test_generator_search_returns_integer_matrices():
+    from klotho.tonos.systems.tone_lattices import find_generator_basis
+    results = find_generator_basis([2, 3, 5], top_k=5)
+    assert list(results['generators'].iloc[0]) == [2, Fraction(3, 2), Fraction(5, 3)]
+    for A, A_inv, det in zip(results['A'], results['A_inv'], results['det']):
+        assert det in (1, -1)
+        assert (A @ A_inv == np.eye(3, dtype=int)).all()
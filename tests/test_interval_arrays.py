@@ -0,0 +1,82 @@
+"""Array forms of the interval and frequency conversions.
+
+Each vectorized path must agree with calling the scalar function on every
+entry, including its rounding.
+"""
+import random
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+from klotho.tonos.utils.frequency_conversion import (
+    freq_to_midicents, freq_to_pitchclass, midicents_to_freq, midicents_to_pitchclass,
+)
+from klotho.tonos.utils.intervals import (
+    cents_to_ratio, cents_to_setclass, fold_cents_symmetric, logarithmic_distance,
+    ratio_to_cents, ratio_to_setclass,
+)
+
+rng = random.Random(7)
+NUMS = np.array([rng.randint(1, 10**6) for _ in range(2000)])
+DENS = np.array([rng.randint(1, 10**6) for _ in range(2000)])
+CENTS = np.array([rng.uniform(-5000, 5000) for _ in range(5000)])
+FREQS = np.array([rng.uniform(20, 20000) for _ in range(5000)])
+
+
+def test_ratio_to_cents_from_integer_arrays():
+    out = ratio_to_cents(NUMS, denominator=DENS)
+    assert out.tolist() == [ratio_to_cents(Fraction(int(n), int(d)))
+                            for n, d in zip(NUMS, DENS)]
+
+
+def test_ratio_to_cents_from_exact_and_float_arrays():
+    ratios = ['3/2', Fraction(5, 4), 7, '11/8']
+    assert ratio_to_cents(ratios, round_to=2).tolist() == [
+        ratio_to_cents(r, round_to=2) for r in ratios]
+    floats = NUMS / DENS
+    assert ratio_to_cents(floats).tolist() == [ratio_to_cents(x) for x in floats.tolist()]
+    assert ratio_to_setclass(['3/2', '5/4']).tolist() == [7.02, 3.86]
+
+
+def test_ratio_arrays_validate():
+    with pytest.raises(TypeError):
+        ratio_to_cents(NUMS, denominator=DENS.astype(float))
+    with pytest.raises(ZeroDivisionError):
+        ratio_to_cents([3, 5], denominator=[2, 0])
+
+
+@pytest.mark.parametrize("n_tet, round_to", [(12, 2), (19, 3), (31, 0)])
+def test_cents_to_setclass_matches_builtin_rounding(n_tet, round_to):
+    assert cents_to_setclass(CENTS, n_tet, round_to).tolist() == [
+        cents_to_setclass(c, n_tet, round_to) for c in CENTS.tolist()]
+
+
+def test_fold_and_cents_to_ratio():
+    assert fold_cents_symmetric(CENTS).tolist() == [
+        fold_cents_symmetric(c) for c in CENTS.tolist()]
+    np.testing.assert_allclose(cents_to_ratio(CENTS),
+                               [cents_to_ratio(c) for c in CENTS.tolist()], rtol=1e-15)
+
+
+def test_logarithmic_distance_broadcasts():
+    out = logarithmic_distance(NUMS[:500], DENS[:500])
+    assert out.tolist() == [logarithmic_distance(int(a), int(b))
+                            for a, b in zip(NUMS[:500], DENS[:500])]
+    assert logarithmic_distance(['1/1', '4/1'], '2/1').tolist() == [1.0, 1.0]
+    with pytest.raises(TypeError):
+        logarithmic_distance(np.array([1.5]), 1)
+
+
+def test_frequency_conversions():
+    np.testing.assert_allclose(freq_to_midicents(FREQS),
+                               [freq_to_midicents(f) for f in FREQS.tolist()], rtol=1e-15)
+    np.testing.assert_allclose(midicents_to_freq([6900, 6000]), [440.0, midicents_to_freq(6000)])
+    for arrays, scalars in [
+        (freq_to_pitchclass(FREQS), [freq_to_pitchclass(f) for f in FREQS.tolist()]),
+        (midicents_to_pitchclass(freq_to_midicents(FREQS)),
+         [midicents_to_pitchclass(m) for m in freq_to_midicents(FREQS).tolist()]),
+    ]:
+        assert arrays.pitchclass.tolist() == [s.pitchclass for s in scalars]
+        assert arrays.octave.tolist() == [s.octave for s in scalars]
+        assert arrays.cents_offset.tolist() == [s.cents_offset for s in scalars]
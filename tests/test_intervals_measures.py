@@ -57,3 +57,59 @@ class TestHarmonicity:
     def test_rejects_float(self):
         with pytest.raises(TypeError):
             harmonicity(1.5)
+
+
+class TestSieveAndArrays:
+    def test_sieve_factorization_matches_sympy(self):
+        import random
+        from fractions import Fraction
+        from sympy import factorint
+        from klotho.utils.algorithms.factors import to_factors
+        rng = random.Random(0)
+        for _ in range(200):
+            r = Fraction(rng.randint(1, 10**6), rng.randint(1, 10**6))
+            expected = dict(factorint(r.numerator))
+            for p, e in factorint(r.denominator).items():
+                expected[p] = expected.get(p, 0) - e
+            assert to_factors(r) == {p: e for p, e in expected.items() if e}
+
+    def test_fallback_above_sieve_limit(self):
+        from klotho.utils.algorithms import factors
+        old = factors._SIEVE_LIMIT
+        try:
+            factors.set_sieve_limit(100)
+            assert factors.to_factors(1009 * 4) == {2: 2, 1009: 1}
+            assert factors.nth_prime(7919) == 1000
+            assert indigestibility([1009, 12]).tolist() == [
+                indigestibility(1009), indigestibility(12)]
+        finally:
+            factors.set_sieve_limit(old)
+        with pytest.raises(ValueError):
+            factors.set_sieve_limit(0)
+
+    def test_indigestibility_array_matches_scalar(self):
+        import numpy as np
+        n = np.arange(1, 2002).reshape(-1, 3)
+        out = indigestibility(n)
+        assert out.shape == n.shape
+        assert all(out.flat[i] == indigestibility(int(v)) for i, v in enumerate(n.flat))
+        with pytest.raises(ValueError):
+            indigestibility(np.array([3, 0]))
+
+    def test_harmonicity_array_matches_scalar(self):
+        import numpy as np
+        from fractions import Fraction
+        num = np.array([3, 4, 1, 10, 15])
+        den = np.array([2, 3, 1, 8, 8])
+        out = harmonicity(num, den)
+        assert out.tolist() == [harmonicity(Fraction(int(p), int(q))) for p, q in zip(num, den)]
+        assert harmonicity(['3/2', Fraction(5, 4)]).tolist() == [
+            harmonicity('3/2'), harmonicity('5/4')]
+        assert harmonicity(3, 2) == harmonicity('3/2')
+
+    def test_harmonicity_array_rejects_float(self):
+        import numpy as np
+        with pytest.raises(TypeError):
+            harmonicity(np.array([1.5, 2.0]))
+        with pytest.raises(TypeError):
+            harmonicity([3, 5], [2.0, 4.0])
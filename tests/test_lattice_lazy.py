@@ -0,0 +1,110 @@
+"""Implicit (lazy) lattices: arithmetic structure, on-demand materialization."""
+import itertools
+
+import numpy as np
+import pytest
+
+from klotho.thetos.parameters.parameter_fields.parameter_field import ParameterField
+from klotho.tonos import ToneLattice
+from klotho.tonos.systems.tonnetz.tonnetz import Tonnetz
+from klotho.topos.graphs import Lattice
+from klotho.topos.graphs.lattices.algorithms import shortest_path
+
+
+def _edge_set(lattice):
+    return sorted(tuple(sorted(e)) for e in lattice.edges)
+
+
+@pytest.mark.parametrize("dim,res,bipolar,periodic", [
+    (1, 3, True, False), (2, 2, True, False), (2, 3, False, True),
+    (3, 2, True, True), (3, 1, False, False), (2, 1, False, True),
+])
+def test_lazy_structure_matches_eager(dim, res, bipolar, periodic):
+    eager = Lattice(dim, res, bipolar, periodic, lazy=False)
+    lazy = Lattice(dim, res, bipolar, periodic, lazy=True)
+    assert lazy._is_lazy and not eager._is_lazy
+    assert lazy.number_of_nodes() == eager.number_of_nodes() == len(lazy)
+    assert lazy.number_of_edges() == eager.number_of_edges()
+    assert _edge_set(lazy) == _edge_set(eager)
+    assert sorted(lazy.coords) == sorted(eager.coords)
+    for coord in eager.coords:
+        assert sorted(lazy.neighbors(coord)) == sorted(eager.neighbors(coord))
+    for u, v in itertools.product(eager.coords[:4], eager.coords):
+        assert lazy.has_edge(u, v) == eager.has_edge(u, v)
+    assert lazy._rx.num_nodes() == 0
+
+
+def test_large_lattice_defaults_to_lazy():
+    lattice = Lattice(3, 200)
+    assert lattice._is_lazy
+    assert lattice.number_of_nodes() == 401 ** 3
+    assert lattice.number_of_edges() == 3 * 400 * 401 ** 2
+    assert (200, -200, 0) in lattice and (201, 0, 0) not in lattice
+    assert lattice[(1, 2, 3)]['coord'] == (1, 2, 3)
+    assert len(shortest_path(lattice, (0, 0, 0), (2, -1, 3))) == 7
+    assert lattice._rx.num_nodes() == 0
+
+
+def test_get_node_materializes_once():
+    lattice = Lattice(2, 5, lazy=True)
+    node = lattice.get_node((1, 1))
+    assert lattice.get_node((1, 1)) == node
+    assert lattice.get_coordinates(node) == (1, 1)
+    assert lattice.get_node((9, 9)) is None
+    assert lattice._rx.num_nodes() == 1
+
+
+def test_lazy_tonnetz_uses_edge_offsets():
+    eager, lazy = Tonnetz(resolution=2), Tonnetz(resolution=2, lazy=True)
+    assert _edge_set(lazy) == _edge_set(eager)
+    assert lazy.has_edge((0, 0), (1, -1))
+
+
+def test_lazy_tone_lattice_lookup():
+    eager = ToneLattice.from_generators((3, 5), resolution=2)
+    lazy = ToneLattice.from_generators((3, 5), resolution=2, lazy=True)
+    for ratio in ["16/15", "3/2", "9/8", "15/8"]:
+        for mode in ("first", "all", "unique"):
+            assert (lazy.get_coordinates_for_ratio(ratio, lookup=mode, warn=False)
+                    == eager.get_coordinates_for_ratio(ratio, lookup=mode, warn=False))
+    assert lazy[(1, 1)]['ratio'] == eager[(1, 1)]['ratio']
+    assert lazy.with_generators(("3/2", "5/4"))._is_lazy
+
+
+def test_lazy_field_keeps_graph_empty():
+    fn = lambda x: x.sum(axis=1)
+    eager = ParameterField(2, 4, function=fn, lazy=False)
+    lazy = ParameterField(2, 4, function=fn, lazy=True)
+    assert lazy[(1, 2)] == pytest.approx(eager[(1, 2)])
+    assert np.allclose(lazy.gradient((0, 0)), eager.gradient((0, 0)))
+    lazy[(3, 3)] = 7.0
+    assert lazy[(3, 3)] == 7.0
+    assert lazy._rx.num_nodes() == 0
+    with pytest.raises(KeyError):
+        lazy[(5, 0)] = 1.0
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_copy_keeps_lattice_state(lazy):
+    lattice = Lattice(2, 3, lazy=lazy)
+    lattice.get_node((1, 1))
+    copied = lattice.copy()
+    assert copied._is_lazy == lazy
+    assert copied.number_of_nodes() == len(copied) == 49
+    assert copied.coords == lattice.coords
+    assert _edge_set(copied) == _edge_set(lattice)
+    assert copied.get_node((1, 1)) == lattice.get_node((1, 1))
+    copied.get_node((2, 2))
+    assert ((2, 2) in lattice._materialized_coords) == (not lazy)
+    tone = ToneLattice.from_generators((3, 5), resolution=2, lazy=lazy).copy()
+    assert tone[(1, 1)]['ratio'] == ToneLattice.from_generators((3, 5), resolution=2)[(1, 1)]['ratio']
+
+
+def test_lazy_iteration_and_nodes_cover_every_coordinate():
+    lattice = Lattice(2, 1, periodic=True, lazy=True)
+    expected = sorted(Lattice(2, 1, lazy=False).coords)
+    assert len(lattice) == len(lattice.nodes) == 9
+    assert sorted(lattice) == sorted(lattice.nodes) == expected
+    assert all(coord in lattice.nodes for coord in lattice)
+    assert dict(lattice.nodes(data=True))[(1, -1)]['coord'] == (1, -1)
+    assert lattice._rx.num_nodes() == 0
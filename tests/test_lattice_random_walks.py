@@ -0,0 +1,82 @@
+"""Vectorized multi-walker lattice walks."""
+import random
+
+import numpy as np
+import pytest
+
+from klotho.tonos.systems.tonnetz.tonnetz import Tonnetz
+from klotho.topos.graphs import Lattice
+from klotho.topos.graphs.lattices.algorithms import random_walk, random_walks
+
+
+def _coords(walk):
+    return [tuple(int(v) for v in c) for c in walk]
+
+
+@pytest.mark.parametrize("lattice", [
+    Lattice(2, 3), Lattice(3, 2, periodic=True), Tonnetz(resolution=2),
+])
+def test_every_step_is_an_edge(lattice):
+    start = (0,) * lattice.dimensionality
+    paths = random_walks(lattice, start, 40, n_walkers=100, max_repeats=2,
+                         avoid_backtrack=True, seed=1)
+    assert paths.shape == (100, 41, lattice.dimensionality)
+    for walk in paths:
+        cs = _coords(walk)
+        for a, b in zip(cs, cs[1:]):
+            assert a == b or lattice.has_edge(a, b)
+
+
+def test_seeded_and_independent_of_global_random():
+    lattice = Lattice(2, 5)
+    random.seed(0)
+    a = random_walks(lattice, (0, 0), 20, n_walkers=8, seed=3)
+    random.seed(99)
+    b = random_walks(lattice, (0, 0), 20, n_walkers=8, seed=np.random.default_rng(3))
+    assert np.array_equal(a, b)
+
+
+def test_max_repeats_without_tolerance_never_revisits():
+    lattice = Lattice(2, 4)
+    paths = random_walks(lattice, (0, 0), 30, n_walkers=200, max_repeats=0,
+                         stuck_tolerance=0, seed=2)
+    for walk in paths:
+        cs = _coords(walk)
+        # stopped walkers repeat their last cell; drop the tail
+        while len(cs) > 1 and cs[-1] == cs[-2]:
+            cs.pop()
+        assert len(set(cs)) == len(cs)
+
+
+def test_stuck_tolerance_matches_scalar_walk():
+    lattice = Lattice(1, 1, bipolar=False)
+    paths = random_walks(lattice, (0,), 8, n_walkers=2, max_repeats=0,
+                         stuck_tolerance=2, seed=0)
+    scalar = random_walk(lattice, (0,), 8, max_repeats=0, stuck_tolerance=2, seed=0)
+    for walk in paths:
+        cs = _coords(walk)
+        assert cs[:len(scalar)] == scalar
+        assert set(cs[len(scalar):]) <= {scalar[-1]}
+
+
+def test_direction_weights():
+    paths = random_walks(Lattice(2, 5), (0, 0), 5, n_walkers=50,
+                         direction_weights=[0, 1, 0, 0], seed=0)
+    assert (paths[:, -1] == [5, 0]).all()
+
+
+def test_per_walker_starts_and_bounds():
+    lattice = Lattice(2, 2)
+    starts = np.array([[0, 0], [2, 2], [-2, 1]])
+    paths = random_walks(lattice, starts, 3, seed=0)
+    assert np.array_equal(paths[:, 0], starts)
+    with pytest.raises(KeyError):
+        random_walks(lattice, (3, 0), 3)
+    with pytest.raises(ValueError):
+        random_walks(lattice, starts, 3, n_walkers=2)
+
+
+def test_huge_lattice_uses_history_scan():
+    small = random_walks(Lattice(2, 50), (0, 0), 20, n_walkers=30, max_repeats=1, seed=5)
+    huge = random_walks(Lattice(2, 2 ** 31), (0, 0), 20, n_walkers=30, max_repeats=1, seed=5)
+    assert np.array_equal(small, huge)
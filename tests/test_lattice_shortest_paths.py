@@ -0,0 +1,99 @@
+"""Closed-form / A* lattice shortest paths and their batch forms."""
+import itertools
+import math
+
+import numpy as np
+import pytest
+import rustworkx as rx
+
+from klotho.tonos import ToneLattice
+from klotho.tonos.systems.tonnetz.tonnetz import Tonnetz
+from klotho.topos.graphs import Lattice
+from klotho.topos.graphs.lattices.algorithms import (
+    shortest_path, shortest_path_lengths, shortest_paths,
+)
+
+
+def _graph_distance(lattice, a, b):
+    if a == b:
+        return 0
+    u, v = lattice._get_node_for_coord(a), lattice._get_node_for_coord(b)
+    return rx.dijkstra_shortest_path_lengths(
+        lattice._rx, u, edge_cost_fn=lambda _: 1.0, goal=v)[v]
+
+
+@pytest.mark.parametrize("lattice", [
+    Lattice(2, 3), Lattice(3, 2, periodic=True), Lattice(1, 4, periodic=True),
+    Tonnetz(resolution=3),
+], ids=["grid", "torus", "cycle", "tonnetz"])
+def test_matches_graph_search(lattice):
+    pairs = list(itertools.product(lattice.coords[:8], lattice.coords))
+    starts, ends = [p[0] for p in pairs], [p[1] for p in pairs]
+    lengths = shortest_path_lengths(lattice, starts, ends)
+    paths = shortest_paths(lattice, starts, ends)
+    for (a, b), length, path in zip(pairs, lengths, paths):
+        assert length == _graph_distance(lattice, a, b)
+        assert len(path) == length + 1 and path[0] == a and path[-1] == b
+        assert all(lattice.has_edge(u, v) for u, v in zip(path, path[1:]))
+
+
+def test_grid_path_is_axis_ordered():
+    assert shortest_path(Lattice(2, 3), (0, 0), (2, -1)) == [
+        (0, 0), (1, 0), (2, 0), (2, -1)]
+
+
+def test_periodic_wraps_the_short_way():
+    assert shortest_path(Lattice(1, 3, periodic=True), (-3,), (3,)) == [(-3,), (3,)]
+
+
+def test_harmonic_weights():
+    tl = ToneLattice.from_generators((3, 5), resolution=2)
+    lengths = shortest_path_lengths(tl, (0, 0), [(1, 0), (1, 1)], weight='harmonic')
+    assert lengths == pytest.approx([math.log2(3), math.log2(3) + math.log2(5)])
+    # Tonnetz diagonal 6/5 (log2 30) beats 3/2 then 4/5 (log2 6 + log2 20)
+    tn = Tonnetz(resolution=3)
+    path = shortest_path(tn, (0, 0), (2, -2), weight='harmonic')
+    assert path == [(0, 0), (1, -1), (2, -2)]
+
+
+def test_weighted_tonnetz_matches_dijkstra():
+    tn = Tonnetz(resolution=2)
+    costs = [1.0, 2.5, 0.7]
+    cost_of = {}
+    for offset, cost in zip(tn._neighbor_offsets(), costs):
+        cost_of[offset] = cost_of[tuple(-v for v in offset)] = cost
+    rx_cost = {}
+    for u, v in tn.edges:
+        rx_cost[(u, v)] = rx_cost[(v, u)] = cost_of[tuple(b - a for a, b in zip(u, v))]
+    graph = rx.PyGraph()
+    index = {c: graph.add_node(c) for c in tn.coords}
+    for (u, v), cost in rx_cost.items():
+        if index[u] < index[v]:
+            graph.add_edge(index[u], index[v], cost)
+    for a, b in itertools.product(tn.coords[:4], tn.coords):
+        if a == b:
+            continue
+        expected = rx.dijkstra_shortest_path_lengths(
+            graph, index[a], edge_cost_fn=float, goal=index[b])[index[b]]
+        assert shortest_path_lengths(tn, a, b, weight=costs)[0] == pytest.approx(expected)
+
+
+def test_lazy_batch_distances():
+    lattice = Lattice(3, 500)
+    assert lattice._is_lazy
+    rng = np.random.default_rng(0)
+    starts = rng.integers(-500, 501, size=(1000, 3))
+    ends = rng.integers(-500, 501, size=(1000, 3))
+    lengths = shortest_path_lengths(lattice, starts, ends)
+    assert np.array_equal(lengths, np.abs(ends - starts).sum(axis=1))
+    assert len(shortest_path(lattice, (0, 0, 0), (500, -500, 3))) == 1004
+
+
+def test_errors():
+    lattice = Lattice(2, 2)
+    with pytest.raises(KeyError):
+        shortest_path_lengths(lattice, (0, 0), [(3, 0)])
+    with pytest.raises(ValueError):
+        shortest_path(lattice, (0, 0), (1, 1), weight=[1.0])
+    with pytest.raises(ValueError):
+        shortest_path(lattice, (0, 0), (1, 1), weight='harmonic')
@@ -216,3 +216,33 @@ class TestEdgeCases:
     def test_eikosany_positions_count(self):
         ek = Eikosany(master_set='asterisk')
         assert len(ek.positions) == 20
+
+
+class TestGeometryIndex:
+    def test_index_shared_across_sort_orders(self):
+        ek = Eikosany(master_set='asterisk')
+        by_position = match_pattern(ek, [11, 6, 10, 14])
+        index = ek._traversal_cache()['cps_geometry_index']
+        cached = dict(index._hits)
+        by_rotation = match_pattern(ek, [11, 6, 10, 14], sort_by='rotation')
+        assert index._hits == cached
+        assert sorted(by_position) == sorted(by_rotation)
+
+    def test_matches_are_congruent(self):
+        ek = Eikosany(master_set='asterisk')
+        target = [6, 14, 17, 12]
+        pos = ek.positions
+
+        def dists(nodes):
+            return [round(math.dist(pos[a], pos[b]), 6)
+                    for i, a in enumerate(nodes) for b in nodes[i + 1:]]
+
+        for match in match_pattern(ek, target):
+            assert dists(list(match)) == dists(target)
+
+    def test_large_cps_six_node_shape(self):
+        from klotho.tonos.systems.combination_product_sets import Hebdomekontany
+        hb = Hebdomekontany()
+        result = match_pattern(hb, [0, 1, 5, 9, 20, 33])
+        assert result
+        assert all(len(set(m)) == 6 for m in result)
@@ -0,0 +1,127 @@
+"""NRT binary OSC score export: codec round-trips and payload translation."""
+
+import numpy as np
+import pytest
+
+from klotho.dynatos import Envelope
+from klotho.thetos import CompositionalUnit as UC
+from klotho.thetos.composition.score import Score
+from klotho.thetos.instruments.synthdef import SynthDefInstrument, SynthDefFX
+from klotho.utils.playback._osc import (
+    decode_bundle,
+    decode_message,
+    decode_nrt_score,
+    encode_bundle,
+    encode_message,
+    encode_nrt_score,
+)
+from klotho.utils.playback.nrt import (
+    nrt_command,
+    payload_to_nrt_bundles,
+    read_nrt_score,
+    write_nrt_score,
+)
+from klotho.utils.playback.supersonic.converters import (
+    convert_score_to_sc_events,
+    convert_to_sc_payload,
+)
+
+
+def _uc(control=True):
+    uc = UC(tempus='4/4', prolatio=(1, 1, 1, 1), beat='1/4', bpm=60,
+            inst=SynthDefInstrument.from_manifest('kl_tri'))
+    if control:
+        uc.root.apply_envelope(Envelope([0.1, 0.8]), pfields='amp', control=True)
+    return uc
+
+
+def _messages(bundles, address):
+    return [(t, args) for t, msgs in bundles for a, args in msgs if a == address]
+
+
+class TestOSCCodec:
+    def test_message_round_trip(self):
+        data = encode_message('/s_new', ['kl_tri', 1001, 0, 1, 'freq', 440.5, b'\x01\x02\x03'])
+        assert len(data) % 4 == 0
+        address, args = decode_message(data)
+        assert address == '/s_new'
+        assert args == ['kl_tri', 1001, 0, 1, 'freq', 440.5, b'\x01\x02\x03']
+
+    def test_numpy_and_bool_args(self):
+        _, args = decode_message(encode_message('/x', [np.int64(3), np.float32(0.5), True]))
+        assert args == [3, 0.5, 1]
+
+    def test_unsupported_arg_raises(self):
+        with pytest.raises(TypeError):
+            encode_message('/x', [object()])
+
+    def test_bundle_round_trip_with_fractional_time(self):
+        data = encode_bundle(1.25, [('/n_set', [1001, 'gate', 0]), ('/n_free', [1001])])
+        time, elements = decode_bundle(data)
+        assert time == pytest.approx(1.25, abs=1e-9)
+        assert elements == [('/n_set', [1001, 'gate', 0]), ('/n_free', [1001])]
+
+    def test_nested_bundle(self):
+        inner = encode_bundle(2.0, [('/a', [1])])
+        _, elements = decode_bundle(encode_bundle(1.0, [inner]))
+        assert elements == [(2.0, [('/a', [1])])]
+
+    def test_nrt_framing_round_trip(self):
+        bundles = [(0.0, [('/g_new', [1000, 0, 0])]), (3.5, [('/n_free', [1000])])]
+        assert decode_nrt_score(encode_nrt_score(bundles)) == bundles
+
+
+class TestPayloadTranslation:
+    def test_score_with_tracks_inserts_and_envelope(self, tmp_path):
+        score = Score()
+        score.track('v', inserts=[SynthDefFX('kl_chop')])
+        score.add(_uc(), track='v')
+        path = write_nrt_score(score, tmp_path / 'piece.osc', ring_time=2.0)
+        bundles = read_nrt_score(path)
+
+        times = [t for t, _ in bundles]
+        assert times == sorted(times)
+        assert (tmp_path / 'piece_ctrl.wav').exists()
+
+        first = [a for a, _ in bundles[0][1]]
+        assert '/d_recv' in first and '/b_alloc' in first
+        assert first.index('/b_alloc') < first.index('/b_read')
+
+        notes = _messages(bundles, '/s_new')
+        kl_tri = [(t, a) for t, a in notes if a[0] == 'kl_tri']
+        assert [t for t, _ in kl_tri] == [0.0, 1.0, 2.0, 3.0]
+        assert any(a[0] == 'kl_chop' for _, a in notes)
+        assert any(a[0] == '__klEnvCtrl' for _, a in notes)
+
+        node_ids = [a[1] for _, a in kl_tri]
+        maps = _messages(bundles, '/n_map')
+        assert sorted(a[0] for _, a in maps) == sorted(node_ids)
+        releases = [a[0] for _, a in _messages(bundles, '/n_set') if a[1:] == ['gate', 0]]
+        assert sorted(releases) == sorted(node_ids)
+
+        end_time, end_msgs = bundles[-1]
+        assert end_msgs == [('/n_free', [1000])]
+        assert end_time == pytest.approx(4.0 + 2.0)
+
+    def test_bare_payload_routes_to_score_group(self, tmp_path):
+        payload = convert_to_sc_payload(_uc(control=False))
+        bundles = payload_to_nrt_bundles(payload, tmp_path)
+        notes = [a for _, a in _messages(bundles, '/s_new') if a[0] == 'kl_tri']
+        assert len(notes) == 4
+        assert all(a[3] == 1000 for a in notes)
+        assert not _messages(bundles, '/b_alloc')
+
+    def test_adaptive_descriptor_offsets(self, tmp_path):
+        score = Score(adaptive_blocks=True)
+        score.add(_uc())
+        bundles = payload_to_nrt_bundles(convert_score_to_sc_events(score), tmp_path)
+        ctrl = [a for _, a in _messages(bundles, '/s_new') if a[0] == '__klEnvCtrl'][0]
+        fields = dict(zip(ctrl[4::2], ctrl[5::2]))
+        alloc = _messages(bundles, '/b_alloc')[0][1]
+        assert fields['startFrame'] == 0
+        assert fields['numFrames'] == alloc[1] < 512
+
+
+def test_nrt_command():
+    argv = nrt_command('a.osc', 'a.wav', sample_rate=44100, channels=2)
+    assert argv == ['scsynth', '-N', 'a.osc', '_', 'a.wav', '44100', 'WAV', 'int24', '-o', '2']
@@ -0,0 +1,87 @@
+"""Dense-grid storage, chunked evaluation and stencil derivatives for ParameterField."""
+import numpy as np
+import pytest
+
+from klotho.thetos.parameters.parameter_fields import ParameterField
+
+
+def _fn(x):
+    return np.sin(3 * x[:, 0]) + x[:, -1] ** 2
+
+
+@pytest.mark.parametrize("dim,res,bipolar,periodic", [
+    (2, 4, True, False), (3, 2, False, True), (2, 1, True, True), (1, 5, False, False),
+])
+def test_whole_grid_stencils_match_pointwise(dim, res, bipolar, periodic):
+    field = ParameterField(dim, res, function=_fn, bipolar=bipolar, periodic=periodic)
+    grads, laps = field.gradients(), field.laplacians()
+    lows = field._grid_lows()
+    for coord in field.coords:
+        idx = tuple(np.array(coord) - lows)
+        assert laps[idx] == pytest.approx(field.laplacian(coord))
+        assert np.allclose(grads[(slice(None),) + idx], field.gradient(coord))
+        neighbors = field.neighbors(coord)
+        expected = sum(field[n] for n in neighbors) - len(neighbors) * field[coord]
+        assert field.laplacian(coord) == pytest.approx(expected)
+
+
+def test_gradient_is_np_gradient():
+    field = ParameterField(2, 5, function=lambda x: x[:, 0] ** 2 + 3 * x[:, 1])
+    grid = field.grid_values()
+    assert np.allclose(field.gradients(), np.stack(np.gradient(grid)))
+
+
+def test_values_are_grid_aligned_and_read_only():
+    field = ParameterField(2, 3, function=lambda x: x[:, 0] - 2 * x[:, 1])
+    grid = field.grid_values()
+    assert grid.shape == (7, 7)
+    assert grid[0, 0] == pytest.approx(field[(-3, -3)])
+    assert field.get_field_values([(3, 3), (0, 0)]) == pytest.approx([-1.0, 0.0])
+    with pytest.raises(ValueError):
+        grid[0, 0] = 1.0
+
+
+def test_evaluation_is_chunked_and_lazy():
+    calls = []
+
+    class Small(ParameterField):
+        _EVAL_CHUNK_BYTES = 8 * 3 * 100
+
+    field = Small(2, 20, function=lambda x: (calls.append(len(x)), x.sum(axis=1))[1])
+    field[(0, 0)]
+    assert calls == [1]
+    field.grid_values()
+    assert max(calls) <= 100
+    assert sum(calls) == 41 * 41
+    field.grid_values()
+    assert sum(calls) == 41 * 41
+
+
+def test_set_value_and_apply_function():
+    field = ParameterField(2, 2, function=lambda x: np.zeros(len(x)))
+    field[(1, 1)] = 5.0
+    assert field.grid_values()[3, 3] == 5.0
+    field.apply_function(lambda x: np.ones(len(x)))
+    assert field[(1, 1)] == 1.0
+
+
+def test_sample_field_interpolates_cached_grid():
+    field = ParameterField(2, 10, function=lambda x: 2 * x[:, 0] - x[:, 1],
+                           ranges=[(1.0, -1.0), (0.0, 2.0)])
+    points = np.random.default_rng(0).uniform([-1, 0], [1, 2], size=(50, 2))
+    assert np.allclose(field.sample_field(points), 2 * points[:, 0] - points[:, 1])
+    assert field.sample_field(np.array([[5.0, 5.0]]))[0] == 0.0
+
+
+def test_large_lazy_field_stores_values_sparsely():
+    field = ParameterField(8, 10, function=lambda x: x.sum(axis=1), lazy=True)
+    origin = (0,) * 8
+    assert field.get_field_value(origin) == 0.0
+    field[(1,) * 8] = 3.5
+    assert field[(1,) * 8] == 3.5
+    assert field.get_field_values([origin, (10,) * 8]) == [0.0, 8.0]
+    assert field._grid is None and len(field._sparse) == 3
+    with pytest.raises(ValueError, match="dense grid"):
+        field.grid_values()
+    with pytest.raises(ValueError):
+        field.gradients()
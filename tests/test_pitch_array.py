@@ -0,0 +1,99 @@
+"""NumPy-backed PitchArray and one-call collection realization."""
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+from klotho.tonos import Chord, Pitch, PitchArray, Scale, Voicing, cent, frequency
+from klotho.tonos.pitch import PitchCollection
+
+
+def _same(arr, pitches):
+    assert len(arr) == len(pitches)
+    for a, b in zip(arr, pitches):
+        assert a.freq == b.freq
+        assert a.partial == b.partial
+        assert str(a) == str(b)
+
+
+class TestRealize:
+    def test_cyclic_ratio_scale_matches_indexing(self):
+        s = Scale(['1/1', '9/8', '5/4', '4/3', '3/2', '5/3', '15/8'], reference_pitch='D3')
+        idx = list(range(-15, 22))
+        arr = s.realize(idx)
+        _same(arr, [s[i] for i in idx])
+        assert isinstance(arr[3].partial, Fraction)
+
+    def test_cents_chord_matches_indexing(self):
+        c = Chord([0.0, 386.3, 702.0], 'cents', reference_pitch='A3')
+        idx = list(range(-7, 8))
+        _same(c.realize(idx), [c[i] for i in idx])
+
+    def test_default_is_pitches_and_freqs(self):
+        v = Voicing(['1/1', '5/4', '3/1'], reference_pitch='G3')
+        _same(v.realize(), v.pitches)
+        assert v.freqs == tuple(p.freq for p in v.pitches)
+
+    def test_non_cyclic_out_of_range(self):
+        v = Voicing(['1/1', '5/4', '3/1'])
+        assert v.realize([-1])[0] == v[-1]
+        with pytest.raises(IndexError):
+            v.realize([3])
+
+    def test_absolute_collection(self):
+        a = PitchCollection.from_freq([100.0, 200.0, 300.0], equave=2)
+        _same(a.realize([0, 4, -1]), [a[0], a[4], a[-1]])
+        assert a.freqs == (100.0, 200.0, 300.0)
+
+
+class TestPitchArray:
+    def _arr(self):
+        return Scale(['1/1', '9/8', '5/4', '3/2'], reference_pitch='C3').realize(range(-6, 14))
+
+    def test_derived_views_match_pitch(self):
+        arr = self._arr()
+        pitches = arr.to_pitches()
+        np.testing.assert_allclose(arr.midicents, [p.midicent for p in pitches])
+        assert arr.midi.tolist() == [p.midi for p in pitches]
+        assert arr.cents_offsets.tolist() == [p.cents_offset for p in pitches]
+        assert arr.octaves.tolist() == [p.octave for p in pitches]
+        assert arr.pitchclasses == [p.pitchclass for p in pitches]
+
+    def test_indexing(self):
+        arr = self._arr()
+        assert isinstance(arr[0], Pitch)
+        assert isinstance(arr[2:5], PitchArray) and len(arr[2:5]) == 3
+        assert len(arr[arr.freqs > 200]) == int((arr.freqs > 200).sum())
+        assert arr[[0, 0]].freqs.tolist() == [arr[0].freq] * 2
+        with pytest.raises(ValueError):
+            arr.freqs[0] = 1.0
+
+    def test_transpose_and_equave_shift(self):
+        arr = self._arr()
+        np.testing.assert_allclose(arr.transpose('3/2').freqs, arr.freqs * 1.5)
+        np.testing.assert_allclose(arr.transpose(cent(1200)).freqs, arr.freqs * 2)
+        np.testing.assert_allclose(arr.equave_shift(-1).freqs, arr.freqs / 2)
+        shifts = np.arange(len(arr)) % 3
+        np.testing.assert_allclose(arr.equave_shift(shifts).freqs, arr.freqs * 2.0 ** shifts)
+        assert arr.transpose('3/2').partials.tolist() == arr.partials.tolist()
+
+    def test_fold(self):
+        arr = self._arr()
+        lo, hi = Pitch('G3').freq, Pitch('G4').freq
+        folded = arr.fold('G3', frequency(hi))
+        assert ((folded.freqs >= lo - 1e-6) & (folded.freqs <= hi + 1e-6)).all()
+        ratio = np.log2(folded.freqs / arr.freqs)
+        np.testing.assert_allclose(ratio, np.round(ratio), atol=1e-9)
+        narrow = arr.fold('C4', 'E4')
+        assert len(narrow) == len(arr)
+        with pytest.raises(TypeError):
+            arr.fold(lo=200.0)
+
+    def test_constructors(self):
+        arr = PitchArray.from_midi([60, 69, 60.5])
+        assert arr[1].freq == pytest.approx(440.0)
+        assert arr.midi.tolist() == [60.0, 69.0, 60.5]
+        pa = PitchArray.from_pitches(['C4', Pitch('A4', partial=Fraction(3, 2))])
+        assert pa[1].partial == Fraction(3, 2)
+        with pytest.raises(ValueError):
+            PitchArray([100.0, 200.0], partials=[1])
@@ -1,9 +1,12 @@
+import gc
+import weakref
 from fractions import Fraction
 
 import pytest
 
 from klotho.tonos.scales.scale import Scale
 from klotho.tonos.chords.chord import Chord, Voicing
+from klotho.tonos.pitch import pitch_collections
 from klotho.tonos.pitch.pitch import Pitch
 
 C4 = Pitch("C4").freq
@@ -63,3 +66,52 @@ def test_chord_root_instancing_returns_pitches():
     assert isinstance(instanced[0], Pitch)
     assert instanced.degrees[0] == Fraction(1, 1)
     assert isinstance(instanced.pitches[0], Pitch)
+
+
+def test_derived_collections_are_memoized():
+    scale = Scale.ionian("A4")
+    assert scale.mode(1) is scale.mode(1)
+    assert scale.mode(1).reference_pitch.freq == pytest.approx(440.0)
+    assert scale.root("D4") is scale.root("D4")
+    assert scale.transpose("3/2") is scale.transpose(Fraction(3, 2))
+    assert ~scale is ~scale
+    assert scale[1:5] is scale[1:5]
+    assert scale[[0, 2, 4]] is scale[[0, 2, 4]]
+    chord = Chord(["1/1", "5/4", "3/2"])
+    assert chord.voicing([0, 1, 2, 3]) is chord.voicing((0, 1, 2, 3))
+    assert chord.normalized() is chord.normalized()
+    assert chord.as_voicing().root("E2") is chord.as_voicing().root("E2")
+
+
+def test_derived_cache_is_bounded_and_results_unchanged():
+    scale = Scale.ionian()
+    first = scale.root("C3")
+    for i in range(pitch_collections._DERIVED_CACHE_SIZE):
+        scale.root(Pitch("D4", cents_offset=i / 10))
+    assert len(pitch_collections._derived_cache) == pitch_collections._DERIVED_CACHE_SIZE
+    again = scale.root("C3")
+    assert again is not first and again == first
+    assert scale.mode(5).degrees == Scale.aeolian().degrees
+    assert (~Chord(["1/1", "5/4", "3/2"])).degrees == [Fraction(1), Fraction(6, 5), Fraction(3, 2)]
+
+
+def test_long_derivation_chain_is_not_pinned_by_root():
+    root = Chord(["1/1", "5/4", "3/2"])
+    chord = root.transpose("3/2")
+    first = weakref.ref(chord)
+    for _ in range(2 * pitch_collections._DERIVED_CACHE_SIZE):
+        chord = chord.transpose(Fraction(1001, 1000))
+    gc.collect()
+    assert first() is None
+    assert "_derived_cache" not in root.__dict__
+
+
+def test_collections_hash_by_value():
+    a = Chord(["1/1", "5/4", "3/2"], reference_pitch="A3")
+    b = Chord([Fraction(3, 2), "5/4", 1], reference_pitch=Pitch("A3"))
+    assert a == b and hash(a) == hash(b)
+    assert {a: "major"}[b] == "major"
+    assert a != a.root("B3")
+    assert a != Voicing(["1/1", "5/4", "3/2"], reference_pitch="A3")
+    assert a != a[0:3]
+    assert len({Scale.ionian(), Scale.ionian(), Scale.aeolian()}) == 2
@@ -0,0 +1,75 @@
+"""Precomputed set-class catalog over pitch-class bitmasks."""
+import numpy as np
+import pytest
+
+from klotho.topos.collections import SetClassCatalog, set_class_catalog
+from klotho.topos.collections import set_classes
+from klotho.topos.collections.sets import Operations
+
+
+def _rahn_prime(pcs, modulus):
+    best = None
+    for T in (set(pcs), {(-p) % modulus for p in pcs}):
+        for k in range(modulus):
+            key = sum(1 << ((p + k) % modulus) for p in T)
+            best = key if best is None else min(best, key)
+    return best
+
+
+@pytest.fixture(scope="module")
+def cat():
+    return SetClassCatalog(12, cache_dir=False)
+
+
+def test_class_counts():
+    assert len(SetClassCatalog(12, cache_dir=False)) == 224
+    assert [len(SetClassCatalog(m, cache_dir=False)) for m in (1, 2, 5, 7)] == [2, 3, 8, 18]
+
+
+def test_matches_per_set_operations(cat):
+    masks = np.arange(1 << 12)
+    vectors = cat.interval_vectors(masks)
+    primes = cat.prime_masks(masks)
+    for m in range(1, 1 << 12, 7):
+        pcs = set(cat.from_mask(m))
+        assert vectors[m].tolist() == Operations.interval_vector(pcs, 12).tolist()
+        assert int(primes[m]) == _rahn_prime(pcs, 12)
+
+
+def test_classify_is_transposition_and_inversion_invariant(cat):
+    chord = {0, 4, 7}
+    sets = [Operations.transpose(chord, k, 12) for k in range(12)]
+    sets += [Operations.invert(chord, k, 12) for k in range(12)]
+    ids = cat.classify(cat.to_masks(sets))
+    assert len(set(ids.tolist())) == 1
+    assert cat.prime_form(chord) == (0, 3, 7)
+    assert cat.label(ids[0]) == '3-11'
+
+
+def test_z_relations(cat):
+    all_interval = cat.set_class({0, 1, 4, 6})
+    partner = cat.z_related(all_interval)
+    assert cat.table.prime_form[partner[0]] == (0, 1, 3, 7)
+    assert cat.z_related(cat.set_class({0, 4, 7})) == []
+    # Forte's 23 Z-pairs
+    assert sum(len(z) > 0 for z in cat.table.z_related) == 46
+
+
+def test_disk_cache_round_trip(tmp_path):
+    built = SetClassCatalog(7, cache_dir=tmp_path)
+    assert (tmp_path / 'setclasses_m7_v1.npz').exists()
+    set_classes._catalog_arrays.cache_clear()
+    loaded = SetClassCatalog(7, cache_dir=tmp_path)
+    masks = np.arange(1 << 7)
+    assert (loaded.classify(masks) == built.classify(masks)).all()
+    assert (loaded.interval_vectors(masks) == built.interval_vectors(masks)).all()
+
+
+def test_memoized_factory_and_validation(cat):
+    assert set_class_catalog(6, cache_dir=False) is set_class_catalog(6, cache_dir=False)
+    with pytest.raises(ValueError):
+        SetClassCatalog(25, cache_dir=False)
+    with pytest.raises(ValueError):
+        cat.classify([1 << 12])
+    with pytest.raises(TypeError):
+        cat.classify([1.0])
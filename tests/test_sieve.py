@@ -0,0 +1,114 @@
+"""Symbolic Xenakis sieves with periodic bitmap evaluation."""
+import random
+
+import numpy as np
+import pytest
+
+from klotho.topos.collections import sets
+from klotho.topos.collections.sets import Sieve
+
+
+def _random_sieve(rng, depth):
+    if depth == 0 or rng.random() < 0.3:
+        m = rng.randint(1, 12)
+        r = rng.randint(0, m - 1)
+        return Sieve(m, r, 300), (lambda n, m=m, r=r: n % m == r)
+    op = rng.choice(['|', '&', '-', '^', '~'])
+    a, fa = _random_sieve(rng, depth - 1)
+    if op == '~':
+        return ~a, (lambda n: not fa(n))
+    b, fb = _random_sieve(rng, depth - 1)
+    rules = {
+        '|': (lambda: a | b, lambda n: fa(n) or fb(n)),
+        '&': (lambda: a & b, lambda n: fa(n) and fb(n)),
+        '-': (lambda: a - b, lambda n: fa(n) and not fb(n)),
+        '^': (lambda: a ^ b, lambda n: fa(n) != fb(n)),
+    }
+    make, f = rules[op]
+    return make(), f
+
+
+def test_expressions_match_brute_force():
+    rng = random.Random(3)
+    for _ in range(200):
+        s, member = _random_sieve(rng, 4)
+        s.N = 400
+        expected = [n for n in range(401) if member(n)]
+        assert sorted(s.S) == expected
+        assert list(s) == expected
+        assert len(s) == len(expected)
+        assert s.indices(1000, 1100).tolist() == [n for n in range(1000, 1100) if member(n)]
+        assert all((n in s) == (0 <= n <= 400 and member(n)) for n in range(-40, 440, 7))
+
+
+def test_operators_compose_symbolically():
+    s = (Sieve(3, 1, 10) | Sieve(5, 2, 10)) - Sieve(2, 0, 10)
+    assert isinstance(s, Sieve)
+    assert s.period == 30
+    assert s.expression == '((3,1) ∪ (5,2)) - (2,0)'
+    assert s.r is None
+    assert s._pattern is None
+    assert sorted(s.S) == [1, 7]
+
+
+def test_membership_respects_bounds():
+    s = Sieve(3, 1, N=10)
+    assert 10 in s and 13 not in s and -2 not in s
+    assert 13 not in (Sieve(3, 1, N=10) | Sieve(5, 2, N=10))
+    assert 13 not in (Sieve(3, 1, N=10) | Sieve(5, 2, N=30))
+    assert 22 in (Sieve(3, 1, N=10) | Sieve(5, 2, N=30))
+    for sieve in (s, Sieve(3, 1, N=10) | Sieve(5, 2, N=30), ~s):
+        assert [n for n in range(-5, 40) if n in sieve] == list(sieve)
+
+
+def test_str_reports_last_member_of_bounded_combinations():
+    s = Sieve(1, 0, N=50) | (Sieve(2, 0, N=100) & Sieve(2, 1, N=100))
+    assert len(s) == 51
+    assert '... 50' in str(s)
+    assert '... 99' in str(Sieve(3, 0, N=100))
+
+
+def test_mixed_bounds_keep_each_operand_bound():
+    a, b = Sieve(3, 1, N=10), Sieve(5, 2, N=30)
+    assert sorted(a | b) == sorted(a.S | b.S)
+    assert sorted(b | a) == sorted(a.S | b.S)
+    assert sorted(a & b) == sorted(a.S & b.S)
+    assert sorted(b - a) == sorted(b.S - a.S)
+    assert sorted(a ^ b) == sorted(a.S ^ b.S)
+    assert 22 in (b - a) and 13 not in (a | b)
+    union = a | b
+    assert len(union) == len(a.S | b.S)
+    assert union.expression == '(3,1)[0,10] ∪ (5,2)'
+    assert sorted(~union) == sorted(set(range(31)) - (a.S | b.S))
+
+
+def test_changing_n_reuses_the_period_bitmap():
+    s = Sieve(3, 1) | Sieve(5, 2)
+    s.N = 20
+    pattern = s.pattern
+    s.N = 10**6
+    assert s.pattern is pattern
+    assert len(s) == len(s.indices()) == int(s.mask().sum())
+    assert s.mask(7, 37).tolist() == s.mask(37, 67).tolist()
+
+
+def test_long_periods_evaluate_by_window(monkeypatch):
+    monkeypatch.setattr(sets, '_SIEVE_PATTERN_LIMIT', 100)
+    s = Sieve(7, 1) | Sieve(11, 2) | Sieve(13, 3)
+    s.N = 5000
+    assert s.period == 1001
+    assert s.indices().tolist() == [n for n in range(5001)
+                                    if n % 7 == 1 or n % 11 == 2 or n % 13 == 3]
+    assert s._pattern is None
+    assert 1002 in s and 1005 not in s
+
+
+def test_elementary_sieve_properties():
+    s = Sieve(3, 4, 20)
+    assert s.r == 4 and s.period == 3
+    assert sorted(s.S) == list(range(1, 21, 3))
+    assert s.compl == set(range(21)) - s.S
+    assert sorted(~s) == sorted(s.compl)
+    with pytest.raises(ValueError):
+        Sieve(0, 0)
+    assert np.array_equal(s.pattern, [False, True, False])
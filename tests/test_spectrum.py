@@ -0,0 +1,89 @@
+"""Array-backed Spectrum and level-order HarmonicTree evaluation."""
+from fractions import Fraction
+
+import numpy as np
+import pytest
+
+from klotho.tonos import HarmonicTree, Spectrum
+from klotho.tonos.pitch import Pitch
+from klotho.tonos.utils.interval_normalization import reduce_interval
+
+
+def _recursive_harmonics(tree):
+    """The per-node values of the original depth-first evaluation."""
+    out = {}
+
+    def walk(node, inherited):
+        harmonic = tree[node]['factor'] * inherited
+        out[node] = harmonic
+        for child in tree.successors(node):
+            walk(child, harmonic)
+
+    walk(tree.root, 1)
+    return out
+
+
+def test_level_order_evaluation_matches_recursion():
+    tree = HarmonicTree(1, (3, 5, (7, (11, Fraction(13, 2))), (2, (3, (5, (1, 2))))),
+                        equave=2, span=1)
+    expected = _recursive_harmonics(tree)
+    for node, harmonic in expected.items():
+        assert tree[node]['harmonic'] == harmonic
+        assert type(tree[node]['harmonic']) is type(harmonic)
+        assert tree[node]['ratio'] == reduce_interval(Fraction(harmonic), 2, 1)
+    inner = tree.successors(tree.root)[2]
+    tree.set_node_data(inner, factor=9)
+    assert tree.harmonics == tuple(_recursive_harmonics(tree)[n] for n in tree.leaf_nodes)
+
+
+def test_non_positive_partials_rejected():
+    for partials in ([1, -2, Fraction(3, 2), 9], [1, 0, 3]):
+        with pytest.raises(ValueError, match='positive'):
+            Spectrum(110.0, partials)
+
+
+def test_flat_and_nested_spectra():
+    flat = Spectrum(Pitch('A', 2), [5, 1, 3, 2])
+    assert flat.partials == (1, 2, 3, 5)
+    assert flat.freq == (110.0, 220.0, 330.0, 550.0)
+    assert flat.data['node_id'].tolist() == [2, 4, 3, 1]
+    assert flat.ht.harmonics == (5, 1, 3, 2)
+
+    nested = Spectrum(Pitch('A', 2, partial=3), [1, 2, (3, (1, 2)), 5])
+    assert nested.partials == (3, 6, 9, 15, 18)
+    assert nested.data['node_id'].tolist() == [1, 2, 4, 6, 5]
+    np.testing.assert_allclose(nested.freq, [110.0 * p for p in nested.partials])
+
+
+def test_data_is_built_lazily():
+    spectrum = Spectrum(55.0, list(range(1, 2001)))
+    assert spectrum._data is None and spectrum._ht is None
+    assert len(spectrum.realize()) == 2000
+    data = spectrum.data
+    assert list(data.columns) == ['partial', 'freq (Hz)', 'pitch', 'cents_offset', 'node_id']
+    assert data['pitch'][6].freq == pytest.approx(55.0 * 7)
+    assert spectrum[7] == data['pitch'][6]
+
+
+def test_transformations_scale_frequencies():
+    spectrum = Spectrum(Pitch('A', 2), [1, 2, 3, 5, 7])
+    retargeted = spectrum.retarget(3, Pitch('C4'))
+    assert retargeted[3].freq == pytest.approx(Pitch('C4').freq, abs=1e-3)
+    assert retargeted.partials == spectrum.partials
+    pivoted = spectrum.pivot(3, 2)
+    assert pivoted.fundamental.freq == pytest.approx(165.0)
+    other = Spectrum(100.0, [1, 2, 3])
+    modulated = spectrum.modulate(other, 3, 2)
+    assert modulated[3].freq == pytest.approx(200.0, abs=1e-3)
+
+
+def test_missing_partials_raise():
+    spectrum = Spectrum(Pitch('A', 2), [1, 2, 3])
+    with pytest.raises(KeyError):
+        spectrum[4]
+    with pytest.raises(ValueError):
+        spectrum.retarget(4, Pitch('C4'))
+    with pytest.raises(ValueError):
+        spectrum.pivot(1, 4)
+    with pytest.raises(ValueError):
+        spectrum.modulate(spectrum, 1, 9)
@@ -235,3 +235,60 @@ class TestParsingAndTransforms:
                         0.4, tritone=0.5, rng=2)
         for sym in word:
             assert len(list(C[sym])) >= 3
+
+
+class TestCompiledProgressions:
+    def test_compile_assigns_table_ids(self):
+        C = Key('C4')
+        ids = C.compile(['I', 'IV', 'V7/V', 'V7', 'I', 'IV'])
+        assert ids.tolist() == [0, 1, 2, 3, 0, 1]
+        assert C.table == ('I', 'IV', 'V7/V', 'V7')
+        assert C.compile(['V7', 'ii']).tolist() == [3, 4]
+        assert C.chord('V7') is C.chord('V7')
+
+    def test_realize_matches_chord_resolution(self):
+        C = Key('C4')
+        symbols = ['I', 'vi', 'ii7', 'V7/V', 'V7', 'I']
+        fresh = Key('C4')
+        seq = C.realize(C.compile(symbols))
+        assert isinstance(seq, ChordSequence)
+        assert [_pcs(ch) for ch in seq] == [_pcs(fresh.chord(s)) for s in symbols]
+        assert [_pcs(ch) for ch in C.progression(symbols)] == [_pcs(ch) for ch in seq]
+        assert len(C.realize(symbols)) == len(symbols)
+
+    def test_frequency_matrix_pads_with_nan(self):
+        C = Key('C4')
+        m = C.realize(C.compile(['I', 'V7', 'I']), freqs=True)
+        assert m.shape == (3, 4)
+        assert math.isnan(m[0, 3]) and not math.isnan(m[1, 3])
+        assert m[1, :4].tolist() == list(C['V7'].freqs)
+        assert C.realize([], freqs=True).shape == (0, 4)
+
+    def test_failed_symbols_and_rooting_leave_tables_separate(self):
+        C = Key('C4')
+        C.compile(['I'])
+        with pytest.raises((KeyError, ValueError)):
+            C.compile(['V', 'IX'])
+        assert C.table == ('I', 'V')
+        D = C.rooted('D4')
+        assert D.table == ()
+        assert _pcs(D.realize(D.compile(['I']))[0]) == 'D F# A'
+        with pytest.raises(TypeError):
+            C.realize([0.5])
+
+    def test_realize_rejects_ids_outside_the_table(self):
+        C = Key('C4')
+        C.compile(['I', 'V'])
+        for ids in ([0, 2], [-1], (1, 0, 5)):
+            with pytest.raises(IndexError, match='table id'):
+                C.realize(ids)
+            with pytest.raises(IndexError, match='table id'):
+                C.realize(ids, freqs=True)
+        assert len(C.realize([1, 0])) == 2
+
+    def test_transformed_progressions_reuse_table(self):
+        C = Key('C4')
+        base = ['I', 'IV', 'V7', 'I']
+        for seed in range(20):
+            C.compile(approach(tonicize(base, 0.5, rng=seed), 0.5, rng=seed))
+        assert len(C.table) == len(set(C.table)) < 20
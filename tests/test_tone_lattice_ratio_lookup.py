@@ -185,3 +185,36 @@ class TestEquaveProperty:
         assert tl.equave == Fraction(2)
         tl3 = ToneLattice.from_generators((2, 5), equave=3, resolution=1)
         assert tl3.equave == Fraction(3)
+
+
+class TestBatchedLookup:
+    """``get_coordinates_for_ratios`` agrees with per-ratio lookup."""
+
+    RATIOS = ["16/15", "8/15", "3/2", "1/1", "15/8", "9/8", "3/1", "6/5", "16/15"]
+
+    @pytest.mark.parametrize("equave_reduce", [True, False])
+    @pytest.mark.parametrize("lookup", ["first", "all", "unique"])
+    def test_matches_single_lookup(self, equave_reduce, lookup):
+        tl = ToneLattice.from_generators((3, 5), resolution=2,
+                                         equave_reduce=equave_reduce)
+        expected = [tl.get_coordinates_for_ratio(r, lookup=lookup, warn=False)
+                    for r in self.RATIOS]
+        assert tl.get_coordinates_for_ratios(self.RATIOS, lookup=lookup,
+                                             warn=False) == expected
+
+    def test_unresolved_warns_and_returns_none(self, tl_3x5):
+        with pytest.warns(ToneLatticeLookupWarning):
+            assert tl_3x5.get_coordinates_for_ratios(["3/2", "243/128"]) == [(1, 0), None]
+
+    def test_all_mode_returns_independent_lists(self):
+        tl = ToneLattice.from_generators((3, 5), resolution=2, equave_reduce=False)
+        first, second = tl.get_coordinates_for_ratios(["16/15", "16/15"], lookup="all")
+        first.clear()
+        assert second and (-1, -1) in second
+
+    def test_index_built_once_and_extended(self, tl_3x5):
+        tl_3x5.get_coordinates_for_ratios(["3/2"])
+        index = tl_3x5._ratio_match_index
+        assert tl_3x5._ratio_indexed_count == tl_3x5.number_of_nodes()
+        tl_3x5.get_coordinates_for_ratios(["5/4"])
+        assert tl_3x5._ratio_match_index is index
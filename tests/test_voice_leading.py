@@ -385,6 +385,102 @@ class TestAnchors:
             assert any(abs(g - f) < 1e-6 for g in anchored)
 
 
+def _total_motion(led):
+    total = 0.0
+    for a, b in zip(led, led[1:]):
+        x = sorted(math.log(p.freq) for p in a.pitches)
+        y = sorted(math.log(p.freq) for p in b.pitches)
+        total += sum(abs(u - v) for u, v in zip(x, y))
+    return total
+
+
+class TestGlobalStrategy:
+    def _seq(self, refs=('C4', 'G4', 'A3', 'F4', 'D4', 'E4')):
+        return [Chord(['1/1', '5/4', '3/2'] if i % 2 == 0 else ['1/1', '6/5', '3/2'],
+                      reference_pitch=r) for i, r in enumerate(refs)]
+
+    def test_matches_brute_force(self):
+        import itertools
+        seq = self._seq()[:4]
+        lo, hi = Pitch('C3').freq, Pitch('C5').freq
+        layers = []
+        for c in seq:
+            per = [[p.freq * 2 ** k for k in range(-6, 7)
+                    if lo - 1e-3 <= p.freq * 2 ** k <= hi + 1e-3] for p in c.pitches]
+            layers.append([sorted(v) for v in itertools.product(*per)])
+        best = min(sum(sum(abs(math.log(u / v)) for u, v in zip(a, b))
+                       for a, b in zip(path, path[1:]))
+                   for path in itertools.product(*layers))
+        led = voice_lead(seq, 'C3', 'C5', strategy='global')
+        assert _total_motion(led) == pytest.approx(best)
+        for v in led:
+            assert _in_window(v, lo, hi)
+
+    def test_never_worse_than_greedy(self):
+        import random
+        rng = random.Random(1)
+        names = ['C4', 'D4', 'E4', 'F4', 'G4', 'A4', 'B3']
+        for _ in range(20):
+            seq = [Chord(rng.choice([['1/1', '5/4', '3/2'], ['1/1', '6/5', '3/2']]),
+                         reference_pitch=rng.choice(names)) for _ in range(5)]
+            greedy = _total_motion(voice_lead(seq, 'C3', 'A4'))
+            assert _total_motion(voice_lead(seq, 'C3', 'A4', strategy='global')) <= greedy + 1e-9
+
+    def test_repeated_shapes_reuse_transition_costs(self, monkeypatch):
+        from klotho.tonos.chords import voice_leading as vl
+        calls = []
+        original = vl._transition_costs
+        monkeypatch.setattr(vl, '_transition_costs',
+                            lambda *a: calls.append(1) or original(*a))
+        seq = self._seq(('C4', 'G4')) * 50
+        led = voice_lead(seq, 'C3', 'C5', strategy='global')
+        assert len(led) == 100
+        assert len(calls) == 2
+
+    def test_unbounded_transitions_cost_only_the_beam(self, monkeypatch):
+        from klotho.tonos.chords import voice_leading as vl
+        rows = []
+        original = vl._transition_costs
+        monkeypatch.setattr(vl, '_transition_costs',
+                            lambda prev, ln: rows.append(len(prev)) or original(prev, ln))
+        seq = [Chord(['1/1', '5/4', '3/2', '7/4'], reference_pitch=r)
+               for r in ('C4', 'F4', 'G4', 'D4', 'A3')] * 20
+        led = voice_lead(seq, strategy='global')
+        assert len(led) == 100
+        assert len(rows) == 99
+        assert max(rows) <= vl._DEFAULT_BEAM
+
+    def test_beam_and_unbounded(self):
+        seq = self._seq() * 5
+        for led in (voice_lead(seq, 'C3', 'C5', strategy='global', beam=1),
+                    voice_lead(seq, strategy='global')):
+            assert [len(v.pitches) for v in led] == [3] * len(seq)
+        exact = voice_lead(seq, 'C3', 'C5', strategy='global')
+        wide = voice_lead(seq, 'C3', 'C5', strategy='global', beam=10 ** 6)
+        assert [v.degrees for v in exact] == [v.degrees for v in wide]
+
+    def test_voices_cardinalities_and_anchors(self):
+        mixed = [Chord(['1/1', '5/4', '3/2', '7/4'], reference_pitch='D4'),
+                 Chord(['1/1', '3/2'], reference_pitch='C4'),
+                 Voicing([0.0, 300.0, 700.0], interval_type='cents',
+                         reference_pitch='A3')] * 3
+        led = voice_lead(mixed, 'G2', 'G5', strategy='global')
+        assert [len(v.pitches) for v in led] == [4, 2, 3] * 3
+        led = voice_lead(mixed, 'G2', 'G5', voices=4, strategy='global')
+        assert all(len(v.pitches) == 4 for v in led)
+        led = voice_lead(mixed, 'G2', 'G5', strategy='global', anchor=[0, -1])
+        assert led[0].degrees == mixed[0].degrees
+        assert led[-1].degrees == mixed[-1].degrees
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError, match='strategy'):
+            voice_lead(self._seq(), strategy='viterbi')
+        with pytest.raises(ValueError, match='beam'):
+            voice_lead(self._seq(), beam=4)
+        with pytest.raises(ValueError, match='beam'):
+            voice_lead(self._seq(), strategy='global', beam=0)
+
+
 class TestChordSequenceConcatenation:
     def _seq(self, n=1):
         return ChordSequence([Chord(['1/1', '5/4', '3/2'])] * n)